@@ -3,6 +3,7 @@
 
 import asyncio
 import logging
+from contextlib import aclosing
 from nia.memory.vector_store import VectorStore
 from nia.memory.embedding import EmbeddingService
 
@@ -36,25 +37,32 @@ async def main():
         logger.info("Connecting to vector store...")
         await vector_store.connect()
         
-        # Inspect collection
+        # Stream the collection page by page and look for specific thread
         logger.info("Inspecting memories collection...")
-        points = await vector_store.inspect_collection()
-        
-        # Look for specific thread
         logger.info("\nSearching for nova-team thread...")
-        for point in points:
-            if point.payload.get("metadata_thread_id") == "nova-team":
-                logger.info("Found nova-team thread:")
-                logger.info(f"Point ID: {point.id}")
-                logger.info("Metadata:")
-                for k, v in point.payload.items():
-                    if k.startswith("metadata_"):
-                        logger.info(f"  {k}: {v}")
-                logger.info("Content:")
-                logger.info(point.payload.get("content"))
-                break
-        else:
-            logger.info("nova-team thread not found")
+        scanned = 0
+        found = False
+        async with aclosing(vector_store.scan_collection()) as pages:
+            async for page in pages:
+                for point in page:
+                    scanned += 1
+                    payload = point.get("payload") or {}
+                    if payload.get("metadata_thread_id") == "nova-team":
+                        logger.info("Found nova-team thread:")
+                        logger.info(f"Point ID: {point.get('id')}")
+                        logger.info("Metadata:")
+                        for k, v in payload.items():
+                            if k.startswith("metadata_"):
+                                logger.info(f"  {k}: {v}")
+                        logger.info("Content:")
+                        logger.info(payload.get("content"))
+                        found = True
+                        break
+                if found:
+                    break
+                    
+        if not found:
+            logger.info(f"nova-team thread not found in {scanned} points")
     except Exception as e:
         logger.error(f"Error inspecting episodic layer: {str(e)}")
 
@@ -9,6 +9,8 @@ from ..tinytroupe_agent import TinyTroupeAgent
 from ...world.environment import NIAWorld
 from ...memory.two_layer import TwoLayerMemorySystem
 from ...core.types.memory_types import AgentResponse
+from ...core.compute import ComputePool, get_compute_pool
+from ...core.compute import analytics as compute_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +23,17 @@ class AnalyticsAgent(TinyTroupeAgent, NovaAnalyticsAgent):
         memory_system: Optional[TwoLayerMemorySystem] = None,
         world: Optional[NIAWorld] = None,
         attributes: Optional[Dict] = None,
-        domain: Optional[str] = None
+        domain: Optional[str] = None,
+        compute_pool: Optional[ComputePool] = None
     ):
-        """Initialize analytics agent."""
+        """Initialize analytics agent.
+        
+        Clustering, anomaly detection and trend fitting run on compute_pool
+        (the shared process pool by default) to keep the event loop free.
+        """
         # Set domain before initialization
         self.domain = domain or "professional"  # Default to professional domain
+        self.compute_pool = compute_pool or get_compute_pool()
         
         # Initialize NovaAnalyticsAgent first
         NovaAnalyticsAgent.__init__(
@@ -528,35 +536,27 @@ class AnalyticsAgent(TinyTroupeAgent, NovaAnalyticsAgent):
         
         if algorithm and parameters:
             try:
-                # Apply insight generation
-                import numpy as np
-                from sklearn import metrics
-                
+                # Apply insight generation in a worker process
                 data = analysis_state.get("data")
                 if data is not None:
+                    result = None
                     if algorithm == "clustering":
-                        from sklearn.cluster import KMeans
-                        n_clusters = parameters.get("n_clusters", 3)
-                        kmeans = KMeans(n_clusters=n_clusters)
-                        clusters = kmeans.fit_predict(data)
-                        silhouette = metrics.silhouette_score(data, clusters)
-                        
-                        # Update analysis state
-                        analysis_state["insights"][model_id] = {
-                            "clusters": clusters.tolist(),
-                            "silhouette": silhouette,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        
+                        result = await self.compute_pool.run(
+                            compute_jobs.cluster,
+                            data,
+                            n_clusters=parameters.get("n_clusters", 3)
+                        )
                     elif algorithm == "anomaly_detection":
-                        from sklearn.ensemble import IsolationForest
-                        contamination = parameters.get("contamination", 0.1)
-                        iso_forest = IsolationForest(contamination=contamination)
-                        anomalies = iso_forest.fit_predict(data)
+                        result = await self.compute_pool.run(
+                            compute_jobs.detect_anomalies,
+                            data,
+                            contamination=parameters.get("contamination", 0.1)
+                        )
                         
-                        # Update analysis state
+                    # Update analysis state
+                    if result is not None:
                         analysis_state["insights"][model_id] = {
-                            "anomalies": anomalies.tolist(),
+                            **result,
                             "timestamp": datetime.now().isoformat()
                         }
                         
@@ -583,33 +583,22 @@ class AnalyticsAgent(TinyTroupeAgent, NovaAnalyticsAgent):
         
         if algorithm:
             try:
-                # Apply trend detection
-                import pandas as pd
-                import numpy as np
-                
-                data = pd.DataFrame(analysis_state.get("data", []))
-                if not data.empty and "timestamp" in data.columns:
-                    if algorithm == "moving_average":
-                        window_size = pd.Timedelta(window)
-                        ma = data.rolling(window=window_size).mean()
-                        
-                        # Update analysis state
-                        analysis_state["trends"][detector_id] = {
-                            "moving_average": ma.to_dict(),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        
-                    elif algorithm == "exponential_smoothing":
-                        from statsmodels.tsa.holtwinters import ExponentialSmoothing
-                        model = ExponentialSmoothing(data)
-                        fitted = model.fit()
-                        
-                        # Update analysis state
-                        analysis_state["trends"][detector_id] = {
-                            "smoothed": fitted.fittedvalues.to_dict(),
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        
+                # Apply trend detection in a worker process
+                data = analysis_state.get("data", [])
+                result = None
+                if algorithm == "moving_average":
+                    result = await self.compute_pool.run(compute_jobs.moving_average, data, window=window)
+                elif algorithm == "exponential_smoothing":
+                    result = await self.compute_pool.run(compute_jobs.exponential_smoothing, data)
+                    
+                # Jobs return None when data has no timestamp column
+                if result is not None:
+                    # Update analysis state
+                    analysis_state["trends"][detector_id] = {
+                        **result,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    
                     # Record reflection if needed
                     if detector.get("needs_review", False):
                         await self.record_reflection(
@@ -11,6 +11,7 @@ from ..tinytroupe_agent import TinyTroupeAgent
 from ...world.environment import NIAWorld
 from ...memory.two_layer import TwoLayerMemorySystem
 from ...core.types.memory_types import AgentResponse
+from ...core.types.json_utils.streaming import extract_json_incremental
 
 logger = logging.getLogger(__name__)
 
@@ -676,6 +677,10 @@ class ParsingAgent(NovaParser, TinyTroupeAgent):
                     if isinstance(parsed, dict):
                         return parsed
                 except json.JSONDecodeError:
+                    # Tolerate prose, fences and common model quirks
+                    parsed = extract_json_incremental(raw_analysis)
+                    if parsed is not None:
+                        return parsed
                     # If JSON parsing fails, create a basic structure
                     return {
                         "response": raw_analysis,
@@ -732,71 +737,11 @@ class ParsingAgent(NovaParser, TinyTroupeAgent):
         if not text:
             return None
             
-        # First try to extract JSON from code block
-        import re
-        json_match = re.search(r'```(?:json)?\n(.*?)\n```', text, re.DOTALL)
-        if json_match:
-            try:
-                json_str = json_match.group(1).strip()
-                # Sometimes the JSON might be indented, so remove any common leading whitespace
-                lines = json_str.splitlines()
-                if len(lines) > 1:
-                    min_indent = min(len(line) - len(line.lstrip()) for line in lines[1:] if line.strip())
-                    json_str = lines[0] + '\n' + '\n'.join(line[min_indent:] for line in lines[1:])
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                logger.warning("Failed to parse JSON from code block")
-                
-        # If no code block or parsing failed, try finding JSON with balanced brackets
-        start = text.find('{')
-        if start == -1:
-            return None
-            
-        # Track bracket balance
-        balance = 0
-        end = -1
-        in_string = False
-        escape_next = False
-        
-        for i in range(start, len(text)):
-            char = text[i]
-            
-            if escape_next:
-                escape_next = False
-                continue
-                
-            if char == '\\':
-                escape_next = True
-                continue
-                
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-                
-            if not in_string:
-                if char == '{':
-                    balance += 1
-                elif char == '}':
-                    balance -= 1
-                    if balance == 0:
-                        end = i + 1
-                        break
-                    
-        if end == -1:
-            return None
-            
-        try:
-            json_block = text[start:end]
-            # Remove any common leading whitespace
-            lines = json_block.splitlines()
-            if len(lines) > 1:
-                min_indent = min(len(line) - len(line.lstrip()) for line in lines[1:] if line.strip())
-                json_block = lines[0] + '\n' + '\n'.join(line[min_indent:] for line in lines[1:])
-            data = json.loads(json_block)
-            return data
-        except json.JSONDecodeError:
-            logger.warning("Loose JSON parse found block but failed to decode")
-            return None
+        # Single pass: skips fences and prose, repairs common quirks
+        data = extract_json_incremental(text)
+        if data is None:
+            logger.warning("Loose JSON parse found no complete object")
+        return data
         
     def _fallback_parse(self, text: str) -> Dict[str, Any]:
         """Create minimal structured output when JSON parsing fails."""
@@ -177,6 +177,40 @@ class TinyTroupeAgent(TinyPerson, MemoryBaseAgent):
             }
             
         return memory_id
+
+    async def store_memories(self, memories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Store many memories in one bulk episodic write.
+        
+        Each entry accepts the same keys as store_memory's arguments.
+        Returns one result per entry with "id", "success" and "error" keys.
+        """
+        episodic_memories = [
+            EpisodicMemory(
+                content=entry.get("content", ""),
+                type=MemoryType.EPISODIC,
+                timestamp=datetime.now().isoformat(),
+                importance=entry.get("importance", 0.5),
+                context=entry.get("context") or {},
+                concepts=entry.get("concepts") or [],
+                relationships=entry.get("relationships") or [],
+                participants=[],
+                metadata={}
+            )
+            for entry in memories
+        ]
+        
+        results = await self.memory_system.episodic.store_memories(episodic_memories)
+        
+        # Update memory references for stored entries
+        for entry, result in zip(memories, results):
+            if result.get("success"):
+                context = entry.get("context") or {}
+                self._configuration["memory_references"][result["id"]] = {
+                    "type": context.get("type", "memory"),
+                    "timestamp": datetime.now().isoformat()
+                }
+                
+        return results
             
     async def process(self, content: Dict[str, Any], metadata: Optional[Dict] = None) -> AgentResponse:
         """Process content through both systems."""
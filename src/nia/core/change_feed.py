@@ -0,0 +1,311 @@
+"""In-process change feed for store writes.
+
+Stores publish a small event after each successful write; subscribers (the
+WebSocket server) receive events through bounded asyncio queues instead of
+polling. With no subscribers and no bridge attached, publishing is a no-op.
+
+For multi-process deployments (Celery workers writing, the API process
+broadcasting), a ``PubSubBridge`` relays events over Redis pub/sub, or over a
+``LocalPubSub`` stand-in with the same interface when Redis is not available.
+"""
+
+import os
+import json
+import uuid
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL = "nia:changes"
+DEFAULT_SUBSCRIPTION_SIZE = 1000
+
+class Subscription:
+    """Bounded event queue for one subscriber.
+
+    When full, the oldest pending event is dropped so a stalled subscriber
+    never blocks publishers.
+    """
+
+    def __init__(self, feed: "ChangeFeed", max_size: int = DEFAULT_SUBSCRIPTION_SIZE):
+        self._feed = feed
+        self._events: Deque[Dict[str, Any]] = deque()
+        self._ready = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self.max_size = max_size
+        self.dropped = 0
+
+    def _put(self, event: Dict[str, Any]):
+        if len(self._events) >= self.max_size:
+            self._events.popleft()
+            self.dropped += 1
+        self._events.append(event)
+        self._ready.set()
+
+    def put(self, event: Dict[str, Any]):
+        """Queue an event; safe to call from any thread."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._put(event)
+        else:
+            self._loop.call_soon_threadsafe(self._put, event)
+
+    async def get(self) -> Dict[str, Any]:
+        """Wait for the next event."""
+        while not self._events:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._events.popleft()
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Take all pending events without waiting."""
+        events = list(self._events)
+        self._events.clear()
+        return events
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        return await self.get()
+
+    def close(self):
+        """Stop receiving events."""
+        self._feed.unsubscribe(self)
+
+class ChangeFeed:
+    """Process-wide publish/subscribe hub for store change events.
+
+    Events are dicts::
+
+        {"store": "vector" | "concept" | "graph", "operation": "upsert" | ...,
+         "ids": [...], "data": {...}, "timestamp": ..., "origin": ...}
+    """
+
+    def __init__(self):
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._subscriptions: Set[Subscription] = set()
+        self._bridge: Optional["PubSubBridge"] = None
+        self.published = 0
+
+    def subscribe(self, max_size: int = DEFAULT_SUBSCRIPTION_SIZE) -> Subscription:
+        """Create a subscription bound to the running event loop."""
+        subscription = Subscription(self, max_size=max_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a subscription."""
+        self._subscriptions.discard(subscription)
+
+    @property
+    def active(self) -> bool:
+        """Whether anyone is listening locally or remotely."""
+        return bool(self._subscriptions) or self._bridge is not None
+
+    def publish(
+        self,
+        store: str,
+        operation: str,
+        ids: Optional[List[str]] = None,
+        **data: Any
+    ):
+        """Publish a change event. Never raises; returns immediately."""
+        if not self.active:
+            return
+        try:
+            event = {
+                "store": store,
+                "operation": operation,
+                "ids": [str(i) for i in ids or []],
+                "data": data,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "origin": self.origin
+            }
+            self.published += 1
+            self._deliver(event)
+            if self._bridge is not None:
+                self._bridge.send(event)
+        except Exception as e:
+            logger.error(f"Failed to publish change event: {str(e)}")
+
+    def _deliver(self, event: Dict[str, Any]):
+        """Hand an event to local subscribers."""
+        for subscription in list(self._subscriptions):
+            subscription.put(event)
+
+    async def attach_bridge(self, bridge: "PubSubBridge"):
+        """Relay events to and from other processes through bridge."""
+        await self.detach_bridge()
+        self._bridge = bridge
+        await bridge.start(self)
+
+    async def detach_bridge(self):
+        """Stop cross-process relaying."""
+        bridge, self._bridge = self._bridge, None
+        if bridge is not None:
+            await bridge.stop()
+
+class LocalPubSub:
+    """In-memory stand-in for the subset of ``redis.asyncio.Redis`` pub/sub
+    the bridge uses. Instances sharing one LocalPubSub see each other's
+    messages, like processes sharing a Redis server.
+    """
+
+    def __init__(self):
+        self._queues: Dict[str, List[asyncio.Queue]] = {}
+
+    async def publish(self, channel: str, message: str) -> int:
+        queues = self._queues.get(channel, [])
+        for queue in queues:
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(queues)
+
+    def pubsub(self) -> "_LocalPubSubConnection":
+        return _LocalPubSubConnection(self)
+
+    async def aclose(self):
+        self._queues.clear()
+
+class _LocalPubSubConnection:
+    def __init__(self, server: LocalPubSub):
+        self._server = server
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._channels: List[str] = []
+
+    async def subscribe(self, *channels: str):
+        for channel in channels:
+            self._server._queues.setdefault(channel, []).append(self._queue)
+            self._channels.append(channel)
+
+    async def listen(self):
+        while True:
+            yield await self._queue.get()
+
+    async def unsubscribe(self, *channels: str):
+        for channel in channels or list(self._channels):
+            queues = self._server._queues.get(channel, [])
+            if self._queue in queues:
+                queues.remove(self._queue)
+
+    async def aclose(self):
+        await self.unsubscribe()
+
+class PubSubBridge:
+    """Relay change events between processes over a pub/sub client.
+
+    ``client`` is a ``redis.asyncio.Redis`` or a ``LocalPubSub``. Events
+    published locally are forwarded to the channel; events from the channel
+    that originated in another process are delivered to local subscribers.
+    """
+
+    def __init__(self, client: Any, channel: str = DEFAULT_CHANNEL):
+        self.client = client
+        self.channel = channel
+        self._feed: Optional[ChangeFeed] = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+
+    @classmethod
+    def from_url(cls, url: str, channel: str = DEFAULT_CHANNEL) -> "PubSubBridge":
+        """Create a bridge backed by Redis at url."""
+        from redis.asyncio import Redis
+        return cls(Redis.from_url(url), channel=channel)
+
+    async def start(self, feed: ChangeFeed):
+        """Subscribe to the channel and start relaying."""
+        self._feed = feed
+        self._pubsub = self.client.pubsub()
+        await self._pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        try:
+            async for message in self._pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    event = json.loads(message["data"])
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Ignoring malformed change event: {str(e)}")
+                    continue
+                if event.get("origin") != self._feed.origin:
+                    self._feed._deliver(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Change feed bridge listener stopped: {str(e)}")
+
+    def send(self, event: Dict[str, Any]):
+        """Forward a local event to the channel without blocking the caller."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("No running loop; change event not relayed")
+            return
+        task = loop.create_task(self._send(event))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _send(self, event: Dict[str, Any]):
+        try:
+            await self.client.publish(self.channel, json.dumps(event, default=str))
+        except Exception as e:
+            logger.error(f"Failed to relay change event: {str(e)}")
+
+    async def stop(self):
+        """Stop relaying and release the subscription."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self._pubsub is not None:
+            # redis<5.0.1 only has close()
+            close = getattr(self._pubsub, "aclose", None) or self._pubsub.close
+            await close()
+            self._pubsub = None
+
+# Process-wide feed
+change_feed = ChangeFeed()
+
+def get_change_feed() -> ChangeFeed:
+    """Get the process-wide change feed."""
+    return change_feed
+
+async def attach_configured_bridge(feed: Optional[ChangeFeed] = None) -> bool:
+    """Attach a Redis bridge if [CHANGE_FEED] redis_url is set in config.ini.
+
+    Returns:
+        bool: True if a bridge is attached
+    """
+    import configparser
+    config = configparser.ConfigParser()
+    config.read("config.ini")
+    url = config.get("CHANGE_FEED", "redis_url", fallback="").strip()
+    if not url:
+        return False
+    feed = feed or change_feed
+    if feed._bridge is not None:
+        return True
+    try:
+        bridge = PubSubBridge.from_url(
+            url, channel=config.get("CHANGE_FEED", "channel", fallback=DEFAULT_CHANNEL)
+        )
+        await feed.attach_bridge(bridge)
+        logger.info(f"Change feed bridged over {url}")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to attach change feed bridge: {str(e)}")
+        return False
@@ -0,0 +1,17 @@
+"""Process-pool offload for CPU-heavy work."""
+
+from .pool import (
+    ComputePool,
+    ComputeError,
+    ComputeTimeoutError,
+    SharedArrayRef,
+    get_compute_pool
+)
+
+__all__ = [
+    'ComputePool',
+    'ComputeError',
+    'ComputeTimeoutError',
+    'SharedArrayRef',
+    'get_compute_pool'
+]
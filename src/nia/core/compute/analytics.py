@@ -0,0 +1,54 @@
+"""Analytics jobs run in compute pool workers.
+
+Each function imports its heavy dependencies when called, so only worker
+processes pay for loading sklearn, pandas or statsmodels. Results are plain
+Python types to keep the return trip cheap.
+"""
+
+from typing import Any, Dict, Optional
+
+def cluster(data: Any, n_clusters: int = 3) -> Dict[str, Any]:
+    """KMeans clustering with silhouette score."""
+    from sklearn import metrics
+    from sklearn.cluster import KMeans
+
+    clusters = KMeans(n_clusters=n_clusters).fit_predict(data)
+    return {
+        "clusters": clusters.tolist(),
+        "silhouette": float(metrics.silhouette_score(data, clusters))
+    }
+
+def detect_anomalies(data: Any, contamination: float = 0.1) -> Dict[str, Any]:
+    """IsolationForest anomaly labels (-1 anomaly, 1 normal)."""
+    from sklearn.ensemble import IsolationForest
+
+    anomalies = IsolationForest(contamination=contamination).fit_predict(data)
+    return {"anomalies": anomalies.tolist()}
+
+def _timestamped_frame(data: Any):
+    """Build a DataFrame, or None if it has no timestamp column."""
+    import pandas as pd
+
+    frame = pd.DataFrame(data if data is not None else [])
+    if frame.empty or "timestamp" not in frame.columns:
+        return None
+    return frame
+
+def moving_average(data: Any, window: str = "1h") -> Optional[Dict[str, Any]]:
+    """Time-window rolling mean; None if data has no timestamp column."""
+    import pandas as pd
+
+    frame = _timestamped_frame(data)
+    if frame is None:
+        return None
+    return {"moving_average": frame.rolling(window=pd.Timedelta(window)).mean().to_dict()}
+
+def exponential_smoothing(data: Any) -> Optional[Dict[str, Any]]:
+    """Holt-Winters fitted values; None if data has no timestamp column."""
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+    frame = _timestamped_frame(data)
+    if frame is None:
+        return None
+    fitted = ExponentialSmoothing(frame).fit()
+    return {"smoothed": fitted.fittedvalues.to_dict()}
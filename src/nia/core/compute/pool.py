@@ -0,0 +1,288 @@
+"""Managed process pool for CPU-heavy work.
+
+Coroutines submit picklable top-level functions with ``await pool.run(...)``
+and the event loop stays responsive while a worker process computes. Jobs
+beyond the worker count wait on an asyncio semaphore, where cancelling them
+is free. A job that is already running cannot be interrupted inside a
+``ProcessPoolExecutor``, so a timeout or cancellation recycles the pool: its
+workers are terminated and the other jobs that were running are resubmitted
+once on fresh workers.
+
+NumPy arrays at or above ``shared_memory_threshold`` bytes are copied once
+into shared memory and attached by the worker instead of being pickled.
+Workers are started with ``spawn`` so they never inherit the parent's event
+loop or connections; heavy libraries are imported inside job functions.
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import weakref
+import multiprocessing
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_JOB_TIMEOUT = 120.0
+DEFAULT_SHARED_MEMORY_THRESHOLD = 1 << 20  # 1 MiB
+
+_DEFAULT = object()
+
+class ComputeError(Exception):
+    """Raised when a compute job cannot be completed by the pool."""
+
+class ComputeTimeoutError(ComputeError):
+    """Raised when a compute job exceeds its timeout."""
+
+@dataclass(frozen=True)
+class SharedArrayRef:
+    """Picklable handle to a NumPy array placed in shared memory."""
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+def _share_array(array: np.ndarray) -> Tuple[SharedArrayRef, shared_memory.SharedMemory]:
+    """Copy an array into a new shared memory block."""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return SharedArrayRef(shm.name, array.shape, array.dtype.str), shm
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block owned by the parent without tracking it here."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    # Before 3.13 attaching registers the block with the resource tracker,
+    # which would unlink it (and warn) when this worker exits
+    from multiprocessing import resource_tracker
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+def _run_job(fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Any:
+    """Worker entry point: resolve shared arrays, run fn, detach."""
+    attached: List[shared_memory.SharedMemory] = []
+
+    def resolve(value):
+        if isinstance(value, SharedArrayRef):
+            shm = _attach(value.name)
+            attached.append(shm)
+            return np.ndarray(value.shape, dtype=np.dtype(value.dtype), buffer=shm.buf)
+        return value
+
+    args = tuple(resolve(arg) for arg in args)
+    kwargs = {key: resolve(value) for key, value in kwargs.items()}
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        del args, kwargs
+        for shm in attached:
+            try:
+                shm.close()
+            except BufferError:
+                # The result still references the block; it is released
+                # when the parent unlinks it and this worker exits
+                pass
+
+def _job_name(fn: Callable) -> str:
+    return f"{getattr(fn, '__module__', '?')}.{getattr(fn, '__qualname__', repr(fn))}"
+
+class ComputePool:
+    """Process pool with job timeouts, cancellation and shared-memory arrays."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        job_timeout: Optional[float] = DEFAULT_JOB_TIMEOUT,
+        shared_memory_threshold: int = DEFAULT_SHARED_MEMORY_THRESHOLD,
+        start_method: str = "spawn"
+    ):
+        """Initialize pool. Worker processes start on first use.
+
+        Args:
+            max_workers: Number of worker processes (and concurrent jobs)
+            job_timeout: Default seconds a job may run, or None for no limit
+            shared_memory_threshold: Array size in bytes from which NumPy
+                arguments go through shared memory
+            start_method: multiprocessing start method for workers
+        """
+        self.max_workers = max_workers
+        self.job_timeout = job_timeout
+        self.shared_memory_threshold = shared_memory_threshold
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._generation = 0
+        # Semaphores are bound to an event loop; keep one per loop
+        self._slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.recycles = 0
+        self.shared_bytes = 0
+        self._run_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.start_method)
+            )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self.max_workers)
+        return slots
+
+    def _recycle(self, reason: str):
+        """Terminate all workers; the next job starts a fresh executor."""
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        self._generation += 1
+        self.recycles += 1
+        logger.warning(f"Recycling compute pool: {reason}")
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _share_args(
+        self,
+        args: Tuple,
+        kwargs: Dict[str, Any],
+        blocks: List[shared_memory.SharedMemory]
+    ) -> Tuple[Tuple, Dict[str, Any]]:
+        """Replace large NumPy arguments with shared memory handles."""
+        def share(value):
+            if (
+                isinstance(value, np.ndarray)
+                and not value.dtype.hasobject
+                and value.nbytes >= self.shared_memory_threshold
+            ):
+                ref, shm = _share_array(value)
+                blocks.append(shm)
+                self.shared_bytes += value.nbytes
+                return ref
+            return value
+
+        return tuple(share(arg) for arg in args), {key: share(value) for key, value in kwargs.items()}
+
+    async def run(self, fn: Callable, *args, timeout: Any = _DEFAULT, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) in a worker process.
+
+        Args:
+            fn: Picklable top-level function
+            timeout: Seconds the job may run once started; defaults to
+                job_timeout, None for no limit
+
+        Returns:
+            Any: The function's return value
+
+        Raises:
+            ComputeTimeoutError: If the job ran longer than timeout
+            ComputeError: If the worker died while running the job
+            Exception: Whatever fn raised, re-raised in the caller
+        """
+        timeout = self.job_timeout if timeout is _DEFAULT else timeout
+        name = _job_name(fn)
+        blocks: List[shared_memory.SharedMemory] = []
+        self.submitted += 1
+        try:
+            args, kwargs = self._share_args(args, kwargs, blocks)
+            async with self._get_slots():
+                return await self._run_in_worker(name, fn, args, kwargs, timeout)
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+    async def _run_in_worker(
+        self,
+        name: str,
+        fn: Callable,
+        args: Tuple,
+        kwargs: Dict[str, Any],
+        timeout: Optional[float]
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            generation = self._generation
+            start = time.perf_counter()
+            future = loop.run_in_executor(self._get_executor(), _run_job, fn, args, kwargs)
+            try:
+                result = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                self._recycle(f"{name} exceeded {timeout}s")
+                raise ComputeTimeoutError(f"Compute job {name} exceeded {timeout}s") from None
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                self._recycle(f"{name} cancelled")
+                raise
+            except BrokenProcessPool as e:
+                if generation != self._generation and attempt == 0:
+                    # Another job's timeout recycled the pool under us
+                    logger.debug(f"Resubmitting {name} after pool recycle")
+                    continue
+                self.failed += 1
+                self._recycle(f"worker died running {name}")
+                raise ComputeError(f"Worker died running compute job {name}") from e
+            except Exception:
+                self.failed += 1
+                raise
+            self.completed += 1
+            self._run_seconds += time.perf_counter() - start
+            return result
+        raise ComputeError(f"Compute job {name} was interrupted twice by pool recycles")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get job counters and mean run time."""
+        return {
+            "max_workers": self.max_workers,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "recycles": self.recycles,
+            "shared_bytes": self.shared_bytes,
+            "avg_run_ms": self._run_seconds / self.completed * 1000 if self.completed else 0.0
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop worker processes; the pool restarts them on next use."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+_compute_pool: Optional[ComputePool] = None
+
+def get_compute_pool() -> ComputePool:
+    """Get the process-wide pool, configured from [COMPUTE] in config.ini."""
+    global _compute_pool
+    if _compute_pool is None:
+        import configparser
+        config = configparser.ConfigParser()
+        config.read("config.ini")
+        timeout = config.getfloat("COMPUTE", "job_timeout", fallback=DEFAULT_JOB_TIMEOUT)
+        _compute_pool = ComputePool(
+            max_workers=config.getint("COMPUTE", "max_workers", fallback=DEFAULT_MAX_WORKERS),
+            job_timeout=timeout or None,
+            shared_memory_threshold=config.getint(
+                "COMPUTE", "shared_memory_threshold", fallback=DEFAULT_SHARED_MEMORY_THRESHOLD
+            )
+        )
+    return _compute_pool
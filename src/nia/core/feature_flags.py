@@ -1,8 +1,21 @@
-"""Feature flags implementation."""
+"""Feature flags implementation.
 
-from typing import Optional
+Flags live in Redis under ``debug:<name>`` and are mirrored into an
+in-process snapshot, so checking a flag is a dict lookup that never awaits.
+Writes through ``FeatureFlags`` update Redis and announce the change on a
+pub/sub channel. ``start`` keeps the snapshot current from that channel and
+from Redis keyspace notifications (when the server has them enabled), and
+polls Redis as a fallback for anything missed.
+"""
+
+import json
+import asyncio
+import logging
+from typing import Any, Dict, Optional
 from redis.asyncio import Redis
 
+logger = logging.getLogger(__name__)
+
 # Debug flags
 DEBUG_FLAGS = {
     'log_validation': 'debug:log_validation',     # Log all validation attempts
@@ -11,28 +24,162 @@ DEBUG_FLAGS = {
     'strict_mode': 'debug:strict_mode'            # Throw on any validation error
 }
 
+DEFAULT_CHANNEL = "flags:changes"
+DEFAULT_POLL_INTERVAL = 30.0
+DEFAULT_REDIS_URL = "redis://localhost:6379/0"
+
+def _decode(value: Any) -> Optional[str]:
+    return value.decode() if isinstance(value, bytes) else value
+
 class FeatureFlags:
-    """Feature flags manager using Redis."""
-    def __init__(self, redis_client: Redis):
+    """Feature flags manager using Redis with a local snapshot."""
+    def __init__(
+        self,
+        redis_client: Redis,
+        poll_interval: Optional[float] = DEFAULT_POLL_INTERVAL,
+        channel: str = DEFAULT_CHANNEL
+    ):
         self.redis = redis_client
         self.prefix = "debug:"
-        
+        self.channel = channel
+        self.poll_interval = poll_interval
+        self._flags: Dict[str, bool] = {}
+        self._loaded = False
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._poller: Optional[asyncio.Task] = None
+        self.refreshes = 0
+        self.notifications = 0
+
+    def is_enabled(self, flag_name: str) -> bool:
+        """Check a flag against the local snapshot. Never touches Redis."""
+        return self._flags.get(flag_name, False)
+
+    def snapshot(self) -> Dict[str, bool]:
+        """Get a copy of all known flags."""
+        return dict(self._flags)
+
+    async def refresh(self):
+        """Reload every flag from Redis and swap in the new snapshot."""
+        keys = [key async for key in self.redis.scan_iter(match=f"{self.prefix}*")]
+        flags = {}
+        if keys:
+            values = await self.redis.mget(keys)
+            for key, value in zip(keys, values):
+                flags[_decode(key)[len(self.prefix):]] = _decode(value) == "true"
+        self._flags = flags
+        self._loaded = True
+        self.refreshes += 1
+
+    async def set_debug(self, flag_name: str, enabled: bool):
+        """Set a debug flag and announce the change to other processes."""
+        key = f"{self.prefix}{flag_name}"
+        await self.redis.set(key, "true" if enabled else "false")
+        self._flags[flag_name] = enabled
+        await self.redis.publish(self.channel, json.dumps({"flag": flag_name, "enabled": enabled}))
+
     async def enable_debug(self, flag_name: str):
         """Enable debug flag."""
-        key = f"{self.prefix}{flag_name}"
-        await self.redis.set(key, "true")
-        
+        await self.set_debug(flag_name, True)
+
+    async def disable_debug(self, flag_name: str):
+        """Disable debug flag."""
+        await self.set_debug(flag_name, False)
+
     async def is_debug_enabled(self, flag_name: str) -> bool:
-        """Check if debug flag is enabled."""
-        key = f"{self.prefix}{flag_name}"
-        return await self.redis.get(key) == b"true"
+        """Check if debug flag is enabled, loading the snapshot on first use."""
+        if not self._loaded:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Could not load feature flags: {str(e)}")
+        return self.is_enabled(flag_name)
+
+    async def start(self):
+        """Load the snapshot and keep it in sync until stop()."""
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"Could not load feature flags: {str(e)}")
+        try:
+            self._pubsub = self.redis.pubsub()
+            await self._pubsub.subscribe(self.channel)
+            await self._pubsub.psubscribe(f"__keyspace@*__:{self.prefix}*")
+            self._listener = asyncio.create_task(self._listen())
+        except Exception as e:
+            self._pubsub = None
+            logger.warning(f"Feature flag notifications unavailable, polling only: {str(e)}")
+        if self.poll_interval:
+            self._poller = asyncio.create_task(self._poll())
+
+    async def _listen(self):
+        try:
+            async for message in self._pubsub.listen():
+                try:
+                    if message.get("type") == "message":
+                        update = json.loads(_decode(message["data"]))
+                        self._flags[update["flag"]] = bool(update["enabled"])
+                    elif message.get("type") == "pmessage":
+                        # Channel is __keyspace@<db>__:<key>, data the command
+                        key = _decode(message["channel"]).split(":", 1)[1]
+                        flag = key[len(self.prefix):]
+                        if _decode(message["data"]) in ("del", "expired", "evicted"):
+                            self._flags[flag] = False
+                        else:
+                            self._flags[flag] = _decode(await self.redis.get(key)) == "true"
+                    else:
+                        continue
+                    self.notifications += 1
+                except Exception as e:
+                    logger.warning(f"Ignoring malformed flag notification: {str(e)}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Feature flag listener stopped, polling only: {str(e)}")
+
+    async def _poll(self):
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.debug(f"Feature flag poll failed: {str(e)}")
+
+    async def stop(self):
+        """Stop syncing; the last snapshot stays readable."""
+        for task in (self._listener, self._poller):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._listener = self._poller = None
+        if self._pubsub is not None:
+            # redis<5.0.1 only has close()
+            close = getattr(self._pubsub, "aclose", None) or self._pubsub.close
+            await close()
+            self._pubsub = None
 
 _feature_flags: Optional[FeatureFlags] = None
 
+def debug_enabled(flag_name: str) -> bool:
+    """Synchronous flag check for hot paths; False until flags are created."""
+    return _feature_flags is not None and _feature_flags.is_enabled(flag_name)
+
 async def get_feature_flags() -> FeatureFlags:
-    """Get or create feature flags instance."""
+    """Get or create feature flags instance, configured from [FEATURE_FLAGS]."""
     global _feature_flags
     if _feature_flags is None:
-        redis_client = Redis(host='localhost', port=6379, db=0)
-        _feature_flags = FeatureFlags(redis_client)
+        import configparser
+        config = configparser.ConfigParser()
+        config.read("config.ini")
+        redis_client = Redis.from_url(
+            config.get("FEATURE_FLAGS", "redis_url", fallback=DEFAULT_REDIS_URL).strip() or DEFAULT_REDIS_URL
+        )
+        _feature_flags = FeatureFlags(
+            redis_client,
+            poll_interval=config.getfloat("FEATURE_FLAGS", "poll_interval", fallback=DEFAULT_POLL_INTERVAL)
+        )
+        await _feature_flags.start()
     return _feature_flags
@@ -0,0 +1,279 @@
+"""Sampled, rate-limited logging for hot paths.
+
+Per-call logs on the request path (vector upserts and searches, Neo4j
+queries, WebSocket messages) go through a ``HotPathLogger``. A call that
+will not be emitted costs a level check: arguments are %-formatted only when
+a handler formats the record, and ``Lazy`` defers expensive previews such as
+vector heads or payload dumps. Every call names its site. Below WARNING a
+site is sampled, and below ERROR it is rate-limited by a token bucket; the
+number of records a site dropped is attached to the next one it emits, with
+any structured fields, as ``record.suppressed`` and ``record.fields``.
+
+The active ``LogProfile`` comes from ``[LOGGING] profile`` in config.ini.
+``development`` leaves logger levels alone and keeps every record.
+``production`` raises hot loggers to INFO, samples 1% of INFO records,
+rate-limits each site to one record a second and moves handler I/O onto a
+``QueueListener`` thread, so a log call never formats a record or blocks
+on a file or stream; records are dropped, and counted, when the queue is
+full.
+"""
+
+import atexit
+import queue
+import random
+import time
+import logging
+import threading
+from dataclasses import dataclass, replace
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "development"
+DEFAULT_QUEUE_SIZE = 10000
+
+@dataclass(frozen=True)
+class LogProfile:
+    """How hot-path loggers filter and deliver records."""
+    name: str
+    level: int
+    sample_rate: float = 1.0
+    rate_per_second: Optional[float] = None
+    burst: int = 10
+    queued: bool = False
+    queue_size: int = DEFAULT_QUEUE_SIZE
+
+PROFILES: Dict[str, LogProfile] = {
+    "development": LogProfile("development", logging.NOTSET),
+    "production": LogProfile(
+        "production",
+        logging.INFO,
+        sample_rate=0.01,
+        rate_per_second=1.0,
+        burst=10,
+        queued=True
+    )
+}
+
+class Lazy:
+    """Log argument that calls ``func(*args)`` only when formatted."""
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any):
+        self.func = func
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.func(*self.args))
+
+    __repr__ = __str__
+
+def _head(values: Any, count: int) -> List[Any]:
+    return [round(float(v), 4) for v in values[:count]]
+
+def head(values: Any, count: int = 5) -> Lazy:
+    """Lazily preview the first values of a vector."""
+    return Lazy(_head, values, count)
+
+class _Site:
+    """Token bucket and drop count for one call site."""
+
+    __slots__ = ("tokens", "updated", "suppressed")
+
+    def __init__(self, burst: int):
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.suppressed = 0
+
+    def take(self, rate: float, burst: int) -> bool:
+        now = time.monotonic()
+        self.tokens = min(float(burst), self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when full.
+
+    Records are queued unformatted; the listener's handlers format them on
+    its thread, so the logging call pays for neither formatting nor ``Lazy``.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _stats["dropped"] += 1
+
+_profile: Optional[LogProfile] = None
+_hot_loggers: Dict[str, "HotPathLogger"] = {}
+_installed: Dict[str, Tuple[List[logging.Handler], QueueListener]] = {}
+_lock = threading.Lock()
+_stats: Dict[str, int] = {"sampled_out": 0, "rate_limited": 0, "dropped": 0}
+
+class HotPathLogger:
+    """Logger wrapper for per-call logging on hot paths."""
+
+    def __init__(self, name: str):
+        self.logger = logging.getLogger(name)
+        self._default_level = self.logger.level
+        self._sites: Dict[str, _Site] = {}
+
+    def isEnabledFor(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
+    def _log(self, level: int, site: str, msg: str, args: Tuple[Any, ...], fields: Dict[str, Any]):
+        profile = _profile or _load_profile()
+        if not self.logger.isEnabledFor(level):
+            return
+        state = self._sites.get(site)
+        if state is None:
+            state = self._sites[site] = _Site(profile.burst)
+        if level < logging.WARNING and profile.sample_rate < 1.0 and random.random() >= profile.sample_rate:
+            state.suppressed += 1
+            _stats["sampled_out"] += 1
+            return
+        if profile.rate_per_second and level < logging.ERROR and not state.take(profile.rate_per_second, profile.burst):
+            state.suppressed += 1
+            _stats["rate_limited"] += 1
+            return
+        suppressed, state.suppressed = state.suppressed, 0
+        self.logger.log(
+            level, msg, *args,
+            extra={"site": site, "fields": fields, "suppressed": suppressed},
+            stacklevel=3
+        )
+
+    def debug(self, site: str, msg: str, *args: Any, **fields: Any):
+        self._log(logging.DEBUG, site, msg, args, fields)
+
+    def info(self, site: str, msg: str, *args: Any, **fields: Any):
+        self._log(logging.INFO, site, msg, args, fields)
+
+    def warning(self, site: str, msg: str, *args: Any, **fields: Any):
+        self._log(logging.WARNING, site, msg, args, fields)
+
+    def error(self, site: str, msg: str, *args: Any, **fields: Any):
+        self._log(logging.ERROR, site, msg, args, fields)
+
+    def _apply(self, profile: LogProfile):
+        # A profile only ever raises a logger above its own level
+        self.logger.setLevel(max(profile.level, self._default_level))
+        self._sites.clear()
+
+def record_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    """Structured fields a hot-path call attached to a record, if any."""
+    fields = dict(getattr(record, "fields", None) or {})
+    if hasattr(record, "site"):
+        fields["site"] = record.site
+    if getattr(record, "suppressed", 0):
+        fields["suppressed"] = record.suppressed
+    return fields
+
+def _read_profile(name: Optional[str] = None) -> LogProfile:
+    """Build a profile from [LOGGING], with name overriding the configured one."""
+    import configparser
+    config = configparser.ConfigParser()
+    config.read("config.ini")
+    name = name or config.get("LOGGING", "profile", fallback=DEFAULT_PROFILE).strip() or DEFAULT_PROFILE
+    if name not in PROFILES:
+        raise ValueError(f"Unknown logging profile: {name}")
+    profile = PROFILES[name]
+    if name != "production":
+        return profile
+    # Tuning in [LOGGING] applies to the production profile
+    rate = config.getfloat("LOGGING", "rate_per_second", fallback=profile.rate_per_second)
+    return replace(
+        profile,
+        sample_rate=config.getfloat("LOGGING", "sample_rate", fallback=profile.sample_rate),
+        rate_per_second=rate or None,
+        burst=config.getint("LOGGING", "burst", fallback=profile.burst),
+        queue_size=config.getint("LOGGING", "queue_size", fallback=profile.queue_size)
+    )
+
+def _load_profile() -> LogProfile:
+    with _lock:
+        if _profile is None:
+            _activate(_read_profile())
+    return _profile
+
+def _queue_handlers(target: logging.Logger, profile: LogProfile):
+    """Move a logger's handlers behind a queue drained by a listener thread."""
+    key = target.name
+    if key in _installed or not target.handlers:
+        return
+    handlers = list(target.handlers)
+    records: queue.Queue = queue.Queue(maxsize=profile.queue_size)
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        target.removeHandler(handler)
+    target.addHandler(_DroppingQueueHandler(records))
+    listener.start()
+    _installed[key] = (handlers, listener)
+
+def _restore_handlers():
+    """Stop queue listeners, flushing them, and put the original handlers back."""
+    for key, (handlers, listener) in list(_installed.items()):
+        target = logging.getLogger() if key == "root" else logging.getLogger(key)
+        listener.stop()
+        for handler in list(target.handlers):
+            if isinstance(handler, _DroppingQueueHandler):
+                target.removeHandler(handler)
+        for handler in handlers:
+            target.addHandler(handler)
+        del _installed[key]
+
+def _activate(profile: LogProfile):
+    global _profile
+    _restore_handlers()
+    _profile = profile
+    for hot in _hot_loggers.values():
+        hot._apply(profile)
+    if profile.queued:
+        _queue_handlers(logging.getLogger(), profile)
+        for hot in _hot_loggers.values():
+            _queue_handlers(hot.logger, profile)
+
+def configure_hot_path_logging(profile: Union[str, LogProfile, None] = None) -> LogProfile:
+    """Activate a logging profile, by default the one in [LOGGING].
+
+    Args:
+        profile: Profile name ("development" or "production") or a LogProfile
+
+    Returns:
+        LogProfile: The active profile
+    """
+    resolved = profile if isinstance(profile, LogProfile) else _read_profile(profile)
+    with _lock:
+        _activate(resolved)
+    logger.info(f"Hot-path logging profile: {resolved.name}")
+    return resolved
+
+def get_hot_logger(name: str) -> HotPathLogger:
+    """Get the hot-path logger for a module, applying the active profile."""
+    with _lock:
+        hot = _hot_loggers.get(name)
+        if hot is None:
+            hot = _hot_loggers[name] = HotPathLogger(name)
+            if _profile is not None:
+                hot._apply(_profile)
+                if _profile.queued:
+                    _queue_handlers(hot.logger, _profile)
+    return hot
+
+def hot_path_stats() -> Dict[str, Any]:
+    """Counts of records sampled out, rate-limited and dropped."""
+    return {
+        "profile": _profile.name if _profile else None,
+        "queued": sorted(_installed),
+        **_stats
+    }
+
+atexit.register(_restore_handlers)
@@ -0,0 +1,371 @@
+"""Long-lived gateway to an OpenAI-compatible LLM server (LM Studio).
+
+One gateway per server keeps a pooled HTTP session, caches model discovery
+for a TTL, tracks server health in a background task and reuses compiled
+schema guides, so a chat turn costs a single completion request.
+"""
+
+import json
+import time
+import asyncio
+import logging
+import aiohttp
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 8
+DEFAULT_MODELS_TTL = 60.0
+DEFAULT_HEALTH_INTERVAL = 30.0
+DEFAULT_TIMEOUT = 30.0
+
+class LLMGatewayError(Exception):
+    """Raised when the LLM server cannot serve a request."""
+
+@dataclass
+class RequestTiming:
+    """Phase timings for one completion request, in milliseconds.
+
+    queue_ms is time spent waiting for a free pooled connection, connect_ms
+    time spent opening a new one (0 when a connection was reused).
+    """
+    queue_ms: float = 0.0
+    connect_ms: float = 0.0
+    ttft_ms: float = 0.0
+    total_ms: float = 0.0
+    reused_connection: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+def _compile_guide(schema: Dict[str, Any]) -> Optional[Any]:
+    """Compile an outlines guide for schema, or None if outlines is missing."""
+    try:
+        import outlines
+    except ImportError:
+        logger.warning("outlines not installed; structured output guides disabled")
+        return None
+    return outlines.Guide(schema)
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+class LLMGateway:
+    """Pooled, health-tracked client for one OpenAI-compatible server."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str = "lm-studio",
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        models_ttl: float = DEFAULT_MODELS_TTL,
+        health_interval: float = DEFAULT_HEALTH_INTERVAL,
+        timeout: float = DEFAULT_TIMEOUT,
+        guide_factory: Callable[[Dict[str, Any]], Optional[Any]] = _compile_guide
+    ):
+        """Initialize gateway.
+
+        Args:
+            base_url: Server base URL including /v1
+            api_key: API key sent as bearer token (LM Studio accepts any)
+            max_connections: Size of the HTTP connection pool
+            models_ttl: Seconds a discovered model list stays valid
+            health_interval: Seconds between background health checks
+            timeout: Per-request timeout in seconds
+            guide_factory: Compiles a schema into a guide; called once per schema
+        """
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.max_connections = max_connections
+        self.models_ttl = models_ttl
+        self.health_interval = health_interval
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._guide_factory = guide_factory
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._models: List[str] = []
+        self._models_fetched_at = 0.0
+        self._models_lock: Optional[asyncio.Lock] = None
+        self._guides: Dict[str, Optional[Any]] = {}
+        self._health_task: Optional[asyncio.Task] = None
+
+        self.healthy: Optional[bool] = None  # None until the first check
+        self.last_health_check = 0.0
+        self.requests = 0
+        self.errors = 0
+        self._timings: Deque[RequestTiming] = deque(maxlen=1000)
+
+    # Session
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """Record pool queueing and connection setup per request."""
+        trace = aiohttp.TraceConfig()
+
+        async def queued_start(session, ctx, params):
+            ctx.queued_at = time.perf_counter()
+
+        async def queued_end(session, ctx, params):
+            timing = ctx.trace_request_ctx
+            if timing is not None:
+                timing.queue_ms += (time.perf_counter() - ctx.queued_at) * 1000
+
+        async def create_start(session, ctx, params):
+            ctx.connect_at = time.perf_counter()
+
+        async def create_end(session, ctx, params):
+            timing = ctx.trace_request_ctx
+            if timing is not None:
+                timing.connect_ms += (time.perf_counter() - ctx.connect_at) * 1000
+
+        async def reuse(session, ctx, params):
+            timing = ctx.trace_request_ctx
+            if timing is not None:
+                timing.reused_connection = True
+
+        trace.on_connection_queued_start.append(queued_start)
+        trace.on_connection_queued_end.append(queued_end)
+        trace.on_connection_create_start.append(create_start)
+        trace.on_connection_create_end.append(create_end)
+        trace.on_connection_reuseconn.append(reuse)
+        return trace
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session, recreating it if its loop has changed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None and not self._session.closed:
+                await self._close_stale_session(self._session, self._session_loop)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=self.timeout,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                trace_configs=[self._trace_config()]
+            )
+            self._session_loop = loop
+            self._models_lock = asyncio.Lock()
+        return self._session
+
+    async def _close_stale_session(self, session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]):
+        """Close a session left behind on another event loop."""
+        try:
+            if loop is not None and loop.is_running():
+                # Its connections belong to that loop; close them there
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            else:
+                await session.close()
+        except Exception as e:
+            logger.debug(f"Failed to close stale LLM session: {str(e)}")
+
+    # Models and health
+
+    async def _fetch_models(self) -> List[str]:
+        session = await self._ensure_session()
+        async with session.get(f"{self.base_url}/models") as response:
+            if response.status != 200:
+                raise LLMGatewayError(f"Model listing failed with status {response.status}")
+            payload = await response.json()
+        models = [m["id"] for m in payload.get("data", []) if m.get("id")]
+        if not models:
+            raise LLMGatewayError("No models available")
+        self._models = models
+        self._models_fetched_at = time.monotonic()
+        return models
+
+    async def get_models(self, refresh: bool = False) -> List[str]:
+        """Get available model ids, cached for models_ttl seconds."""
+        if not refresh and self._models and time.monotonic() - self._models_fetched_at < self.models_ttl:
+            return self._models
+        await self._ensure_session()
+        async with self._models_lock:
+            # Another caller may have refreshed while we waited
+            if not refresh and self._models and time.monotonic() - self._models_fetched_at < self.models_ttl:
+                return self._models
+            return await self._fetch_models()
+
+    async def get_model_id(self) -> str:
+        """Get the model used for chat completions (first listed)."""
+        return (await self.get_models())[0]
+
+    async def check_health(self) -> bool:
+        """Check the server once, refreshing the model cache."""
+        try:
+            await self.get_models(refresh=True)
+            self.healthy = True
+        except Exception as e:
+            if self.healthy is not False:
+                logger.warning(f"LLM server at {self.base_url} unavailable: {str(e)}")
+            self.healthy = False
+        self.last_health_check = time.monotonic()
+        return self.healthy
+
+    async def _health_loop(self):
+        try:
+            while True:
+                # Requests update health as they go; probe between them
+                await asyncio.sleep(self.health_interval)
+                await self.check_health()
+        except asyncio.CancelledError:
+            pass
+
+    def start(self):
+        """Start background health tracking on the running loop."""
+        task = self._health_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def initialize(self) -> bool:
+        """Check the server once, then start background health tracking.
+
+        Returns:
+            bool: Whether the server is healthy
+        """
+        healthy = await self.check_health()
+        self.start()
+        return healthy
+
+    async def recheck(self) -> bool:
+        """Make sure health tracking runs, probing now if the last check is stale.
+
+        Callers refusing requests because the server is unavailable use this,
+        so recovery does not depend on a health task whose loop has ended.
+
+        Returns:
+            bool: Whether requests should be attempted
+        """
+        self.start()
+        if time.monotonic() - self.last_health_check >= self.health_interval:
+            await self.check_health()
+        return self.available
+
+    @property
+    def available(self) -> bool:
+        """Whether requests should be attempted (healthy or not yet known)."""
+        return self.healthy is not False
+
+    # Guides
+
+    def get_guide(self, schema: Dict[str, Any]) -> Optional[Any]:
+        """Get the compiled guide for schema, compiling it on first use."""
+        key = json.dumps(schema, sort_keys=True, default=str)
+        if key not in self._guides:
+            try:
+                self._guides[key] = self._guide_factory(schema)
+            except Exception as e:
+                logger.error(f"Failed to compile schema guide: {str(e)}")
+                self._guides[key] = None
+        return self._guides[key]
+
+    # Completions
+
+    async def complete(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        **params: Any
+    ) -> Tuple[str, RequestTiming]:
+        """Run a chat completion over a pooled connection.
+
+        The completion is streamed so time-to-first-token can be measured;
+        servers that ignore stream and answer with plain JSON are handled too.
+
+        Returns:
+            Tuple[str, RequestTiming]: Completion text and phase timings
+        """
+        self.start()
+        timing = RequestTiming()
+        started = time.perf_counter()
+        self.requests += 1
+        try:
+            payload = {
+                "model": model or await self.get_model_id(),
+                "messages": messages,
+                "stream": True,
+                **params
+            }
+            session = await self._ensure_session()
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                json=payload,
+                trace_request_ctx=timing
+            ) as response:
+                if response.status != 200:
+                    error = await response.text()
+                    raise LLMGatewayError(f"Completion failed with status {response.status}: {error}")
+
+                if response.content_type != "text/event-stream":
+                    body = await response.json()
+                    timing.ttft_ms = (time.perf_counter() - started) * 1000
+                    content = body["choices"][0]["message"]["content"] or ""
+                else:
+                    parts = []
+                    async for line in response.content:
+                        line = line.strip()
+                        if not line.startswith(b"data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == b"[DONE]":
+                            break
+                        delta = json.loads(data)["choices"][0].get("delta", {}).get("content")
+                        if delta:
+                            if not parts:
+                                timing.ttft_ms = (time.perf_counter() - started) * 1000
+                            parts.append(delta)
+                    content = "".join(parts)
+
+            self.healthy = True
+            return content, timing
+        except aiohttp.ClientConnectionError as e:
+            self.errors += 1
+            self.healthy = False
+            raise LLMGatewayError(f"Failed to connect to {self.base_url}: {str(e)}") from e
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            timing.total_ms = (time.perf_counter() - started) * 1000
+            self._timings.append(timing)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get request counts and per-phase latency summaries."""
+        metrics: Dict[str, Any] = {
+            "requests": self.requests,
+            "errors": self.errors,
+            "healthy": self.healthy,
+            "models": list(self._models),
+            "guides": len(self._guides)
+        }
+        timings = list(self._timings)
+        if timings:
+            metrics["reused_connections"] = sum(t.reused_connection for t in timings)
+            for phase in ("queue_ms", "connect_ms", "ttft_ms", "total_ms"):
+                values = [getattr(t, phase) for t in timings]
+                metrics[phase] = {
+                    "avg": sum(values) / len(values),
+                    "p50": _percentile(values, 0.5),
+                    "p95": _percentile(values, 0.95)
+                }
+        return metrics
+
+    async def close(self):
+        """Stop health tracking and close pooled connections."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+            self._health_task = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+# One gateway per server, shared by every LLMInterface in the process
+_gateways: Dict[str, LLMGateway] = {}
+
+def get_gateway(base_url: str, **kwargs: Any) -> LLMGateway:
+    """Get the shared gateway for base_url, creating it on first use."""
+    key = base_url.rstrip("/")
+    if key not in _gateways:
+        _gateways[key] = LLMGateway(key, **kwargs)
+    return _gateways[key]
@@ -7,6 +7,7 @@ import asyncio
 from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from datetime import datetime
 from ..types.memory_types import AgentResponse
+from .llm_gateway import LLMGateway, get_gateway
 
 if TYPE_CHECKING:
     from nia.nova.core.parsing import NovaParser
@@ -38,6 +39,11 @@ class LLMInterface:
         self.logger.addHandler(handler)
         self.logger.setLevel(logging.DEBUG)
         
+    @property
+    def gateway(self) -> LLMGateway:
+        """Shared pooled gateway for base_url."""
+        return get_gateway(self.base_url)
+        
     async def initialize(self) -> None:
         """Initialize LLM interface with retries."""
         if self._initialized:
@@ -75,41 +81,22 @@ class LLMInterface:
         
     async def check_lmstudio(self, retry: bool = False) -> bool:
         """Check if LMStudio is running and get available models."""
-        from openai import AsyncOpenAI
         try:
-            # Initialize OpenAI client for LMStudio
-            client = AsyncOpenAI(
-                base_url=self.base_url,
-                api_key="lm-studio"  # LMStudio accepts any non-empty string
-            )
-            
             retry_count = 0
             max_retries = 5 if retry else 1
             
             while retry_count < max_retries:
-                try:
-                    # Check models endpoint
-                    models = await client.models.list()
-                    if not models.data:
-                        raise Exception("No models available")
-                    
-                    # Test chat completions endpoint
-                    test_completion = await client.chat.completions.create(
-                        model=models.data[0].id,
-                        messages=[{"role": "user", "content": "test"}],
-                        max_tokens=1,
-                        temperature=0.7
-                    )
-                    
-                    return bool(test_completion.choices)
-                    
-                except Exception as e:
-                    retry_count += 1
-                    if retry_count == max_retries:
-                        self.logger.warning(f"LMStudio check failed after {max_retries} retries: {str(e)}")
-                        return False
-                    self.logger.warning(f"LMStudio check attempt {retry_count} failed: {str(e)}")
-                    await asyncio.sleep(1)
+                # Health check lists models (refreshing the gateway's cache)
+                # without spending a completion, then tracks health in the background
+                if await self.gateway.initialize():
+                    return True
+                
+                retry_count += 1
+                if retry_count == max_retries:
+                    self.logger.warning(f"LMStudio check failed after {max_retries} retries")
+                    return False
+                self.logger.warning(f"LMStudio check attempt {retry_count} failed")
+                await asyncio.sleep(1)
             
             return False
             
@@ -203,19 +190,14 @@ class LLMInterface:
         
     async def _make_llm_request(self, messages: List[Dict[str, str]]) -> str:
         """Make request to LMStudio API."""
-        from openai import AsyncOpenAI
-        import outlines
         from .schema import response_schema
         
         try:
-            # Initialize OpenAI client for LMStudio
-            client = AsyncOpenAI(
-                base_url=self.base_url,
-                api_key="lm-studio"  # LMStudio accepts any non-empty string
-            )
+            gateway = self.gateway
             
-            # First verify LMStudio is running
-            if not await self.check_lmstudio():
+            # Health is tracked in the background and by earlier requests;
+            # an unavailable server is re-probed once the last check is stale
+            if not gateway.available and not await gateway.recheck():
                 logger.warning("LMStudio is not running or not accessible")
                 return json.dumps({
                     "response": "I apologize, but I'm currently unable to process messages. Please ensure LMStudio is running and try again.",
@@ -238,38 +220,35 @@ class LLMInterface:
                     "reasoning": ["Connection check failed"]
                 })
             
-            # Get available models
-            models = await client.models.list()
-            if not models.data:
-                raise Exception("No models available in LMStudio")
-            
-            # Use first available model for chat completions
-            model_id = models.data[0].id
+            # Use first available model for chat completions (cached)
+            model_id = await gateway.get_model_id()
             
-            # Create outlines guide with our schema
-            guide = outlines.Guide(response_schema)
+            # Schema guide is compiled once per process
+            guide = gateway.get_guide(response_schema)
             
-            # Make completion request using outlines
+            # Make completion request over the pooled session
             async def get_completion():
-                completion = await client.chat.completions.create(
+                content, timing = await gateway.complete(
+                    messages,
                     model=model_id,
-                    messages=messages,
                     temperature=0.7,
-                    max_tokens=10000,  # Increased token limit
-                    timeout=30.0  # Added timeout for longer responses
+                    max_tokens=10000  # Increased token limit
                 )
-                return completion.choices[0].message.content
+                self.logger.debug(f"LLM request timing: {timing.to_dict()}")
+                return content
                 
             # Use outlines to get structured output
-            try:
-                result = guide.run(get_completion)
-                self.logger.debug(f"Structured Output: {result}")
-                return json.dumps(result)
-            except Exception as e:
-                self.logger.error(f"Error using outlines: {str(e)}")
-                # Fallback to basic parsing if outlines fails
-                completion = await get_completion()
-                content = completion.strip()
+            if guide is not None:
+                try:
+                    result = guide.run(get_completion)
+                    self.logger.debug(f"Structured Output: {result}")
+                    return json.dumps(result)
+                except Exception as e:
+                    self.logger.error(f"Error using outlines: {str(e)}")
+                    
+            # Fallback to basic parsing if outlines fails or is unavailable
+            completion = await get_completion()
+            content = completion.strip()
             
             # Handle empty or invalid content
             if not content or content == "null":
@@ -6,9 +6,10 @@ import logging
 import asyncio
 import json
 from datetime import datetime
+from nia.core.hot_logging import Lazy, get_hot_logger
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+hot = get_hot_logger(__name__)
 
 from contextlib import asynccontextmanager
 
@@ -105,14 +106,15 @@ class Neo4jBaseStore:
             
         try:
             driver = await self.driver
-            logger.debug(f"Executing query: {query}")
-            logger.debug(f"With parameters: {parameters}")
             
             async with driver.session() as session:
                 result = await session.run(query, parameters or {})
                 records = await result.data()
                 
-                logger.debug(f"Query returned {len(records)} records")
+                hot.debug(
+                    "run_query", "Query returned %d records: %s",
+                    len(records), query, parameter_names=Lazy(sorted, parameters or {})
+                )
                 return records
                 
         except Exception as e:
@@ -129,22 +131,20 @@ class Neo4jBaseStore:
             raise RuntimeError("Maximum recursion depth exceeded")
             
         try:
-            logger.debug(f"Starting transaction with {len(queries)} queries")
-            
             async with self.transaction() as tx:
                 results = []
                 for query_dict in queries:
                     query = query_dict["query"]
                     parameters = query_dict.get("parameters", {})
                     
-                    logger.debug(f"Executing query in transaction: {query}")
-                    logger.debug(f"With parameters: {parameters}")
-                    
                     result = await tx.run(query, parameters)
                     records = await result.data()
                     results.append(records)
                 
-                logger.debug("Transaction completed successfully")
+                hot.debug(
+                    "run_transaction", "Transaction of %d queries returned %s records",
+                    len(queries), [len(records) for records in results]
+                )
                 return results
                     
         except Exception as e:
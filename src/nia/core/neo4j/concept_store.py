@@ -1,20 +1,83 @@
 """Neo4j concept store implementation with enhanced memory management."""
 
+import re
 import json
 import logging
 import asyncio
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Union, Any
+import copy
 import uuid
-from collections import deque
 
+from nia.nova.memory.memory_cache import MemoryCache
 from .base_store import Neo4jBaseStore
 from .validation_handler import ValidationHandler
+from ..change_feed import change_feed
 from ..types.json_utils.validation import validate_json_structure
 from ..types.concept_utils.validation import validate_concept_structure
 
 logger = logging.getLogger(__name__)
 
+# Full-text index over concept names and descriptions
+CONCEPT_TEXT_INDEX = "concept_text"
+
+# How each word of a search is matched: whole term, term prefix or within
+# Lucene's default edit distance
+SEARCH_MODES = {"term": "", "prefix": "*", "fuzzy": "~"}
+DEFAULT_SEARCH_LIMIT = 20
+
+# Validation fields stored as concept properties, by query_knowledge context key
+VALIDATION_FILTERS = {
+    "domain": "domain",
+    "access_domain": "access_domain",
+    "cross_domain.approved": "cross_domain_approved",
+    "cross_domain.requested": "cross_domain_requested",
+    "cross_domain.source_domain": "cross_domain_source",
+    "cross_domain.target_domain": "cross_domain_target"
+}
+
+# Defaults used when [NEO4J] concept cache settings are missing from config.ini
+DEFAULT_CONCEPT_CACHE_SIZE = 1000
+DEFAULT_CONCEPT_CACHE_TTL_SECONDS = 3600.0
+
+# Concepts updated per transaction when backfilling validation properties
+DEFAULT_MIGRATION_BATCH_SIZE = 1000
+
+# Derives the validation properties of concepts written before they were
+# stored; mirrors ValidationHandler.validation_properties
+MIGRATE_VALIDATION_QUERY = """
+MATCH (c:Concept)
+WHERE c.validation_json IS NOT NULL
+CALL {
+    WITH c
+    WITH c, apoc.convert.fromJsonMap(c.validation_json) AS v
+    SET c.domain = coalesce(toString(v.domain), 'general'),
+        c.access_domain = coalesce(toString(v.access_domain), 'general'),
+        c.confidence = coalesce(toFloat(v.confidence), 0.5),
+        c.cross_domain_approved = v.cross_domain.approved,
+        c.cross_domain_requested = v.cross_domain.requested,
+        c.cross_domain_source = v.cross_domain.source_domain,
+        c.cross_domain_target = v.cross_domain.target_domain
+} IN TRANSACTIONS OF $batch_size ROWS
+RETURN count(c) AS migrated
+"""
+
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+def fulltext_query(text: str, mode: str = "term") -> str:
+    """Build a Lucene query that requires every word of text.
+    
+    Words are lowercased, which keeps AND/OR/NOT from being read as
+    operators, and their special characters are escaped.
+    """
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode: {mode}")
+    suffix = SEARCH_MODES[mode]
+    return " AND ".join(
+        _LUCENE_SPECIAL.sub(r"\\\1", word.lower()) + suffix
+        for word in str(text).split()
+    )
+
 class ConceptStore(Neo4jBaseStore):
     """Handles concept storage and retrieval in Neo4j with memory optimization."""
 
@@ -32,25 +95,30 @@ class ConceptStore(Neo4jBaseStore):
         self.max_retry_time = max_retry_time
         self.retry_interval = retry_interval
         
-        # Initialize memory pools
-        self._concept_pool = {}  # Cache for frequently accessed concepts
-        self._relationship_pool = {}  # Cache for frequently accessed relationships
-        self._memory_pool = {}  # Cache for frequently accessed memories
-        self._pool_lock = asyncio.Lock()
-        self._max_pool_size = 1000  # Maximum number of items in each pool
-        self._access_queue = deque()  # Queue for tracking access order
+        # LRU/TTL caches for concepts (by name) and relationships (by
+        # "source-target"), sized by [NEO4J] concept_cache_size. Writes
+        # invalidate the concepts they touch; entries are copied on insert.
+        import configparser
+        config = configparser.ConfigParser()
+        config.read("config.ini")
+        cache_size = config.getint("NEO4J", "concept_cache_size", fallback=DEFAULT_CONCEPT_CACHE_SIZE)
+        cache_ttl = config.getfloat(
+            "NEO4J", "concept_cache_ttl_seconds", fallback=DEFAULT_CONCEPT_CACHE_TTL_SECONDS
+        )
+        self._concept_pool = MemoryCache(max_size=cache_size, ttl_seconds=cache_ttl, freeze=copy.deepcopy)
+        self._relationship_pool = MemoryCache(max_size=cache_size, ttl_seconds=cache_ttl, freeze=copy.deepcopy)
         
-    async def _manage_pool(self, pool: Dict, key: str, value: Any):
-        """Manage pool size and contents."""
-        async with self._pool_lock:
-            # Add new item
-            pool[key] = value
-            self._access_queue.append((pool, key))
-            
-            # Remove oldest items if pool is too large
-            while len(self._access_queue) > self._max_pool_size:
-                old_pool, old_key = self._access_queue.popleft()
-                old_pool.pop(old_key, None)
+    def _invalidate_concepts(self, names: List[str]):
+        """Drop written concepts from the cache so the next read sees the write."""
+        for name in names:
+            self._concept_pool.invalidate(name)
+            
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get hit, miss and eviction counters of the concept and relationship caches."""
+        return {
+            "concepts": self._concept_pool.stats(),
+            "relationships": self._relationship_pool.stats()
+        }
 
     async def _execute_with_retry(self, operation):
         """Execute an operation with retry logic."""
@@ -91,10 +159,35 @@ class ConceptStore(Neo4jBaseStore):
                 ON (c.type)
             """)
             
+            # Validation fields filtered on by query_knowledge
+            await self.run_query("""
+                CREATE INDEX concept_domain IF NOT EXISTS
+                FOR (c:Concept)
+                ON (c.domain, c.access_domain)
+            """)
+            
             await self.run_query("""
-                CREATE INDEX concept_validation IF NOT EXISTS
+                CREATE INDEX concept_access_domain IF NOT EXISTS
                 FOR (c:Concept)
-                ON (c.validation_json)
+                ON (c.access_domain)
+            """)
+            
+            await self.run_query("""
+                CREATE INDEX concept_cross_domain IF NOT EXISTS
+                FOR (c:Concept)
+                ON (c.cross_domain_source, c.cross_domain_target)
+            """)
+            
+            await self.run_query("""
+                CREATE INDEX concept_cross_domain_status IF NOT EXISTS
+                FOR (c:Concept)
+                ON (c.cross_domain_approved, c.cross_domain_requested)
+            """)
+            
+            await self.run_query(f"""
+                CREATE FULLTEXT INDEX {CONCEPT_TEXT_INDEX} IF NOT EXISTS
+                FOR (c:Concept)
+                ON EACH [c.name, c.description]
             """)
             
             # Create composite index for relationship properties
@@ -144,11 +237,6 @@ class ConceptStore(Neo4jBaseStore):
             logger.error("Maximum recursion depth exceeded in store_concept")
             raise RuntimeError("Maximum recursion depth exceeded")
 
-        # Check if concept already exists in pool
-        if name in self._concept_pool:
-            logger.info(f"Concept {name} already in pool")
-            return
-
         async def store_operation():
             # Process validation data with minimal fields
             validation_dict = ValidationHandler.process_validation(validation, is_consolidation)
@@ -162,6 +250,7 @@ class ConceptStore(Neo4jBaseStore):
             if validation and "cross_domain" in validation:
                 essential_validation["cross_domain"] = {
                     "approved": validation["cross_domain"].get("approved", False),
+                    "requested": validation["cross_domain"].get("requested", False),
                     "source_domain": validation["cross_domain"].get("source_domain", "general"),
                     "target_domain": validation["cross_domain"].get("target_domain", "general")
                 }
@@ -173,14 +262,16 @@ class ConceptStore(Neo4jBaseStore):
                 c.description = $description,
                 c.is_consolidation = $is_consolidation,
                 c.validation = $validation_json,
-                c.validation_json = $validation_json
+                c.validation_json = $validation_json,
+                c += $validation_properties
             """
             params = {
                 "name": name,
                 "type": type,
                 "description": description,
                 "is_consolidation": is_consolidation,
-                "validation_json": json.dumps(essential_validation)
+                "validation_json": json.dumps(essential_validation),
+                "validation_properties": ValidationHandler.validation_properties(essential_validation)
             }
 
             query = base_query
@@ -193,9 +284,6 @@ class ConceptStore(Neo4jBaseStore):
                     "c": result[0]["c"],
                     "relationships": []
                 })
-                
-                # Add to concept pool
-                await self._manage_pool(self._concept_pool, name, stored_concept)
 
             # Handle related concepts in transaction
             if related:
@@ -217,11 +305,13 @@ class ConceptStore(Neo4jBaseStore):
                                         c.description = 'Pending concept',
                                         c.is_consolidation = false,
                                         c.validation = $validation_json,
-                                        c.validation_json = $validation_json
+                                        c.validation_json = $validation_json,
+                                        c += $validation_properties
                             """,
                             {
                                 "name": rel,
-                                "validation_json": json.dumps(default_validation)
+                                "validation_json": json.dumps(default_validation),
+                                "validation_properties": ValidationHandler.validation_properties(default_validation)
                             }
                         )
                     
@@ -265,6 +355,10 @@ class ConceptStore(Neo4jBaseStore):
         except Exception as e:
             logger.error(f"Error storing concept {name}: {str(e)}")
             raise
+        finally:
+            # Related concepts gain a relationship, so their cached copies are stale too
+            self._invalidate_concepts([name, *(related or [])])
+        change_feed.publish("concept", "upsert", ids=[name], type=type, related=related or [])
 
 
     async def store_relationship(self, source: str, target: str, rel_type: str, attributes: Dict = None, _depth: int = 0) -> None:
@@ -323,20 +417,22 @@ class ConceptStore(Neo4jBaseStore):
             }
         )
         
-        # Add to relationship pool
-        rel_key = f"{source}-{target}"
-        await self._manage_pool(self._relationship_pool, rel_key, {
+        # Write through to the relationship cache; both concepts now list it
+        self._relationship_pool.put(f"{source}-{target}", {
             "source": source,
             "target": target,
             "type": rel_type,
             "attributes": attributes
         })
+        self._invalidate_concepts([source, target])
+        change_feed.publish("concept", "relationship", ids=[source, target], type=rel_type)
 
     async def get_concept(self, name: str, _depth: int = 0) -> Optional[Dict]:
         """Get concept by name with retry logic."""
-        # Check concept pool first
-        if name in self._concept_pool:
-            return self._concept_pool[name]
+        # Check concept pool first; a hit refreshes its recency
+        cached = self._concept_pool.get(name)
+        if cached is not None:
+            return copy.deepcopy(cached)
             
         # Ensure indexes are created
         await self._ensure_indexes()
@@ -377,7 +473,7 @@ class ConceptStore(Neo4jBaseStore):
             if result and len(result) > 0:
                 concept = self._process_concept_record(result[0])
                 # Add to concept pool
-                await self._manage_pool(self._concept_pool, name, concept)
+                self._concept_pool.put(name, concept)
                 return concept
             return None
 
@@ -517,7 +613,7 @@ class ConceptStore(Neo4jBaseStore):
             
             # Add to concept pool
             for concept in concepts:
-                await self._manage_pool(self._concept_pool, concept["name"], concept)
+                self._concept_pool.put(concept["name"], concept)
                 
             return concepts
 
@@ -566,7 +662,7 @@ class ConceptStore(Neo4jBaseStore):
             
             # Add to concept pool
             for concept in concepts:
-                await self._manage_pool(self._concept_pool, concept["name"], concept)
+                self._concept_pool.put(concept["name"], concept)
                 
             return concepts
 
@@ -576,23 +672,60 @@ class ConceptStore(Neo4jBaseStore):
             logger.error(f"Error getting related concepts for {name}: {str(e)}")
             return []
 
-    async def search_concepts(self, query: str) -> List[Dict]:
-        """Search concepts using full-text search."""
+    async def search_concepts(
+        self,
+        query: str,
+        mode: str = "prefix",
+        limit: int = 1000,
+        offset: int = 0
+    ) -> List[Dict]:
+        """Search concepts using full-text search, best match first.
+        
+        Words match as prefixes by default, as in query_knowledge, so partial
+        words still find concepts as the former substring search did.
+        """
+        page = await self.search_concept_page(query, mode=mode, limit=limit, offset=offset)
+        return page["concepts"]
+
+    async def search_concept_page(
+        self,
+        query: str,
+        mode: str = "prefix",
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """Get a page of concepts whose name or description match a query.
+        
+        Every word of the query must match, as a whole term, a prefix or a
+        fuzzy term depending on ``mode``. Results come from the
+        ``concept_text`` full-text index ranked by score.
+        
+        Returns:
+            Dict[str, Any]: ``concepts`` (each with its ``score``), ``has_more``
+                and ``next_offset`` (the offset of the next page, or None)
+        """
+        search = fulltext_query(query, mode)
+        if not search:
+            return {"concepts": [], "has_more": False, "next_offset": None}
+            
         # Ensure indexes are created
         await self._ensure_indexes()
         
         async def search_operation():
-            result = await self.run_query(
+            # Fetch one extra row to know whether another page exists
+            return await self.run_query(
                 """
-                MATCH (c:Concept)
-                WHERE c.name = $query OR c.description = $query OR
-                      toLower(c.name) CONTAINS toLower($query) OR 
-                      toLower(c.description) CONTAINS toLower($query)
+                CALL db.index.fulltext.queryNodes($index, $search)
+                YIELD node AS c, score
+                WITH c, score
+                ORDER BY score DESC, c.name
+                SKIP $offset
+                LIMIT $limit
                 OPTIONAL MATCH (c)-[r1:RELATED_TO]->(related1:Concept)
                 WHERE r1.bidirectional = true OR r1.direction = 'forward'
                 OPTIONAL MATCH (c)<-[r2:RELATED_TO]-(related2:Concept)
                 WHERE r2.bidirectional = true OR r2.direction = 'reverse'
-                WITH c, 
+                WITH c, score,
                     collect(DISTINCT {
                         name: related1.name, 
                         type: r1.type, 
@@ -607,31 +740,48 @@ class ConceptStore(Neo4jBaseStore):
                         direction: 'reverse',
                         bidirectional: r2.bidirectional
                     }) as incoming
-                RETURN c, outgoing + incoming as relationships
-                LIMIT 1000
+                RETURN c, score, outgoing + incoming as relationships
+                ORDER BY score DESC, c.name
                 """,
-                {"query": query}
+                {
+                    "index": CONCEPT_TEXT_INDEX,
+                    "search": search,
+                    "offset": offset,
+                    "limit": limit + 1
+                }
             )
-            
-            concepts = [self._process_concept_record(record) for record in result]
-            
-            # Add to concept pool
-            for concept in concepts:
-                await self._manage_pool(self._concept_pool, concept["name"], concept)
-                
-            return concepts
 
         try:
-            return await self._execute_with_retry(search_operation)
+            records = await self._execute_with_retry(search_operation)
         except Exception as e:
             logger.error(f"Error searching concepts with query {query}: {str(e)}")
-            return []
+            return {"concepts": [], "has_more": False, "next_offset": None}
+            
+        has_more = len(records) > limit
+        concepts = []
+        for record in records[:limit]:
+            concept = self._process_concept_record(record)
+            # Add to concept pool
+            self._concept_pool.put(concept["name"], concept)
+            concepts.append({**concept, "score": record["score"]})
+            
+        return {
+            "concepts": concepts,
+            "has_more": has_more,
+            "next_offset": offset + limit if has_more else None
+        }
 
     async def query_knowledge(self, query: Dict) -> List[Dict]:
-        """Query semantic knowledge."""
+        """Query semantic knowledge.
+        
+        Concept patterns are matched through the full-text index, by word
+        prefix unless the query names another search ``mode``.
+        """
         try:
             conditions = []
             params = {}
+            # Filters attach to the MATCH (or index call) so they can use indexes
+            source = "MATCH (n:Concept) WHERE {where} WITH n, 1.0 AS score"
             
             # Handle entity queries with number conversion
             if query.get("type") == "entity" and "names" in query:
@@ -647,62 +797,27 @@ class ConceptStore(Neo4jBaseStore):
             
             # Handle concept queries with pattern
             elif query.get("type") == "concept" and "pattern" in query:
-                pattern = query["pattern"]
-                params["pattern"] = f".*{pattern}.*"
-                conditions.append("(n.name =~ $pattern OR n.description =~ $pattern)")
+                search = fulltext_query(query["pattern"], query.get("mode", "prefix"))
+                if search:
+                    params["index"] = CONCEPT_TEXT_INDEX
+                    params["search"] = search
+                    source = "CALL db.index.fulltext.queryNodes($index, $search) YIELD node AS n, score WHERE {where}"
             
-            # Handle context filtering with improved validation handling
+            # Handle context filtering; validation fields are indexed properties
             if "context" in query:
                 for key, value in query["context"].items():
-                    if key == "access_domain":
-                        params[f"context_{key}"] = value
-                        conditions.append("""
-                            EXISTS(n.validation_json)
-                            AND apoc.convert.fromJsonMap(n.validation_json).access_domain = $context_access_domain
-                        """)
-                    elif key == "domain":
-                        params[f"context_{key}"] = str(value)
-                        conditions.append("""
-                            EXISTS(n.validation_json)
-                            AND apoc.convert.fromJsonMap(n.validation_json).domain = $context_domain
-                        """)
-                    elif key == "cross_domain.approved":
-                        params[f"context_{key}"] = value
-                        conditions.append("""
-                            EXISTS(n.validation_json)
-                            AND apoc.convert.fromJsonMap(n.validation_json).cross_domain.approved = $context_cross_domain_approved
-                        """)
-                    elif key == "cross_domain.requested":
-                        params[f"context_{key}"] = value
-                        conditions.append("""
-                            EXISTS(n.validation_json)
-                            AND apoc.convert.fromJsonMap(n.validation_json).cross_domain.requested = $context_cross_domain_requested
-                        """)
-                    elif key == "cross_domain.source_domain":
-                        params[f"context_{key}"] = value
-                        conditions.append("""
-                            EXISTS(n.validation_json)
-                            AND apoc.convert.fromJsonMap(n.validation_json).cross_domain.source_domain = $context_cross_domain_source_domain
-                        """)
-                    elif key == "cross_domain.target_domain":
-                        params[f"context_{key}"] = value
-                        conditions.append("""
-                            EXISTS(n.validation_json)
-                            AND apoc.convert.fromJsonMap(n.validation_json).cross_domain.target_domain = $context_cross_domain_target_domain
-                        """)
-                    else:
-                        params[f"context_{key}"] = value
-                        conditions.append(f"n.{key} = $context_{key}")
+                    prop = VALIDATION_FILTERS.get(key, key)
+                    params[f"context_{prop}"] = str(value) if key == "domain" else value
+                    conditions.append(f"n.{prop} = $context_{prop}")
             
             where_clause = " AND ".join(conditions) if conditions else "true"
             
             cypher = f"""
-            MATCH (n:Concept)
-            WHERE {where_clause}
-            WITH n
+            {source.format(where=where_clause)}
+            WITH n, score
             OPTIONAL MATCH (n)-[r:RELATED_TO]-(related:Concept)
             WHERE r.bidirectional = true OR r.direction IN ['forward', 'reverse']
-            WITH n, collect(DISTINCT {{
+            WITH n, score, collect(DISTINCT {{
                 name: related.name,
                 type: r.type,
                 attributes: properties(r),
@@ -714,6 +829,7 @@ class ConceptStore(Neo4jBaseStore):
                 bidirectional: r.bidirectional
             }}) as relationships
             RETURN n, relationships
+            ORDER BY score DESC
             LIMIT 1000
             """
             
@@ -736,7 +852,7 @@ class ConceptStore(Neo4jBaseStore):
                         results.append(concept)
                         
                         # Add to concept pool
-                        await self._manage_pool(self._concept_pool, concept["name"], concept)
+                        self._concept_pool.put(concept["name"], concept)
                         
                         logger.info(f"Processed concept: {concept}")
                     except Exception as e:
@@ -798,6 +914,25 @@ class ConceptStore(Neo4jBaseStore):
             logger.error(f"Error storing concepts from JSON: {str(e)}")
             raise
 
+    async def migrate_validation_properties(self, batch_size: int = DEFAULT_MIGRATION_BATCH_SIZE) -> int:
+        """Backfill indexed validation properties on existing concepts.
+        
+        Concepts stored before validation fields became properties only have
+        them in ``validation_json``. Each is rewritten from its JSON in
+        transactions of ``batch_size`` concepts, so the migration can be
+        re-run safely. The index on the raw JSON string, which no query can
+        use, is dropped.
+        
+        Returns:
+            int: Number of concepts migrated
+        """
+        await self._ensure_indexes()
+        result = await self.run_query(MIGRATE_VALIDATION_QUERY, {"batch_size": batch_size})
+        await self.run_query("DROP INDEX concept_validation IF EXISTS")
+        migrated = result[0]["migrated"] if result else 0
+        logger.info(f"Migrated validation properties of {migrated} concepts")
+        return migrated
+
     async def count_concepts(self) -> int:
         """Count total number of concepts in the database."""
         async def count_operation():
@@ -844,39 +979,38 @@ class ConceptStore(Neo4jBaseStore):
         """Clear all relationships from the database."""
         async def clear_operation():
             await self.run_query("MATCH ()-[r:RELATED_TO]->() DELETE r")
-            # Clear relationship pool
-            async with self._pool_lock:
-                self._relationship_pool.clear()
+            # Clear relationship pool; cached concepts list the deleted relationships
+            self._relationship_pool.clear()
+            self._concept_pool.clear()
 
         try:
             await self._execute_with_retry(clear_operation)
         except Exception as e:
             logger.error(f"Error clearing relationships: {str(e)}")
             raise
+        change_feed.publish("concept", "clear_relationships")
 
     async def clear_concepts(self) -> None:
         """Clear all concepts from the database."""
         async def clear_operation():
             await self.run_query("MATCH (n:Concept) DETACH DELETE n")
             # Clear concept pool
-            async with self._pool_lock:
-                self._concept_pool.clear()
+            self._concept_pool.clear()
+            self._relationship_pool.clear()
 
         try:
             await self._execute_with_retry(clear_operation)
         except Exception as e:
             logger.error(f"Error clearing concepts: {str(e)}")
             raise
+        change_feed.publish("concept", "clear")
 
     async def cleanup(self):
         """Clean up resources."""
         try:
             # Clear all pools
-            async with self._pool_lock:
-                self._concept_pool.clear()
-                self._relationship_pool.clear()
-                self._memory_pool.clear()
-                self._access_queue.clear()
+            self._concept_pool.clear()
+            self._relationship_pool.clear()
                 
             # Clear database
             await self.clear_concepts()
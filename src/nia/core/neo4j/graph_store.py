@@ -2,6 +2,7 @@
 
 from typing import Dict, Any, List, Optional
 from .base_store import Neo4jBaseStore
+from ..change_feed import change_feed
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,7 +25,9 @@ class GraphStore(Neo4jBaseStore):
         SET n = $properties
         RETURN n
         """
-        return await self.run_query(query, {"properties": properties})
+        result = await self.run_query(query, {"properties": properties})
+        change_feed.publish("graph", "create_node", ids=[properties.get("id")] if properties.get("id") else [], labels=labels)
+        return result
         
     async def create_relationship(self, from_id: str, to_id: str, rel_type: str, properties: Optional[Dict[str, Any]] = None):
         """Create a relationship between nodes."""
@@ -35,11 +38,13 @@ class GraphStore(Neo4jBaseStore):
         SET r = $properties
         RETURN r
         """
-        return await self.run_query(query, {
+        result = await self.run_query(query, {
             "from_id": from_id,
             "to_id": to_id,
             "properties": properties or {}
         })
+        change_feed.publish("graph", "create_relationship", ids=[from_id, to_id], type=rel_type)
+        return result
         
     async def get_node(self, node_id: str):
         """Get node by ID."""
@@ -58,10 +63,12 @@ class GraphStore(Neo4jBaseStore):
         SET n += $properties
         RETURN n
         """
-        return await self.run_query(query, {
+        result = await self.run_query(query, {
             "node_id": node_id,
             "properties": properties
         })
+        change_feed.publish("graph", "update_node", ids=[node_id], properties=list(properties))
+        return result
         
     async def delete_node(self, node_id: str):
         """Delete node by ID."""
@@ -70,7 +77,9 @@ class GraphStore(Neo4jBaseStore):
         WHERE n.id = $node_id
         DETACH DELETE n
         """
-        return await self.run_query(query, {"node_id": node_id})
+        result = await self.run_query(query, {"node_id": node_id})
+        change_feed.publish("graph", "delete_node", ids=[node_id])
+        return result
         
     async def get_relationships(self, node_id: str, rel_type: Optional[str] = None, direction: str = "BOTH"):
         """Get node relationships."""
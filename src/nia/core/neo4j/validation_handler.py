@@ -163,3 +163,21 @@ class ValidationHandler:
                 }
         
         return validation
+
+    @staticmethod
+    def validation_properties(validation: Dict) -> Dict:
+        """Flatten stored validation into indexed concept properties.
+        
+        Uses the property names extract_validation falls back to. Absent
+        cross-domain fields are None, which removes them on ``SET c += ...``.
+        """
+        cross_domain = validation.get("cross_domain") or {}
+        return {
+            "domain": str(validation.get("domain", "general")),
+            "access_domain": str(validation.get("access_domain", "general")),
+            "confidence": float(validation.get("confidence", 0.5)),
+            "cross_domain_approved": cross_domain.get("approved"),
+            "cross_domain_requested": cross_domain.get("requested"),
+            "cross_domain_source": cross_domain.get("source_domain"),
+            "cross_domain_target": cross_domain.get("target_domain")
+        }
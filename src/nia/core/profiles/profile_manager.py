@@ -1,8 +1,11 @@
 """Profile management system implementation."""
 
+import copy
+import time
 import logging
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from nia.core.profiles.profile_types import (
     UserProfile,
@@ -16,16 +19,108 @@ from nia.core.neo4j.neo4j_store import Neo4jMemoryStore
 
 logger = logging.getLogger(__name__)
 
-class ProfileManager:
-    """Manages user profiles in Neo4j."""
+# Defaults for the per-profile read-through cache
+DEFAULT_CACHE_MAX_SIZE = 10000
+DEFAULT_CACHE_TTL_SECONDS = 300.0
 
-    def __init__(self, store: Neo4jMemoryStore):
+class ProfileManager:
+    """Manages user profiles in Neo4j.
+    
+    Stored profile data is kept in a bounded LRU/TTL read-through cache keyed
+    by profile id. Every write through this manager invalidates its entry;
+    writes made elsewhere become visible once the TTL expires.
+    """
+
+    def __init__(
+        self,
+        store: Neo4jMemoryStore,
+        cache_max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        cache_ttl_seconds: Optional[float] = DEFAULT_CACHE_TTL_SECONDS
+    ):
         """Initialize profile manager.
         
         Args:
             store: Neo4j store for profile persistence
+            cache_max_size: Maximum cached profiles before LRU eviction
+            cache_ttl_seconds: Cached profile lifetime, or None/0 for no expiry
         """
         self.store = store
+        self.cache_max_size = cache_max_size
+        self.cache_ttl_seconds = cache_ttl_seconds or None
+        self._cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _cache_get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """Get cached profile data, dropping it if expired."""
+        item = self._cache.get(profile_id)
+        if item is not None:
+            expires_at, data = item
+            if not expires_at or expires_at > time.monotonic():
+                self._cache.move_to_end(profile_id)
+                self.cache_hits += 1
+                return data
+            del self._cache[profile_id]
+        self.cache_misses += 1
+        return None
+
+    def _cache_put(self, profile_data: Dict[str, Any]):
+        """Cache stored profile data, evicting least recently used entries."""
+        expires_at = time.monotonic() + self.cache_ttl_seconds if self.cache_ttl_seconds else 0.0
+        self._cache[profile_data["profile_id"]] = (expires_at, profile_data)
+        self._cache.move_to_end(profile_data["profile_id"])
+        while len(self._cache) > self.cache_max_size:
+            self._cache.popitem(last=False)
+
+    def invalidate(self, profile_id: str):
+        """Drop a profile from the read-through cache."""
+        self._cache.pop(profile_id, None)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get profile cache size and hit counters."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "size": len(self._cache),
+            "max_size": self.cache_max_size,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0
+        }
+
+    @staticmethod
+    def _hydrate(profile_data: Dict[str, Any]) -> UserProfile:
+        """Reconstruct full profile from minimal stored data."""
+        return UserProfile(
+            profile_id=profile_data["profile_id"],
+            personality=BigFiveTraits(**profile_data["personality"]),
+            learning_style=LearningStyle(**profile_data["learning_style"]),
+            communication=CommunicationPreferences(**profile_data["communication"]),
+            auto_approval=AutoApprovalSettings(**profile_data["auto_approval"]),
+            # Copied so callers can mutate the profile without touching the cache
+            domains=copy.deepcopy(profile_data.get("domains", {
+                "professional": {"confidence": 1.0},
+                "personal": {"confidence": 1.0}
+            })),
+            created_at=profile_data.get("created_at", datetime.now(timezone.utc).isoformat()),
+            updated_at=profile_data.get("updated_at", datetime.now(timezone.utc).isoformat())
+        )
+
+    async def _write_profile(self, profile: UserProfile):
+        """Replace stored profile data and invalidate its cache entry."""
+        try:
+            # Update in Neo4j with minimal data
+            await self.store.query(
+                """
+                MATCH (p:Profile {profile_id: $profile_id})
+                SET p = $profile
+                """,
+                {
+                    "profile_id": profile.profile_id,
+                    "profile": profile.dict(minimal=True)
+                }
+            )
+        finally:
+            self.invalidate(profile.profile_id)
 
     async def create_profile(
         self,
@@ -93,6 +188,10 @@ class ProfileManager:
         Returns:
             User profile if found, None otherwise
         """
+        profile_data = self._cache_get(profile_id)
+        if profile_data is not None:
+            return self._hydrate(profile_data)
+
         result = await self.store.query(
             """
             MATCH (p:Profile {profile_id: $profile_id})
@@ -104,20 +203,45 @@ class ProfileManager:
             return None
 
         profile_data = result[0]["p"]
-        # Reconstruct full profile from minimal data
-        return UserProfile(
-            profile_id=profile_data["profile_id"],
-            personality=BigFiveTraits(**profile_data["personality"]),
-            learning_style=LearningStyle(**profile_data["learning_style"]),
-            communication=CommunicationPreferences(**profile_data["communication"]),
-            auto_approval=AutoApprovalSettings(**profile_data["auto_approval"]),
-            domains=profile_data.get("domains", {
-                "professional": {"confidence": 1.0},
-                "personal": {"confidence": 1.0}
-            }),
-            created_at=profile_data.get("created_at", datetime.now(timezone.utc).isoformat()),
-            updated_at=profile_data.get("updated_at", datetime.now(timezone.utc).isoformat())
-        )
+        self._cache_put(profile_data)
+        return self._hydrate(profile_data)
+
+    async def get_profiles(self, profile_ids: List[str]) -> Dict[str, UserProfile]:
+        """Get many user profiles, loading cache misses in one query.
+        
+        Args:
+            profile_ids: Profile identifiers
+
+        Returns:
+            Found profiles keyed by profile id
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for profile_id in dict.fromkeys(profile_ids):
+            profile_data = self._cache_get(profile_id)
+            if profile_data is None:
+                missing.append(profile_id)
+            else:
+                found[profile_id] = profile_data
+
+        if missing:
+            result = await self.store.query(
+                """
+                UNWIND $profile_ids AS profile_id
+                MATCH (p:Profile {profile_id: profile_id})
+                RETURN p
+                """,
+                {"profile_ids": missing}
+            )
+            for record in result or []:
+                self._cache_put(record["p"])
+                found[record["p"]["profile_id"]] = record["p"]
+
+        return {
+            profile_id: self._hydrate(found[profile_id])
+            for profile_id in dict.fromkeys(profile_ids)
+            if profile_id in found
+        }
 
     async def update_profile(
         self,
@@ -147,17 +271,7 @@ class ProfileManager:
         # Create updated profile
         updated_profile = UserProfile(**profile_dict)
 
-        # Update in Neo4j with minimal data
-        await self.store.query(
-            """
-            MATCH (p:Profile {profile_id: $profile_id})
-            SET p = $profile
-            """,
-            {
-                "profile_id": profile_id,
-                "profile": updated_profile.dict(minimal=True)
-            }
-        )
+        await self._write_profile(updated_profile)
 
         return updated_profile
 
@@ -178,27 +292,46 @@ class ProfileManager:
             """,
             {"profile_id": profile_id}
         )
+        self.invalidate(profile_id)
         return result[0]["deleted"] > 0
 
     async def list_profiles(
         self,
-        domain: Optional[str] = None
+        domain: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
     ) -> List[UserProfile]:
         """List user profiles, optionally filtered by domain.
         
+        Profiles are hydrated from a single query and ordered by profile id.
+        Pass the last profile id of a page as ``after`` to get the next page.
+        
         Args:
             domain: Optional domain to filter by
+            limit: Optional maximum number of profiles to return
+            after: Optional profile id to start after (keyset cursor)
 
         Returns:
             List of matching profiles
         """
         query = """
         MATCH (p:Profile)
-        WHERE $domain IS NULL OR $domain IN keys(p.domains)
+        WHERE ($domain IS NULL OR $domain IN keys(p.domains))
+          AND ($after IS NULL OR p.profile_id > $after)
         RETURN p
+        ORDER BY p.profile_id
         """
-        result = await self.store.query(query, {"domain": domain})
-        return [await self.get_profile(r["p"]["profile_id"]) for r in result]
+        params: Dict[str, Any] = {"domain": domain, "after": after}
+        if limit is not None:
+            query += "LIMIT $limit\n"
+            params["limit"] = limit
+
+        result = await self.store.query(query, params)
+        profiles = []
+        for record in result or []:
+            self._cache_put(record["p"])
+            profiles.append(self._hydrate(record["p"]))
+        return profiles
 
     async def get_domain_confidence(
         self,
@@ -249,17 +382,32 @@ class ProfileManager:
         profile.domains[domain]["confidence"] = confidence
         profile.updated_at = datetime.now(timezone.utc).isoformat()
 
-        # Update in Neo4j with minimal data
-        await self.store.query(
-            """
-            MATCH (p:Profile {profile_id: $profile_id})
-            SET p = $profile
-            """,
-            {
-                "profile_id": profile_id,
-                "profile": profile.dict(minimal=True)
-            }
-        )
+        await self._write_profile(profile)
+
+        return True
+
+    async def update_auto_approval(
+        self,
+        profile_id: str,
+        auto_approval: AutoApprovalSettings
+    ) -> bool:
+        """Update auto-approval settings.
+        
+        Args:
+            profile_id: Profile identifier
+            auto_approval: New auto-approval settings
+
+        Returns:
+            True if updated, False if profile not found
+        """
+        profile = await self.get_profile(profile_id)
+        if not profile:
+            return False
+
+        profile.auto_approval = auto_approval
+        profile.updated_at = datetime.now(timezone.utc).isoformat()
+
+        await self._write_profile(profile)
 
         return True
 
@@ -1,10 +1,14 @@
 """JSON utilities for memory system."""
 
 from .extraction import extract_valid_json, extract_json_from_lmstudio
+from .streaming import StreamingJSONExtractor, extract_json_incremental, iter_json_fields
 from .validation import validate_json_structure
 
 __all__ = [
     'extract_valid_json',
     'extract_json_from_lmstudio',
+    'StreamingJSONExtractor',
+    'extract_json_incremental',
+    'iter_json_fields',
     'validate_json_structure'
 ]
@@ -4,14 +4,22 @@ import logging
 import asyncio
 import json
 import aiohttp
-import re
 from typing import Dict, Optional
 from datetime import datetime
 
+from .streaming import extract_json_incremental
+
 logger = logging.getLogger(__name__)
 
 def extract_valid_json(text: str, model: Optional[str] = None) -> Dict:
-    """Extract and validate JSON from any text, handling common issues."""
+    """Extract and validate JSON from any text, handling common issues.
+
+    Text is parsed once with the incremental extractor, which repairs model
+    quirks as it scans; there is no regex or json.loads retry cascade.
+
+    Raises:
+        ValueError: If no JSON object can be extracted
+    """
     start_time = datetime.now()
     parse_attempts = []
     
@@ -66,79 +74,6 @@ def extract_valid_json(text: str, model: Optional[str] = None) -> Dict:
             attempt["error"] = str(error)
         parse_attempts.append(attempt)
 
-    def clean_json_string(s: str) -> str:
-        """Clean up JSON string to handle common format issues."""
-        s = re.sub(r'%[0-9.]*[diouxXeEfFgGcrs]', '', s)
-        s = s.replace('\\"', '"').replace('\\n', '\n')
-        s = re.sub(r'[^\x20-\x7E\n]', '', s)
-        s = re.sub(r',(\s*[}\]])', r'\1', s)
-        s = re.sub(r'([{,]\s*)(\w+)(:)', r'\1"\2"\3', s)
-        return s
-
-    def find_json_object(text: str) -> Optional[str]:
-        """Find the first valid JSON object in text."""
-        logger.debug(f"Searching for JSON object in text of length {len(text)}")
-        concept_match = re.search(r'\{[^{]*"concepts"\s*:\s*\[.*?\][^}]*\}', text, re.DOTALL)
-        if concept_match:
-            return concept_match.group(0)
-        
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            return json_match.group(0)
-        
-        return None
-
-    def try_parse_json(text: str, method: str) -> Optional[Dict]:
-        """Try to parse JSON with various cleanup attempts."""
-        try:
-            result = json.loads(text)
-            log_attempt(f"{method}/direct", result=result)
-            return result
-        except json.JSONDecodeError as e:
-            log_attempt(f"{method}/direct", error=e)
-            
-            cleaned = clean_json_string(text)
-            if cleaned != text:
-                try:
-                    result = json.loads(cleaned)
-                    log_attempt(f"{method}/cleaned", result=result)
-                    return result
-                except json.JSONDecodeError as e:
-                    log_attempt(f"{method}/cleaned", error=e)
-            
-            try:
-                text_no_trailing = re.sub(r',(\s*[\]}])', r'\1', text)
-                if text_no_trailing != text:
-                    try:
-                        result = json.loads(text_no_trailing)
-                        log_attempt(f"{method}/trailing", result=result)
-                        return result
-                    except json.JSONDecodeError:
-                        pass
-                
-                text_quotes = text.replace("'", '"')
-                if text_quotes != text:
-                    try:
-                        result = json.loads(text_quotes)
-                        log_attempt(f"{method}/quotes", result=result)
-                        return result
-                    except json.JSONDecodeError:
-                        pass
-                
-                text_whitespace = re.sub(r'"\s+([^"]+)\s+":', r'"\1":', text)
-                if text_whitespace != text:
-                    try:
-                        result = json.loads(text_whitespace)
-                        log_attempt(f"{method}/whitespace", result=result)
-                        return result
-                    except json.JSONDecodeError:
-                        pass
-                        
-            except Exception as e:
-                log_attempt(f"{method}/fixes", error=e)
-            
-            return None
-
     logger.debug(f"Processing text input of length {len(text)}")
     if len(text) > 100:
         logger.debug(f"Text preview: {text[:100]}...")
@@ -149,24 +84,19 @@ def extract_valid_json(text: str, model: Optional[str] = None) -> Dict:
         if "choices" in response_obj and isinstance(response_obj["choices"], list):
             for i, choice in enumerate(response_obj["choices"]):
                 if "message" in choice and "content" in choice["message"]:
-                    content = choice["message"]["content"]
-                    result = try_parse_json(content, f"choice_{i}")
+                    result = extract_json_incremental(choice["message"]["content"] or "")
+                    log_attempt(f"choice_{i}", result=result)
                     if result:
                         return result
     except json.JSONDecodeError as e:
         log_attempt("full_response", error=e)
 
-    json_text = find_json_object(text)
-    if json_text:
-        result = try_parse_json(json_text, "json_object")
-        if result:
-            return result
-
-    code_match = re.search(r'```(?:json)?\s*(.*?)\s*```', text, re.DOTALL)
-    if code_match:
-        result = try_parse_json(code_match.group(1), "code_block")
-        if result:
-            return result
+    # Single pass over the text; tolerates fences, prose and common quirks
+    # (trailing commas, single quotes, unquoted keys, Python literals)
+    result = extract_json_incremental(text)
+    log_attempt("incremental", result=result)
+    if result:
+        return result
 
     logger.error("JSON extraction failed. Attempts:")
     for attempt in parse_attempts:
@@ -0,0 +1,252 @@
+"""Incremental JSON extraction for streamed LLM output."""
+
+import re
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Characters that end a run of plain string content
+_STRING_SPECIAL = re.compile(r'["\'\\\x00-\x1f]')
+_WORD_CHAR = re.compile(r'[A-Za-z0-9_.+\-]')
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+class StreamingJSONExtractor:
+    """Single-pass parser for a JSON object that arrives in chunks.
+
+    Text before the first ``{`` (prose, ```json fences) is skipped. Each
+    top-level field is returned by ``feed`` as soon as its value closes, so
+    callers can act on ``concepts`` before ``reasoning`` has been generated.
+
+    The same model quirks ``extract_valid_json`` repairs are normalized as the
+    text is scanned: trailing commas, single-quoted strings, unquoted keys,
+    raw control characters inside strings and Python ``True``/``False``/
+    ``None``. A malformed object is abandoned and scanning resumes at the next
+    ``{``.
+    """
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+        self._reset()
+
+    def _reset(self):
+        self._stack: List[str] = []       # open containers: "o" object, "a" array
+        self._expect_key: List[bool] = []  # per container: next token is a key
+        self._buffer: List[str] = []       # normalized text of current key/value
+        self._in_string = False
+        self._quote = '"'
+        self._escape = False
+        self._word: List[str] = []
+        self._comma = False                # comma seen, not yet written
+        self._key: Optional[str] = None
+        self._partial: Dict[str, Any] = {}
+
+    # Output helpers
+
+    def _write(self, text: str):
+        if self._comma:
+            self._comma = False
+            # Only write commas between values inside the current field
+            if len(self._stack) > 1:
+                self._buffer.append(",")
+        self._buffer.append(text)
+
+    def _take(self) -> str:
+        text = "".join(self._buffer).strip()
+        self._buffer.clear()
+        return text
+
+    def _flush_word(self):
+        if not self._word:
+            return
+        word = "".join(self._word)
+        self._word.clear()
+        if self._expect_key[-1]:
+            self._write(json.dumps(word))
+            if len(self._stack) == 1:
+                self._key = word
+                self._buffer.clear()
+        else:
+            self._write(_LITERALS.get(word, word))
+
+    def _value_closed(self) -> bool:
+        """Whether the current top-level field already holds a complete value."""
+        return (
+            len(self._stack) == 1 and not self._expect_key[-1]
+            and (bool(self._buffer) or self._key is None)
+        )
+
+    def _emit(self, completed: List[Tuple[str, Any]]):
+        """Finish the current top-level field from the buffer."""
+        text = self._take()
+        if self._key is None or not text:
+            return
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError:
+            value = text
+        self._partial[self._key] = value
+        completed.append((self._key, value))
+        self._key = None
+
+    # Scanning
+
+    def _scan_string(self, text: str, i: int) -> int:
+        """Consume string content from text[i:], returning the next index."""
+        n = len(text)
+        while i < n:
+            if self._escape:
+                self._escape = False
+                char = text[i]
+                # \' is only meaningful in single-quoted strings
+                self._buffer.append("'" if char == "'" else "\\" + char)
+                i += 1
+                continue
+            match = _STRING_SPECIAL.search(text, i)
+            end = match.start() if match else n
+            if end > i:
+                self._buffer.append(text[i:end])
+                i = end
+            if not match:
+                break
+            char = text[i]
+            i += 1
+            if char == "\\":
+                self._escape = True
+            elif char == self._quote:
+                self._in_string = False
+                self._buffer.append('"')
+                if len(self._stack) == 1 and self._expect_key[-1]:
+                    self._key = json.loads(self._take())
+                return i
+            elif char == '"':
+                self._buffer.append('\\"')
+            elif char == "'":
+                self._buffer.append("'")
+            else:
+                self._buffer.append(_CONTROL_ESCAPES.get(char, ""))
+        return i
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume a chunk of text.
+
+        Returns:
+            List[Tuple[str, Any]]: Top-level (key, value) pairs completed by
+            this chunk, in order
+        """
+        completed: List[Tuple[str, Any]] = []
+        i, n = 0, len(chunk)
+        while i < n and not self.done:
+            if self._in_string:
+                i = self._scan_string(chunk, i)
+                continue
+
+            char = chunk[i]
+            i += 1
+
+            if not self._stack:
+                if char == "{":
+                    self._stack.append("o")
+                    self._expect_key.append(True)
+                continue
+
+            if _WORD_CHAR.match(char):
+                if not self._word and self._value_closed():
+                    # Second value without a comma: not our object
+                    logger.debug("Missing comma in streamed JSON; rescanning")
+                    self._reset()
+                    i -= 1
+                    continue
+                self._word.append(char)
+                continue
+            self._flush_word()
+
+            if char in " \t\r\n":
+                continue
+
+            if char in "\"'{[" and self._value_closed():
+                logger.debug("Missing comma in streamed JSON; rescanning")
+                self._reset()
+                i -= 1
+                continue
+
+            depth = len(self._stack)
+            if char in "\"'":
+                self._write('"')
+                self._in_string = True
+                self._quote = char
+            elif char in "{[":
+                self._write(char)
+                self._stack.append("o" if char == "{" else "a")
+                self._expect_key.append(char == "{")
+            elif char in "}]":
+                self._comma = False  # drop trailing comma
+                if self._stack[-1] != ("o" if char == "}" else "a") or (
+                    depth == 1 and self._key is not None and self._expect_key[-1]
+                ):
+                    # Mismatched bracket or a key with no value: not our object
+                    logger.debug("Malformed object in streamed JSON; rescanning")
+                    self._reset()
+                    continue
+                self._stack.pop()
+                self._expect_key.pop()
+                if depth == 1:
+                    self._emit(completed)
+                    self.fields.update(self._partial)
+                    self.done = True
+                    break
+                self._buffer.append(char)
+                if depth == 2:
+                    self._emit(completed)
+            elif char == ":":
+                self._expect_key[-1] = False
+                if depth == 1:
+                    self._buffer.clear()
+                else:
+                    self._write(":")
+            elif char == ",":
+                if self._stack[-1] == "o":
+                    self._expect_key[-1] = True
+                if depth == 1:
+                    self._emit(completed)
+                else:
+                    self._comma = True
+            # Anything else (stray punctuation, fence backticks) is dropped
+        return completed
+
+    def result(self) -> Dict[str, Any]:
+        """Get the parsed object.
+
+        Raises:
+            ValueError: If no complete object was found
+        """
+        if not self.done:
+            raise ValueError("Could not extract a complete JSON object from stream")
+        return self.fields
+
+    @property
+    def partial(self) -> Dict[str, Any]:
+        """Fields completed so far, including those of an unfinished object."""
+        return self.fields if self.done else dict(self._partial)
+
+def extract_json_incremental(text: str) -> Optional[Dict[str, Any]]:
+    """Extract the first JSON object from text in a single pass.
+
+    Returns:
+        Optional[Dict[str, Any]]: Parsed object, or None if none was found
+    """
+    extractor = StreamingJSONExtractor()
+    extractor.feed(text)
+    return extractor.fields if extractor.done else None
+
+async def iter_json_fields(chunks: AsyncIterator[str]) -> AsyncIterator[Tuple[str, Any]]:
+    """Yield top-level (key, value) pairs of a streamed object as they close."""
+    extractor = StreamingJSONExtractor()
+    async for chunk in chunks:
+        for field in extractor.feed(chunk):
+            yield field
+        if extractor.done:
+            break
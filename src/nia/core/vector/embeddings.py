@@ -1,32 +1,165 @@
 """Embedding service using local LLM."""
 
+import os
+import asyncio
+import hashlib
 import logging
 import aiohttp
 import numpy as np
-from typing import List, Union, Optional
+from collections import OrderedDict
+from typing import Dict, List, Set, Union, Optional, Tuple
 import json
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_SIZE = 1000  # In-memory embeddings kept per service
+
+class EmbeddingCache:
+    """Content-addressed embedding cache keyed by (model, text hash).
+    
+    The most recently used ``max_size`` embeddings are kept in memory as
+    read-only arrays. With a ``cache_dir``, entries are also stored on disk as
+    ``.npy`` files under ``<cache_dir>/<model>/<hash[:2]>/<hash>.npy``, so they
+    survive restarts. Writes go through a temporary file and ``os.replace`` so
+    concurrent writers never expose partial files.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_size: int = DEFAULT_CACHE_SIZE):
+        """Initialize cache.
+        
+        Args:
+            cache_dir: Directory for on-disk entries; None keeps entries in memory only
+            max_size: Maximum embeddings kept in memory; 0 disables the memory layer
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        
+    def _path(self, model: str, digest: str) -> str:
+        """Get the file path for a (model, text hash) entry."""
+        model_dir = model.replace("/", "_").replace("@", "_")
+        return os.path.join(self.cache_dir, model_dir, digest[:2], f"{digest}.npy")
+        
+    def _remember(self, key: Tuple[str, str], embedding: np.ndarray) -> np.ndarray:
+        """Keep embedding in memory, evicting least recently used entries."""
+        if not self.max_size:
+            return embedding
+        embedding.setflags(write=False)
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return embedding
+        
+    def get(self, model: str, text: str) -> Optional[np.ndarray]:
+        """Get cached embedding, or None on miss or unreadable entry."""
+        key = (model, hashlib.sha256(text.encode()).hexdigest())
+        embedding = self._entries.get(key)
+        if embedding is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding
+        if self.cache_dir:
+            try:
+                embedding = np.load(self._path(*key))
+                self.hits += 1
+                return self._remember(key, embedding)
+            except (OSError, ValueError):
+                pass
+        self.misses += 1
+        return None
+            
+    def put(self, model: str, text: str, embedding: np.ndarray):
+        """Store embedding for (model, text)."""
+        key = (model, hashlib.sha256(text.encode()).hexdigest())
+        self._remember(key, embedding)
+        if not self.cache_dir:
+            return
+        path = self._path(*key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{id(embedding)}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, embedding)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write embedding cache entry: {str(e)}")
+
 class EmbeddingService:
-    """Service for generating embeddings using local LLM."""
+    """Service for generating embeddings using local LLM.
+    
+    Requests share one pooled HTTP session. Concurrent ``get_embedding`` calls
+    arriving within ``batch_window`` seconds are coalesced into a single
+    ``/embeddings`` request, and ``get_embeddings`` sends its batches
+    concurrently with at most ``max_in_flight`` requests outstanding.
+    Embeddings are cached by (model, text) in memory and, with ``cache_dir``,
+    on disk; cached vectors are read-only.
+    """
     
     def __init__(self, api_base: str = "http://localhost:1234/v1",
                  api_key: str = "not-needed",
                  model: str = "text-embedding-nomic-embed-text-v1.5@q8_0",
                  max_tokens: int = 2048,
-                 embedding_dim: int = 384):  # Changed to match Qdrant's expected dimension
-        """Initialize embedding service."""
+                 embedding_dim: int = 384,  # Changed to match Qdrant's expected dimension
+                 batch_size: int = 32,
+                 batch_window: float = 0.005,
+                 max_in_flight: int = 4,
+                 cache_size: int = DEFAULT_CACHE_SIZE,
+                 cache_dir: Optional[str] = None):
+        """Initialize embedding service.
+        
+        Args:
+            batch_size: Maximum texts per /embeddings request
+            batch_window: Seconds to wait for concurrent get_embedding calls to coalesce
+            max_in_flight: Maximum concurrent /embeddings requests (and pooled connections)
+            cache_size: Embeddings cached in memory; 0 disables the memory cache
+            cache_dir: Directory for the on-disk embedding cache; None disables it
+        """
         self.api_base = api_base
         self.api_key = api_key
         self.model = model
         self.max_tokens = max_tokens
         self.embedding_dim = embedding_dim
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.max_in_flight = max_in_flight
         self.headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         }
         self.timeout = aiohttp.ClientTimeout(total=30)
+        self.cache = EmbeddingCache(cache_dir, cache_size) if cache_dir or cache_size else None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()  # Coalesced requests in flight
+        self.requests = 0  # /embeddings requests sent
+        
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Ensure we have an active pooled session."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_in_flight)
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=self.timeout,
+                connector=connector
+            )
+            self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        return self._session
+        
+    async def close(self):
+        """Send pending get_embedding calls, wait for them and close the pooled session."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        self._flush_pending()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     def _truncate_text(self, text: str) -> str:
         """Truncate text to fit within token limit."""
@@ -60,32 +193,111 @@ class EmbeddingService:
             # Truncate
             return vector[:target_dim]
     
+    async def _request_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Send one /embeddings request for already-truncated texts."""
+        session = await self._ensure_session()
+        url = f"{self.api_base}/embeddings"
+        payload = {
+            "model": self.model,
+            "input": texts,
+            "encoding_format": "float"
+        }
+        
+        async with self._in_flight:
+            self.requests += 1
+            async with session.post(url, json=payload) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(f"Failed to get embeddings: {error_text}")
+                result = await response.json()
+                
+        if 'data' not in result or len(result['data']) != len(texts):
+            raise Exception("Invalid response format from embedding service")
+        # Sort embeddings by index to maintain order
+        sorted_embeddings = sorted(result['data'], key=lambda x: x['index'])
+        return [
+            self._pad_vector(item['embedding'], self.embedding_dim)
+            for item in sorted_embeddings
+        ]
+        
+    async def _embed_truncated(self, texts: List[str]) -> List[np.ndarray]:
+        """Embed truncated texts through the cache and concurrent batches.
+        
+        Duplicate texts are requested once. Misses are split into batch_size
+        requests that run concurrently, bounded by max_in_flight.
+        """
+        embeddings: Dict[str, np.ndarray] = {}
+        missing: List[str] = []
+        for text in dict.fromkeys(texts):
+            cached = self.cache.get(self.model, text) if self.cache else None
+            if cached is not None:
+                embeddings[text] = cached
+            else:
+                missing.append(text)
+                
+        if missing:
+            batches = [
+                missing[i:i + self.batch_size]
+                for i in range(0, len(missing), self.batch_size)
+            ]
+            results = await asyncio.gather(*(self._request_embeddings(batch) for batch in batches))
+            for batch, batch_embeddings in zip(batches, results):
+                for text, embedding in zip(batch, batch_embeddings):
+                    embeddings[text] = embedding
+                    if self.cache:
+                        self.cache.put(self.model, text, embedding)
+                        
+        return [embeddings[text] for text in texts]
+        
+    def _schedule_flush(self):
+        """Flush pending get_embedding calls now if full, else after the window."""
+        loop = asyncio.get_running_loop()
+        if len(self._pending) >= self.batch_size:
+            if self._flush_handle:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush_pending)
+            
+    def _flush_pending(self):
+        """Send pending get_embedding calls as one request."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.ensure_future(self._resolve_pending(pending))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+            
+    async def _resolve_pending(self, pending: List[Tuple[str, asyncio.Future]]):
+        """Embed coalesced texts and resolve their futures."""
+        try:
+            embeddings = await self._embed_truncated([text for text, _ in pending])
+            for (_, future), embedding in zip(pending, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+    
     async def get_embedding(self, text: str) -> np.ndarray:
-        """Get embedding for text."""
+        """Get embedding for text.
+        
+        Concurrent calls are coalesced into one request by the micro-batcher.
+        """
         try:
             # Truncate text if needed
             text = self._truncate_text(text)
             
-            url = f"{self.api_base}/embeddings"
-            payload = {
-                "model": self.model,
-                "input": text,
-                "encoding_format": "float"
-            }
-            
-            async with aiohttp.ClientSession(headers=self.headers, timeout=self.timeout) as session:
-                async with session.post(url, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Failed to get embedding: {error_text}")
-                    
-                    result = await response.json()
-                    if 'data' in result and len(result['data']) > 0:
-                        embedding = result['data'][0]['embedding']
-                        # Ensure consistent dimensionality
-                        return self._pad_vector(embedding, self.embedding_dim)
-                    else:
-                        raise Exception("Invalid response format from embedding service")
+            cached = self.cache.get(self.model, text) if self.cache else None
+            if cached is not None:
+                return cached
+                
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append((text, future))
+            self._schedule_flush()
+            return await future
             
         except Exception as e:
             logger.error(f"Error getting embedding: {str(e)}")
@@ -95,41 +307,8 @@ class EmbeddingService:
     async def get_embeddings(self, texts: List[str]) -> List[np.ndarray]:
         """Get embeddings for multiple texts."""
         try:
-            # Process texts in batches to avoid overwhelming the service
-            batch_size = 10
-            all_embeddings = []
-            
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i + batch_size]
-                # Truncate each text if needed
-                batch = [self._truncate_text(text) for text in batch]
-                
-                url = f"{self.api_base}/embeddings"
-                payload = {
-                    "model": self.model,
-                    "input": batch,
-                    "encoding_format": "float"
-                }
-                
-                async with aiohttp.ClientSession(headers=self.headers, timeout=self.timeout) as session:
-                    async with session.post(url, json=payload) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            raise Exception(f"Failed to get embeddings: {error_text}")
-                        
-                        result = await response.json()
-                        if 'data' in result:
-                            # Sort embeddings by index to maintain order
-                            sorted_embeddings = sorted(result['data'], key=lambda x: x['index'])
-                            batch_embeddings = [
-                                self._pad_vector(item['embedding'], self.embedding_dim) 
-                                for item in sorted_embeddings
-                            ]
-                            all_embeddings.extend(batch_embeddings)
-                        else:
-                            raise Exception("Invalid response format from embedding service")
-            
-            return all_embeddings
+            # Truncate each text if needed
+            return await self._embed_truncated([self._truncate_text(text) for text in texts])
             
         except Exception as e:
             logger.error(f"Error getting embeddings: {str(e)}")
@@ -139,9 +318,8 @@ class EmbeddingService:
     async def get_similarity(self, text1: str, text2: str) -> float:
         """Get cosine similarity between two texts."""
         try:
-            # Get embeddings
-            embedding1 = await self.get_embedding(text1)
-            embedding2 = await self.get_embedding(text2)
+            # Get both embeddings in one request
+            embedding1, embedding2 = await self.get_embeddings([text1, text2])
             
             # Calculate cosine similarity
             similarity = float(np.dot(embedding1, embedding2) / 
@@ -157,11 +335,8 @@ class EmbeddingService:
                            top_k: Optional[int] = None) -> List[tuple[int, float]]:
         """Search for most similar texts."""
         try:
-            # Get query embedding
-            query_embedding = await self.get_embedding(query)
-            
-            # Get embeddings for all texts
-            text_embeddings = await self.get_embeddings(texts)
+            # Get query and text embeddings in one pipelined call
+            query_embedding, *text_embeddings = await self.get_embeddings([query, *texts])
             
             # Calculate similarities
             similarities = []
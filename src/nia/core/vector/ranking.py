@@ -0,0 +1,95 @@
+"""Merging of ranked hits from several filtered searches for the same query."""
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+def normalize_scores(hits: Sequence[Dict[str, Any]], floor: float = 0.0) -> List[float]:
+    """Min-max scale one search's scores to [0, 1] between floor and its best hit.
+
+    Similarity scores are not comparable across layers or domains (a small
+    semantic layer tops out lower than a dense episodic one), so each
+    search's best hit maps to 1.0 and its score threshold to 0.0.
+    """
+    if not hits:
+        return []
+    top = max(hit.get("score") or 0.0 for hit in hits)
+    if top <= floor:
+        return [1.0] * len(hits)
+    return [max(0.0, ((hit.get("score") or 0.0) - floor) / (top - floor)) for hit in hits]
+
+def check_quotas(names: Sequence[str], quotas: Optional[Mapping[str, int]], limit: int):
+    """Raise ValueError if quotas name unknown searches or exceed limit."""
+    quotas = quotas or {}
+    unknown = set(quotas) - set(names)
+    if unknown:
+        raise ValueError(f"Quotas for unknown searches: {sorted(unknown)}")
+    if sum(quotas.values()) > limit:
+        raise ValueError(f"Quotas {dict(quotas)} exceed limit {limit}")
+
+def merge_ranked(
+    hits: Mapping[str, Sequence[Dict[str, Any]]],
+    limit: int,
+    quotas: Optional[Mapping[str, int]] = None,
+    floor: float = 0.0,
+    normalize: bool = True,
+    key: Optional[Callable[[Dict[str, Any]], Any]] = None
+) -> List[Dict[str, Any]]:
+    """Merge per-search hits into one top-k list.
+
+    Each search first gets its quota of slots, filled with its best hits;
+    the remaining slots go to the best of all other hits. Hits are tagged
+    with the search they came from as "source" and ranked by
+    "normalized_score", then by raw score.
+
+    Args:
+        hits: Hits per search name, each with a "score"
+        limit: Number of results to return
+        quotas: Slots reserved per search name
+        floor: Score mapped to 0.0 when normalizing (the score threshold)
+        normalize: Rank by normalized rather than raw scores
+        key: Identity of a hit; repeats after the first are dropped
+
+    Returns:
+        List[Dict[str, Any]]: At most limit hits, best first
+
+    Raises:
+        ValueError: If quotas name unknown searches or exceed limit
+    """
+    quotas = dict(quotas or {})
+    check_quotas(hits, quotas, limit)
+
+    ranked: Dict[str, List[Dict[str, Any]]] = {}
+    for name, results in hits.items():
+        scores = normalize_scores(results, floor) if normalize else [r.get("score") or 0.0 for r in results]
+        tagged = [{**hit, "source": name, "normalized_score": score} for hit, score in zip(results, scores)]
+        tagged.sort(key=lambda hit: (hit["normalized_score"], hit.get("score") or 0.0), reverse=True)
+        ranked[name] = tagged
+
+    selected: List[Dict[str, Any]] = []
+    seen = set()
+
+    def take(hit: Dict[str, Any]) -> bool:
+        identity = key(hit) if key else None
+        if identity is not None:
+            if identity in seen:
+                return False
+            seen.add(identity)
+        selected.append(hit)
+        return True
+
+    rest: List[Dict[str, Any]] = []
+    for name, results in ranked.items():
+        reserved = quotas.get(name, 0)
+        for hit in results:
+            if reserved and take(hit):
+                reserved -= 1
+            elif not reserved:
+                rest.append(hit)
+
+    rest.sort(key=lambda hit: (hit["normalized_score"], hit.get("score") or 0.0), reverse=True)
+    for hit in rest:
+        if len(selected) >= limit:
+            break
+        take(hit)
+
+    selected.sort(key=lambda hit: (hit["normalized_score"], hit.get("score") or 0.0), reverse=True)
+    return selected[:limit]
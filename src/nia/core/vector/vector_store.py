@@ -1,7 +1,7 @@
 """Vector store implementation with enhanced serialization support."""
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional, Sequence
 from enum import Enum
 from datetime import datetime
 import json
@@ -10,6 +10,7 @@ import asyncio
 from qdrant_client import QdrantClient, models
 from qdrant_client.http.exceptions import UnexpectedResponse
 from .embeddings import EmbeddingService
+from .ranking import check_quotas, merge_ranked
 from ..types.memory_types import JSONSerializable
 
 # Disable httpx logging to prevent recursion
@@ -199,6 +200,35 @@ class VectorStore:
             if client_info:
                 await self._release_client(client_info)
     
+    @staticmethod
+    def _format_hit(result: Any, include_metadata: bool = True) -> Dict[str, Any]:
+        """Convert a scored point to a memory dict."""
+        # Extract content and metadata
+        content = result.payload["content"]
+        metadata = result.payload.get("metadata", {})
+        
+        # Create memory with minimal data
+        memory = {
+            "content": content,
+            "score": result.score,
+            "type": (
+                metadata.get("type") or  # First try metadata
+                (content.get("type") if isinstance(content, dict) else None) or  # Then content
+                "unknown"  # Default
+            ),
+            "id": metadata.get("id") or str(uuid.uuid4()),
+            "layer": result.payload.get("layer", "unknown"),
+            "timestamp": result.payload.get("timestamp")
+        }
+        
+        # Include minimal metadata if requested
+        if include_metadata:
+            memory["metadata"] = {
+                k: v for k, v in metadata.items()
+                if k in ["type", "id", "thread_id", "task_id", "message_id"]
+            }
+        return memory
+    
     async def search_vectors(
         self,
         content: Any,
@@ -257,36 +287,93 @@ class VectorStore:
             )
             
             # Format results
-            memories = []
-            for result in results:
-                # Extract content and metadata
-                content = result.payload["content"]
-                metadata = result.payload.get("metadata", {})
-                
-                # Create memory with minimal data
-                memory = {
-                    "content": content,
-                    "score": result.score,
-                    "type": (
-                        metadata.get("type") or  # First try metadata
-                        (content.get("type") if isinstance(content, dict) else None) or  # Then content
-                        "unknown"  # Default
-                    ),
-                    "id": metadata.get("id") or str(uuid.uuid4()),
-                    "layer": result.payload.get("layer", "unknown"),
-                    "timestamp": result.payload.get("timestamp")
-                }
-                
-                # Include minimal metadata if requested
-                if include_metadata:
-                    memory["metadata"] = {
-                        k: v for k, v in metadata.items()
-                        if k in ["type", "id", "thread_id", "task_id", "message_id"]
-                    }
-                
-                memories.append(memory)
+            return [self._format_hit(result, include_metadata) for result in results]
             
-            return memories
+        except Exception as e:
+            logger.error(f"Error searching vectors: {str(e)}")
+            return []
+        finally:
+            if client_info:
+                await self._release_client(client_info)
+    
+    async def search_multi(
+        self,
+        content: Any,
+        filters: Mapping[str, Sequence[models.FieldCondition]],
+        limit: int = 5,
+        quotas: Optional[Mapping[str, int]] = None,
+        score_threshold: float = 0.7,
+        include_metadata: bool = True,
+        normalize: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Search several filtered views for the same content.
+        
+        Embeds once, searches every filter in one batched request and merges
+        the hits with per-filter quotas and normalized scores (see
+        merge_ranked).
+        """
+        if not filters:
+            return []
+        check_quotas(list(filters), quotas, limit)
+        client_info = None
+        try:
+            client_info = await self._get_client()
+            client = client_info["client"]
+            
+            # Serialize content the way search_vectors does, then embed once
+            serialized_content = serialize_for_vector_store(content)
+            if isinstance(serialized_content, dict):
+                content_str = json.dumps(serialized_content)
+            else:
+                content_str = str(serialized_content)
+            embedding = await self.embedding_service.get_embedding(content_str)
+            
+            names = list(filters)
+            query_filters = [
+                models.Filter(must=list(filters[name])) if filters[name] else None
+                for name in names
+            ]
+            if hasattr(client, "query_batch_points"):
+                responses = client.query_batch_points(
+                    collection_name=self.collection_name,
+                    requests=[
+                        models.QueryRequest(
+                            query=embedding,
+                            filter=query_filter,
+                            limit=min(limit, 100),
+                            score_threshold=score_threshold,
+                            with_payload=True
+                        )
+                        for query_filter in query_filters
+                    ]
+                )
+                batches = [response.points for response in responses]
+            else:
+                batches = client.search_batch(
+                    collection_name=self.collection_name,
+                    requests=[
+                        models.SearchRequest(
+                            vector=embedding,
+                            filter=query_filter,
+                            limit=min(limit, 100),
+                            score_threshold=score_threshold,
+                            with_payload=True
+                        )
+                        for query_filter in query_filters
+                    ]
+                )
+            
+            return merge_ranked(
+                {
+                    name: [self._format_hit(hit, include_metadata) for hit in batch]
+                    for name, batch in zip(names, batches)
+                },
+                limit,
+                quotas=quotas,
+                floor=score_threshold,
+                normalize=normalize,
+                key=lambda memory: memory["id"]
+            )
             
         except Exception as e:
             logger.error(f"Error searching vectors: {str(e)}")
@@ -295,6 +382,34 @@ class VectorStore:
             if client_info:
                 await self._release_client(client_info)
     
+    async def search_layers(
+        self,
+        content: Any,
+        layers: Sequence[str] = ("episodic", "semantic"),
+        limit: int = 5,
+        quotas: Optional[Mapping[str, int]] = None,
+        score_threshold: float = 0.7,
+        include_metadata: bool = True,
+        filter_conditions: Optional[List[models.FieldCondition]] = None,
+        normalize: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Search several layers with one embedding and one batched request."""
+        return await self.search_multi(
+            content,
+            {
+                layer: [
+                    models.FieldCondition(key="layer", match=models.MatchValue(value=layer)),
+                    *(filter_conditions or [])
+                ]
+                for layer in layers
+            },
+            limit=limit,
+            quotas=quotas,
+            score_threshold=score_threshold,
+            include_metadata=include_metadata,
+            normalize=normalize
+        )
+    
     async def delete_vector(self, point_id: str) -> bool:
         """Delete a single vector from collection."""
         client_info = None
@@ -493,5 +608,8 @@ class VectorStore:
                         pass
                 self._client_pool.clear()
                 
+            # Close pooled embedding session
+            await self.embedding_service.close()
+                
         except Exception as e:
             logger.error(f"Error cleaning up vector store: {str(e)}")
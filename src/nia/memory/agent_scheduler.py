@@ -0,0 +1,171 @@
+"""Dependency-aware, concurrent scheduling of agent calls."""
+
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Defaults used when [AGENTS] settings are missing from config.ini
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_AGENT_TIMEOUT = 0.0  # No limit: a slow agent delays the turn rather than vanishing
+
+@dataclass
+class AgentStep:
+    """One agent call in a schedule.
+
+    ``run`` receives the results of the steps listed in ``requires`` that
+    succeeded. A step starts once every step it requires has finished,
+    successfully or not, so a failed or timed-out agent leaves a gap in its
+    dependents' inputs instead of failing them.
+    """
+    name: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    requires: Tuple[str, ...] = ()
+    timeout: Optional[float] = None  # None uses the scheduler timeout, 0 disables
+
+@dataclass
+class StepTiming:
+    """When a step became ready, started and finished, relative to the schedule start."""
+    status: str
+    ready: float
+    started: float
+    finished: float
+
+    @property
+    def waited(self) -> float:
+        """Time spent ready but waiting for a concurrency slot."""
+        return self.started - self.ready
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+@dataclass
+class ScheduleResult:
+    """Results, errors and timings of a schedule run."""
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    timings: Dict[str, StepTiming] = field(default_factory=dict)
+    total: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        return not self.errors
+
+    def latency_breakdown(self) -> Dict[str, Any]:
+        """Per-step start offset, queueing and run time in milliseconds."""
+        return {
+            "total_ms": round(self.total * 1000, 3),
+            "steps": {
+                name: {
+                    "status": timing.status,
+                    "start_ms": round(timing.started * 1000, 3),
+                    "wait_ms": round(timing.waited * 1000, 3),
+                    "run_ms": round(timing.duration * 1000, 3)
+                }
+                for name, timing in sorted(self.timings.items(), key=lambda item: item[1].started)
+            }
+        }
+
+def _check_graph(steps: List[AgentStep]):
+    """Reject duplicate names, unknown dependencies and cycles."""
+    names = [step.name for step in steps]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate step names: {names}")
+    requires = {step.name: step.requires for step in steps}
+    for name, deps in requires.items():
+        unknown = set(deps) - set(requires)
+        if unknown:
+            raise ValueError(f"Step {name} requires unknown steps: {sorted(unknown)}")
+
+    visiting, visited = set(), set()
+
+    def visit(name: str):
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle through step {name}")
+        visiting.add(name)
+        for dep in requires[name]:
+            visit(dep)
+        visiting.discard(name)
+        visited.add(name)
+
+    for name in requires:
+        visit(name)
+
+class AgentScheduler:
+    """Run agent steps concurrently, each as soon as its inputs are ready.
+
+    At most ``max_concurrency`` steps run at once (``[AGENTS]
+    max_concurrency`` in config.ini); a step waiting on its dependencies does
+    not hold a slot. Each step is bounded by its own timeout or the
+    scheduler's (``[AGENTS] timeout``, none by default). Failures and
+    timeouts are recorded in the result's ``errors`` and logged rather than
+    raised, so a turn returns partial results.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None
+    ):
+        """Initialize scheduler.
+
+        Args:
+            max_concurrency: Maximum steps running at once
+            timeout: Default per-step timeout in seconds, 0 for none
+        """
+        import configparser
+        config = configparser.ConfigParser()
+        config.read("config.ini")
+        self.max_concurrency = max_concurrency or config.getint(
+            "AGENTS", "max_concurrency", fallback=DEFAULT_MAX_CONCURRENCY
+        )
+        self.timeout = timeout if timeout is not None else config.getfloat(
+            "AGENTS", "timeout", fallback=DEFAULT_AGENT_TIMEOUT
+        )
+
+    async def run(self, steps: Iterable[AgentStep]) -> ScheduleResult:
+        """Run steps in dependency order with bounded concurrency.
+
+        Raises:
+            ValueError: If names repeat, a dependency is unknown or steps form a cycle
+        """
+        steps = list(steps)
+        _check_graph(steps)
+        result = ScheduleResult()
+        finished = {step.name: asyncio.Event() for step in steps}
+        slots = asyncio.Semaphore(self.max_concurrency)
+        origin = time.perf_counter()
+
+        async def execute(step: AgentStep):
+            try:
+                for dep in step.requires:
+                    await finished[dep].wait()
+                ready = time.perf_counter() - origin
+                inputs = {dep: result.results[dep] for dep in step.requires if dep in result.results}
+                timeout = self.timeout if step.timeout is None else step.timeout
+                async with slots:
+                    started = time.perf_counter() - origin
+                    try:
+                        result.results[step.name] = await asyncio.wait_for(step.run(inputs), timeout or None)
+                        status = "ok"
+                    except asyncio.TimeoutError:
+                        status = "timeout"
+                        result.errors[step.name] = f"timed out after {timeout}s"
+                        logger.warning(f"Agent step {step.name} timed out after {timeout}s")
+                    except Exception as e:
+                        status = "error"
+                        result.errors[step.name] = str(e)
+                        logger.error(f"Agent step {step.name} failed: {str(e)}")
+                result.timings[step.name] = StepTiming(status, ready, started, time.perf_counter() - origin)
+            finally:
+                finished[step.name].set()
+
+        await asyncio.gather(*(execute(step) for step in steps))
+        result.total = time.perf_counter() - origin
+        return result
@@ -2,6 +2,7 @@
 
 import logging
 import json
+from contextlib import aclosing
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta, timezone
 
@@ -415,6 +416,14 @@ class TinyTroupePattern(ConsolidationPattern):
             logger.error(f"Failed to convert domain contexts: {str(e)}")
             raise
 
+def _candidate_field(memory, key: str, default):
+    """Read a field from a candidate object or a vector store result dict."""
+    if isinstance(memory, dict):
+        if key in memory:
+            return memory[key]
+        return (memory.get("metadata") or {}).get(key, default)
+    return getattr(memory, key, default)
+
 class ConsolidationManager:
     """Manages memory consolidation process."""
     
@@ -425,23 +434,31 @@ class ConsolidationManager:
         self.last_consolidation = datetime.now()
         self.consolidation_interval = timedelta(minutes=5)
         self.importance_threshold = 0.8
+        self.volume_threshold = 10
         # Initialize with default pattern
         self.add_pattern(TinyTroupePattern())
         
     async def should_consolidate(self) -> bool:
-        """Determine if consolidation should occur."""
+        """Determine if consolidation should occur.
+        
+        Candidates are streamed a page at a time and the scan stops as soon
+        as the answer is known, so at most volume_threshold are read.
+        """
         time_elapsed = datetime.now() - self.last_consolidation
         if time_elapsed >= self.consolidation_interval:
             return True
             
-        candidates = await self.episodic.get_consolidation_candidates()
-        if any(getattr(m, "importance", 0) >= self.importance_threshold 
-               and not getattr(m, "consolidated", False)
-               for m in candidates):
-            return True
-            
-        if len(candidates) >= 10:
-            return True
+        seen = 0
+        pages = self.episodic.iter_consolidation_candidates(page_size=self.volume_threshold)
+        async with aclosing(pages):
+            async for page in pages:
+                if any(_candidate_field(m, "importance", 0) >= self.importance_threshold
+                       and not _candidate_field(m, "consolidated", False)
+                       for m in page):
+                    return True
+                seen += len(page)
+                if seen >= self.volume_threshold:
+                    return True
             
         return False
         
@@ -2,6 +2,7 @@
 
 import logging
 import json
+import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import uuid
@@ -19,6 +20,7 @@ from ..nova.core.structure import StructureAgent
 from .agents.task_agent import TaskAgent
 from .agents.dialogue_agent import DialogueAgent
 from ..nova.core.context import ContextAgent
+from .agent_scheduler import AgentScheduler, AgentStep, ScheduleResult
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +40,12 @@ def serialize_datetime(obj: Any) -> Any:
         return [serialize_datetime(item) for item in obj]
     return obj
 
+def _lap(phases: Dict[str, float], name: str, since: float) -> float:
+    """Record milliseconds since a mark under name and return a new mark."""
+    now = time.perf_counter()
+    phases[name] = round((now - since) * 1000, 3)
+    return now
+
 class MemorySystem:
     """Memory system integration with enhanced parsing capabilities.
     
@@ -61,8 +69,19 @@ class MemorySystem:
     
     Integration:
     - MetaAgent: Response synthesis and dialogue
+    
+    Agents run through an AgentScheduler: the understanding, task and
+    structure agents run concurrently, and the meta synthesis starts as soon
+    as the responses in META_INPUTS are in. An agent that fails or times out
+    is left out of the synthesis instead of failing the turn, and is listed
+    in the turn's errors.
     """
     
+    UNDERSTANDING_AGENTS = ('belief', 'desire', 'emotion', 'reflection', 'research')
+    TASK_AGENTS = ('task', 'dialogue', 'context')
+    # Responses the meta synthesis waits for and receives as agent_responses
+    META_INPUTS = UNDERSTANDING_AGENTS + TASK_AGENTS + ('structure',)
+    
     def __init__(
         self,
         llm: LLMInterface,
@@ -108,10 +127,56 @@ class MemorySystem:
         # Initialize integration agent with agents dictionary
         self.meta_agent = MetaAgent(llm, store, vector_store, agents)
         
+        # Concurrent agent fan-out
+        self.scheduler = AgentScheduler()
+        self.last_turn_latency: Dict[str, Any] = {}
+        
         # Track consolidation
         self.last_consolidation = datetime.now()
         self.consolidation_interval = 60 * 60  # 1 hour
     
+    def _agent_steps(
+        self,
+        content_dict: Dict[str, Any],
+        content: str,
+        synthesis_input: Dict[str, Any]
+    ) -> List[AgentStep]:
+        """Build the agent schedule for one piece of content.
+        
+        Every agent reads the same content; only the meta synthesis depends on
+        other steps, receiving the META_INPUTS responses as agent_responses.
+        """
+        steps = [
+            AgentStep(name, lambda _, agent=getattr(self, f"{name}_agent"): agent.process(content_dict))
+            for name in self.UNDERSTANDING_AGENTS + self.TASK_AGENTS
+        ]
+        steps.append(AgentStep(
+            'structure',
+            lambda _: self.structure_agent.analyze_structure(content)
+        ))
+        steps.append(AgentStep(
+            'meta',
+            lambda responses: self.meta_agent.synthesize_dialogue({
+                **synthesis_input,
+                'agent_responses': responses
+            }),
+            requires=self.META_INPUTS
+        ))
+        return steps
+    
+    @staticmethod
+    def _synthesis(schedule: ScheduleResult) -> AgentResponse:
+        """The meta synthesis of a schedule, raising if it did not complete."""
+        if 'meta' not in schedule.results:
+            raise RuntimeError(f"Meta synthesis failed: {schedule.errors.get('meta')}")
+        if schedule.errors:
+            logger.warning(f"Synthesized without agents: {sorted(schedule.errors)}")
+        return schedule.results['meta']
+    
+    def get_turn_latency(self) -> Dict[str, Any]:
+        """Latency breakdown of the last processed interaction."""
+        return self.last_turn_latency
+    
     async def _check_consolidation(self) -> None:
         """Check if consolidation is needed."""
         now = datetime.now()
@@ -147,36 +212,13 @@ class MemorySystem:
                 ])
                 
                 # Process through agents
-                responses = {}
                 content_dict = {'content': content, 'memories': memories}
-                
-                # Process through understanding agents
-                for agent_type, agent in [
-                    ('belief', self.belief_agent),
-                    ('desire', self.desire_agent),
-                    ('emotion', self.emotion_agent),
-                    ('reflection', self.reflection_agent),
-                    ('research', self.research_agent)
-                ]:
-                    responses[agent_type] = await agent.process(content_dict)
-                
-                # Process through task management agents
-                for agent_type, agent in [
-                    ('task', self.task_agent),
-                    ('dialogue', self.dialogue_agent),
-                    ('context', self.context_agent)
-                ]:
-                    responses[agent_type] = await agent.process(content_dict)
-                
-                # Analyze structure
-                structure_response = await self.structure_agent.analyze_structure(content)
-                responses['structure'] = structure_response
-                
-                # Synthesize responses
-                synthesis = await self.meta_agent.synthesize_dialogue({
-                    'content': {'content': content},
-                    'agent_responses': responses
-                })
+                schedule = await self.scheduler.run(self._agent_steps(
+                    content_dict,
+                    content,
+                    {'content': {'content': content}}
+                ))
+                synthesis = self._synthesis(schedule)
                 
                 # Store consolidated memory
                 memory_id = str(uuid.uuid4())
@@ -230,26 +272,12 @@ class MemorySystem:
     ) -> List[Dict]:
         """Find relevant memories from both layers."""
         try:
-            # Search both layers
-            episodic = await self.vector_store.search_vectors(
+            # One embedding and one batched search across both layers
+            return await self.vector_store.search_layers(
                 content=content,
-                limit=limit,
-                layer="episodic"
+                layers=("episodic", "semantic"),
+                limit=limit
             )
-            semantic = await self.vector_store.search_vectors(
-                content=content,
-                limit=limit,
-                layer="semantic"
-            )
-            
-            # Combine and sort by relevance
-            all_memories = episodic + semantic
-            all_memories.sort(
-                key=lambda x: x.get("score", 0),
-                reverse=True
-            )
-            
-            return all_memories[:limit]
             
         except Exception as e:
             logger.error(f"Error finding relevant memories: {str(e)}")
@@ -261,9 +289,12 @@ class MemorySystem:
         metadata: Optional[Dict] = None
     ) -> AgentResponse:
         """Process an interaction through the memory system."""
+        phases: Dict[str, float] = {}
+        turn_start = mark = time.perf_counter()
         try:
             # Check for memory consolidation
             await self._check_consolidation()
+            mark = _lap(phases, 'consolidation', mark)
             
             # Generate UUID for memory ID
             memory_id = str(uuid.uuid4())
@@ -285,9 +316,11 @@ class MemorySystem:
                 }),
                 layer="episodic"
             )
+            mark = _lap(phases, 'store_episodic', mark)
             
             # Find relevant memories from both layers
             similar_memories = await self._find_relevant_memories(content)
+            mark = _lap(phases, 'retrieval', mark)
             
             # Process through agent system
             content_dict = {
@@ -296,40 +329,14 @@ class MemorySystem:
                 **(metadata or {})
             }
             
-            # Get agent responses
-            responses = {}
-            
-            # Process through understanding agents
-            for agent_type, agent in [
-                ('belief', self.belief_agent),
-                ('desire', self.desire_agent),
-                ('emotion', self.emotion_agent),
-                ('reflection', self.reflection_agent),
-                ('research', self.research_agent)
-            ]:
-                responses[agent_type] = await agent.process(content_dict)
-                logger.info(f"{agent_type.capitalize()}Agent processed interaction")
-            
-            # Process through task management agents
-            for agent_type, agent in [
-                ('task', self.task_agent),
-                ('dialogue', self.dialogue_agent),
-                ('context', self.context_agent)
-            ]:
-                responses[agent_type] = await agent.process(content_dict)
-                logger.info(f"{agent_type.capitalize()}Agent processed interaction")
-            
-            # Analyze structure
-            structure_response = await self.structure_agent.analyze_structure(content)
-            responses['structure'] = structure_response
-            logger.info("StructureAgent processed interaction")
-            
-            # Synthesize responses using dialogue format
-            response = await self.meta_agent.synthesize_dialogue({
-                'content': {'content': content},
-                'dialogue_context': None,
-                'agent_responses': responses
-            })
+            # Run agents concurrently; synthesis starts once its inputs are in
+            schedule = await self.scheduler.run(self._agent_steps(
+                content_dict,
+                content,
+                {'content': {'content': content}, 'dialogue_context': None}
+            ))
+            mark = _lap(phases, 'agents', mark)
+            response = self._synthesis(schedule)
             
             # Store processed memory in semantic layer
             await self.vector_store.store_vector(
@@ -351,6 +358,7 @@ class MemorySystem:
                 }),
                 layer="semantic"
             )
+            mark = _lap(phases, 'store_semantic', mark)
             
             # Store extracted concepts in knowledge graph
             for concept in response.concepts:
@@ -360,6 +368,15 @@ class MemorySystem:
                     type=concept["type"],
                     description=concept["description"]
                 )
+            _lap(phases, 'store_concepts', mark)
+            
+            self.last_turn_latency = {
+                'total_ms': round((time.perf_counter() - turn_start) * 1000, 3),
+                'phases': phases,
+                'agents': schedule.latency_breakdown(),
+                'errors': dict(schedule.errors)
+            }
+            logger.info(f"Processed interaction: {self.last_turn_latency}")
             
             return response
             
@@ -386,37 +403,21 @@ class MemorySystem:
     ) -> List[Dict]:
         """Search memories across layers."""
         try:
-            results = []
-            
-            # Search episodic layer
-            if include_episodic:
-                episodic = await self.vector_store.search_vectors(
-                    content=query,
-                    limit=limit,
-                    layer="episodic"
-                )
-                results.extend(episodic)
+            layers = [
+                layer for layer, included in (
+                    ("episodic", include_episodic),
+                    ("semantic", include_semantic)
+                ) if included
+            ]
             
-            # Search semantic layer
-            if include_semantic:
-                semantic = await self.vector_store.search_vectors(
-                    content=query,
-                    limit=limit,
-                    layer="semantic",
-                    include_metadata=True  # Ensure metadata is included
-                )
-                # Filter out non-semantic memories
-                semantic = [m for m in semantic if m.get("layer") == "semantic"]
-                results.extend(semantic)
-            
-            # Sort by relevance
-            results.sort(
-                key=lambda x: x.get("score", 0),
-                reverse=True
+            # One embedding and one batched search across the layers
+            return await self.vector_store.search_layers(
+                content=query,
+                layers=layers,
+                limit=limit,
+                include_metadata=True  # Ensure metadata is included
             )
             
-            return results[:limit]
-            
         except Exception as e:
             logger.error(f"Error searching memories: {str(e)}")
             return []
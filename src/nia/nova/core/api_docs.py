@@ -36,6 +36,10 @@ Nova's analytics and orchestration API
 - POST / - Create a new task
   - Body: TaskNode object with task details
   - Response: { "success": true, "taskId": string }
+- POST /bulk - Create many tasks in one transaction
+  - Body: Array<TaskNode>; dependencies may reference other tasks in the batch
+  - Rejects the whole batch if any task is invalid: { "detail": { "message": string, "invalid": Array<{taskId, issues}> } }
+  - Response: { "success": true, "taskIds": Array<string>, "count": number }
 - GET /{task_id}/details - Get detailed information about a task
   - Response: TaskDetails object with task data, dependencies, subtasks, comments
 - GET /{task_id}/history - Get task history (state changes, updates, comments, assignments)
@@ -54,6 +58,10 @@ Nova's analytics and orchestration API
     - BLOCKED -> IN_PROGRESS
     - COMPLETED -> No transitions allowed
   - Response: { "success": true, "taskId": string, "newState": TaskState }
+- POST /transition - Transition many tasks in one transaction
+  - Body: Array<{ "task_id": string, "new_state": TaskState }>
+  - Same rules as above; rejects the whole batch if any transition is invalid
+  - Response: { "success": true, "transitions": Array<{taskId, newState}> }
 
 ### Task Components (/api/tasks)
 - POST /{task_id}/subtasks - Add a subtask to a task
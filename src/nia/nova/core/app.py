@@ -20,7 +20,7 @@ from ..endpoints.websocket_endpoints import ws_router
 from ..endpoints.tasks_endpoints import tasks_router
 from ..endpoints.channel_endpoints import channel_router
 from ..endpoints.agent_endpoints import agent_router
-from nia.nova.core.auth.token import validate_api_key
+from nia.nova.core.auth.token import validate_api_key, get_permission
 
 import logging
 
@@ -137,7 +137,12 @@ app.include_router(graph_router, prefix="/api/graph", tags=["Knowledge Graph"])
 app.include_router(user_router, prefix="/api", tags=["User Management"])
 app.include_router(memory_router, prefix="/api/memory", tags=["System"])
 app.include_router(kg_router, prefix="/api/knowledge", tags=["Knowledge Graph"])
-app.include_router(tasks_router, prefix="/api/tasks", tags=["Task Orchestration"])
+app.include_router(
+    tasks_router,
+    prefix="/api/tasks",
+    tags=["Task Orchestration"],
+    dependencies=[Depends(get_permission("write"))]
+)
 app.include_router(channel_router, prefix="/api/channels", tags=["Chat & Threads"])
 app.include_router(agent_router, prefix="/api/agents", tags=["Agent Management"])
 
@@ -180,8 +185,10 @@ app.openapi_tags = [
 # Initialize WebSocket server on startup
 @app.on_event("startup")
 async def startup_event():
-    """Initialize WebSocket server on startup."""
+    """Initialize logging and the WebSocket server on startup."""
+    from nia.core.hot_logging import configure_hot_path_logging
     from ..endpoints.websocket_endpoints import initialize_websocket_server
+    configure_hot_path_logging()
     await initialize_websocket_server()
 
 # Health check endpoint
@@ -1,16 +1,22 @@
 """Celery configuration and tasks for Nova."""
 
 from celery import Celery
-from typing import Dict, Any, Optional, cast
+from celery.signals import celeryd_after_setup, worker_process_init, worker_process_shutdown
+from typing import Dict, Any, List, Optional, Tuple, cast
 from nia.memory.two_layer import TwoLayerMemorySystem
 import json
 import uuid
+import os
 import asyncio
 import logging
+import threading
+import configparser
+import concurrent.futures
 from datetime import datetime, timezone
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 from nia.core.types.memory_types import EpisodicMemory
+from nia.core.change_feed import attach_configured_bridge
 
 from nia.nova.core.websocket_state import websocket_manager
 
@@ -18,6 +24,10 @@ from nia.nova.core.websocket_state import websocket_manager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds a task waits for its coroutine when [CELERY] task_timeout is not
+# set; below task_soft_time_limit so the task can still report the error
+DEFAULT_TASK_TIMEOUT = 200.0
+
 # Initialize Celery app
 celery_app = Celery(
     'nova',
@@ -43,14 +53,258 @@ celery_app.conf.update(
     task_max_retries=3  # Maximum of 3 retries
 )
 
+class WorkerRuntime:
+    """Per-process async runtime for Celery tasks.
+    
+    Owns one event loop running in a background thread, so the Neo4j driver,
+    Qdrant executor and aiohttp sessions the memory system creates stay bound
+    to a live loop across tasks. The loop is started at worker process init
+    (or lazily on first use) and restarted if the process has forked since.
+    """
+    
+    def __init__(self, task_timeout: Optional[float] = None):
+        """Initialize runtime.
+        
+        Args:
+            task_timeout: Seconds run() waits for a coroutine, 0 for no limit
+        """
+        config = configparser.ConfigParser()
+        config.read("config.ini")
+        self.task_timeout = task_timeout if task_timeout is not None else config.getfloat(
+            "CELERY", "task_timeout", fallback=DEFAULT_TASK_TIMEOUT
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._memory_system: Optional[TwoLayerMemorySystem] = None
+        self._memory_lock: Optional[asyncio.Lock] = None
+        
+    @property
+    def running(self) -> bool:
+        """Whether this process owns a live loop."""
+        return (
+            self._loop is not None
+            and self._pid == os.getpid()
+            and self._thread is not None
+            and self._thread.is_alive()
+        )
+        
+    def start(self):
+        """Start the loop thread if this process does not have one yet."""
+        with self._lock:
+            if self.running:
+                return
+            # A loop inherited across fork is unusable; drop its state
+            self._memory_system = None
+            self._memory_lock = None
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=self._run_loop,
+                args=(loop,),
+                name="celery-async-runtime",
+                daemon=True
+            )
+            thread.start()
+            self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            logger.info("Started worker async runtime")
+            
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+        
+    def run(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the worker loop and wait for its result.
+        
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait, task_timeout if None, 0 for no limit
+            
+        Raises:
+            concurrent.futures.TimeoutError: If the coroutine does not finish
+                in time; it is cancelled on the loop
+        """
+        self.start()
+        if timeout is None:
+            timeout = self.task_timeout
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout or None)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise concurrent.futures.TimeoutError(f"Task timed out after {timeout}s") from None
+        
+    async def get_memory_system(self) -> TwoLayerMemorySystem:
+        """Get the memory system, initializing it once per process."""
+        if self._memory_system is None:
+            if self._memory_lock is None:
+                self._memory_lock = asyncio.Lock()
+            async with self._memory_lock:
+                if self._memory_system is None:
+                    from nia.nova.core.dependencies import get_memory_system
+                    self._memory_system = await get_memory_system()
+                    await attach_configured_bridge()
+        return self._memory_system
+        
+    def stop(self):
+        """Clean up the memory system and stop the loop."""
+        with self._lock:
+            if not self.running:
+                return
+            loop, thread = self._loop, self._thread
+            try:
+                if self._memory_system is not None:
+                    asyncio.run_coroutine_threadsafe(self._memory_system.cleanup(), loop).result(30)
+            except Exception as e:
+                logger.error(f"Error cleaning up worker memory system: {str(e)}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+            self._loop = self._thread = self._pid = None
+            self._memory_system = None
+            self._memory_lock = None
+            logger.info("Stopped worker async runtime")
+
+# One runtime per worker process
+runtime = WorkerRuntime()
+
+@worker_process_init.connect
+def start_worker_runtime(**kwargs):
+    """Create the worker loop when a worker process starts."""
+    runtime.start()
+
+@worker_process_shutdown.connect
+def stop_worker_runtime(**kwargs):
+    """Release connections and stop the loop when a worker process exits."""
+    runtime.stop()
+
 def run_async(coro):
-    """Run an async function synchronously."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    """Run an async function synchronously on the worker's event loop."""
+    return runtime.run(coro)
+
+def _chat_message_event(data: Dict[str, Any], now: datetime) -> Tuple[Dict[str, Any], EpisodicMemory]:
+    message = {
+        "type": "chat_message",
+        "content": data.get("content", ""),  # Default to empty string
+        "sender_id": data.get("sender_id"),
+        "timestamp": datetime.now().isoformat()
+    }
+    memory = EpisodicMemory(
+        type="chat_message",
+        content=str(message["content"]),  # Ensure string content
+        timestamp=now,
+        metadata={
+            "sender_id": message["sender_id"],
+            "timestamp": now.isoformat()
+        }
+    )
+    return message, memory
+
+def _task_update_event(data: Dict[str, Any], now: datetime) -> Tuple[Dict[str, Any], EpisodicMemory]:
+    update = {
+        "type": "task_update",
+        "task_id": data.get("task_id"),
+        "status": data.get("status", "unknown"),  # Default status
+        "timestamp": datetime.now().isoformat(),
+        "metadata": data.get("metadata", {})
+    }
+    memory = EpisodicMemory(
+        type="task_update",
+        content=str(update["status"]),  # Use status as content
+        timestamp=now,
+        metadata={
+            "task_id": update["task_id"],
+            "timestamp": now.isoformat()
+        }
+    )
+    return update, memory
+
+def _agent_status_event(data: Dict[str, Any], now: datetime) -> Tuple[Dict[str, Any], EpisodicMemory]:
+    status = {
+        "type": "agent_status",
+        "agent_id": data.get("agent_id"),
+        "status": data.get("status", "unknown"),  # Default status
+        "timestamp": datetime.now().isoformat(),
+        "metadata": data.get("metadata", {})
+    }
+    memory = EpisodicMemory(
+        type="agent_status",
+        content=str(status["status"]),  # Use status as content
+        timestamp=now,
+        metadata={
+            "agent_id": status["agent_id"],
+            "timestamp": now.isoformat()
+        }
+    )
+    return status, memory
+
+def _graph_update_event(data: Dict[str, Any], now: datetime) -> Tuple[Dict[str, Any], EpisodicMemory]:
+    update = {
+        "type": "graph_update",
+        "nodes": data.get("nodes", []),
+        "edges": data.get("edges", []),
+        "timestamp": datetime.now().isoformat(),
+        "metadata": data.get("metadata", {})
+    }
+    memory = EpisodicMemory(
+        type="graph_update",
+        content=str(len(update["nodes"])) + " nodes, " + str(len(update["edges"])) + " edges",
+        timestamp=now,
+        metadata={
+            "graph_id": data.get("graph_id"),
+            "timestamp": now.isoformat()
+        }
+    )
+    return update, memory
+
+# Event type -> (event/memory builder, websocket broadcast method name)
+EVENT_HANDLERS = {
+    "chat_message": (_chat_message_event, "broadcast_chat_message"),
+    "task_update": (_task_update_event, "broadcast_task_update"),
+    "agent_status": (_agent_status_event, "broadcast_agent_status"),
+    "graph_update": (_graph_update_event, "broadcast_graph_update")
+}
+
+async def _store_events(events: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Store and broadcast events in one pass on the worker loop.
+    
+    A single event goes through ``store_memory``; several are written with
+    one ``store_memories`` call (one embedding batch, bulk upserts).
+    """
+    memory_system = await runtime.get_memory_system()
+    if not isinstance(memory_system, TwoLayerMemorySystem):
+        logger.error("Memory system not initialized")
+        return [{"error": "Memory system not initialized"} for _ in events]
+    memory_system = cast(TwoLayerMemorySystem, memory_system)
+    
+    # Check if episodic layer is properly initialized
+    if not memory_system.episodic or not memory_system.episodic.store:
+        logger.error("Memory system episodic layer not initialized")
+        return [{"error": "Memory system episodic layer not initialized"} for _ in events]
+        
+    now = datetime.now(timezone.utc)
+    built = [EVENT_HANDLERS[event_type][0](data, now) for event_type, data in events]
+    results = [event for event, _ in built]
+    
+    if len(built) == 1:
+        if not await memory_system.episodic.store_memory(built[0][1]):
+            results[0] = {**results[0], "error": "Failed to store memory"}
+    else:
+        stored = await memory_system.episodic.store_memories([memory for _, memory in built])
+        for i, result in enumerate(stored):
+            if not result["success"]:
+                results[i] = {**results[i], "error": result["error"]}
+                
+    # Broadcast updates
+    broadcasts = []
+    for (event_type, data), event in zip(events, results):
+        if data.get("client_id") and "error" not in event:
+            broadcast = getattr(websocket_manager, EVENT_HANDLERS[event_type][1])
+            broadcasts.append(broadcast(event, channel=data.get("channel")))
+    if broadcasts:
+        await asyncio.gather(*broadcasts)
+    return results
 
 @celery_app.task(name='nova.check_status')
 def check_status() -> Dict[str, Any]:
@@ -70,47 +324,7 @@ def check_status() -> Dict[str, Any]:
 def store_chat_message(self, data: Dict[str, Any]) -> Dict[str, Any]:
     """Store and broadcast a chat message."""
     try:
-        # Get memory system
-        from nia.nova.core.dependencies import get_memory_system
-        memory_system = run_async(get_memory_system())
-        if not isinstance(memory_system, TwoLayerMemorySystem):
-            logger.error("Memory system not initialized")
-            return {"error": "Memory system not initialized"}
-        memory_system = cast(TwoLayerMemorySystem, memory_system)
-        
-        # Create message
-        message = {
-            "type": "chat_message",
-            "content": data.get("content", ""),  # Default to empty string
-            "sender_id": data.get("sender_id"),
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        # Check if episodic layer is properly initialized
-        if not memory_system.episodic or not memory_system.episodic.store:
-            logger.error("Memory system episodic layer not initialized")
-            return {"error": "Memory system episodic layer not initialized"}
-            
-        now = datetime.now(timezone.utc)
-        run_async(memory_system.episodic.store_memory(EpisodicMemory(
-            type="chat_message",
-            content=str(message["content"]),  # Ensure string content
-            timestamp=now,
-            metadata={
-                "sender_id": message["sender_id"],
-                "timestamp": now.isoformat()
-            }
-        )))
-        
-        # Broadcast update
-        client_id = data.get("client_id")
-        channel = data.get("channel")
-        if client_id:
-            run_async(websocket_manager.broadcast_chat_message(
-                message,
-                channel=channel
-            ))
-        return message
+        return run_async(_store_events([("chat_message", data)]))[0]
     except Exception as e:
         logger.error(f"Store message error: {e}")
         return {"error": str(e)}
@@ -119,48 +333,7 @@ def store_chat_message(self, data: Dict[str, Any]) -> Dict[str, Any]:
 def store_task_update(self, data: Dict[str, Any]) -> Dict[str, Any]:
     """Store and broadcast a task update."""
     try:
-        # Get memory system
-        from nia.nova.core.dependencies import get_memory_system
-        memory_system = run_async(get_memory_system())
-        if not isinstance(memory_system, TwoLayerMemorySystem):
-            logger.error("Memory system not initialized")
-            return {"error": "Memory system not initialized"}
-        memory_system = cast(TwoLayerMemorySystem, memory_system)
-            
-        # Create update
-        update = {
-            "type": "task_update",
-            "task_id": data.get("task_id"),
-            "status": data.get("status", "unknown"),  # Default status
-            "timestamp": datetime.now().isoformat(),
-            "metadata": data.get("metadata", {})
-        }
-        
-        # Check if episodic layer is properly initialized
-        if not memory_system.episodic or not memory_system.episodic.store:
-            logger.error("Memory system episodic layer not initialized")
-            return {"error": "Memory system episodic layer not initialized"}
-            
-        now = datetime.now(timezone.utc)
-        run_async(memory_system.episodic.store_memory(EpisodicMemory(
-            type="task_update",
-            content=str(update["status"]),  # Use status as content
-            timestamp=now,
-            metadata={
-                "task_id": update["task_id"],
-                "timestamp": now.isoformat()
-            }
-        )))
-        
-        # Broadcast update
-        client_id = data.get("client_id")
-        channel = data.get("channel")
-        if client_id:
-            run_async(websocket_manager.broadcast_task_update(
-                update,
-                channel=channel
-            ))
-        return update
+        return run_async(_store_events([("task_update", data)]))[0]
     except Exception as e:
         logger.error(f"Task update error: {e}")
         return {"error": str(e)}
@@ -169,48 +342,7 @@ def store_task_update(self, data: Dict[str, Any]) -> Dict[str, Any]:
 def store_agent_status(self, data: Dict[str, Any]) -> Dict[str, Any]:
     """Store and broadcast an agent status update."""
     try:
-        # Get memory system
-        from nia.nova.core.dependencies import get_memory_system
-        memory_system = run_async(get_memory_system())
-        if not isinstance(memory_system, TwoLayerMemorySystem):
-            logger.error("Memory system not initialized")
-            return {"error": "Memory system not initialized"}
-        memory_system = cast(TwoLayerMemorySystem, memory_system)
-            
-        # Create status
-        status = {
-            "type": "agent_status",
-            "agent_id": data.get("agent_id"),
-            "status": data.get("status", "unknown"),  # Default status
-            "timestamp": datetime.now().isoformat(),
-            "metadata": data.get("metadata", {})
-        }
-        
-        # Check if episodic layer is properly initialized
-        if not memory_system.episodic or not memory_system.episodic.store:
-            logger.error("Memory system episodic layer not initialized")
-            return {"error": "Memory system episodic layer not initialized"}
-            
-        now = datetime.now(timezone.utc)
-        run_async(memory_system.episodic.store_memory(EpisodicMemory(
-            type="agent_status",
-            content=str(status["status"]),  # Use status as content
-            timestamp=now,
-            metadata={
-                "agent_id": status["agent_id"],
-                "timestamp": now.isoformat()
-            }
-        )))
-        
-        # Broadcast update
-        client_id = data.get("client_id")
-        channel = data.get("channel")
-        if client_id:
-            run_async(websocket_manager.broadcast_agent_status(
-                status,
-                channel=channel
-            ))
-        return status
+        return run_async(_store_events([("agent_status", data)]))[0]
     except Exception as e:
         logger.error(f"Agent status error: {e}")
         return {"error": str(e)}
@@ -219,55 +351,25 @@ def store_agent_status(self, data: Dict[str, Any]) -> Dict[str, Any]:
 def store_graph_update(self, data: Dict[str, Any]) -> Dict[str, Any]:
     """Store and broadcast a graph update."""
     try:
-        # Get memory system
-        from nia.nova.core.dependencies import get_memory_system
-        memory_system = run_async(get_memory_system())
-        if not isinstance(memory_system, TwoLayerMemorySystem):
-            logger.error("Memory system not initialized")
-            return {"error": "Memory system not initialized"}
-        memory_system = cast(TwoLayerMemorySystem, memory_system)
-            
-        # Create update
-        update = {
-            "type": "graph_update",
-            "nodes": data.get("nodes", []),
-            "edges": data.get("edges", []),
-            "timestamp": datetime.now().isoformat(),
-            "metadata": data.get("metadata", {})
-        }
-        
-        # Check if episodic layer is properly initialized
-        if not memory_system.episodic or not memory_system.episodic.store:
-            logger.error("Memory system episodic layer not initialized")
-            return {"error": "Memory system episodic layer not initialized"}
-            
-        now = datetime.now(timezone.utc)
-        run_async(memory_system.episodic.store_memory(EpisodicMemory(
-            type="graph_update",
-            content=str(len(update["nodes"])) + " nodes, " + str(len(update["edges"])) + " edges",
-            timestamp=now,
-            metadata={
-                "graph_id": data.get("graph_id"),
-                "timestamp": now.isoformat()
-            }
-        )))
-        
-        # Broadcast update
-        client_id = data.get("client_id")
-        channel = data.get("channel")
-        if client_id:
-            run_async(websocket_manager.broadcast_graph_update(
-                update,
-                channel=channel
-            ))
-        return update
+        return run_async(_store_events([("graph_update", data)]))[0]
     except Exception as e:
         logger.error(f"Graph update error: {e}")
         return {"error": str(e)}
 
-# Register startup handler
-from celery.signals import celeryd_after_setup
+@celery_app.task(bind=True, name='nova.store_events')
+def store_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Store and broadcast a batch of events.
+    
+    Each event is ``{"type": <event type>, "data": {...}}`` with a type from
+    EVENT_HANDLERS. The batch shares one embedding call and bulk upserts.
+    """
+    try:
+        return run_async(_store_events([(event["type"], event["data"]) for event in events]))
+    except Exception as e:
+        logger.error(f"Store events error: {e}")
+        return [{"error": str(e)} for _ in events]
 
+# Register startup handler
 @celeryd_after_setup.connect
 def setup_periodic_tasks(**kwargs):
     # Check service status every 30 seconds
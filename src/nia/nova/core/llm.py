@@ -5,6 +5,7 @@ import json
 import asyncio
 from typing import Dict, Any, Optional, Type, TypeVar, Union, AsyncGenerator, AsyncIterator
 from datetime import datetime
+from nia.core.types.json_utils.streaming import StreamingJSONExtractor, extract_json_incremental
 from .llm_types import (
     LLMProvider,
     LLMModel,
@@ -21,6 +22,9 @@ from .llm_types import (
 
 T = TypeVar('T')
 
+# Returned by LMStudioLLM._parse_stream_line at the end of a stream
+STREAM_DONE: Dict[str, Any] = {"type": "done"}
+
 class LLMInterface:
     """Base LLM interface."""
     
@@ -108,16 +112,36 @@ class LMStudioLLM(LLMInterface):
         endpoint: str,
         payload: Dict[str, Any],
         stream: bool = False
-    ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
-        """Make request to LM Studio API."""
+    ) -> Union[Dict[str, Any], aiohttp.ClientResponse]:
+        """Make request to LM Studio API.
+        
+        With stream=True the open response is returned and the connection
+        stays checked out until _stream_chunks has consumed and released it.
+        """
         session = await self._ensure_session()
+        url = f"{self.api_base}/{endpoint}"
         try:
-            # Add streaming parameter if needed
             if stream:
                 payload["stream"] = True
+                # Streams may run long; only bound the wait between reads
+                response = await session.post(
+                    url,
+                    json=payload,
+                    timeout=aiohttp.ClientTimeout(total=None, sock_read=300)
+                )
+                if response.status == 200:
+                    return response
+                try:
+                    error = await response.text()
+                finally:
+                    response.release()
+                raise LLMError(
+                    code="API_ERROR",
+                    message=f"LM Studio API error: {error}"
+                )
                 
             async with session.post(
-                f"{self.api_base}/{endpoint}",
+                url,
                 json=payload,
                 timeout=aiohttp.ClientTimeout(total=300)  # 5 minute timeout
             ) as response:
@@ -127,9 +151,6 @@ class LMStudioLLM(LLMInterface):
                         code="API_ERROR",
                         message=f"LM Studio API error: {error}"
                     )
-                
-                if stream:
-                    return self._stream_chunks(response)
                 return await response.json()
                 
         except aiohttp.ClientError as e:
@@ -138,27 +159,60 @@ class LMStudioLLM(LLMInterface):
                 message=f"Failed to connect to LM Studio API: {str(e)}"
             )
 
+    def _parse_stream_line(self, line: bytes) -> Optional[Dict[str, Any]]:
+        """Parse one line of an SSE (``data: {...}``) or JSON-lines stream.
+        
+        Returns None for lines that carry no chunk, and STREAM_DONE at the
+        ``[DONE]`` sentinel.
+        """
+        line = line.strip()
+        if line.startswith(b"data:"):
+            line = line[5:].strip()
+        if not line or line.startswith((b":", b"event:", b"id:", b"retry:")):
+            return None
+        if line == b"[DONE]":
+            return STREAM_DONE
+        try:
+            chunk = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        choices = chunk.get("choices") or [{}]
+        delta = choices[0].get("delta")
+        finish_reason = choices[0].get("finish_reason", chunk.get("finish_reason"))
+        if delta is None and finish_reason is None:
+            return None
+        return {
+            "type": "llm_chunk",
+            "data": {
+                "content": (delta or {}).get("content") or "",
+                "is_final": finish_reason is not None
+            },
+            "timestamp": datetime.now().isoformat()
+        }
+
     async def _stream_chunks(
         self,
         response: aiohttp.ClientResponse
     ) -> AsyncIterator[Dict[str, Any]]:
-        """Stream response chunks."""
+        """Stream response chunks as they arrive.
+        
+        Reads happen only when the consumer asks for the next chunk, so a
+        slow consumer applies backpressure all the way to the server.
+        """
+        buffer = b""
         try:
-            async for line in response.content:
-                if line:
-                    try:
-                        chunk = json.loads(line.decode())
-                        if chunk.get("choices") and chunk["choices"][0].get("delta"):
-                            yield {
-                                "type": "llm_chunk",
-                                "data": {
-                                    "content": chunk["choices"][0]["delta"].get("content", ""),
-                                    "is_final": chunk.get("finish_reason") is not None
-                                },
-                                "timestamp": datetime.now().isoformat()
-                            }
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        continue
+            async for data in response.content.iter_any():
+                buffer += data
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    chunk = self._parse_stream_line(line)
+                    if chunk is STREAM_DONE:
+                        return
+                    if chunk is not None:
+                        yield chunk
+            chunk = self._parse_stream_line(buffer)
+            if chunk is not None and chunk is not STREAM_DONE:
+                yield chunk
         except Exception as e:
             yield {
                 "type": "error",
@@ -168,6 +222,19 @@ class LMStudioLLM(LLMInterface):
                 },
                 "timestamp": datetime.now().isoformat()
             }
+        finally:
+            response.release()
+
+    async def _error_stream(self, error: Exception) -> AsyncIterator[Dict[str, Any]]:
+        """Single-chunk stream reporting a failed request."""
+        yield {
+            "type": "error",
+            "data": {
+                "code": getattr(error, "code", "STREAM_ERROR"),
+                "message": str(error)
+            },
+            "timestamp": datetime.now().isoformat()
+        }
 
     async def _collect_stream(
         self,
@@ -241,12 +308,8 @@ class LMStudioLLM(LLMInterface):
             
             # Try to parse the response as JSON
             try:
-                # Find the first { and last }
-                start = content_text.find('{')
-                end = content_text.rfind('}') + 1
-                if start >= 0 and end > start:
-                    json_str = content_text[start:end]
-                    parsed = json.loads(json_str)
+                parsed = extract_json_incremental(content_text)
+                if parsed is not None:
                     
                     # Add metadata
                     if metadata:
@@ -327,11 +390,14 @@ class LMStudioLLM(LLMInterface):
             
             response = await self._make_request("chat/completions", payload, stream=stream)
             
-            if isinstance(response, AsyncIterator):
-                return response
+            if stream:
+                return self._stream_chunks(response)
             
             return self._parse_chat_response(response, template, content)
         except Exception as e:
+            if stream:
+                return self._error_stream(e)
+                
             # Return error response
             error_concept = LLMConcept(
                 name="error",
@@ -351,6 +417,35 @@ class LMStudioLLM(LLMInterface):
                 metadata=content.get("metadata", {})
             ).dict()
 
+    async def analyze_fields(
+        self,
+        content: Dict[str, Any],
+        template: str,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream an analysis, yielding each top-level field once it closes.
+        
+        Yields ``llm_field`` events (``{"field": ..., "value": ...}``) while the
+        model is still generating later fields; errors are passed through.
+        """
+        stream = await self.analyze(content, template, stream=True, **kwargs)
+        extractor = StreamingJSONExtractor()
+        try:
+            async for chunk in stream:
+                if chunk["type"] == "error":
+                    yield chunk
+                    return
+                for field, value in extractor.feed(chunk["data"]["content"]):
+                    yield {
+                        "type": "llm_field",
+                        "data": {"field": field, "value": value},
+                        "timestamp": datetime.now().isoformat()
+                    }
+                if extractor.done:
+                    return
+        finally:
+            await stream.aclose()
+
     async def generate(
         self,
         prompt: str,
@@ -369,8 +464,8 @@ class LMStudioLLM(LLMInterface):
         
         response = await self._make_request("chat/completions", payload, stream=stream)
         
-        if isinstance(response, AsyncIterator):
-            return response
+        if stream:
+            return self._stream_chunks(response)
             
         return response["choices"][0]["message"]["content"]
 
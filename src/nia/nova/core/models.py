@@ -22,6 +22,11 @@ class TaskStateTransition(BaseModel):
     requires_validation: bool = False
     validation_rules: Optional[Dict[str, Any]] = None
 
+class TaskTransitionRequest(BaseModel):
+    """One entry of a bulk task state transition."""
+    task_id: str
+    new_state: TaskState
+
 class Message(BaseModel):
     """Message model."""
     id: str
@@ -13,7 +13,8 @@ from pydantic import BaseModel, Field
 
 from nia.core.types.memory_types import Memory, MemoryType, EpisodicMemory
 from nia.nova.memory.two_layer import TwoLayerMemorySystem
-from .error_handling import ResourceNotFoundError, ServiceError
+from nia.core.hot_logging import get_hot_logger, record_fields
+from .error_handling import ResourceNotFoundError, ServiceError, ValidationError
 from qdrant_client.http import models
 
 import os
@@ -93,6 +94,7 @@ class ThreadValidation(BaseModel):
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)  # Reduce logging level
 logger.propagate = False  # Prevent console output
+hot = get_hot_logger(__name__)
 
 # Create logs directory if it doesn't exist
 LOGS_DIR = Path("scripts/logs/fastapi")
@@ -108,14 +110,15 @@ class JsonFormatter(logging.Formatter):
         log_entry = {
             "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
-            "message": record.getMessage()
+            "message": record.getMessage(),
+            **record_fields(record)
         }
         
         # Only add exception info for errors
         if record.exc_info and record.levelno >= logging.ERROR:
             log_entry["error"] = str(record.exc_info[1])
             
-        return json.dumps(log_entry)
+        return json.dumps(log_entry, default=str)
 
 # Configure logging with smaller file size and more backups
 handler = RotatingFileHandler(
@@ -143,6 +146,19 @@ class ThreadManager:
     NOVA_UUID = "00000000-0000-4000-a000-000000000002"
     SYSTEM_LOGS_UUID = "00000000-0000-4000-a000-000000000003"
     AGENT_COMMUNICATION_UUID = "00000000-0000-4000-a000-000000000004"
+    
+    # Legacy system thread IDs
+    LEGACY_THREAD_IDS = {
+        "nova-team": NOVA_TEAM_UUID,
+        "nova": NOVA_UUID,
+        "system-logs": SYSTEM_LOGS_UUID,
+        "agent-communication": AGENT_COMMUNICATION_UUID
+    }
+    
+    # Message log paging and legacy migration
+    MESSAGE_PAGE_SIZE = 100
+    MAX_MESSAGE_PAGE_SIZE = 1000
+    LEGACY_MIGRATION_BATCH_SIZE = 500
 
     def __init__(self, memory_system: TwoLayerMemorySystem):
         if not memory_system:
@@ -151,6 +167,7 @@ class ThreadManager:
             raise ValueError("Memory system must have both episodic and semantic layers")
         self.memory_system = memory_system
         self._initialized = False
+        self._migrated_threads = set()  # Threads whose embedded messages are in the log
         
     async def initialize(self) -> bool:
         """Initialize the thread manager."""
@@ -160,6 +177,15 @@ class ThreadManager:
             if not self.memory_system.episodic or not self.memory_system.semantic:
                 raise RuntimeError("Memory system layers not properly initialized")
                 
+            # Index the append-only message log on its (thread_id, seq) key
+            await self.memory_system.semantic.run_query(
+                """
+                CREATE INDEX thread_message_seq IF NOT EXISTS
+                FOR (m:ThreadMessage)
+                ON (m.thread_id, m.seq)
+                """
+            )
+            
             # Create system threads if they don't exist
             await self.get_thread(self.NOVA_TEAM_UUID)
             await self.get_thread(self.NOVA_UUID)
@@ -180,7 +206,7 @@ class ThreadManager:
         if recursion_depth > 3:
             logger.error(f"Maximum recursion depth reached for thread {thread_id}")
             raise ServiceError(f"Maximum recursion depth reached for thread {thread_id}")
-        logger.debug(f"Getting thread {thread_id}")
+        hot.debug("get_thread", "Getting thread %s", thread_id)
         
         # Map legacy IDs to UUIDs
         id_mapping = {
@@ -206,7 +232,6 @@ class ThreadManager:
         for attempt in range(max_retries):
             try:
                 # Check episodic layer first
-                logger.debug("Querying episodic layer...")
                 # Create serializable filter conditions
                 filter_dict = {
                     "must": [
@@ -237,12 +262,12 @@ class ThreadManager:
                 })
 
                 if result and len(result) > 0 and "content" in result[0]:
-                    logger.debug("Found thread in episodic layer")
-                    return result[0]["content"]
+                    hot.debug("get_thread.episodic", "Found thread %s in episodic layer", thread_id)
+                    thread = result[0]["content"]
+                    await self._hydrate_messages([thread])
+                    return thread
 
                 # Check semantic layer before creating system thread
-                logger.debug("Checking semantic layer...")
-                
                 if not self.memory_system.semantic:
                     raise ServiceError("Semantic layer not initialized")
                     
@@ -576,10 +601,6 @@ class ThreadManager:
                     "source": "nova"
                 }
 
-                # Create memory data with enhanced thread ID handling
-                logger.info("Creating memory data for thread storage")
-                logger.info(f"Thread ID: {thread['id']}")
-                
                 # Create memory data with explicit thread ID handling
                 thread_id = thread["id"]  # Extract thread ID
                 memory_data = {
@@ -604,22 +625,16 @@ class ThreadManager:
                     }
                 }
                 
-                # Create EpisodicMemory object
-                logger.info("Creating EpisodicMemory object")
                 # Create memory with proper type handling
                 memory_data["type"] = str(memory_data["type"])  # Convert type to string
                 memory = EpisodicMemory(**memory_data)
-                logger.info(f"Created memory object with ID: {memory.id}")
                 
                 # Store memory directly in episodic layer
-                logger.info("Storing memory in episodic layer")
                 if not self.memory_system.episodic:
                     raise ServiceError("Episodic layer not initialized")
                 store_result = await self.memory_system.episodic.store_memory(memory)
-                logger.debug("Successfully stored in episodic layer")
 
                 # Store in semantic layer with flattened metadata
-                logger.debug("Storing in semantic layer...")
                 if not self.memory_system.semantic:
                     raise ServiceError("Semantic layer not initialized")
                     
@@ -644,18 +659,14 @@ class ThreadManager:
                     }
                 )
 
-                logger.debug("Successfully stored in semantic layer")
-
-                # Log successful storage
-                logger.info(f"Successfully stored thread {thread_id} in both layers")
+                hot.info("store_thread", "Stored thread %s in both layers", thread_id, attempt=attempt + 1)
 
                 # Verify storage if requested
                 if verify:
-                    logger.debug(f"Verifying thread storage for {thread_id}")
                     stored_thread = await self.get_thread(thread_id)
                     if not stored_thread:
                         raise RuntimeError(f"Thread {thread_id} verification failed - not found after storage")
-                    logger.info(f"Successfully verified thread {thread_id} storage")
+                    hot.debug("store_thread.verify", "Verified thread %s storage", thread_id)
                 return
 
             except Exception as e:
@@ -742,11 +753,115 @@ class ThreadManager:
             for result in results:
                 if "content" in result:
                     threads.append(result["content"])
+        await self._hydrate_messages(threads)
         return threads
 
+    async def _migrate_legacy_messages(self, thread: Dict[str, Any]) -> None:
+        """Move messages embedded in a thread document into its message log.
+        
+        Threads stored before the message log kept their history in
+        ``thread["messages"]``. The first caller to see such a thread claims
+        it by flagging the Thread node, shifts any log records already
+        appended after the claimed messages, and writes the embedded messages
+        as seqs 1..n in batches of LEGACY_MIGRATION_BATCH_SIZE.
+        """
+        thread_id = thread.get("id")
+        if not thread_id or thread_id in self._migrated_threads:
+            return
+        legacy = thread.get("messages") or []
+        
+        # Claim the thread; the counter update holds its write lock, so
+        # concurrent appends land after the migrated history. Grouping by t
+        # returns no row when the thread was already claimed.
+        claimed = await self.memory_system.semantic.run_query(
+            """
+            MATCH (t:Thread {id: $thread_id})
+            WHERE t.messages_migrated IS NULL
+            SET t.messages_migrated = true,
+                t.message_count = coalesce(t.message_count, 0) + $count
+            WITH t
+            OPTIONAL MATCH (m:ThreadMessage {thread_id: $thread_id})
+            SET m.seq = m.seq + $count
+            WITH t, count(m) AS shifted
+            RETURN t.id AS id, shifted
+            """,
+            {"thread_id": thread_id, "count": len(legacy)}
+        )
+        self._migrated_threads.add(thread_id)
+        if not claimed or not legacy:
+            return
+            
+        batch_size = self.LEGACY_MIGRATION_BATCH_SIZE
+        for start in range(0, len(legacy), batch_size):
+            batch = [
+                {
+                    "seq": start + offset + 1,
+                    "id": str((message.get("data") or {}).get("id") or uuid.uuid4()),
+                    "timestamp": str(message.get("timestamp") or thread.get("updatedAt")),
+                    "payload": json.dumps(message, default=str)
+                }
+                for offset, message in enumerate(legacy[start:start + batch_size])
+            ]
+            await self.memory_system.semantic.run_query(
+                """
+                UNWIND $messages AS message
+                CREATE (m:ThreadMessage {
+                    thread_id: $thread_id,
+                    seq: message.seq,
+                    id: message.id,
+                    timestamp: message.timestamp,
+                    payload: message.payload
+                })
+                """,
+                {"thread_id": thread_id, "messages": batch}
+            )
+        logger.info(f"Migrated {len(legacy)} embedded messages of thread {thread_id} to the message log")
+
+    async def _hydrate_messages(self, threads: List[Dict[str, Any]]) -> None:
+        """Replace each thread's embedded ``messages`` with its newest logged messages.
+        
+        Loads at most MESSAGE_PAGE_SIZE messages per thread in one query;
+        older history is paged through get_thread_messages.
+        """
+        if not threads or not self.memory_system.semantic:
+            return
+        for thread in threads:
+            await self._migrate_legacy_messages(thread)
+            
+        rows = await self.memory_system.semantic.run_query(
+            """
+            UNWIND $thread_ids AS thread_id
+            MATCH (m:ThreadMessage {thread_id: thread_id})
+            WITH thread_id, m
+            ORDER BY m.seq DESC
+            WITH thread_id, collect(m)[..$limit] AS recent
+            RETURN thread_id, [m IN reverse(recent) | {seq: m.seq, payload: m.payload}] AS messages
+            """,
+            {"thread_ids": [thread["id"] for thread in threads], "limit": self.MESSAGE_PAGE_SIZE}
+        )
+        logged = {row["thread_id"]: row["messages"] for row in rows or []}
+        for thread in threads:
+            thread["messages"] = [self._message_from_row(row) for row in logged.get(thread["id"], [])]
+
+    @staticmethod
+    def _message_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode a ThreadMessage record into a message dict with its seq."""
+        return {**json.loads(row["payload"]), "seq": row["seq"]}
+
     async def add_message(self, thread_id: str, message: Dict[str, Any]) -> Dict[str, Any]:
-        """Add a message to a thread."""
-        thread = await self.get_thread(thread_id)
+        """Append a message to a thread's message log.
+        
+        Messages are stored as individual ThreadMessage records keyed by
+        (thread_id, seq); the thread header is not loaded or rewritten, so
+        posting cost does not grow with thread length. Messages embedded in
+        a legacy thread document are moved ahead of appended ones the next
+        time the thread is read.
+        
+        Returns:
+            Dict[str, Any]: The stored message, including its ``seq``
+        """
+        # Map legacy IDs to UUIDs
+        thread_id = self.LEGACY_THREAD_IDS.get(thread_id, thread_id)
         
         # Validate message with ThreadMessage model
         thread_message = ThreadMessage(
@@ -756,21 +871,132 @@ class ThreadManager:
             thread_id=thread_id,
             sender_id=message.get("sender_id", "system")
         )
+        record = thread_message.model_dump(mode="json")
+        message_id = str(message.get("id") or uuid.uuid4())
         
-        # Add validated message
-        thread["messages"].append(thread_message.model_dump())
-        await self.update_thread(thread)
+        if not self.memory_system.semantic:
+            raise ServiceError("Semantic layer not initialized")
+            
+        # Allocate the next seq and create the record in one statement;
+        # the counter increment holds the thread's write lock
+        params = {
+            "thread_id": thread_id,
+            "id": message_id,
+            "timestamp": record["timestamp"],
+            "payload": json.dumps(record)
+        }
+        query = """
+            MATCH (t:Thread {id: $thread_id})
+            SET t.message_count = coalesce(t.message_count, 0) + 1,
+                t.updatedAt = $timestamp
+            CREATE (m:ThreadMessage {
+                thread_id: $thread_id,
+                seq: t.message_count,
+                id: $id,
+                timestamp: $timestamp,
+                payload: $payload
+            })
+            RETURN m.seq AS seq
+        """
+        result = await self.memory_system.semantic.run_query(query, params)
+        if not result:
+            # Thread header missing; get_thread creates system threads or raises
+            await self.get_thread(thread_id)
+            result = await self.memory_system.semantic.run_query(query, params)
+            if not result:
+                raise ResourceNotFoundError(f"Thread {thread_id} not found")
         
-        # Broadcast update via WebSocket
-        thread_update = ThreadUpdate(
-            type="thread_update",
-            client_id=message.get("client_id", "system"),
-            data=Thread(**thread),
-            update_type="updated"
-        )
+        return {**record, "id": message_id, "seq": result[0]["seq"]}
+
+    async def get_thread_messages(
+        self,
+        thread_id: str,
+        after: Optional[int] = None,
+        before: Optional[int] = None,
+        limit: int = MESSAGE_PAGE_SIZE,
+        offset: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get a page of messages from a thread's message log.
         
-        # Return updated thread
-        return thread
+        With ``after``, returns the oldest messages with seq > after; with
+        ``offset``, skips that many messages from the oldest. Otherwise
+        returns the newest messages (with seq < before, if given). Messages
+        are always in ascending seq order.
+        
+        Returns:
+            Dict[str, Any]: ``messages``, ``has_more`` and ``next_cursor`` (the
+                seq to pass as ``after``/``before`` for the next page, or None)
+                
+        Raises:
+            ValidationError: If limit is outside 1..MAX_MESSAGE_PAGE_SIZE or offset is negative
+            ResourceNotFoundError: If the thread does not exist
+        """
+        if not 1 <= limit <= self.MAX_MESSAGE_PAGE_SIZE:
+            raise ValidationError(f"limit must be between 1 and {self.MAX_MESSAGE_PAGE_SIZE}")
+        if offset is not None and offset < 0:
+            raise ValidationError("offset must not be negative")
+            
+        # Map legacy IDs to UUIDs
+        thread_id = self.LEGACY_THREAD_IDS.get(thread_id, thread_id)
+        
+        if not self.memory_system.semantic:
+            raise ServiceError("Semantic layer not initialized")
+            
+        if thread_id not in self._migrated_threads:
+            header = await self.memory_system.semantic.run_query(
+                """
+                MATCH (t:Thread {id: $thread_id})
+                RETURN t.messages_migrated AS migrated
+                """,
+                {"thread_id": thread_id}
+            )
+            if not header and thread_id not in self.LEGACY_THREAD_IDS.values():
+                raise ResourceNotFoundError(f"Thread {thread_id} not found")
+            if not header or header[0].get("migrated") is None:
+                # get_thread creates system threads and migrates embedded messages
+                await self.get_thread(thread_id)
+            self._migrated_threads.add(thread_id)
+            
+        if after is not None or offset is not None:
+            query = """
+                MATCH (m:ThreadMessage {thread_id: $thread_id})
+                WHERE m.seq > $cursor
+                RETURN m.seq AS seq, m.payload AS payload
+                ORDER BY m.seq ASC
+                SKIP $offset
+                LIMIT $limit
+            """
+            cursor = after if after is not None else 0
+        else:
+            query = """
+                MATCH (m:ThreadMessage {thread_id: $thread_id})
+                WHERE $cursor IS NULL OR m.seq < $cursor
+                RETURN m.seq AS seq, m.payload AS payload
+                ORDER BY m.seq DESC
+                LIMIT $limit
+            """
+            cursor = before
+        forward = after is not None or offset is not None
+            
+        # Fetch one extra row to know whether another page exists
+        rows = await self.memory_system.semantic.run_query(
+            query,
+            {"thread_id": thread_id, "cursor": cursor, "offset": offset or 0, "limit": limit + 1}
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if not forward:
+            rows.reverse()
+            
+        messages = [self._message_from_row(row) for row in rows]
+        next_cursor = None
+        if has_more and messages:
+            next_cursor = messages[-1]["seq"] if forward else messages[0]["seq"]
+        return {
+            "messages": messages,
+            "has_more": has_more,
+            "next_cursor": next_cursor
+        }
 
     async def add_participant(self, thread_id: str, participant: Dict[str, Any]) -> Dict[str, Any]:
         """Add a participant to a thread."""
@@ -966,7 +1192,7 @@ class ThreadManager:
             # Delete from episodic layer
             await self.memory_system.delete_memory(thread_id)
             
-            # Delete from semantic layer
+            # Delete from semantic layer, including the message log
             await self.memory_system.semantic.run_query(
                 """
                 MATCH (t:Thread {id: $id})
@@ -974,6 +1200,14 @@ class ThreadManager:
                 """,
                 {"id": thread_id}
             )
+            await self.memory_system.semantic.run_query(
+                """
+                MATCH (m:ThreadMessage {thread_id: $id})
+                DETACH DELETE m
+                """,
+                {"id": thread_id}
+            )
+            self._migrated_threads.discard(thread_id)
             
             logger.info(f"Successfully deleted thread {thread_id}")
             return True
@@ -1,23 +1,171 @@
 """WebSocket server for real-time updates."""
 
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Awaitable, AsyncIterator, Deque, Tuple
+from collections import deque
 from datetime import datetime
 import json
+import time
 import asyncio
 import logging
 import traceback
 from qdrant_client.http import models
 from nia.core.types.memory_types import Memory, MemoryType, EpisodicMemory
+from nia.nova.memory.vector_store import OperationMetrics
+from nia.core.change_feed import change_feed, attach_configured_bridge
+from nia.core.hot_logging import get_hot_logger
 from .celery_app import celery_app, store_chat_message, store_task_update, store_agent_status, store_graph_update
 from .dependencies import get_memory_system, get_agent_store
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+hot = get_hot_logger(__name__)
+
+# What to do when a client's send queue is full
+SLOW_CONSUMER_POLICIES = ("drop_oldest", "coalesce", "disconnect")
+DEFAULT_SEND_QUEUE_SIZE = 256
+DEFAULT_FLUSH_TIMEOUT = 1.0  # Seconds a closing connection may spend sending what it has queued
+
+class SlowConsumerError(Exception):
+    """Raised when a client's send queue overflows under the disconnect policy."""
+
+class ClientSender:
+    """Bounded send queue for one connection, drained by a writer task.
+    
+    Messages are queued as pre-serialized JSON text. When the queue is full
+    the slow-consumer policy decides what happens:
+    
+    - ``drop_oldest``: discard the oldest queued message
+    - ``coalesce``: replace the queued message with the same coalesce key
+      (message type), falling back to dropping the oldest
+    - ``disconnect``: close the connection
+    """
+    
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_size: int,
+        policy: str,
+        metrics: OperationMetrics,
+        on_error: Callable[[Exception, Optional[str]], Awaitable[None]]
+    ):
+        self.websocket = websocket
+        self.max_size = max_size
+        self.policy = policy
+        self.metrics = metrics
+        self.on_error = on_error
+        self.queue: Deque[Tuple[Optional[str], str, float, Optional[str]]] = deque()
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._task = asyncio.create_task(self._drain())
+        
+    def enqueue(self, text: str, key: Optional[str] = None, channel: Optional[str] = None) -> bool:
+        """Queue a serialized message. Returns False if the client must be dropped.
+        
+        ``channel`` is the channel the message was broadcast to, if any; it is
+        passed to ``on_error`` if sending the message fails.
+        """
+        if len(self.queue) >= self.max_size:
+            if self.policy == "disconnect":
+                return False
+            if self.policy == "coalesce" and key is not None:
+                for i, (queued_key, _, _, _) in enumerate(self.queue):
+                    if queued_key == key:
+                        del self.queue[i]
+                        self.coalesced += 1
+                        break
+                else:
+                    self.queue.popleft()
+                    self.dropped += 1
+            else:
+                self.queue.popleft()
+                self.dropped += 1
+        self.queue.append((key, text, time.perf_counter(), channel))
+        self._idle.clear()
+        self._ready.set()
+        return True
+        
+    async def put(self, text: str, channel: Optional[str] = None):
+        """Queue a message, waiting for space instead of applying the policy.
+        
+        Used for ordered streams that must not lose messages; the producer
+        is paused until the client catches up.
+        """
+        while len(self.queue) >= self.max_size:
+            if self.closed:
+                break
+            self._space.clear()
+            await self._space.wait()
+        if self.closed:
+            raise ConnectionError("Client sender closed")
+        self.queue.append((None, text, time.perf_counter(), channel))
+        self._idle.clear()
+        self._ready.set()
+        
+    async def _drain(self):
+        """Send queued messages in order until cancelled or a send fails."""
+        while True:
+            if not self.queue:
+                self._idle.set()
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            _, text, enqueued_at, channel = self.queue.popleft()
+            self._space.set()
+            start = time.perf_counter()
+            try:
+                await self.websocket.send_text(text)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.metrics.record(0.0, error=True)
+                await self.on_error(e, channel)
+                return
+            end = time.perf_counter()
+            self.metrics.record((end - start) * 1000, wait_ms=(start - enqueued_at) * 1000)
+            
+    async def close(self, flush_timeout: float = 0.0):
+        """Stop the writer task, discarding queued messages.
+        
+        Args:
+            flush_timeout: Seconds to wait for queued messages to be sent first
+        """
+        if flush_timeout and not self._task.done() and self._task is not asyncio.current_task():
+            try:
+                await asyncio.wait_for(self._idle.wait(), flush_timeout)
+            except asyncio.TimeoutError:
+                pass
+        self.closed = True
+        self.queue.clear()
+        self._space.set()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
 
 class ConnectionManager:
-    """Manage WebSocket connections and channels."""
-    def __init__(self):
+    """Manage WebSocket connections and channels.
+    
+    Broadcasts serialize the message once and enqueue it to each client's
+    ClientSender, so a slow client never delays delivery to the others.
+    """
+    def __init__(
+        self,
+        send_queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
+        slow_consumer_policy: str = "drop_oldest"
+    ):
+        if slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Invalid slow consumer policy: {slow_consumer_policy}")
+        self.send_queue_size = send_queue_size
+        self.slow_consumer_policy = slow_consumer_policy
+        self.senders: Dict[str, Dict[str, ClientSender]] = {}
+        self.send_metrics = OperationMetrics()
+        self.slow_disconnects = 0
         self.active_connections: Dict[str, Dict[str, WebSocket]] = {
             "chat": {},      # Chat/channel connections
             "tasks": {},     # Task board connections
@@ -44,10 +192,19 @@ class ConnectionManager:
                     await old_websocket.close(code=1012, reason="Reconnecting")
                 except Exception as e:
                     logger.error(f"Error closing old connection for client {client_id}: {str(e)}")
+                await self._close_sender(connection_type, client_id)
                 
             # Store connection
             logger.debug(f"Storing connection for client {client_id} in {connection_type}")
             self.active_connections[connection_type][client_id] = websocket
+            sender = ClientSender(
+                websocket,
+                max_size=self.send_queue_size,
+                policy=self.slow_consumer_policy,
+                metrics=self.send_metrics,
+                on_error=lambda e, channel: self._drop_client(client_id, connection_type, websocket, e, channel)
+            )
+            self.senders.setdefault(connection_type, {})[client_id] = sender
             
             # Send initial connection success message
             message = {
@@ -59,12 +216,9 @@ class ConnectionManager:
                     "connection_type": connection_type
                 }
             }
-            try:
-                await websocket.send_json(message)
-                logger.debug(f"Sent connection success message to client {client_id}")
-            except Exception as e:
-                logger.error(f"Error sending connection success message to client {client_id}: {str(e)}")
-                raise RuntimeError(f"Failed to send connection success message: {str(e)}") from e
+            # Queued first, so it precedes any broadcast; a failed send drops the client
+            await sender.put(json.dumps(message, default=str))
+            logger.debug(f"Queued connection success message to client {client_id}")
                 
         except Exception as e:
             logger.error(f"Error connecting client {client_id}: {str(e)}")
@@ -77,10 +231,11 @@ class ConnectionManager:
             # Clean up connection if stored
             if connection_type in self.active_connections and client_id in self.active_connections[connection_type]:
                 self.active_connections[connection_type].pop(client_id, None)
+            await self._close_sender(connection_type, client_id)
             raise
             
-    async def disconnect(self, client_id: str, connection_type: str):
-        """Disconnect a client."""
+    async def disconnect(self, client_id: str, connection_type: str, flush: bool = False):
+        """Disconnect a client, optionally sending its queued messages first."""
         try:
             if connection_type not in self.active_connections:
                 logger.warning(f"Invalid connection type for disconnect: {connection_type}")
@@ -94,14 +249,57 @@ class ConnectionManager:
             
             # Remove from active connections first
             self.active_connections[connection_type].pop(client_id, None)
+            await self._close_sender(connection_type, client_id, flush)
             logger.debug(f"Removed client {client_id} from {connection_type} connections")
             
         except Exception as e:
             logger.error(f"Error disconnecting client {client_id}: {str(e)}")
             logger.error(traceback.format_exc())
             
+    async def _close_sender(self, connection_type: str, client_id: str, flush: bool = False):
+        """Stop and remove a client's sender, if any."""
+        sender = self.senders.get(connection_type, {}).pop(client_id, None)
+        if sender:
+            await sender.close(DEFAULT_FLUSH_TIMEOUT if flush else 0.0)
+            
+    async def _drop_client(
+        self,
+        client_id: str,
+        connection_type: str,
+        websocket: WebSocket,
+        error: Exception,
+        channel: Optional[str] = None
+    ):
+        """Close and remove a client whose send failed or whose queue overflowed.
+        
+        The client is unsubscribed only from ``channel``, the channel of the
+        message that failed; its other connections keep their subscriptions.
+        """
+        # Ignore stale senders from a connection that has since been replaced
+        if self.active_connections.get(connection_type, {}).get(client_id) is not websocket:
+            return
+        logger.error(f"Error broadcasting message to client {client_id}: {str(error)}")
+        slow = isinstance(error, SlowConsumerError)
+        try:
+            await websocket.close(
+                code=1008 if slow else 1011,
+                reason="Slow consumer" if slow else "Failed to send message"
+            )
+        except Exception as close_error:
+            logger.error(f"Error closing failed connection for client {client_id}: {str(close_error)}")
+        logger.info(f"Removing failed connection for client {client_id}")
+        self.active_connections[connection_type].pop(client_id, None)
+        await self._close_sender(connection_type, client_id)
+        # Remove from the failed message's channel
+        if channel in self.channel_subscriptions:
+            self.channel_subscriptions[channel].pop(client_id, None)
+            
     async def broadcast(self, message: Dict[str, Any], connection_type: str, channel: Optional[str] = None):
-        """Broadcast message to all connections of a specific type or channel."""
+        """Broadcast message to all connections of a specific type or channel.
+        
+        The message is serialized once and queued per client; delivery happens
+        on each client's writer task.
+        """
         if connection_type not in self.active_connections:
             logger.warning(f"Invalid connection type for broadcast: {connection_type}")
             return
@@ -113,47 +311,95 @@ class ConnectionManager:
             # Get target clients based on channel
             if channel and channel in self.channel_subscriptions:
                 target_clients = self.channel_subscriptions[channel].keys()
-                logger.debug(f"Broadcasting to {len(target_clients)} clients in channel {channel}")
             else:
                 target_clients = self.active_connections[connection_type].keys()
-                logger.debug(f"Broadcasting to {len(target_clients)} {connection_type} connections")
+            hot.debug(
+                "broadcast", "Broadcasting %s to %d clients",
+                message.get("type"), len(target_clients),
+                connection_type=connection_type, channel=channel
+            )
             
             if not target_clients:
-                logger.debug(f"No target clients for broadcast")
                 return
             
-            # Track failed connections for cleanup
-            failed_clients = []
+            # Serialize once for all clients
+            text = json.dumps(message, default=str)
+            key = message.get("type")
+            senders = self.senders.get(connection_type, {})
             
-            # Broadcast to target clients
+            overflowed = []
             for client_id in target_clients:
-                if client_id not in self.active_connections[connection_type]:
+                sender = senders.get(client_id)
+                if sender is None:
                     continue
-                    
-                connection = self.active_connections[connection_type][client_id]
-                try:
-                    await connection.send_json(message)
-                    logger.debug(f"Successfully sent message to client {client_id}")
-                except Exception as e:
-                    logger.error(f"Error broadcasting message to client {client_id}: {str(e)}")
-                    logger.error(traceback.format_exc())
-                    failed_clients.append(client_id)
-                    try:
-                        await connection.close(code=1011, reason="Failed to send message")
-                    except Exception as close_error:
-                        logger.error(f"Error closing failed connection for client {client_id}: {str(close_error)}")
+                if not sender.enqueue(text, key, channel):
+                    overflowed.append((client_id, sender.websocket))
             
-            # Clean up failed connections
-            for client_id in failed_clients:
-                logger.info(f"Removing failed connection for client {client_id}")
-                self.active_connections[connection_type].pop(client_id, None)
-                # Remove from channel subscriptions
-                if channel:
-                    self.channel_subscriptions[channel].pop(client_id, None)
+            # Disconnect slow consumers
+            for client_id, websocket in overflowed:
+                self.slow_disconnects += 1
+                await self._drop_client(
+                    client_id,
+                    connection_type,
+                    websocket,
+                    SlowConsumerError(f"Send queue full ({self.send_queue_size})"),
+                    channel
+                )
                 
         except Exception as e:
             logger.error(f"Error preparing broadcast message: {str(e)}")
             logger.error(traceback.format_exc())
+            
+    async def stream(
+        self,
+        client_id: str,
+        connection_type: str,
+        messages: AsyncIterator[Dict[str, Any]]
+    ) -> int:
+        """Send a stream of messages to one client, in order, without drops.
+        
+        The next message is pulled only once the client's queue has room, so
+        a slow client slows the producer instead of losing chunks.
+        
+        Returns:
+            int: Number of messages queued before the stream ended or the
+            client went away
+        """
+        sent = 0
+        try:
+            async for message in messages:
+                sender = self.senders.get(connection_type, {}).get(client_id)
+                if sender is None:
+                    break
+                try:
+                    await sender.put(json.dumps(message, default=str))
+                except ConnectionError:
+                    break
+                sent += 1
+        finally:
+            # Release the producer (e.g. an open HTTP stream) if we stopped early
+            aclose = getattr(messages, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        return sent
+        
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get send queue depth, send latency and slow-consumer counters."""
+        senders = [sender for by_client in self.senders.values() for sender in by_client.values()]
+        depths = [len(sender.queue) for sender in senders]
+        return {
+            "connections": len(senders),
+            "policy": self.slow_consumer_policy,
+            "queue_depth": {
+                "total": sum(depths),
+                "max": max(depths, default=0),
+                "limit": self.send_queue_size
+            },
+            "send": self.send_metrics.snapshot(),
+            "dropped": sum(sender.dropped for sender in senders),
+            "coalesced": sum(sender.coalesced for sender in senders),
+            "slow_disconnects": self.slow_disconnects
+        }
 
     async def join_channel(self, client_id: str, channel: str) -> bool:
         """Subscribe a client to a channel."""
@@ -188,6 +434,39 @@ class ConnectionManager:
             logger.error(traceback.format_exc())
             return False
 
+    async def send(
+        self,
+        websocket: WebSocket,
+        client_id: str,
+        message: Dict[str, Any],
+        key: Optional[str] = None
+    ) -> bool:
+        """Queue a message for one connection behind what it already has queued.
+        
+        A full queue applies the slow-consumer policy as broadcasts do; a
+        client that must be dropped is closed.
+        
+        Returns:
+            bool: Whether the message was queued
+        """
+        for connection_type, senders in self.senders.items():
+            sender = senders.get(client_id)
+            if sender is not None and sender.websocket is websocket:
+                break
+        else:
+            logger.warning(f"No sender for client {client_id}, dropping {message.get('type')} message")
+            return False
+        if not sender.enqueue(json.dumps(message, default=str), key):
+            self.slow_disconnects += 1
+            await self._drop_client(
+                client_id,
+                connection_type,
+                websocket,
+                SlowConsumerError(f"Send queue full ({self.send_queue_size})")
+            )
+            return False
+        return True
+
     async def handle_ping(self, websocket: WebSocket, client_id: str):
         """Handle ping message from client."""
         try:
@@ -199,8 +478,8 @@ class ConnectionManager:
                 "channel": None,
                 "data": {}
             }
-            await websocket.send_json(pong_message)
-            logger.debug(f"Sent pong message to client {client_id}")
+            if await self.send(websocket, client_id, pong_message, "pong"):
+                hot.debug("pong", "Queued pong message to client %s", client_id)
         except Exception as e:
             logger.error(f"Error sending pong message to client {client_id}: {str(e)}")
             logger.error(traceback.format_exc())
@@ -213,7 +492,17 @@ class WebSocketServer:
         Args:
             memory_system_provider: Memory system provider function
         """
-        self.manager = ConnectionManager()
+        import configparser
+        config = configparser.ConfigParser()
+        config.read("config.ini")
+        self.manager = ConnectionManager(
+            send_queue_size=config.getint(
+                "WEBSOCKET", "send_queue_size", fallback=DEFAULT_SEND_QUEUE_SIZE
+            ),
+            slow_consumer_policy=config.get(
+                "WEBSOCKET", "slow_consumer_policy", fallback="drop_oldest"
+            )
+        )
         self.memory_system_provider = memory_system_provider
         self._initialized = False
         self._init_lock = asyncio.Lock()
@@ -300,40 +589,32 @@ class WebSocketServer:
             raise RuntimeError("Failed to ensure WebSocket server initialization") from e
 
     async def broadcast_memory_updates(self):
-        """Start background task for broadcasting memory updates."""
+        """Start background task for broadcasting memory updates.
+        
+        Subscribes to the store change feed; the task sleeps until a store
+        publishes a write, then broadcasts everything pending, grouped by store.
+        """
         try:
             if self._memory_update_task is not None:
                 logger.warning("Memory update task already running")
                 return
 
+            await attach_configured_bridge(change_feed)
+            subscription = change_feed.subscribe()
+
             async def memory_update_loop():
                 logger.info("Starting memory update loop")
                 try:
                     while True:
                         try:
-                            # Get memory updates from both vector and graph stores
-                            memory_system = await self.memory_system_provider()
-                            vector_updates = await memory_system.vector_store.get_updates()
-                            graph_updates = await memory_system.graph_store.get_updates()
-
-                            # Broadcast vector store updates
-                            if vector_updates:
-                                await self.manager.broadcast(
-                                    {
-                                        "type": "memory_update",
-                                        "timestamp": datetime.now().isoformat(),
-                                        "client_id": None,
-                                        "channel": None,
-                                        "data": {
-                                            "store": "vector",
-                                            "updates": vector_updates
-                                        }
-                                    },
-                                    "graph"
-                                )
-
-                            # Broadcast graph store updates
-                            if graph_updates:
+                            events = [await subscription.get()]
+                            events.extend(subscription.drain())
+                            
+                            updates: Dict[str, List[Dict[str, Any]]] = {}
+                            for event in events:
+                                updates.setdefault(event["store"], []).append(event)
+                                
+                            for store, store_updates in updates.items():
                                 await self.manager.broadcast(
                                     {
                                         "type": "memory_update",
@@ -341,26 +622,26 @@ class WebSocketServer:
                                         "client_id": None,
                                         "channel": None,
                                         "data": {
-                                            "store": "graph",
-                                            "updates": graph_updates
+                                            "store": store,
+                                            "updates": store_updates
                                         }
                                     },
                                     "graph"
                                 )
 
-                            # Wait before next update check
-                            await asyncio.sleep(1.0)  # 1 second interval
-
+                        except asyncio.CancelledError:
+                            raise
                         except Exception as e:
                             logger.error(f"Error in memory update loop: {str(e)}")
                             logger.error(traceback.format_exc())
-                            await asyncio.sleep(5.0)  # Wait longer on error
 
                 except asyncio.CancelledError:
                     logger.info("Memory update loop cancelled")
                 except Exception as e:
                     logger.error(f"Memory update loop terminated with error: {str(e)}")
                     logger.error(traceback.format_exc())
+                finally:
+                    subscription.close()
 
             self._memory_update_task = asyncio.create_task(memory_update_loop())
             logger.info("Memory update task started")
@@ -370,6 +651,23 @@ class WebSocketServer:
             logger.error(traceback.format_exc())
             raise
 
+    async def stream_llm(
+        self,
+        client_id: str,
+        chunks: AsyncIterator[Dict[str, Any]],
+        connection_type: str = "chat"
+    ) -> int:
+        """Forward LLM stream chunks to a client as they are generated."""
+        async def messages():
+            try:
+                async for chunk in chunks:
+                    yield {**chunk, "client_id": client_id, "channel": None}
+            finally:
+                aclose = getattr(chunks, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        return await self.manager.stream(client_id, connection_type, messages())
+
     async def handle_chat_connection(self, websocket: WebSocket, client_id: str):
         """Handle chat/channel WebSocket connections."""
         await self.ensure_initialized()
@@ -377,7 +675,7 @@ class WebSocketServer:
         try:
             while True:
                 data = await websocket.receive_json()
-                logger.debug(f"Received chat message from {client_id}: {data}")
+                hot.debug("receive.chat", "Received chat message from %s: %s", client_id, data)
                 
                 try:
                     if data.get("type") == "ping":
@@ -392,7 +690,7 @@ class WebSocketServer:
                         success = await self.manager.join_channel(client_id, channel)
                         if success:
                             # Send subscription success
-                            await websocket.send_json({
+                            await self.manager.send(websocket, client_id, {
                                 "type": "subscription_success",
                                 "timestamp": datetime.now().isoformat(),
                                 "client_id": client_id,
@@ -413,7 +711,7 @@ class WebSocketServer:
                         success = await self.manager.leave_channel(client_id, channel)
                         if success:
                             # Send unsubscription success
-                            await websocket.send_json({
+                            await self.manager.send(websocket, client_id, {
                                 "type": "unsubscription_success",
                                 "timestamp": datetime.now().isoformat(),
                                 "client_id": client_id,
@@ -473,7 +771,7 @@ class WebSocketServer:
                             )
                             
                         # Send delivery confirmation
-                        await websocket.send_json({
+                        await self.manager.send(websocket, client_id, {
                             "type": "message_delivered",
                             "timestamp": datetime.now().isoformat(),
                             "client_id": client_id,
@@ -496,7 +794,7 @@ class WebSocketServer:
                             "error": str(e)
                         }
                     }
-                    await websocket.send_json(error_message)
+                    await self.manager.send(websocket, client_id, error_message)
         except WebSocketDisconnect:
             await self.manager.disconnect(client_id, "chat")
             logger.info(f"Client {client_id} disconnected from chat")
@@ -508,7 +806,7 @@ class WebSocketServer:
         try:
             while True:
                 data = await websocket.receive_json()
-                logger.debug(f"Received task update from {client_id}: {data}")
+                hot.debug("receive.tasks", "Received task update from %s: %s", client_id, data)
                 
                 try:
                     if data.get("type") == "ping":
@@ -540,7 +838,7 @@ class WebSocketServer:
                             "error": str(e)
                         }
                     }
-                    await websocket.send_json(error_message)
+                    await self.manager.send(websocket, client_id, error_message)
         except WebSocketDisconnect:
             await self.manager.disconnect(client_id, "tasks")
             logger.info(f"Client {client_id} disconnected from tasks")
@@ -580,12 +878,12 @@ class WebSocketServer:
                     "agents": formatted_agents
                 }
             }
-            await websocket.send_json(agent_team_message)
+            await self.manager.send(websocket, client_id, agent_team_message)
             
             # Handle incoming messages
             while True:
                 data = await websocket.receive_json()
-                logger.debug(f"Received agent status from {client_id}: {data}")
+                hot.debug("receive.agents", "Received agent status from %s: %s", client_id, data)
                 
                 try:
                     if data.get("type") == "ping":
@@ -617,7 +915,7 @@ class WebSocketServer:
                             "error": str(e)
                         }
                     }
-                    await websocket.send_json(error_message)
+                    await self.manager.send(websocket, client_id, error_message)
         except WebSocketDisconnect:
             await self.manager.disconnect(client_id, "agents")
             logger.info(f"Client {client_id} disconnected from agents")
@@ -633,9 +931,9 @@ class WebSocketServer:
                     "error": str(e)
                 }
             }
-            await websocket.send_json(error_message)
-            # Ensure we still disconnect on error
-            await self.manager.disconnect(client_id, "agents")
+            await self.manager.send(websocket, client_id, error_message)
+            # Ensure we still disconnect on error, after the error is sent
+            await self.manager.disconnect(client_id, "agents", flush=True)
             
     async def handle_graph_connection(self, websocket: WebSocket, client_id: str):
         """Handle knowledge graph WebSocket connections."""
@@ -644,7 +942,7 @@ class WebSocketServer:
         try:
             while True:
                 data = await websocket.receive_json()
-                logger.debug(f"Received graph update from {client_id}: {data}")
+                hot.debug("receive.graph", "Received graph update from %s: %s", client_id, data)
                 
                 try:
                     if data.get("type") == "ping":
@@ -676,7 +974,7 @@ class WebSocketServer:
                             "error": str(e)
                         }
                     }
-                    await websocket.send_json(error_message)
+                    await self.manager.send(websocket, client_id, error_message)
         except WebSocketDisconnect:
             await self.manager.disconnect(client_id, "graph")
             logger.info(f"Client {client_id} disconnected from graph")
@@ -1,16 +1,21 @@
 """Debug endpoints for managing debug flags and settings."""
 
+import logging
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from nia.core.feature_flags import get_feature_flags
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/debug", tags=["debug"])
 
-# In-memory debug flags storage
+# API flag names -> feature flag names
 debug_flags = {
-    'logValidation': False,
-    'logWebSocket': False,
-    'logStorage': False,
-    'strictMode': False
+    'logValidation': 'log_validation',
+    'logWebSocket': 'log_websocket',
+    'logStorage': 'log_storage',
+    'strictMode': 'strict_mode'
 }
 
 class DebugFlagUpdate(BaseModel):
@@ -20,14 +25,20 @@ class DebugFlagUpdate(BaseModel):
 
 @router.post("/flags")
 async def update_debug_flag(update: DebugFlagUpdate):
-    """Update a debug flag's state."""
+    """Update a debug flag's state and publish it to all processes."""
     if update.flag not in debug_flags:
         raise HTTPException(status_code=400, detail=f"Unknown debug flag: {update.flag}")
     
-    debug_flags[update.flag] = update.enabled
+    flags = await get_feature_flags()
+    try:
+        await flags.set_debug(debug_flags[update.flag], update.enabled)
+    except Exception as e:
+        logger.error(f"Failed to publish debug flag {update.flag}: {str(e)}")
+        raise HTTPException(status_code=503, detail=f"Could not publish debug flag: {str(e)}")
     return {"status": "success", "flag": update.flag, "enabled": update.enabled}
 
 @router.get("/flags")
 async def get_debug_flags():
     """Get current state of all debug flags."""
-    return debug_flags
+    flags = await get_feature_flags()
+    return {name: flags.is_enabled(flag) for name, flag in debug_flags.items()}
@@ -195,24 +195,21 @@ async def consolidate_memory(
     _: None = Depends(get_permission("write")),
     memory_system: TwoLayerMemorySystem = Depends(get_memory_system)
 ) -> Dict:
-    """Trigger memory consolidation."""
+    """Trigger memory consolidation.
+    
+    Without memory_ids, every unconsolidated episodic memory is consolidated
+    page by page, resuming an interrupted scan.
+    """
     try:
-        # Get candidates if no IDs provided
-        if not memory_ids:
-            if memory_system.episodic:
-                candidates = await memory_system.episodic.get_consolidation_candidates()
-                memory_ids = [m["id"] for m in candidates if isinstance(m, dict) and "id" in m]
-            else:
-                memory_ids = []
-            
-        # Run consolidation
-        if memory_ids:
-            await memory_system.consolidate_memories(memory_ids)
+        await memory_system.consolidate_memories(memory_ids or None)
+        run = memory_system.get_metrics().get("consolidation", {}).get("last_run", {})
         
-        # Return basic result since consolidate_memories doesn't return stats
         return {
-            "consolidated_count": len(memory_ids) if memory_ids else 0,
+            "consolidated_count": run.get("consolidated", 0),
+            "failed_count": run.get("failed", 0),
             "pruned_count": 0,  # Not tracked
+            "memories_per_second": run.get("memories_per_second", 0.0),
+            "max_lag_seconds": run.get("max_lag_seconds", 0.0),
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     except Exception as e:
@@ -254,3 +251,19 @@ async def prune_memory(
         if isinstance(e, HTTPException):
             raise
         raise ServiceError(str(e))
+
+@memory_router.get("/metrics")
+async def memory_metrics(
+    _: None = Depends(get_permission("read")),
+    memory_system: TwoLayerMemorySystem = Depends(get_memory_system)
+) -> Dict:
+    """Get memory pool and store latency metrics."""
+    try:
+        return {
+            **memory_system.get_metrics(),
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
+        raise ServiceError(str(e))
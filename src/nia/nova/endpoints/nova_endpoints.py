@@ -479,17 +479,27 @@ async def add_thread_agent(
 @chat_router.get("/threads/{thread_id}/messages", response_model=List[Dict[str, Any]])
 async def get_thread_messages(
     thread_id: str,
+    after: Optional[int] = None,
+    before: Optional[int] = None,
+    limit: int = 100,
     _: None = Depends(get_permission("read")),
     thread_manager: Any = Depends(get_thread_manager)
 ) -> List[Dict[str, Any]]:
-    """Get messages from a thread."""
+    """Get a page of messages from a thread.
+    
+    Returns the newest ``limit`` messages by default; pass a message's ``seq``
+    as ``before`` or ``after`` to page backwards or forwards.
+    """
     try:
-        # Create system threads if they don't exist
-        if thread_id in ["nova-team", "nova"]:
-            thread = await thread_manager._create_system_thread(thread_id)
-        else:
-            thread = await thread_manager.get_thread(thread_id)
-        return thread.get("messages", [])
+        page = await thread_manager.get_thread_messages(
+            thread_id,
+            after=after,
+            before=before,
+            limit=limit
+        )
+        return page["messages"]
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except ResourceNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ServiceError as e:
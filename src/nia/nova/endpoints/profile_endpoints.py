@@ -1,6 +1,6 @@
 """FastAPI endpoints for profile management."""
 
-from fastapi import APIRouter, HTTPException, Depends, Body
+from fastapi import APIRouter, HTTPException, Depends, Body, Query
 from typing import List, Optional
 from pydantic import BaseModel
 
@@ -97,10 +97,15 @@ async def delete_profile(
 @router.get("/", response_model=List[UserProfile])
 async def list_profiles(
     domain: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    after: Optional[str] = None,
     profile_manager: ProfileManager = Depends(get_profile_manager)
 ) -> List[UserProfile]:
-    """List all user profiles, optionally filtered by domain."""
-    return await profile_manager.list_profiles(domain)
+    """List user profiles ordered by id, optionally filtered by domain.
+    
+    Pass the last profile_id of a page as ``after`` to fetch the next page.
+    """
+    return await profile_manager.list_profiles(domain, limit=limit, after=after)
 
 @router.post("/{profile_id}/adapt-task")
 async def adapt_task(
@@ -7,14 +7,13 @@ from datetime import datetime
 import uuid
 
 from ..core.dependencies import get_memory_system
-from ..core.auth.token import get_permission
 from ..core.error_handling import ServiceError
 from ..core.validation import ValidationResult, ValidationPattern
 from ..core.models import (
     TaskNode, TaskEdge, TaskUpdate, TaskDetails, TaskState, TaskStateTransition,
-    SubTask, Comment, TaskPriority
+    TaskTransitionRequest, SubTask, Comment, TaskPriority
 )
-from ...core.types.memory_types import Memory, MemoryType
+from ...core.types.memory_types import Memory, MemoryType, EpisodicMemory
 
 logger = logging.getLogger(__name__)
 
@@ -37,32 +36,56 @@ class TaskValidationPattern(ValidationPattern):
         "populate_by_name": True
     }
 
+def _transition_issues(
+    current_state: TaskState,
+    new_state: TaskState,
+    task_id: str,
+    dep_count: int
+) -> List[Dict[str, Any]]:
+    """Check a state transition against VALID_TRANSITIONS and block rules."""
+    issues = []
+    
+    # Check valid transitions
+    if new_state not in VALID_TRANSITIONS.get(current_state, []):
+        issue = {
+            "type": "invalid_transition",
+            "severity": "high",
+            "description": f"Invalid state transition from {current_state} to {new_state}",
+            "task_id": task_id
+        }
+        issues.append(issue)
+        
+        logger.warning(f"Invalid state transition detected: {issue}")
+            
+    # Additional validation for BLOCKED state
+    if new_state == TaskState.BLOCKED and dep_count == 0:
+        issue = {
+            "type": "invalid_block",
+            "severity": "high",
+            "description": "Cannot block task without dependencies",
+            "task_id": task_id
+        }
+        issues.append(issue)
+        
+        logger.warning(f"Invalid block attempt detected: {issue}")
+        
+    return issues
+
 async def validate_state_transition(
     current_state: TaskState,
     new_state: TaskState,
     task_id: str,
-    memory_system: Any
+    memory_system: Any,
+    dep_count: Optional[int] = None
 ) -> ValidationResult:
-    """Validate if a state transition is allowed with debug logging."""
+    """Validate if a state transition is allowed with debug logging.
+    
+    The dependency count is only queried when blocking and not supplied.
+    """
     try:
         logger.debug(f"Validating state transition - from: {current_state}, to: {new_state}, task: {task_id}")
             
-        validation_issues = []
-        
-        # Check valid transitions
-        if new_state not in VALID_TRANSITIONS.get(current_state, []):
-            issue = {
-                "type": "invalid_transition",
-                "severity": "high",
-                "description": f"Invalid state transition from {current_state} to {new_state}",
-                "task_id": task_id
-            }
-            validation_issues.append(issue)
-            
-            logger.warning(f"Invalid state transition detected: {issue}")
-                
-        # Additional validation for BLOCKED state
-        if new_state == TaskState.BLOCKED:
+        if new_state == TaskState.BLOCKED and dep_count is None:
             # Check if task has dependencies
             dependencies = await memory_system.semantic.run_query(
                 """
@@ -71,16 +94,9 @@ async def validate_state_transition(
                 """,
                 {"task_id": task_id}
             )
-            if dependencies[0]["dep_count"] == 0:
-                issue = {
-                    "type": "invalid_block",
-                    "severity": "high",
-                    "description": "Cannot block task without dependencies",
-                    "task_id": task_id
-                }
-                validation_issues.append(issue)
-                
-                logger.warning(f"Invalid block attempt detected: {issue}")
+            dep_count = dependencies[0]["dep_count"]
+            
+        validation_issues = _transition_issues(current_state, new_state, task_id, dep_count or 0)
                     
         # Create validation result
         result = ValidationResult(
@@ -157,6 +173,81 @@ async def validate_domain_access(
         logger.error(error_msg)
         raise
 
+async def find_missing_dependencies(
+    dep_ids: List[str],
+    memory_system: Any
+) -> List[str]:
+    """Return the dependency ids with no matching concept, in one round-trip."""
+    if not dep_ids:
+        return []
+        
+    result = await memory_system.semantic.run_query(
+        """
+        UNWIND $deps AS dep_id
+        OPTIONAL MATCH (t:Concept {name: dep_id})
+        WITH dep_id, t
+        WHERE t IS NULL
+        RETURN collect(DISTINCT dep_id) as missing
+        """,
+        {"deps": list(dict.fromkeys(dep_ids))}
+    )
+    return result[0]["missing"] if result else []
+
+def _task_field_issues(task: TaskNode) -> List[Dict[str, Any]]:
+    """Check required fields and formats of a task."""
+    issues = []
+    
+    # Validate required fields
+    if not task.id:
+        issues.append({
+            "type": "missing_field",
+            "severity": "high",
+            "description": "Task ID is required"
+        })
+        
+    if not task.label:
+        issues.append({
+            "type": "missing_field",
+            "severity": "high",
+            "description": "Task label is required"
+        })
+        
+    # Validate field formats
+    if task.dueDate:
+        try:
+            datetime.fromisoformat(task.dueDate)
+        except ValueError:
+            issues.append({
+                "type": "invalid_format",
+                "severity": "medium",
+                "description": "Due date must be in ISO format"
+            })
+            
+    return issues
+
+def _dependency_issues(task: TaskNode, missing: set) -> List[Dict[str, Any]]:
+    """Report each of a task's dependencies found in the missing set."""
+    return [
+        {
+            "type": "invalid_dependency",
+            "severity": "medium",
+            "description": f"Dependency {dep} does not exist"
+        }
+        for dep in task.dependencies or []
+        if dep in missing
+    ]
+
+def _task_validation_result(task: TaskNode, issues: List[Dict[str, Any]]) -> ValidationResult:
+    """Wrap task validation issues in a ValidationResult."""
+    return ValidationResult(
+        is_valid=len(issues) == 0,
+        issues=issues,
+        metadata={
+            "task_id": task.id,
+            "timestamp": datetime.now().isoformat()
+        }
+    )
+
 async def validate_task(
     task: TaskNode,
     memory_system: Any
@@ -165,61 +256,14 @@ async def validate_task(
     try:
         logger.debug(f"Validating task data: {task.dict()}")
             
-        validation_issues = []
+        validation_issues = _task_field_issues(task)
         
-        # Validate required fields
-        if not task.id:
-            validation_issues.append({
-                "type": "missing_field",
-                "severity": "high",
-                "description": "Task ID is required"
-            })
-            
-        if not task.label:
-            validation_issues.append({
-                "type": "missing_field",
-                "severity": "high",
-                "description": "Task label is required"
-            })
-            
-        # Validate field formats
-        if task.dueDate:
-            try:
-                datetime.fromisoformat(task.dueDate)
-            except ValueError:
-                validation_issues.append({
-                    "type": "invalid_format",
-                    "severity": "medium",
-                    "description": "Due date must be in ISO format"
-                })
-                
         # Validate dependencies
-        if task.dependencies:
-            for dep in task.dependencies:
-                # Check if dependency exists
-                dep_exists = await memory_system.semantic.run_query(
-                    """
-                    MATCH (t:Concept {name: $dep_id})
-                    RETURN count(t) as exists
-                    """,
-                    {"dep_id": dep}
-                )
-                if dep_exists[0]["exists"] == 0:
-                    validation_issues.append({
-                        "type": "invalid_dependency",
-                        "severity": "medium",
-                        "description": f"Dependency {dep} does not exist"
-                    })
+        missing = await find_missing_dependencies(task.dependencies or [], memory_system)
+        validation_issues.extend(_dependency_issues(task, set(missing)))
                     
         # Create validation result
-        result = ValidationResult(
-            is_valid=len(validation_issues) == 0,
-            issues=validation_issues,
-            metadata={
-                "task_id": task.id,
-                "timestamp": datetime.now().isoformat()
-            }
-        )
+        result = _task_validation_result(task, validation_issues)
         
         logger.debug(f"Task validation result: {result.dict()}")
                 
@@ -236,10 +280,89 @@ async def validate_task(
         logger.error(error_msg)
         raise
 
+async def validate_tasks(
+    tasks: List[TaskNode],
+    memory_system: Any
+) -> List[ValidationResult]:
+    """Validate many tasks with a single dependency lookup.
+    
+    Dependencies on other tasks in the same batch count as existing.
+    Returns one result per task; invalid tasks are not raised.
+    """
+    batch_ids = {task.id for task in tasks}
+    dep_ids = [
+        dep
+        for task in tasks
+        for dep in task.dependencies or []
+        if dep not in batch_ids
+    ]
+    missing = set(await find_missing_dependencies(dep_ids, memory_system))
+    
+    results = []
+    for task in tasks:
+        issues = _task_field_issues(task) + _dependency_issues(task, missing)
+        results.append(_task_validation_result(task, issues))
+        
+    logger.debug(f"Validated {len(tasks)} tasks, {len(missing)} missing dependencies")
+    return results
+
+async def store_tasks(
+    tasks: List[TaskNode],
+    validations: List[ValidationResult],
+    memory_system: Any
+) -> None:
+    """Create or update task concepts with all fields in one statement."""
+    await memory_system.semantic.run_query(
+        """
+        UNWIND $tasks AS task
+        MERGE (t:Concept {name: task.id})
+        SET t.type = 'task',
+            t.description = task.label,
+            t.status = task.status,
+            t.created_at = task.created_at,
+            t.updated_at = task.updated_at,
+            t.metadata = task.metadata,
+            t.title = task.title,
+            t.priority = task.priority,
+            t.assignee = task.assignee,
+            t.dueDate = task.dueDate,
+            t.tags = task.tags,
+            t.time_active = task.time_active,
+            t.dependencies = task.dependencies,
+            t.blocked_by = task.blocked_by,
+            t.sub_tasks = task.sub_tasks,
+            t.completed = task.completed,
+            t.validation = task.validation
+        """,
+        {
+            "tasks": [
+                {**task.dict(), "validation": validation.dict()}
+                for task, validation in zip(tasks, validations)
+            ]
+        }
+    )
+
+async def fetch_task_states(
+    task_ids: List[str],
+    memory_system: Any
+) -> Dict[str, Dict[str, Any]]:
+    """Load status, domain and dependency count for many tasks at once."""
+    records = await memory_system.semantic.run_query(
+        """
+        UNWIND $ids AS id
+        MATCH (t:Concept {name: id})
+        OPTIONAL MATCH (t)<-[:DEPENDS_ON]-(d:Concept)
+        RETURN id, t.status as status, t.domain as domain, count(d) as dep_count
+        """,
+        {"ids": list(dict.fromkeys(task_ids))}
+    )
+    return {record["id"]: record for record in records}
+
+# The write permission dependency is added where the app mounts this router,
+# so the task operations can be imported without the auth backend
 tasks_router = APIRouter(
     prefix="",
-    tags=["Tasks"],
-    dependencies=[Depends(get_permission("write"))]
+    tags=["Tasks"]
 )
 
 @tasks_router.post("", response_model=None)
@@ -269,47 +392,8 @@ async def create_task(
                     detail=domain_result.issues[0]["description"]
                 )
                 
-        # Store task in semantic layer with validation metadata
-        await memory_system.semantic.store_knowledge({
-            "concepts": [{
-                "name": task.id,
-                "type": "task",
-                "description": task.label,
-                "validation": {
-                    "domain": "tasks",
-                    "access_domain": "tasks",
-                    "confidence": 1.0,
-                    "source": "system",
-                    "validation_result": validation_result.dict()
-                }
-            }]
-        })
-        
-        # Store task metadata and all fields
-        await memory_system.semantic.run_query(
-            """
-            MATCH (t:Concept {name: $name})
-            SET t.status = $status,
-                t.created_at = $created_at,
-                t.updated_at = $updated_at,
-                t.metadata = $metadata,
-                t.title = $title,
-                t.priority = $priority,
-                t.assignee = $assignee,
-                t.dueDate = $dueDate,
-                t.tags = $tags,
-                t.time_active = $time_active,
-                t.dependencies = $dependencies,
-                t.blocked_by = $blocked_by,
-                t.sub_tasks = $sub_tasks,
-                t.completed = $completed,
-                t.validation = $validation
-            """,
-            {
-                **task.dict(),
-                "validation": validation_result.dict()
-            }
-        )
+        # Store task and all fields in semantic layer with validation metadata
+        await store_tasks([task], [validation_result], memory_system)
         
         return {
             "success": True,
@@ -331,14 +415,8 @@ async def transition_task_state(
 ) -> Dict[str, Any]:
     """Transition a task to a new state with validation."""
     try:
-        # Get current task state
-        current_task = await memory_system.semantic.run_query(
-            """
-            MATCH (t:Concept {name: $name})
-            RETURN t.status as status, t.domain as domain
-            """,
-            {"name": task_id}
-        )
+        # Get current task state and dependency count
+        current_task = list((await fetch_task_states([task_id], memory_system)).values())
         
         if not current_task:
             raise HTTPException(
@@ -351,7 +429,8 @@ async def transition_task_state(
             TaskState(current_task[0]["status"]),
             new_state,
             task_id,
-            memory_system
+            memory_system,
+            dep_count=current_task[0]["dep_count"]
         )
         
         if not validation_result.is_valid:
@@ -413,3 +492,170 @@ async def transition_task_state(
         error_msg = f"Error transitioning task state: {str(e)}"
         logger.error(error_msg)
         raise ServiceError(error_msg)
+
+@tasks_router.post("/bulk", response_model=None)
+async def create_tasks(
+    tasks: List[TaskNode],
+    memory_system: Any = Depends(get_memory_system)
+) -> Dict[str, Any]:
+    """Create many tasks in one transaction.
+    
+    The batch is rejected as a whole if any task fails validation.
+    """
+    try:
+        validation_results = await validate_tasks(tasks, memory_system)
+        invalid = [
+            {"taskId": task.id, "issues": result.issues}
+            for task, result in zip(tasks, validation_results)
+            if not result.is_valid
+        ]
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"message": f"{len(invalid)} of {len(tasks)} tasks failed validation", "invalid": invalid}
+            )
+            
+        # Validate domain access once per distinct domain
+        for domain in dict.fromkeys(task.domain for task in tasks if task.domain):
+            await validate_domain_access(domain, memory_system)
+            
+        await store_tasks(tasks, validation_results, memory_system)
+        
+        return {
+            "success": True,
+            "taskIds": [task.id for task in tasks],
+            "count": len(tasks)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        error_msg = f"Error creating tasks: {str(e)}"
+        logger.error(error_msg)
+        raise ServiceError(error_msg)
+
+@tasks_router.post("/transition", response_model=None)
+async def transition_task_states(
+    transitions: List[TaskTransitionRequest],
+    memory_system: Any = Depends(get_memory_system)
+) -> Dict[str, Any]:
+    """Transition many tasks in one transaction.
+    
+    The batch is rejected as a whole if any transition is invalid.
+    """
+    try:
+        current = await fetch_task_states([t.task_id for t in transitions], memory_system)
+        
+        missing = [t.task_id for t in transitions if t.task_id not in current]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Tasks not found: {', '.join(missing)}"
+            )
+            
+        invalid = []
+        for transition in transitions:
+            record = current[transition.task_id]
+            issues = _transition_issues(
+                TaskState(record["status"]),
+                transition.new_state,
+                transition.task_id,
+                record["dep_count"]
+            )
+            if issues:
+                invalid.append({"taskId": transition.task_id, "issues": issues})
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"message": f"{len(invalid)} of {len(transitions)} transitions are invalid", "invalid": invalid}
+            )
+            
+        # Validate domain access once per distinct domain
+        for domain in dict.fromkeys(record["domain"] for record in current.values() if record["domain"]):
+            await validate_domain_access(domain, memory_system)
+            
+        timestamp = datetime.now().isoformat()
+        updates = [
+            {
+                "name": transition.task_id,
+                "status": transition.new_state,
+                "validation": ValidationResult(
+                    is_valid=True,
+                    metadata={
+                        "task_id": transition.task_id,
+                        "from_state": current[transition.task_id]["status"],
+                        "to_state": transition.new_state,
+                        "timestamp": timestamp
+                    }
+                ).dict()
+            }
+            for transition in transitions
+        ]
+        
+        # Update all task states with validation metadata
+        await memory_system.semantic.run_query(
+            """
+            UNWIND $updates AS update
+            MATCH (t:Concept {name: update.name})
+            SET t.status = update.status,
+                t.updated_at = datetime(),
+                t.validation = update.validation
+            """,
+            {"updates": updates}
+        )
+        
+        # Store transitions in episodic memory with one batched write
+        await memory_system.episodic.store_memories([
+            EpisodicMemory(
+                content=f"Task {update['name']} transitioned from {current[update['name']]['status']} to {update['status']}",
+                type=MemoryType.TASK_UPDATE,
+                metadata={
+                    "task_id": update["name"],
+                    "from_state": current[update["name"]]["status"],
+                    "to_state": update["status"],
+                    "timestamp": timestamp,
+                    "validation": update["validation"]
+                }
+            )
+            for update in updates
+        ])
+        
+        return {
+            "success": True,
+            "transitions": [
+                {"taskId": t.task_id, "newState": t.new_state}
+                for t in transitions
+            ]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        error_msg = f"Error transitioning task states: {str(e)}"
+        logger.error(error_msg)
+        raise ServiceError(error_msg)
+
+@tasks_router.get("/board", response_model=None)
+async def get_task_board(
+    memory_system: Any = Depends(get_memory_system)
+) -> Dict[str, Any]:
+    """Get tasks organized by state for the Kanban board with one query."""
+    try:
+        records = await memory_system.semantic.run_query(
+            """
+            MATCH (t:Concept {type: 'task'})
+            RETURN t.status as status, collect(t {.*, id: t.name}) as tasks
+            """
+        )
+        
+        board = {state.value: [] for state in TaskState}
+        for record in records:
+            board.setdefault(record["status"] or TaskState.PENDING.value, []).extend(record["tasks"])
+            
+        return {
+            "tasks": board,
+            "totalTasks": sum(len(tasks) for tasks in board.values()),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        error_msg = f"Error loading task board: {str(e)}"
+        logger.error(error_msg)
+        raise ServiceError(error_msg)
@@ -211,16 +211,30 @@ async def get_thread_messages(
     thread_id: str,
     start: Optional[int] = 0,
     limit: Optional[int] = 100,
+    after: Optional[int] = None,
     domain: Optional[str] = None,
     _: None = Depends(get_permission("read")),
     thread_manager: Any = Depends(get_thread_manager)
 ) -> Dict:
-    """Get messages from a thread with pagination."""
+    """Get messages from a thread with pagination.
+    
+    ``start`` is an offset from the oldest message. Pass a message's ``seq``
+    as ``after`` to page from a cursor instead.
+    """
     try:
         thread = await thread_manager.get_thread(thread_id)
-        return thread
+        if after is not None:
+            page = await thread_manager.get_thread_messages(thread_id, after=after, limit=limit)
+        else:
+            page = await thread_manager.get_thread_messages(thread_id, offset=start or 0, limit=limit)
+        return {
+            **thread,
+            "messages": page["messages"],
+            "has_more": page["has_more"],
+            "next_cursor": page["next_cursor"]
+        }
     except Exception as e:
-        if isinstance(e, HTTPException):
+        if isinstance(e, (HTTPException, ValidationError, ResourceNotFoundError)):
             raise
         raise ServiceError(str(e))
 
@@ -0,0 +1,346 @@
+"""Batched consolidation from the episodic vector store to the semantic graph.
+
+Unconsolidated memories are read a page at a time with a filter-only scan,
+which fetches the next page while the current one is written. Each page
+goes to Neo4j in one transaction (a concept UNWIND, a relationship UNWIND and
+the checkpoint) and is then marked consolidated with a single payload update,
+so nothing is re-embedded. The checkpoint holds the scroll cursor of the next
+page, so a scan interrupted part way continues from there on the next run.
+"""
+
+import time
+import asyncio
+import logging
+import traceback
+from datetime import datetime, timezone
+from contextlib import aclosing
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from qdrant_client.http import models
+
+logger = logging.getLogger(__name__)
+
+# Memories read, written and marked per round-trip
+DEFAULT_PAGE_SIZE = 500
+
+# Attempts per page write, and the backoff between them in seconds
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 2
+
+# Timeout for each page read, write or mark in seconds
+DEFAULT_TIMEOUT_SECONDS = 30
+
+CHECKPOINT_ID = "episodic"
+
+# Marks a page whose write should leave the checkpoint alone
+_NO_CHECKPOINT = object()
+
+CONCEPTS_QUERY = """
+UNWIND $rows AS row
+MERGE (c:Concept {id: row.id})
+SET c += row.properties
+"""
+
+# Replaces each concept's outgoing edges; targets missing from the graph are skipped
+RELATIONSHIPS_QUERY = """
+UNWIND $rows AS row
+MATCH (c:Concept {id: row.id})
+OPTIONAL MATCH (c)-[old:RELATED_TO]->()
+DELETE old
+WITH DISTINCT c, row
+UNWIND row.related AS rel
+MATCH (r:Concept {id: rel})
+MERGE (c)-[:RELATED_TO]->(r)
+"""
+
+CHECKPOINT_QUERY = """
+MERGE (k:ConsolidationCheckpoint {id: $id})
+SET k.offset = $offset,
+    k.processed = coalesce(k.processed, 0) + $count,
+    k.updated_at = $updated_at
+"""
+
+CHECKPOINT_READ_QUERY = """
+MATCH (k:ConsolidationCheckpoint {id: $id})
+RETURN k.offset as offset, k.processed as processed
+"""
+
+def unconsolidated_filter() -> List[models.FieldCondition]:
+    """Filter conditions selecting memories not yet consolidated."""
+    return [models.FieldCondition(
+        key="metadata_consolidated",
+        match=models.MatchValue(value=False)
+    )]
+
+def _concept_row(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build the UNWIND row for one vector store result, None without an id."""
+    metadata = result.get("metadata") or {}
+    memory_id = metadata.get("id")
+    if not memory_id:
+        return None
+    related = metadata.get("related", [])
+    if not isinstance(related, list):
+        related = []
+    return {
+        "id": str(memory_id),
+        "properties": {
+            "type": str(metadata.get("type", "thread")),
+            "description": str(result.get("content", "")),
+            "importance": str(metadata.get("importance", "0.5")),
+            "thread_id": str(metadata.get("thread_id", "")),
+            "description_meta": str(metadata.get("description", "")),
+            # Indexed validation fields, as ConceptStore writes them
+            "domain": str(metadata.get("domain", "general")),
+            "access_domain": str(metadata.get("access_domain", "general")),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "version": 1
+        },
+        "related": [str(r) for r in related]
+    }
+
+def _age_seconds(timestamp: Any, now: datetime) -> Optional[float]:
+    """Seconds since an ISO timestamp, None if it cannot be parsed."""
+    try:
+        parsed = datetime.fromisoformat(str(timestamp))
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return max(0.0, (now - parsed).total_seconds())
+
+class ConsolidationEngine:
+    """Moves episodic memories into the semantic layer in pages.
+
+    Args:
+        vector_store: Episodic vector store (scan_vectors, get_vectors,
+            update_metadata_batch)
+        semantic_store: Neo4j store with run_query and run_transaction
+        page_size: Memories per page
+        circuit: Optional circuit breaker for the semantic store
+        on_consolidated: Called with the ids of each marked page
+        max_retries: Attempts per page write
+        backoff_factor: Seconds of backoff per failed attempt
+        timeout: Timeout for each page operation in seconds
+    """
+
+    def __init__(
+        self,
+        vector_store: Any,
+        semantic_store: Any,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        circuit: Any = None,
+        on_consolidated: Optional[Callable[[List[str]], None]] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS
+    ):
+        self.vector_store = vector_store
+        self.semantic_store = semantic_store
+        self.page_size = max(1, page_size)
+        self.circuit = circuit
+        self.on_consolidated = on_consolidated
+        self.max_retries = max(1, max_retries)
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self._lock = asyncio.Lock()
+        self.totals = {"runs": 0, "pages": 0, "consolidated": 0, "failed": 0, "missing": 0}
+        self.last_run: Dict[str, Any] = {}
+        self._started = time.perf_counter()
+        self._page_ms_total = 0.0
+        self._lag_total = 0.0
+        self._lag_count = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get lifetime totals and throughput and lag of the latest run."""
+        return {
+            **self.totals,
+            "running": self._lock.locked(),
+            "last_run": dict(self.last_run)
+        }
+
+    async def run(self, memory_ids: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Consolidate the given memories, or every unconsolidated one.
+
+        Runs are serialized; a second caller waits for the first to finish.
+
+        Args:
+            memory_ids: Ids to consolidate. With None, all memories whose
+                consolidated flag is false are scanned, resuming from the
+                checkpoint of an interrupted scan.
+
+        Returns:
+            Dict[str, Any]: Statistics for this run (see stats()["last_run"])
+        """
+        async with self._lock:
+            self.totals["runs"] += 1
+            self.last_run = {
+                "started_at": datetime.now(timezone.utc).isoformat(),
+                "mode": "scan" if memory_ids is None else "ids",
+                "resumed_from": None,
+                "pages": 0,
+                "consolidated": 0,
+                "failed": 0,
+                "missing": 0,
+                "elapsed_seconds": 0.0,
+                "memories_per_second": 0.0,
+                "avg_page_ms": 0.0,
+                "max_lag_seconds": 0.0,
+                "avg_lag_seconds": 0.0,
+                "complete": False
+            }
+            self._lag_total = 0.0
+            self._lag_count = 0
+            self._page_ms_total = 0.0
+            self._started = time.perf_counter()
+            try:
+                if memory_ids is None:
+                    complete = await self._run_scan()
+                else:
+                    complete = await self._run_ids([str(mid) for mid in memory_ids])
+                self.last_run["complete"] = complete and self.last_run["failed"] == 0
+            except Exception as e:
+                logger.error(f"Consolidation run failed: {str(e)}")
+                logger.error(traceback.format_exc())
+            finally:
+                self._update_rates()
+            logger.info(
+                f"Consolidated {self.last_run['consolidated']} memories in {self.last_run['pages']} pages "
+                f"({self.last_run['memories_per_second']:.0f}/s, {self.last_run['failed']} failed, "
+                f"max lag {self.last_run['max_lag_seconds']:.0f}s)"
+            )
+            return dict(self.last_run)
+
+    async def _read_checkpoint(self) -> Optional[Any]:
+        """Get the saved scan cursor, None to start from the beginning."""
+        try:
+            async with asyncio.timeout(self.timeout):
+                records = await self.semantic_store.run_query(CHECKPOINT_READ_QUERY, {"id": CHECKPOINT_ID})
+        except Exception as e:
+            logger.warning(f"Could not read consolidation checkpoint: {str(e)}")
+            return None
+        return records[0].get("offset") if records else None
+
+    async def _run_scan(self) -> bool:
+        """Scan unconsolidated memories page by page; True if the scan finished."""
+        offset = await self._read_checkpoint()
+        self.last_run["resumed_from"] = offset
+
+        # The scan reads the next page while this one is written
+        pages = self.vector_store.scan_vectors(
+            filter_conditions=unconsolidated_filter(),
+            page_size=self.page_size,
+            offset=offset
+        )
+        async with aclosing(pages):
+            async for page in pages:
+                if not await self._process_page(page, checkpoint=page.next_offset):
+                    return False
+        return True
+
+    async def _run_ids(self, memory_ids: List[str]) -> bool:
+        """Consolidate explicit ids in pages; True if every page was written."""
+        ids = list(dict.fromkeys(memory_ids))
+        for start in range(0, len(ids), self.page_size):
+            chunk = ids[start:start + self.page_size]
+            async with asyncio.timeout(self.timeout):
+                found = await self.vector_store.get_vectors(chunk)
+            missing = [mid for mid in chunk if mid not in found]
+            if missing:
+                logger.warning(f"{len(missing)} memories not found for consolidation")
+                self.last_run["missing"] += len(missing)
+                self.totals["missing"] += len(missing)
+            if not await self._process_page([found[mid] for mid in chunk if mid in found]):
+                return False
+        return True
+
+    async def _process_page(self, results: List[Dict], checkpoint: Any = _NO_CHECKPOINT) -> bool:
+        """Write and mark one page; False if the semantic store is unavailable.
+
+        Args:
+            results: Vector store results for this page
+            checkpoint: Scan cursor to save in the same transaction (None
+                once the scan is finished); omitted for explicit ids
+        """
+        if self.circuit is not None and not self.circuit.allow_request():
+            logger.warning("Circuit breaker is open, pausing consolidation")
+            return False
+
+        started = time.perf_counter()
+        rows = [row for row in map(_concept_row, results) if row is not None]
+        queries = []
+        if rows:
+            queries = [
+                {"query": CONCEPTS_QUERY, "parameters": {"rows": rows}},
+                {"query": RELATIONSHIPS_QUERY, "parameters": {"rows": rows}}
+            ]
+        if checkpoint is not _NO_CHECKPOINT:
+            queries.append({"query": CHECKPOINT_QUERY, "parameters": {
+                "id": CHECKPOINT_ID,
+                "offset": checkpoint,
+                "count": len(rows),
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }})
+        if not queries:
+            return True
+
+        ids = [row["id"] for row in rows]
+        try:
+            await self._write(queries)
+            if self.circuit is not None:
+                self.circuit.record_success()
+        except Exception as e:
+            if self.circuit is not None:
+                self.circuit.record_failure()
+            logger.error(f"Failed to consolidate page of {len(rows)} memories: {str(e)}")
+            self._count("failed", len(rows))
+            return True
+
+        if ids:
+            try:
+                async with asyncio.timeout(self.timeout):
+                    await self.vector_store.update_metadata_batch(ids, {"consolidated": True})
+            except Exception as e:
+                # Concepts are written; a later scan re-merges these idempotently
+                logger.error(f"Failed to mark {len(ids)} memories consolidated: {str(e)}")
+                self._count("failed", len(ids))
+                return True
+            if self.on_consolidated is not None:
+                self.on_consolidated(ids)
+
+        self._count("consolidated", len(ids))
+        self._count("pages", 1)
+        self._page_ms_total += (time.perf_counter() - started) * 1000
+        now = datetime.now(timezone.utc)
+        for result in results:
+            age = _age_seconds((result.get("metadata") or {}).get("timestamp"), now)
+            if age is not None:
+                self._lag_total += age
+                self._lag_count += 1
+                self.last_run["max_lag_seconds"] = max(self.last_run["max_lag_seconds"], age)
+        self._update_rates()
+        return True
+
+    async def _write(self, queries: List[Dict[str, Any]]):
+        """Run the page transaction with retries."""
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                async with asyncio.timeout(self.timeout):
+                    await self.semantic_store.run_transaction(queries)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(f"Consolidation page attempt {attempt} failed: {str(e)}")
+                await asyncio.sleep(self.backoff_factor * attempt)
+
+    def _count(self, key: str, amount: int):
+        self.last_run[key] += amount
+        self.totals[key] += amount
+
+    def _update_rates(self):
+        elapsed = time.perf_counter() - self._started
+        run = self.last_run
+        run["elapsed_seconds"] = elapsed
+        run["memories_per_second"] = run["consolidated"] / elapsed if elapsed > 0 else 0.0
+        run["avg_page_ms"] = self._page_ms_total / run["pages"] if run["pages"] else 0.0
+        run["avg_lag_seconds"] = self._lag_total / self._lag_count if self._lag_count else 0.0
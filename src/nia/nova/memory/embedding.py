@@ -6,7 +6,8 @@ system. Key features:
 
 - Deterministic: Same input text always produces the same embedding vector
 - Consistent dimensionality: All embeddings have the same configurable dimension
-- Efficient caching: LRU cache for frequently accessed text
+- Vectorized: Batches are hashed and expanded in a single NumPy operation
+- Efficient caching: LRU cache keyed by content digest
 - Error handling: Returns zero vectors on failure, with detailed logging
 - Thread-safe: Can be safely used in concurrent contexts
 
@@ -15,10 +16,15 @@ creating embeddings suitable for similarity comparisons."""
 
 import logging
 import hashlib
+from collections import OrderedDict
 from typing import List, Union, Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+DIGEST_SIZE = 32  # SHA-256 digest length in bytes
+
 class EmbeddingService:
     """Service for creating deterministic embeddings using SHA-256 hashing.
     
@@ -30,6 +36,7 @@ class EmbeddingService:
     - Uses SHA-256 to hash input text to ensure deterministic output
     - Maps hash bytes to float values in range [-1.0, 1.0] for vector components
     - Supports both single text and batch text inputs
+    - Returns float32 NumPy arrays; batches are expanded in one vectorized step
     - Implements async methods for concurrent usage
     - Thread-safe caching implementation
     
@@ -41,9 +48,9 @@ class EmbeddingService:
     
     Cache Behavior:
     - Maintains fixed-size LRU cache (default 1000 entries)
-    - Automatically evicts oldest entries when cache is full
-    - Cache hits avoid recomputing embeddings
-    - Separate cache entries for each unique text input
+    - Automatically evicts least recently used entries when cache is full
+    - Cache hits avoid recomputing embeddings and refresh recency
+    - Keyed by SHA-256 digest of the text; cached vectors are read-only
     
     Usage:
     >>> service = EmbeddingService(cache_size=1000, dimension=768)
@@ -68,7 +75,8 @@ class EmbeddingService:
             model: Name of the embedding model to use. Defaults to nomic-embed-text.
         """
         self._dimension = dimension  # Set default dimension
-        self._cache = {}  # Simple cache for embeddings
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()  # LRU keyed by content digest
+        self._index: Optional[np.ndarray] = None
         self._cache_size = cache_size
         self.model = model  # Store model name
         logger.info("Embedding service initialized")
@@ -100,35 +108,63 @@ class EmbeddingService:
             logger.error("Dimension not set")
         return self._dimension
             
-    def _get_from_cache(self, text: str) -> Optional[List[float]]:
-        """Get embedding from cache if available.
+    def _byte_index(self) -> np.ndarray:
+        """Get the digest byte index for each embedding component.
+
+        Component ``i`` reads byte ``i % 32`` of the SHA-256 digest. The index
+        array is built once per dimension and reused for every batch.
+        """
+        if self._index is None or len(self._index) != self._dimension:
+            self._index = np.arange(self._dimension) % DIGEST_SIZE
+        return self._index
+
+    def _get_from_cache(self, key: bytes) -> Optional[np.ndarray]:
+        """Get embedding from cache if available, marking it most recently used.
         
         Args:
-            text: Text string to look up in cache
+            key: Content digest to look up in cache
             
         Returns:
-            Optional[List[float]]: Cached embedding vector if found, None if not in cache
+            Optional[np.ndarray]: Cached read-only embedding vector if found,
+                None if not in cache
         """
-        return self._cache.get(text)
+        embedding = self._cache.get(key)
+        if embedding is not None:
+            self._cache.move_to_end(key)
+        return embedding
 
-    def _add_to_cache(self, text: str, embedding: List[float]):
-        """Add embedding to cache, removing oldest entry if at capacity.
+    def _add_to_cache(self, key: bytes, embedding: np.ndarray):
+        """Add embedding to cache, evicting least recently used entries at capacity.
         
         Args:
-            text: Text string to use as cache key
-            embedding: Embedding vector to store in cache
+            key: Content digest to use as cache key
+            embedding: Embedding vector to store in cache. Stored read-only so
+                cached vectors can be shared without copying.
+        """
+        embedding.setflags(write=False)
+        self._cache[key] = embedding
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _hash_embeddings(self, digests: List[bytes]) -> np.ndarray:
+        """Expand a batch of SHA-256 digests into embeddings in one NumPy pass.
+        
+        Args:
+            digests: SHA-256 digests, one per text
             
-        Note:
-            If cache is at capacity (self._cache_size), the oldest entry will be
-            removed before adding the new one.
+        Returns:
+            np.ndarray: float32 array of shape (len(digests), dimension) with
+                values ``byte / 128 - 1`` in range [-1.0, 1.0)
         """
-        if len(self._cache) >= self._cache_size:
-            # Remove oldest item
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-        self._cache[text] = embedding
+        hash_bytes = np.frombuffer(b"".join(digests), dtype=np.uint8)
+        hash_bytes = hash_bytes.reshape(len(digests), DIGEST_SIZE)
+        embeddings = hash_bytes[:, self._byte_index()].astype(np.float32)
+        embeddings /= 128.0
+        embeddings -= 1.0
+        return embeddings
 
-    async def create_embedding(self, text: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
+    async def create_embedding(self, text: Union[str, List[str]]) -> np.ndarray:
         """Create hash-based embeddings for text with caching.
         
         Args:
@@ -136,12 +172,12 @@ class EmbeddingService:
                  pass a list of strings to embed them all at once.
             
         Returns:
-            List[float] or List[List[float]]: 
-                - For single text input (str): Returns a single embedding vector as List[float]
-                - For batch input (List[str]): Returns List[List[float]] containing an embedding
-                  vector for each input text in the same order
-                - Each vector has dimension specified by self._dimension
-                - Uses cached embeddings when available for better performance
+            np.ndarray: float32 embeddings
+                - For single text input (str): Returns a vector of shape (dimension,)
+                - For batch input (List[str]): Returns an array of shape
+                  (len(text), dimension) with one row per input text in the same order
+                - Cache misses in a batch are hashed together in one vectorized step
+                - Single-text results may be the shared read-only cached vector
                 
         Raises:
             ValueError: If dimension is not set (None)
@@ -153,71 +189,47 @@ class EmbeddingService:
             - Maintains cache integrity even after errors
             
         Cache Behavior:
-            - Checks cache before computing new embeddings
+            - Keyed by SHA-256 digest of the text, so large texts are not held as keys
+            - Hits refresh recency; least recently used entries are evicted first
             - Updates cache with new embeddings after computation
-            - Handles cache eviction when at capacity
-            - Thread-safe cache operations
         """
         try:
-            # Check cache for single text
             if isinstance(text, str):
-                cached = self._get_from_cache(text)
+                key = hashlib.sha256(text.encode()).digest()
+                cached = self._get_from_cache(key)
                 if cached is not None:
                     logger.debug("Using cached embedding")
                     return cached
-                texts = [text]
-            else:
-                # For list input, check cache for each text
-                texts = []
-                cached_embeddings = []
-                need_embedding = False
-                for t in text:
-                    cached = self._get_from_cache(t)
-                    if cached is not None:
-                        cached_embeddings.append(cached)
-                    else:
-                        need_embedding = True
-                        texts.append(t)
-                        cached_embeddings.append(None)
-                
-                # If all embeddings were cached, return them
-                if not need_embedding:
-                    logger.debug("Using all cached embeddings")
-                    return cached_embeddings
-                
-            # Use hash-based embeddings
-            logger.debug("Creating hash-based embeddings")
-            if isinstance(text, str):
-                # Create deterministic embedding based on text hash
-                hash_obj = hashlib.sha256(text.encode())
-                hash_bytes = hash_obj.digest()
-                # Use hash bytes to create float values between -1 and 1
-                embedding = []
-                for i in range(self._dimension):
-                    byte_val = hash_bytes[i % len(hash_bytes)]
-                    val = (byte_val / 128.0) - 1.0
-                    embedding.append(val)
-                self._add_to_cache(text, embedding)
+                embedding = self._hash_embeddings([key])[0]
+                self._add_to_cache(key, embedding)
                 return embedding
+
+            digests = [hashlib.sha256(t.encode()).digest() for t in text]
+            embeddings = np.empty((len(digests), self._dimension), dtype=np.float32)
+            missing = []
+            for i, key in enumerate(digests):
+                cached = self._get_from_cache(key)
+                if cached is not None:
+                    embeddings[i] = cached
+                else:
+                    missing.append(i)
+
+            if missing:
+                # Hash all cache misses together, filling the gaps in place
+                logger.debug(f"Creating {len(missing)} hash-based embeddings")
+                computed = self._hash_embeddings([digests[i] for i in missing])
+                embeddings[missing] = computed
+                for row, i in zip(computed, missing):
+                    self._add_to_cache(digests[i], row.copy())
             else:
-                # Handle list of texts
-                embeddings = []
-                for t in texts:
-                    hash_obj = hashlib.sha256(t.encode())
-                    hash_bytes = hash_obj.digest()
-                    embedding = []
-                    for i in range(self._dimension):
-                        byte_val = hash_bytes[i % len(hash_bytes)]
-                        val = (byte_val / 128.0) - 1.0
-                        embedding.append(val)
-                    embeddings.append(embedding)
-                    self._add_to_cache(t, embedding)
-                return embeddings
+                logger.debug("Using all cached embeddings")
+            return embeddings
             
         except Exception as e:
             logger.error(f"Failed to create embedding: {str(e)}")
             if self._dimension is None:
                 raise ValueError("Cannot create embedding: dimension not yet determined") 
-            # Return zero vector on error
-            zero_vector = [0.0] * self._dimension
-            return zero_vector if isinstance(text, str) else [zero_vector]
+            # Return zero vector(s) on error
+            if isinstance(text, str):
+                return np.zeros(self._dimension, dtype=np.float32)
+            return np.zeros((len(text), self._dimension), dtype=np.float32)
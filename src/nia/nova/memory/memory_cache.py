@@ -0,0 +1,161 @@
+"""Bounded LRU/TTL cache for memory pools."""
+
+import time
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+# Defaults used when [MEMORY] pool settings are missing from config.ini
+DEFAULT_POOL_MAX_SIZE = 10000
+DEFAULT_POOL_TTL_SECONDS = 3600.0
+
+def freeze_entry(entry: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return a read-only view of a pool entry with sanitized metadata.
+
+    Metadata values are flattened to simple types once, on insert, so cache
+    hits can be handed out without copying.
+    """
+    metadata = {
+        k: str(v) if not isinstance(v, (bool, int, float)) else v
+        for k, v in (entry.get("metadata") or {}).items()
+    }
+    frozen = dict(entry)
+    frozen["content"] = str(entry.get("content", ""))
+    frozen["metadata"] = MappingProxyType(metadata)
+    return MappingProxyType(frozen)
+
+class MemoryCache:
+    """Size- and TTL-bounded LRU cache with hit/miss/eviction counters.
+
+    Supports the subset of the dict interface the memory system uses
+    (``in``, ``get``, ``[]``, ``pop``, ``clear``) so it can stand in for the
+    plain dicts previously used as memory pools. Entries are frozen on insert.
+
+    Every operation is O(1). Inserts, invalidations and expiry take a write
+    lock so the cache can be shared between threads; hits only move the entry
+    to the recent end and never wait on it.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        ttl_seconds: Optional[float] = DEFAULT_POOL_TTL_SECONDS,
+        freeze: Callable[[Mapping[str, Any]], Any] = freeze_entry
+    ):
+        """Initialize cache.
+
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+            ttl_seconds: Entry lifetime, or None/0 for no expiry
+            freeze: Converts a value to the object stored and handed out
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds or None
+        self.freeze = freeze
+        self._entries: "OrderedDict[str, Tuple[float, Mapping[str, Any]]]" = OrderedDict()
+        self._write_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _lookup(self, key: str) -> Optional[Mapping[str, Any]]:
+        """Get a live entry, dropping it if expired. Does not count stats."""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at and expires_at <= time.monotonic():
+            with self._write_lock:
+                if self._entries.get(key) is item:
+                    del self._entries[key]
+                    self.expirations += 1
+            return None
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get an entry, refreshing its recency."""
+        value = self._lookup(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            pass  # Evicted or invalidated by a concurrent writer
+        return value
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        """Get an entry without counting a hit or miss or refreshing its recency."""
+        value = self._lookup(key)
+        return default if value is None else value
+
+    def put(self, key: str, value: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Insert or replace an entry, evicting least recently used entries.
+
+        Returns:
+            Mapping[str, Any]: The frozen entry as stored
+        """
+        frozen = self.freeze(value)
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+        with self._write_lock:
+            self._entries[key] = (expires_at, frozen)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return frozen
+
+    def invalidate(self, key: str) -> bool:
+        """Remove an entry. Returns True if it was cached."""
+        with self._write_lock:
+            if self._entries.pop(key, None) is None:
+                return False
+            self.invalidations += 1
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key) is not None
+
+    def __getitem__(self, key: str) -> Mapping[str, Any]:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Mapping[str, Any]):
+        self.put(key, value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove and return an entry."""
+        value = self._lookup(key)
+        if value is None:
+            return default
+        self.invalidate(key)
+        return value
+
+    def clear(self):
+        """Drop all entries; counters are kept."""
+        with self._write_lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters and hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations
+        }
@@ -1,6 +1,7 @@
 """Two-layer memory system implementation for NIA."""
 
-from typing import Optional, Dict, List, Any, cast
+from typing import Optional, Dict, List, Any, Tuple, AsyncIterator, cast
+from contextlib import aclosing
 import json
 import logging
 import traceback
@@ -13,6 +14,16 @@ import os
 from nia.core.types.memory_types import Memory, MemoryType, ValidationSchema, CrossDomainSchema, EpisodicMemory
 from nia.nova.memory.vector_store import VectorStore
 from nia.nova.memory.embedding import EmbeddingService
+from nia.nova.memory.memory_cache import (
+    MemoryCache,
+    DEFAULT_POOL_MAX_SIZE,
+    DEFAULT_POOL_TTL_SECONDS
+)
+from nia.nova.memory.consolidation_engine import (
+    ConsolidationEngine,
+    DEFAULT_PAGE_SIZE,
+    unconsolidated_filter
+)
 from nia.core.neo4j.concept_store import ConceptStore
 from nia.core.neo4j.base_store import Neo4jMemoryStore
 from qdrant_client.http import models
@@ -23,6 +34,7 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = 3
 TIMEOUT_SECONDS = 10
 BACKOFF_FACTOR = 2
+DEFAULT_CANDIDATE_LIMIT = 1000  # Bound for get_consolidation_candidates
 
 def create_default_validation():
     """Create default validation data."""
@@ -162,35 +174,123 @@ class EpisodicLayer:
             logger.error(traceback.format_exc())
             raise
 
-    async def get_consolidation_candidates(self) -> List[Dict]:
-        """Get memories that are candidates for consolidation."""
+    async def iter_consolidation_candidates(
+        self,
+        page_size: Optional[int] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """Yield pages of memories that are candidates for consolidation.
+        
+        Pages come from a filter-only scan of the vector store, so memory use
+        does not grow with the number of candidates and no query embedding is
+        created.
+        
+        Args:
+            page_size: Memories per page (vector store default if None)
+        """
         if not self.circuit_breaker.allow_request():
             logger.warning("Circuit breaker is open, skipping consolidation candidates request")
-            return []
-
-        try:
-            # Create filter condition for unconsolidated memories
-            filter_condition = models.FieldCondition(
-                key="metadata_consolidated",
-                match=models.MatchValue(value=False)
-            )
+            return
             
-            async with asyncio.timeout(TIMEOUT_SECONDS):
-                if not self.store or not hasattr(self.store, 'search_vectors'):
-                    logger.error("Vector store missing or search_vectors method not available")
-                    return []
-                    
-                result = await self.store.search_vectors(
-                    content={},  # Empty content since we're only filtering by metadata
-                    filter_conditions=[filter_condition]
-                )
+        if not self.store or not hasattr(self.store, 'scan_vectors'):
+            logger.error("Vector store missing or scan_vectors method not available")
+            return
+            
+        try:
+            async with aclosing(self.store.scan_vectors(
+                filter_conditions=unconsolidated_filter(),
+                page_size=page_size
+            )) as pages:
+                async for page in pages:
+                    yield page
             self.circuit_breaker.record_success()
-            return result
         except Exception as e:
             self.circuit_breaker.record_failure()
             logger.error(f"Failed to get consolidation candidates: {str(e)}")
             logger.error(traceback.format_exc())
-            return []
+
+    async def get_consolidation_candidates(self, limit: int = DEFAULT_CANDIDATE_LIMIT) -> List[Dict]:
+        """Get up to limit memories that are candidates for consolidation.
+        
+        The result is held in one list, so it is always bounded; use
+        iter_consolidation_candidates to process every candidate page by page.
+        
+        Args:
+            limit: Maximum number of candidates
+            
+        Returns:
+            List[Dict]: Candidate memories
+            
+        Raises:
+            ValueError: If limit is not a positive integer
+        """
+        if not isinstance(limit, int) or limit < 1:
+            raise ValueError(
+                f"limit must be a positive integer, got {limit!r}; "
+                "use iter_consolidation_candidates for all candidates"
+            )
+        candidates: List[Dict] = []
+        page_size = min(limit, getattr(self.store, "scan_page_size", limit))
+        async with aclosing(self.iter_consolidation_candidates(page_size)) as pages:
+            async for page in pages:
+                candidates.extend(page)
+                if len(candidates) >= limit:
+                    del candidates[limit:]
+                    break
+        return candidates
+
+    def _prepare_memory(self, memory: EpisodicMemory) -> Tuple[str, Dict[str, Any]]:
+        """Extract storable content and flattened metadata from a memory."""
+        # Generate ID if not present
+        memory_id = getattr(memory, "id", None) or str(uuid.uuid4())
+
+        # Use original metadata with a copy to prevent recursion
+        metadata = {}
+        if hasattr(memory, "metadata") and isinstance(memory.metadata, dict):
+            # Only copy simple types to prevent recursion
+            for k, v in memory.metadata.items():
+                metadata[k] = _safe_convert_value(v)
+
+        # Keep original metadata and add required fields
+        metadata.update({
+            "id": memory_id,
+            "timestamp": getattr(memory, "timestamp", datetime.now().isoformat()),
+            "thread_id": metadata.get("thread_id"),
+            "description": metadata.get("description", ""),
+            "system": bool(metadata.get("system", False)),
+            "pinned": bool(metadata.get("pinned", False)),
+            "consolidated": bool(metadata.get("consolidated", False))
+        })
+
+        # Keep original type from metadata with safe type conversion
+        if "type" in metadata:
+            # Preserve original type if it's a string
+            if isinstance(metadata["type"], str):
+                pass
+            else:
+                metadata["type"] = str(metadata["type"])
+        elif hasattr(memory, "type"):
+            if isinstance(memory.type, str):
+                metadata["type"] = memory.type
+            elif isinstance(memory.type, MemoryType):
+                metadata["type"] = memory.type.value
+            else:
+                metadata["type"] = str(memory.type)
+        else:
+            metadata["type"] = "unknown"
+
+        # Remove None values and ensure all values are simple types
+        metadata = {k: _safe_convert_value(v)
+                   for k, v in metadata.items() 
+                   if v is not None}
+
+        logger.debug(f"Storing memory with metadata: {metadata}")
+
+        # Get content safely
+        content = getattr(memory, "content", "")
+        if not isinstance(content, str):
+            content = str(content)
+        
+        return content, metadata
 
     async def store_memory(self, memory: EpisodicMemory) -> bool:
         """Store a memory directly in the vector store."""
@@ -203,55 +303,7 @@ class EpisodicLayer:
             return False
             
         try:
-            # Generate ID if not present
-            memory_id = getattr(memory, "id", None) or str(uuid.uuid4())
-            
-            # Use original metadata with a copy to prevent recursion
-            metadata = {}
-            if hasattr(memory, "metadata") and isinstance(memory.metadata, dict):
-                # Only copy simple types to prevent recursion
-                for k, v in memory.metadata.items():
-                    metadata[k] = _safe_convert_value(v)
-            
-            # Keep original metadata and add required fields
-            metadata.update({
-                "id": memory_id,
-                "timestamp": getattr(memory, "timestamp", datetime.now().isoformat()),
-                "thread_id": metadata.get("thread_id"),
-                "description": metadata.get("description", ""),
-                "system": bool(metadata.get("system", False)),
-                "pinned": bool(metadata.get("pinned", False)),
-                "consolidated": bool(metadata.get("consolidated", False))
-            })
-            
-            # Keep original type from metadata with safe type conversion
-            if "type" in metadata:
-                # Preserve original type if it's a string
-                if isinstance(metadata["type"], str):
-                    pass
-                else:
-                    metadata["type"] = str(metadata["type"])
-            elif hasattr(memory, "type"):
-                if isinstance(memory.type, str):
-                    metadata["type"] = memory.type
-                elif isinstance(memory.type, MemoryType):
-                    metadata["type"] = memory.type.value
-                else:
-                    metadata["type"] = str(memory.type)
-            else:
-                metadata["type"] = "unknown"
-            
-            # Remove None values and ensure all values are simple types
-            metadata = {k: _safe_convert_value(v)
-                       for k, v in metadata.items() 
-                       if v is not None}
-            
-            logger.debug(f"Storing memory with metadata: {metadata}")
-            
-            # Get content safely
-            content = getattr(memory, "content", "")
-            if not isinstance(content, str):
-                content = str(content)
+            content, metadata = self._prepare_memory(memory)
             
             # Add timeout to prevent infinite recursion
             async with asyncio.timeout(TIMEOUT_SECONDS):
@@ -276,6 +328,78 @@ class EpisodicLayer:
             logger.error(f"Failed to store memory: {str(e)}")
             logger.error(traceback.format_exc())
             return False
+
+    async def store_memories(
+        self,
+        memories: List[EpisodicMemory],
+        batch_size: Optional[int] = None,
+        wait: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Store many memories with one embedding call and chunked upserts.
+        
+        Args:
+            memories: Memories to store
+            batch_size: Points per upsert request (vector store default if None)
+            wait: Wait for each upsert to be applied before returning
+            
+        Returns:
+            List[Dict[str, Any]]: One result per memory, in input order, with
+                "id" (memory id), "success" and "error" keys
+        """
+        results: List[Dict[str, Any]] = []
+        items: List[Dict[str, Any]] = []
+        for memory in memories:
+            try:
+                content, metadata = self._prepare_memory(memory)
+                items.append({"content": content, "metadata": metadata})
+                results.append({"id": metadata["id"], "success": False, "error": None})
+            except Exception as e:
+                items.append(None)
+                results.append({"id": getattr(memory, "id", None), "success": False, "error": str(e)})
+                
+        if not self.circuit_breaker.allow_request():
+            logger.warning("Circuit breaker is open, skipping bulk memory storage")
+            for result in results:
+                result["error"] = result["error"] or "circuit breaker open"
+            return results
+            
+        if not self.store or not hasattr(self.store, 'store_vectors'):
+            logger.error("Vector store missing store_vectors method")
+            for result in results:
+                result["error"] = result["error"] or "vector store unavailable"
+            return results
+            
+        indexes = [i for i, item in enumerate(items) if item is not None]
+        if not indexes:
+            return results
+            
+        try:
+            # Scale the timeout with the number of upsert round-trips
+            batch_size = batch_size or getattr(self.store, "upsert_batch_size", len(indexes))
+            chunks = (len(indexes) + batch_size - 1) // batch_size
+            async with asyncio.timeout(TIMEOUT_SECONDS * max(1, chunks)):
+                stored = await self.store.store_vectors(
+                    [items[i] for i in indexes],
+                    layer="episodic",
+                    batch_size=batch_size,
+                    wait=wait
+                )
+            for i, outcome in zip(indexes, stored):
+                results[i]["success"] = bool(outcome.get("success"))
+                results[i]["error"] = outcome.get("error")
+                
+            if any(r["success"] for r in results):
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
+        except Exception as e:
+            self.circuit_breaker.record_failure()
+            logger.error(f"Failed to store memories: {str(e)}")
+            logger.error(traceback.format_exc())
+            for i in indexes:
+                results[i]["error"] = str(e)
+                
+        return results
             
     async def cleanup(self):
         """Clean up resources and close connections."""
@@ -328,16 +452,24 @@ class TwoLayerMemorySystem:
         self.qdrant_host = config.get("QDRANT", "host", fallback="127.0.0.1")
         self.qdrant_port = config.getint("QDRANT", "port", fallback=6333)
         
-        # Initialize memory pools
+        # Initialize bounded memory pools
+        pool_max_size = config.getint("MEMORY", "pool_max_size", fallback=DEFAULT_POOL_MAX_SIZE)
+        pool_ttl = config.getfloat("MEMORY", "pool_ttl_seconds", fallback=DEFAULT_POOL_TTL_SECONDS)
         self._memory_pools = {
-            "episodic": {},
-            "semantic": {}
+            "episodic": MemoryCache(max_size=pool_max_size, ttl_seconds=pool_ttl),
+            "semantic": MemoryCache(max_size=pool_max_size, ttl_seconds=pool_ttl)
         }
         
         # Initialize circuit breakers
         self.vector_circuit = CircuitBreaker()
         self.semantic_circuit = CircuitBreaker()
         
+        # Consolidation engine is created on first use, once the layers exist
+        self.consolidation_page_size = config.getint(
+            "MEMORY", "consolidation_page_size", fallback=DEFAULT_PAGE_SIZE
+        )
+        self._consolidation_engine: Optional[ConsolidationEngine] = None
+        
     async def initialize(self):
         """Initialize connections to Neo4j and vector store."""
         if not self._initialized:
@@ -391,6 +523,81 @@ class TwoLayerMemorySystem:
                 logger.error(traceback.format_exc())
                 raise
 
+    def _to_episodic_memory(
+        self,
+        memory: Memory,
+        is_sync: bool = False,
+        recursion_depth: int = 0
+    ) -> EpisodicMemory:
+        """Convert a memory to an EpisodicMemory with flattened, sync-tracked metadata."""
+        # Use existing ID or generate new one
+        memory_id = getattr(memory, "id", None) or str(uuid.uuid4())
+
+        # Extract memory attributes safely
+        content = getattr(memory, "content", "")
+        if not isinstance(content, str):
+            content = str(content)
+
+        memory_type = getattr(memory, "type", "thread")
+        if not isinstance(memory_type, (str, MemoryType)):
+            memory_type = str(memory_type)
+
+        timestamp = getattr(memory, "timestamp", datetime.now()).isoformat()
+
+        # Get existing metadata or create new
+        existing_metadata = getattr(memory, "metadata", {})
+        if not isinstance(existing_metadata, dict):
+            existing_metadata = {}
+
+        # Create metadata with type checking, preserving existing values
+        metadata: Dict[str, Any] = {
+            "id": memory_id,
+            "timestamp": timestamp,
+            "type": memory_type,
+            "thread_id": existing_metadata.get("thread_id") or getattr(memory, "thread_id", None),
+            "description": existing_metadata.get("description") or getattr(memory, "description", ""),
+            "system": bool(existing_metadata.get("system", False)) or bool(getattr(memory, "system", False)),
+            "pinned": bool(existing_metadata.get("pinned", False)) or bool(getattr(memory, "pinned", False)),
+            "consolidated": bool(existing_metadata.get("consolidated", False)),
+            "_synced": True,  # Mark as synced to prevent loops
+            "_recursion_depth": recursion_depth,  # Track recursion depth
+            "_sync_source": "episodic" if is_sync else "direct"  # Track sync source
+        }
+
+        # Remove None values and ensure all values are simple types
+        metadata = {k: str(v) if not isinstance(v, (bool, int, float)) else v
+                   for k, v in metadata.items() 
+                   if v is not None}
+
+        # Create episodic memory with flattened metadata
+        episodic_memory = EpisodicMemory(
+            id=memory_id,
+            content=content,
+            metadata=metadata,
+            type=str(memory_type),  # Ensure type is string
+            timestamp=datetime.now(timezone.utc)
+        )
+        
+        return episodic_memory
+
+    def _pool_entry(self, episodic_memory: EpisodicMemory) -> Dict[str, Any]:
+        """Build the memory pool entry for a stored episodic memory."""
+        return {
+            "content": str(episodic_memory.content),
+            "metadata": episodic_memory.metadata,
+            "timestamp": episodic_memory.metadata.get("timestamp"),
+            "layer": "episodic"
+        }
+
+    def _matches_pool(self, layer: str, memory_id: str, memory: Memory) -> bool:
+        """Check whether a pooled memory has the same content and type."""
+        # Write-path check: a peek so duplicate detection does not skew read stats
+        existing_memory = self._memory_pools[layer].peek(memory_id)
+        if existing_memory is None:
+            return False
+        return (str(existing_memory.get("content", "")) == str(getattr(memory, "content", "")) and
+                str(existing_memory.get("metadata", {}).get("type")) == str(getattr(memory, "type", "thread")))
+
     async def store_experience(self, memory: Memory, is_sync: bool = False, recursion_depth: int = 0) -> bool:
         """Store an experience in the episodic layer."""
         # Prevent deep recursion and sync loops
@@ -416,24 +623,15 @@ class TwoLayerMemorySystem:
         if not is_sync:
             # Check if memory already exists with same properties
             memory_id = getattr(memory, "id", None) or str(uuid.uuid4())
-            if memory_id in self._memory_pools["episodic"]:
-                existing_memory = self._memory_pools["episodic"][memory_id]
-                
-                # Compare core properties
-                if (str(existing_memory.get("content", "")) == str(getattr(memory, "content", "")) and
-                    str(existing_memory.get("metadata", {}).get("type")) == str(getattr(memory, "type", "thread"))):
-                    logger.info(f"Memory {memory_id} already exists with same properties, skipping store")
-                    return True
+            if self._matches_pool("episodic", memory_id, memory):
+                logger.info(f"Memory {memory_id} already exists with same properties, skipping store")
+                return True
             
             # Check semantic layer if available
-            if self.semantic and self.semantic_circuit.allow_request() and memory_id in self._memory_pools["semantic"]:
-                existing_memory = self._memory_pools["semantic"][memory_id]
-                
-                # Compare core properties
-                if (str(existing_memory.get("content", "")) == str(getattr(memory, "content", "")) and
-                    str(existing_memory.get("metadata", {}).get("type")) == str(getattr(memory, "type", "thread"))):
-                    logger.info(f"Memory {memory_id} already exists in semantic layer with same properties, skipping store")
-                    return True
+            if self.semantic and self.semantic_circuit.allow_request() and \
+               self._matches_pool("semantic", memory_id, memory):
+                logger.info(f"Memory {memory_id} already exists in semantic layer with same properties, skipping store")
+                return True
                     
         if not self._initialized or not self.episodic:
             return False
@@ -443,53 +641,8 @@ class TwoLayerMemorySystem:
             return False
 
         try:
-            # Use existing ID or generate new one
-            memory_id = getattr(memory, "id", None) or str(uuid.uuid4())
-            
-            # Extract memory attributes safely
-            content = getattr(memory, "content", "")
-            if not isinstance(content, str):
-                content = str(content)
-                
-            memory_type = getattr(memory, "type", "thread")
-            if not isinstance(memory_type, (str, MemoryType)):
-                memory_type = str(memory_type)
-                
-            timestamp = getattr(memory, "timestamp", datetime.now()).isoformat()
-            
-            # Get existing metadata or create new
-            existing_metadata = getattr(memory, "metadata", {})
-            if not isinstance(existing_metadata, dict):
-                existing_metadata = {}
-                
-            # Create metadata with type checking, preserving existing values
-            metadata: Dict[str, Any] = {
-                "id": memory_id,
-                "timestamp": timestamp,
-                "type": memory_type,
-                "thread_id": existing_metadata.get("thread_id") or getattr(memory, "thread_id", None),
-                "description": existing_metadata.get("description") or getattr(memory, "description", ""),
-                "system": bool(existing_metadata.get("system", False)) or bool(getattr(memory, "system", False)),
-                "pinned": bool(existing_metadata.get("pinned", False)) or bool(getattr(memory, "pinned", False)),
-                "consolidated": bool(existing_metadata.get("consolidated", False)),
-                "_synced": True,  # Mark as synced to prevent loops
-                "_recursion_depth": recursion_depth,  # Track recursion depth
-                "_sync_source": "episodic" if is_sync else "direct"  # Track sync source
-            }
-            
-            # Remove None values and ensure all values are simple types
-            metadata = {k: str(v) if not isinstance(v, (bool, int, float)) else v
-                       for k, v in metadata.items() 
-                       if v is not None}
-            
-            # Create episodic memory with flattened metadata
-            episodic_memory = EpisodicMemory(
-                id=memory_id,
-                content=content,
-                metadata=metadata,
-                type=str(memory_type),  # Ensure type is string
-                timestamp=datetime.now(timezone.utc)
-            )
+            episodic_memory = self._to_episodic_memory(memory, is_sync, recursion_depth)
+            memory_id = episodic_memory.id
             
             # Store in episodic layer with timeout
             async with asyncio.timeout(TIMEOUT_SECONDS):
@@ -498,12 +651,7 @@ class TwoLayerMemorySystem:
             if success:
                 self.vector_circuit.record_success()
                 # Add to memory pool with flattened data
-                self._memory_pools["episodic"][memory_id] = {
-                    "content": str(content),
-                    "metadata": metadata,
-                    "timestamp": timestamp,
-                    "layer": "episodic"
-                }
+                self._memory_pools["episodic"][memory_id] = self._pool_entry(episodic_memory)
             else:
                 self.vector_circuit.record_failure()
                 
@@ -514,149 +662,241 @@ class TwoLayerMemorySystem:
             logger.error(traceback.format_exc())
             return False
 
+    async def store_experiences(
+        self,
+        memories: List[Memory],
+        batch_size: Optional[int] = None,
+        wait: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Store many experiences in the episodic layer in one bulk operation.
+        
+        Memories are embedded in a single batch and upserted in chunks of
+        batch_size. Memories already pooled with the same content and type are
+        reported as stored without being re-sent.
+        
+        Args:
+            memories: Memories to store
+            batch_size: Points per upsert request (vector store default if None)
+            wait: Wait for each upsert to be applied before returning
+            
+        Returns:
+            List[Dict[str, Any]]: One result per memory, in input order, with
+                "id", "success" and "error" keys
+        """
+        results: List[Dict[str, Any]] = [
+            {"id": getattr(memory, "id", None), "success": False, "error": None}
+            for memory in memories
+        ]
+        
+        if not self._initialized or not self.episodic:
+            for result in results:
+                result["error"] = "memory system not initialized"
+            return results
+            
+        if not self.vector_circuit.allow_request():
+            logger.warning("Circuit breaker is open, skipping bulk experience storage")
+            for result in results:
+                result["error"] = "circuit breaker open"
+            return results
+            
+        pending: List[EpisodicMemory] = []
+        pending_indexes: List[int] = []
+        for i, memory in enumerate(memories):
+            try:
+                memory_id = getattr(memory, "id", None)
+                if memory_id and self._matches_pool("episodic", memory_id, memory):
+                    results[i]["success"] = True
+                    continue
+                episodic_memory = self._to_episodic_memory(memory)
+                results[i]["id"] = episodic_memory.id
+                pending.append(episodic_memory)
+                pending_indexes.append(i)
+            except Exception as e:
+                results[i]["error"] = str(e)
+                
+        if not pending:
+            return results
+            
+        try:
+            stored = await self.episodic.store_memories(pending, batch_size=batch_size, wait=wait)
+            for i, episodic_memory, outcome in zip(pending_indexes, pending, stored):
+                results[i]["success"] = bool(outcome.get("success"))
+                results[i]["error"] = outcome.get("error")
+                if results[i]["success"]:
+                    self._memory_pools["episodic"][episodic_memory.id] = self._pool_entry(episodic_memory)
+                    
+            if any(results[i]["success"] for i in pending_indexes):
+                self.vector_circuit.record_success()
+            else:
+                self.vector_circuit.record_failure()
+        except Exception as e:
+            self.vector_circuit.record_failure()
+            logger.error(f"Failed to store experiences: {str(e)}")
+            logger.error(traceback.format_exc())
+            for i in pending_indexes:
+                results[i]["error"] = str(e)
+                
+        return results
+
+    def _build_memory(self, memory_data: Dict[str, Any], location: str, recursion_depth: int) -> Optional[Memory]:
+        """Create a memory object with safe defaults and sync tracking."""
+        try:
+            content = str(memory_data.get("content", ""))
+            metadata = memory_data.get("metadata", {})
+            
+            # Get type with safe default
+            memory_type = str(metadata.get("type", "thread"))
+            
+            # Parse timestamp safely
+            try:
+                timestamp = datetime.fromisoformat(str(metadata.get("timestamp", datetime.now().isoformat())))
+            except (ValueError, TypeError):
+                timestamp = datetime.now()
+            
+            # Create memory with sanitized data and sync tracking
+            return Memory(
+                id=str(metadata.get("id", str(uuid.uuid4()))),
+                content=content,
+                type=memory_type,
+                importance=float(metadata.get("importance", 0.8)),
+                timestamp=timestamp,
+                context={},  # Simplified context to prevent recursion
+                metadata={
+                    **metadata,
+                    "_synced": True,  # Mark as synced
+                    "_sync_source": location,  # Track source
+                    "_recursion_depth": recursion_depth
+                }
+            )
+        except Exception as e:
+            logger.error(f"Failed to create memory object: {str(e)}")
+            logger.error(traceback.format_exc())
+            return None
+
     async def get_experience(self, memory_id: str, sync_layers: bool = True, recursion_depth: int = 0) -> Optional[Memory]:
         """Get an experience from either memory layer."""
+        memories = await self.get_experiences(
+            [memory_id],
+            sync_layers=sync_layers,
+            recursion_depth=recursion_depth
+        )
+        return memories.get(str(memory_id))
+
+    async def get_experiences(
+        self,
+        memory_ids: List[str],
+        sync_layers: bool = True,
+        recursion_depth: int = 0
+    ) -> Dict[str, Memory]:
+        """Get many experiences by id from either memory layer.
+        
+        Ids are resolved from the memory pools first, then with one semantic
+        query and one direct vector store lookup for whatever is still missing.
+        
+        Args:
+            memory_ids: Ids of memories to fetch
+            sync_layers: Sync unsynced memories back through store_experience
+            recursion_depth: Current sync recursion depth
+            
+        Returns:
+            Dict[str, Memory]: Found memories keyed by id; missing ids are omitted
+        """
         # Prevent deep recursion
         if recursion_depth > 3:
             logger.warning("Maximum recursion depth reached in get_experience")
-            return None
+            return {}
             
         try:
             if not self._initialized:
                 raise Exception("Memory system not initialized")
             
-            memory_data = None
-            location = None
+            ids = list(dict.fromkeys(str(memory_id) for memory_id in memory_ids))
+            found: Dict[str, Tuple[Dict[str, Any], str]] = {}
             
-            # Check memory pools first with payload structure
-            if memory_id in self._memory_pools["semantic"]:
-                pool_data = self._memory_pools["semantic"][memory_id]
-                memory_data = {
-                    "content": str(pool_data["content"]),
-                    "metadata": {k: str(v) if not isinstance(v, (bool, int, float)) else v 
-                               for k, v in pool_data["metadata"].items()}
-                }
-                location = "semantic"
-            elif memory_id in self._memory_pools["episodic"]:
-                pool_data = self._memory_pools["episodic"][memory_id]
-                memory_data = {
-                    "content": str(pool_data["content"]),
-                    "metadata": {k: str(v) if not isinstance(v, (bool, int, float)) else v 
-                               for k, v in pool_data["metadata"].items()}
-                }
-                location = "episodic"
+            # Check memory pools first; entries are frozen and already sanitized
+            for memory_id in ids:
+                for location in ("semantic", "episodic"):
+                    pool_data = self._memory_pools[location].get(memory_id)
+                    if pool_data is not None:
+                        found[memory_id] = (pool_data, location)
+                        break
             
             # If not in pools, check semantic layer if circuit allows
-            if not memory_data and self.semantic and self.semantic_circuit.allow_request():
+            missing = [memory_id for memory_id in ids if memory_id not in found]
+            if missing and self.semantic and self.semantic_circuit.allow_request():
                 try:
                     async with asyncio.timeout(TIMEOUT_SECONDS):
                         result = await self.semantic.run_query(
                             """
-                            MATCH (m {id: $id})
+                            MATCH (m)
+                            WHERE m.id IN $ids
                             RETURN m
                             """,
-                            {"id": memory_id}
+                            {"ids": missing}
                         )
-                    if result and result[0]:
-                        raw_data = result[0]["m"]
-                        # Flatten and sanitize data
-                        memory_data = {
-                            "content": str(raw_data.get("content", "")),
-                            "metadata": {k: str(v) if not isinstance(v, (bool, int, float)) else v 
-                                       for k, v in raw_data.get("metadata", {}).items()}
-                        }
-                        location = "semantic"
-                        # Add to semantic pool
-                        self._memory_pools["semantic"][memory_id] = memory_data
+                    for record in result or []:
+                        raw_data = record["m"]
+                        memory_id = str(raw_data.get("id"))
+                        if memory_id not in missing or memory_id in found:
+                            continue
+                        # Add to semantic pool, which flattens and sanitizes the data
+                        memory_data = self._memory_pools["semantic"].put(memory_id, {
+                            "content": raw_data.get("content", ""),
+                            "metadata": raw_data.get("metadata", {})
+                        })
+                        found[memory_id] = (memory_data, "semantic")
                     self.semantic_circuit.record_success()
                 except Exception as e:
                     self.semantic_circuit.record_failure()
                     logger.warning(f"Failed to query semantic layer: {str(e)}")
             
-            # Check episodic layer if still not found and circuit allows
-            if not memory_data and self.vector_circuit.allow_request():
+            # Fetch anything still missing from the episodic layer by id
+            missing = [memory_id for memory_id in ids if memory_id not in found]
+            if missing and self.vector_circuit.allow_request():
                 try:
-                    async with asyncio.timeout(TIMEOUT_SECONDS):
-                        if not self.vector_store or not hasattr(self.vector_store, 'search_vectors'):
-                            logger.error("Vector store missing search_vectors method")
-                            return None
-                            
-                        result = await self.vector_store.search_vectors(
-                            content={"id": memory_id},
-                            limit=1,
-                            score_threshold=0.99
-                        )
-                        memories = result if result else []
-                        
-                        if memories:
-                            raw_data = memories[0]
-                            location = "episodic"
-                            # Extract and flatten metadata
-                            if isinstance(raw_data, dict):
-                                content = str(raw_data.get("content", ""))
-                                metadata = {k: str(v) if not isinstance(v, (bool, int, float)) else v 
-                                          for k, v in raw_data.get("metadata", {}).items()}
-                                memory_data = {"content": content, "metadata": metadata}
-                                # Add to episodic pool
-                                self._memory_pools["episodic"][memory_id] = memory_data
+                    if not self.vector_store or not hasattr(self.vector_store, 'get_vectors'):
+                        logger.error("Vector store missing get_vectors method")
+                    else:
+                        async with asyncio.timeout(TIMEOUT_SECONDS):
+                            results = await self.vector_store.get_vectors(missing)
+                        for memory_id, raw_data in results.items():
+                            # Add to episodic pool, which flattens and sanitizes the data
+                            memory_data = self._memory_pools["episodic"].put(memory_id, {
+                                "content": raw_data.get("content", ""),
+                                "metadata": raw_data.get("metadata", {})
+                            })
+                            found[memory_id] = (memory_data, "episodic")
                         self.vector_circuit.record_success()
                 except Exception as e:
                     self.vector_circuit.record_failure()
                     logger.warning(f"Failed to query vector store: {str(e)}")
             
-            if not memory_data:
-                return None
-                
-            # Create memory object with safe defaults and proper sync tracking
-            try:
-                content = str(memory_data.get("content", ""))
-                metadata = memory_data.get("metadata", {})
-                
-                # Get type with safe default
-                memory_type = str(metadata.get("type", "thread"))
-                
-                # Parse timestamp safely
-                try:
-                    timestamp = datetime.fromisoformat(str(metadata.get("timestamp", datetime.now().isoformat())))
-                except (ValueError, TypeError):
-                    timestamp = datetime.now()
-                
-                # Create memory with sanitized data and sync tracking
-                memory = Memory(
-                    id=str(metadata.get("id", str(uuid.uuid4()))),
-                    content=content,
-                    type=memory_type,
-                    importance=float(metadata.get("importance", 0.8)),
-                    timestamp=timestamp,
-                    context={},  # Simplified context to prevent recursion
-                    metadata={
-                        **metadata,
-                        "_synced": True,  # Mark as synced
-                        "_sync_source": location,  # Track source
-                        "_recursion_depth": recursion_depth
-                    }
-                )
-                
+            memories: Dict[str, Memory] = {}
+            for memory_id in ids:
+                if memory_id not in found:
+                    continue
+                memory_data, location = found[memory_id]
+                memory = self._build_memory(memory_data, location, recursion_depth)
+                if memory is None:
+                    continue
+                    
                 # Only sync if conditions allow and not too deep
                 if (sync_layers and self.semantic and 
-                    location in ["semantic", "episodic"] and 
-                    not metadata.get("_synced") and
+                    not memory_data["metadata"].get("_synced") and
                     recursion_depth < 2):  # Reduced recursion limit
                     try:
                         await self.store_experience(memory, is_sync=True, recursion_depth=recursion_depth + 1)
                     except Exception as e:
                         logger.warning(f"Failed to sync memory: {str(e)}")
+                        
+                memories[memory_id] = memory
                 
-                return memory
-            except Exception as e:
-                logger.error(f"Failed to create memory object: {str(e)}")
-                logger.error(traceback.format_exc())
-                return None
+            return memories
                 
         except Exception as e:
             logger.error(f"Failed to get experience: {str(e)}")
             logger.error(traceback.format_exc())
-            return None
+            return {}
 
     async def delete_memory(self, memory_id: str) -> bool:
         """Delete a memory from both episodic and semantic layers."""
@@ -664,8 +904,7 @@ class TwoLayerMemorySystem:
             logger.debug(f"Deleting memory {memory_id}")
             
             # Remove from memory pools
-            self._memory_pools["episodic"].pop(memory_id, None)
-            self._memory_pools["semantic"].pop(memory_id, None)
+            self._invalidate_pools(memory_id)
             
             # Delete from vector store if circuit allows
             if self.vector_store and self.vector_circuit.allow_request():
@@ -701,6 +940,26 @@ class TwoLayerMemorySystem:
             logger.error(traceback.format_exc())
             return False
 
+    def _invalidate_pools(self, memory_id: str):
+        """Drop a memory from both pools."""
+        self._memory_pools["episodic"].invalidate(memory_id)
+        self._memory_pools["semantic"].invalidate(memory_id)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get memory pool, vector store, consolidation and concept cache metrics."""
+        metrics: Dict[str, Any] = {
+            "pools": {
+                layer: pool.stats() for layer, pool in self._memory_pools.items()
+            }
+        }
+        if self.vector_store and hasattr(self.vector_store, "get_metrics"):
+            metrics["vector_store"] = self.vector_store.get_metrics()
+        if self._consolidation_engine is not None:
+            metrics["consolidation"] = self._consolidation_engine.stats()
+        if self.semantic and hasattr(self.semantic, "get_cache_stats"):
+            metrics["concept_cache"] = self.semantic.get_cache_stats()
+        return metrics
+
     async def cleanup(self):
         """Clean up resources and close connections."""
         try:
@@ -736,122 +995,51 @@ class TwoLayerMemorySystem:
             # Reset circuit breakers
             self.vector_circuit = CircuitBreaker()
             self.semantic_circuit = CircuitBreaker()
+            self._consolidation_engine = None
             
             logger.debug("Memory system cleanup complete")
         except Exception as e:
             logger.error(f"Failed to clean up memory system: {str(e)}")
             logger.error(traceback.format_exc())
 
-    async def consolidate_memories(self, memory_ids: List[str]) -> bool:
-        """Consolidate specific memories from episodic to semantic layer."""
+    def _get_consolidation_engine(self) -> ConsolidationEngine:
+        """Get the consolidation engine, created on first use."""
+        if self._consolidation_engine is None:
+            self._consolidation_engine = ConsolidationEngine(
+                vector_store=self.vector_store,
+                semantic_store=self.semantic,
+                page_size=self.consolidation_page_size,
+                circuit=self.semantic_circuit,
+                on_consolidated=self._invalidate_consolidated,
+                max_retries=MAX_RETRIES,
+                backoff_factor=BACKOFF_FACTOR
+            )
+        return self._consolidation_engine
+
+    def _invalidate_consolidated(self, memory_ids: List[str]):
+        """Pooled copies no longer reflect the consolidated state."""
+        for memory_id in memory_ids:
+            self._invalidate_pools(memory_id)
+
+    async def consolidate_memories(self, memory_ids: Optional[List[str]] = None) -> bool:
+        """Consolidate memories from episodic to semantic layer.
+        
+        Memories are processed in pages of [MEMORY] consolidation_page_size:
+        one vector store read, one Neo4j transaction and one payload update
+        per page. See ConsolidationEngine.
+        
+        Args:
+            memory_ids: Memories to consolidate; all unconsolidated memories if None
+            
+        Returns:
+            bool: True if every page was written and marked
+        """
         if not self._initialized or not self.episodic or not self.semantic:
             return False
             
         try:
-            success = True
-            for memory_id in memory_ids:
-                try:
-                    # Get memory from episodic layer
-                    memory = await self.get_experience(memory_id, sync_layers=False)
-                    if not memory:
-                        logger.warning(f"Memory {memory_id} not found for consolidation")
-                        continue
-                        
-                    # Store in semantic layer
-                    if self.semantic_circuit.allow_request():
-                        try:
-                            async with asyncio.timeout(TIMEOUT_SECONDS):
-                                # Extract relationships and metadata with validation
-                                related = []
-                                metadata_fields = {}
-                                retry_count = 0
-                                
-                                while retry_count < MAX_RETRIES:
-                                    try:
-                                        # Validate and extract metadata
-                                        if memory.metadata and isinstance(memory.metadata, dict):
-                                            # Get relationships with validation
-                                            related = memory.metadata.get("related", [])
-                                            if not isinstance(related, list):
-                                                related = []
-                                                
-                                            # Collect metadata fields with validation
-                                            for key in ["importance", "thread_id", "description"]:
-                                                if key in memory.metadata:
-                                                    metadata_fields[key] = str(memory.metadata[key])
-                                        
-                                        # Create concept with metadata in a single atomic transaction
-                                        # Use APOC procedures for atomic operations
-                                        await self.semantic.run_query(
-                                            """
-                                            CALL apoc.do.when(
-                                                EXISTS((:Concept {id: $id})),
-                                                'MATCH (c:Concept {id: $id})
-                                                 SET c += $properties
-                                                 WITH c
-                                                 OPTIONAL MATCH (c)-[r:RELATED_TO]->()
-                                                 DELETE r
-                                                 WITH c
-                                                 UNWIND $related as rel
-                                                 OPTIONAL MATCH (r:Concept {id: rel})
-                                                 WITH c, r
-                                                 WHERE r IS NOT NULL
-                                                 MERGE (c)-[:RELATED_TO]->(r)
-                                                 RETURN c',
-                                                'CREATE (c:Concept)
-                                                 SET c = $properties
-                                                 SET c.id = $id
-                                                 WITH c
-                                                 UNWIND $related as rel
-                                                 OPTIONAL MATCH (r:Concept {id: rel})
-                                                 WITH c, r
-                                                 WHERE r IS NOT NULL
-                                                 MERGE (c)-[:RELATED_TO]->(r)
-                                                 RETURN c',
-                                                {id: $id, properties: $properties, related: $related}
-                                            ) YIELD value
-                                            RETURN value
-                                            """,
-                                            {
-                                                "id": str(memory.id),
-                                                "properties": {
-                                                    "type": str(memory.type),
-                                                    "description": str(memory.content),
-                                                    "importance": metadata_fields.get("importance", "0.5"),
-                                                    "thread_id": metadata_fields.get("thread_id", ""),
-                                                    "description_meta": metadata_fields.get("description", ""),
-                                                    "updated_at": datetime.now(timezone.utc).isoformat(),
-                                                    "version": 1  # Add version for optimistic locking
-                                                },
-                                                "related": related
-                                            }
-                                        )
-                                        break  # Success, exit retry loop
-                                        
-                                    except Exception as e:
-                                        retry_count += 1
-                                        if retry_count == MAX_RETRIES:
-                                            logger.error(f"Failed to consolidate concept after {MAX_RETRIES} attempts: {str(e)}")
-                                            logger.error(traceback.format_exc())
-                                            raise
-                                        else:
-                                            logger.warning(f"Consolidation attempt {retry_count} failed: {str(e)}")
-                                            await asyncio.sleep(BACKOFF_FACTOR * retry_count)
-                            self.semantic_circuit.record_success()
-                            
-                            # Mark as consolidated in episodic layer
-                            if memory.metadata:
-                                memory.metadata["consolidated"] = True
-                                await self.store_experience(memory, is_sync=True)
-                        except Exception as e:
-                            self.semantic_circuit.record_failure()
-                            logger.error(f"Failed to consolidate memory {memory_id}: {str(e)}")
-                            success = False
-                except Exception as e:
-                    logger.error(f"Failed to process memory {memory_id} for consolidation: {str(e)}")
-                    success = False
-                    
-            return success
+            run = await self._get_consolidation_engine().run(memory_ids)
+            return run["complete"]
         except Exception as e:
             logger.error(f"Failed to consolidate memories: {str(e)}")
             logger.error(traceback.format_exc())
@@ -4,20 +4,104 @@ import json
 import logging
 import uuid
 import asyncio
-from typing import Dict, List, Optional, Any, Union, Sequence, cast
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from typing import Dict, List, Optional, Any, Union, Sequence, Mapping, Callable, Tuple, AsyncIterator, cast
 from datetime import datetime
 import numpy as np
 from qdrant_client import QdrantClient, models
 from qdrant_client.http.models import Record, ScoredPoint
 from .embedding import EmbeddingService
+from nia.core.change_feed import change_feed
+from nia.core.hot_logging import get_hot_logger, head, Lazy
+from nia.core.vector.ranking import check_quotas, merge_ranked
 
 logger = logging.getLogger(__name__)
+hot = get_hot_logger(__name__)
+
+# Default number of concurrent blocking Qdrant calls per process
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Default number of points sent per bulk upsert request
+DEFAULT_UPSERT_BATCH_SIZE = 256
+
+# Default number of points read per scroll request when scanning
+DEFAULT_SCAN_PAGE_SIZE = 256
+
+# Namespace for deriving Qdrant point ids from memory ids
+POINT_ID_NAMESPACE = uuid.UUID("6f1c8a52-3d2b-5e4f-9a7c-1b2d3e4f5a6b")
+
+def point_id_for(memory_id: Any) -> str:
+    """Map a memory id to its deterministic Qdrant point id (UUIDv5)."""
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, str(memory_id)))
+
+class ScanPage(list):
+    """One page of a scan; next_offset is the cursor for the page after it."""
+    
+    def __init__(self, items: List[Dict], next_offset: Optional[Any] = None):
+        super().__init__(items)
+        self.next_offset = next_offset
+
+class OperationMetrics:
+    """Rolling latency statistics for a single Qdrant operation."""
+    
+    def __init__(self, window: int = 1000):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.total_wait_ms = 0.0
+        self._samples = deque(maxlen=window)
+        
+    def record(self, latency_ms: float, wait_ms: float = 0.0, error: bool = False):
+        """Record one call.
+        
+        Args:
+            latency_ms: Time spent executing the client call
+            wait_ms: Time spent queued for a free executor slot
+            error: Whether the call raised
+        """
+        self.count += 1
+        if error:
+            self.errors += 1
+        self.total_ms += latency_ms
+        self.total_wait_ms += wait_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+        self._samples.append(latency_ms)
+        
+    def snapshot(self) -> Dict[str, Any]:
+        """Get current statistics as a plain dict."""
+        samples = sorted(self._samples)
+        
+        def percentile(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(p * len(samples)))]
+            
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "avg_wait_ms": self.total_wait_ms / self.count if self.count else 0.0,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "max_ms": self.max_ms
+        }
 
 class VectorStore:
-    """Vector store for memory embeddings using Qdrant."""
+    """Vector store for memory embeddings using Qdrant.
+    
+    The underlying QdrantClient is synchronous, so every client call is run
+    on a bounded thread pool shared by all instances. This keeps the event loop
+    free while Qdrant is busy and caps the number of in-flight requests at
+    ``max_concurrency`` (``[QDRANT] max_concurrency`` in config.ini).
+    """
     
     _client_instance = None
     _client_lock = None
+    _executor = None
 
     def __init__(self, embedding_service: EmbeddingService):
         """Initialize vector store.
@@ -34,6 +118,19 @@ class VectorStore:
         self.embedding_service = embedding_service
         self.host = config.get("QDRANT", "host", fallback="127.0.0.1")
         self.port = config.getint("QDRANT", "port", fallback=6333)
+        self.max_concurrency = config.getint(
+            "QDRANT", "max_concurrency", fallback=DEFAULT_MAX_CONCURRENCY
+        )
+        
+        self.upsert_batch_size = config.getint(
+            "QDRANT", "upsert_batch_size", fallback=DEFAULT_UPSERT_BATCH_SIZE
+        )
+        self.scan_page_size = config.getint(
+            "QDRANT", "scan_page_size", fallback=DEFAULT_SCAN_PAGE_SIZE
+        )
+        
+        # Per-operation latency metrics
+        self._metrics: Dict[str, OperationMetrics] = {}
         
         # Initialize lock if needed
         if VectorStore._client_lock is None:
@@ -54,6 +151,59 @@ class VectorStore:
             )
         return VectorStore._client_instance
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the shared executor for blocking client calls."""
+        if VectorStore._executor is None:
+            VectorStore._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="qdrant"
+            )
+        return VectorStore._executor
+
+    async def _run(self, operation: str, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking client call on the executor and record its latency.
+        
+        Args:
+            operation: Operation name used as the metrics key
+            func: Blocking callable (usually a QdrantClient method)
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            Any: Result of func
+        """
+        submitted = time.perf_counter()
+        started = submitted
+        
+        def call():
+            nonlocal started
+            started = time.perf_counter()
+            return func(*args, **kwargs)
+            
+        loop = asyncio.get_running_loop()
+        error = False
+        try:
+            return await loop.run_in_executor(self._get_executor(), call)
+        except Exception:
+            error = True
+            raise
+        finally:
+            finished = time.perf_counter()
+            metrics = self._metrics.setdefault(operation, OperationMetrics())
+            metrics.record(
+                latency_ms=(finished - started) * 1000,
+                wait_ms=(started - submitted) * 1000,
+                error=error
+            )
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-operation latency metrics.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics keyed by operation name
+        """
+        return {name: m.snapshot() for name, m in self._metrics.items()}
+
     async def get_collection_name(self) -> str:
         """Get the current collection name."""
         if not self._collection_name:
@@ -102,7 +252,7 @@ class VectorStore:
                 logger.info(f"Using collection: {self._collection_name} for {dimension}-dimensional vectors")
                 
                 # Check if collection exists first
-                collections = client.get_collections()
+                collections = await self._run("get_collections", client.get_collections)
                 collection_exists = False
                 for c in collections:
                     collection_name = self._get_collection_name_from_info(c)
@@ -113,7 +263,9 @@ class VectorStore:
                 if not collection_exists:
                     logger.info(f"Creating collection {self._collection_name} with {dimension} dimensions")
                     try:
-                        client.create_collection(
+                        await self._run(
+                            "create_collection",
+                            client.create_collection,
                             collection_name=self._collection_name,
                             vectors_config=models.VectorParams(
                                 size=dimension,
@@ -141,7 +293,9 @@ class VectorStore:
                 
                 # Get collection info to verify configuration
                 try:
-                    collection_info = client.get_collection(self._collection_name)
+                    collection_info = await self._run(
+                        "get_collection", client.get_collection, self._collection_name
+                    )
                     logger.info(f"Retrieved collection info for {self._collection_name}")
                 except Exception as e:
                     logger.error(f"Failed to get collection info: {str(e)}")
@@ -197,7 +351,9 @@ class VectorStore:
                 # Create required indexes without checking existing ones
                 for field_name, field_schema in required_indexes:
                     try:
-                        client.create_payload_index(
+                        await self._run(
+                            "create_payload_index",
+                            client.create_payload_index,
                             collection_name=self._collection_name,
                             field_name=field_name,
                             field_schema=field_schema,
@@ -211,9 +367,8 @@ class VectorStore:
                             logger.error(f"Failed to create index {field_name}: {str(e)}")
                             raise
 
-                # Wait for indexes to be ready
-                import time
-                time.sleep(0.5)
+                # Wait for indexes to be ready without blocking the event loop
+                await asyncio.sleep(0.5)
                 logger.info("Vector store connection initialized with verified indexes")
                 return
             except Exception as e:
@@ -224,39 +379,56 @@ class VectorStore:
                 logger.warning(f"Retry {retry_count}/{max_retries} after error: {str(e)}")
                 await asyncio.sleep(retry_delay * retry_count)
 
-    def _normalize_vector(self, vector: Union[List[float], np.ndarray, List[List[float]]]) -> List[float]:
+    def _normalize_vector(self, vector: Union[List[float], np.ndarray, List[List[float]]]) -> np.ndarray:
         """Normalize vector to unit length.
         
         Args:
             vector: Input vector
             
         Returns:
-            List[float]: Normalized vector
+            np.ndarray: Normalized float32 vector. Convert with ``tolist()`` only
+                at the Qdrant request boundary.
             
         Raises:
             ValueError: If vector cannot be normalized
         """
-        # Convert to numpy array if needed
         try:
             if isinstance(vector, list):
                 # Handle nested lists
                 if vector and isinstance(vector[0], list):
-                    vector = np.array(vector[0], dtype=np.float32)
-                else:
-                    vector = np.array(vector, dtype=np.float32)
+                    vector = vector[0]
             elif not isinstance(vector, np.ndarray):
                 raise ValueError(f"Invalid vector type: {type(vector)}")
                 
-            # Normalize
+            # Single float32 copy (cached embeddings are read-only), normalized in place
+            vector = np.array(vector, dtype=np.float32)
             norm = np.linalg.norm(vector)
             if norm > 0:
-                vector = vector / norm
-                
-            # Convert to list and ensure float type
-            result = [float(x) for x in vector.tolist()]
-            return result
+                vector /= norm
+            return vector
         except Exception as e:
             raise ValueError(f"Failed to normalize vector: {str(e)}")
+
+    def _normalize_vectors(self, vectors: Union[List[List[float]], np.ndarray]) -> np.ndarray:
+        """Normalize each row of a batch of vectors to unit length.
+        
+        Args:
+            vectors: Input vectors, one per row
+            
+        Returns:
+            np.ndarray: Normalized float32 array of shape (len(vectors), dimension)
+            
+        Raises:
+            ValueError: If vectors cannot be normalized
+        """
+        try:
+            vectors = np.array(vectors, dtype=np.float32, ndmin=2)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            vectors /= norms
+            return vectors
+        except Exception as e:
+            raise ValueError(f"Failed to normalize vectors: {str(e)}")
             
     def _convert_point_to_dict(self, point: Union[Record, ScoredPoint, Dict]) -> Dict:
         """Convert point to dictionary format.
@@ -283,6 +455,43 @@ class VectorStore:
             
         return result
             
+    def _point_id(self, metadata: Optional[Dict[str, Any]]) -> str:
+        """Get the point id for a memory, random if it has no id."""
+        if metadata and metadata.get("id"):
+            return point_id_for(metadata["id"])
+        return str(uuid.uuid4())
+            
+    def _payload_to_result(self, payload: Dict[str, Any], score: Optional[float] = None) -> Dict:
+        """Convert a flattened point payload back to a memory result dict."""
+        metadata = {}
+        for k, v in payload.items():
+            if k.startswith('metadata_'):
+                metadata[k[9:]] = v  # Remove metadata_ prefix
+        return {
+            "content": payload.get("content"),
+            "metadata": metadata,
+            "layer": payload.get("layer"),
+            "timestamp": payload.get("timestamp"),
+            "score": score
+        }
+            
+    def _build_payload(
+        self,
+        content: Any,
+        metadata: Optional[Dict[str, Any]],
+        layer: str
+    ) -> Dict[str, Any]:
+        """Build a point payload with metadata flattened under a metadata_ prefix."""
+        payload = {
+            "content": content,
+            "layer": layer,
+            "timestamp": datetime.now().isoformat()
+        }
+        if metadata:
+            for k, v in metadata.items():
+                payload[f"metadata_{k}"] = v
+        return payload
+            
     async def store_vector(
         self,
         content: Any,
@@ -308,39 +517,23 @@ class VectorStore:
             if not isinstance(vector, (list, np.ndarray)):
                 raise ValueError(f"Invalid vector type from embedding service: {type(vector)}")
             vector_list = self._normalize_vector(vector)
-                
-            # Get first few values safely
-            first_values = vector_list[:5] if len(vector_list) >= 5 else vector_list
-            logger.info(f"Normalized storage vector first values: {first_values}")
             
             # Create point with flattened metadata
-            payload = {
-                "content": content,
-                "layer": layer,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            # Flatten metadata into payload with metadata_ prefix
-            if metadata:
-                for k, v in metadata.items():
-                    payload[f"metadata_{k}"] = v
+            payload = self._build_payload(content, metadata, layer)
             
-            # Create point with proper typing
-            point_id = str(uuid.uuid4())
+            # Derive point id from memory id so repeated stores overwrite
+            point_id = self._point_id(metadata)
             try:
                 # Create point with vector
                 point = models.PointStruct(
                     id=point_id,
-                    vector=vector_list,  # Vector list is already normalized
+                    vector=vector_list.tolist(),  # Vector is already normalized
                     payload=payload
                 )
             except Exception as e:
                 logger.error(f"Failed to create point: {str(e)}")
                 raise ValueError(f"Failed to create point: {str(e)}")
             
-            logger.debug(f"Creating point with metadata: {metadata}")
-            logger.debug(f"Creating point with payload: {point.payload}")
-            
             # Store point using client
             client = self.client
             
@@ -349,35 +542,132 @@ class VectorStore:
             if not collection_name:
                 collection_name = await self.get_collection_name()
                 
-            # Log vector details for verification
-            logger.info(
-                f"Storing vector:\n"
-                f"- Collection: {collection_name}\n"
-                f"- ID: {point_id}\n"
-                f"- Dimension: {len(vector_list)}\n"
-                f"- Content: {content_str[:100]}...\n"
-                f"- Layer: {layer}"
-            )
-            
             # Store vector without verification
-            client.upsert(
+            await self._run(
+                "upsert",
+                client.upsert,
                 collection_name=collection_name,
                 points=[point],
                 wait=True
             )
             
-            logger.info(
-                f"Vector stored successfully:\n"
-                f"- ID: {point_id}\n"
-                f"- Dimension: {len(vector_list)}\n"
-                f"- First values: {vector_list[:5] if len(vector_list) >= 5 else vector_list}"
+            hot.debug(
+                "store_vector", "Stored vector %s in %s: %s",
+                point_id, collection_name, head(vector_list),
+                layer=layer, dimension=len(vector_list)
             )
             
+            change_feed.publish(
+                "vector", "upsert",
+                ids=[(metadata or {}).get("id", point_id)],
+                layer=layer
+            )
             return True
         except Exception as e:
             logger.error(f"Failed to store vector: {str(e)}")
             raise
             
+    async def store_vectors(
+        self,
+        items: Sequence[Dict[str, Any]],
+        layer: str = "episodic",
+        batch_size: Optional[int] = None,
+        wait: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Store many vectors with one embedding call and chunked upserts.
+        
+        Args:
+            items: Dicts with "content" and optional "metadata" keys
+            layer: Memory layer
+            batch_size: Points per upsert request, defaults to
+                [QDRANT] upsert_batch_size
+            wait: Wait for Qdrant to apply each chunk before returning.
+                With False, Qdrant only acknowledges receipt.
+            
+        Returns:
+            List[Dict[str, Any]]: One result per item, in input order, with
+                "id", "success" and "error" keys
+        """
+        if not items:
+            return []
+            
+        batch_size = batch_size or self.upsert_batch_size
+        results: List[Dict[str, Any]] = [
+            {"id": None, "success": False, "error": None} for _ in items
+        ]
+        
+        # Embed all items in one call
+        content_strs = [
+            json.dumps(item.get("content")) if isinstance(item.get("content"), dict)
+            else str(item.get("content"))
+            for item in items
+        ]
+        vectors = await self.embedding_service.create_embedding(content_strs)
+        if not isinstance(vectors, (list, np.ndarray)) or len(vectors) != len(items):
+            raise ValueError(
+                f"Embedding service returned {len(vectors) if vectors is not None else 0} "
+                f"vectors for {len(items)} items"
+            )
+            
+        # Normalize the whole batch at once, then build points recording per-item failures
+        vectors = self._normalize_vectors(vectors)
+        points: List[models.PointStruct] = []
+        point_indexes: List[int] = []
+        for i, (item, vector) in enumerate(zip(items, vectors)):
+            try:
+                point_id = self._point_id(item.get("metadata"))
+                points.append(models.PointStruct(
+                    id=point_id,
+                    vector=vector.tolist(),
+                    payload=self._build_payload(item.get("content"), item.get("metadata"), layer)
+                ))
+                point_indexes.append(i)
+                results[i]["id"] = point_id
+            except Exception as e:
+                results[i]["error"] = str(e)
+                
+        collection_name = self._collection_name
+        if not collection_name:
+            collection_name = await self.get_collection_name()
+        client = self.client
+        
+        # Upsert chunks concurrently; the executor bounds in-flight requests
+        async def upsert_chunk(start: int):
+            chunk = points[start:start + batch_size]
+            indexes = point_indexes[start:start + batch_size]
+            try:
+                await self._run(
+                    "upsert",
+                    client.upsert,
+                    collection_name=collection_name,
+                    points=chunk,
+                    wait=wait
+                )
+                for i in indexes:
+                    results[i]["success"] = True
+            except Exception as e:
+                logger.error(f"Failed to upsert chunk of {len(chunk)} points: {str(e)}")
+                for i in indexes:
+                    results[i]["error"] = str(e)
+                    
+        await asyncio.gather(*[
+            upsert_chunk(start) for start in range(0, len(points), batch_size)
+        ])
+        
+        stored_ids = [
+            (item.get("metadata") or {}).get("id", result["id"])
+            for item, result in zip(items, results) if result["success"]
+        ]
+        if stored_ids:
+            change_feed.publish("vector", "upsert", ids=stored_ids, layer=layer)
+            
+        stored = len(stored_ids)
+        logger.info(
+            f"Stored {stored}/{len(items)} vectors in {collection_name} "
+            f"(batch_size={batch_size}, wait={wait})"
+        )
+        return results
+            
     async def delete_vector(self, vector_id: str):
         """Delete a vector by ID."""
         await self.delete_vectors([vector_id])
@@ -389,6 +679,10 @@ class VectorStore:
             if VectorStore._client_instance:
                 VectorStore._client_instance.close()
                 VectorStore._client_instance = None
+            # Release executor threads; a new pool is created on next use
+            if VectorStore._executor:
+                VectorStore._executor.shutdown(wait=False)
+                VectorStore._executor = None
             logger.info("Vector store cleanup complete")
         except Exception as e:
             logger.error(f"Failed to clean up vector store: {str(e)}")
@@ -417,42 +711,22 @@ class VectorStore:
             List[Dict]: Search results
         """
         try:
-            # Handle content for embedding based on type
-            if isinstance(content, str):
-                content_str = content
-            elif isinstance(content, dict):
-                # If content has text field, use that
-                if 'text' in content:
-                    content_str = content['text']
-                # Otherwise use the raw dict
-                else:
-                    content_str = str(content)
-            else:
-                content_str = str(content)
-            
             # Create query embedding and normalize
-            query_vector = await self.embedding_service.create_embedding(content_str)
+            query_vector = await self.embedding_service.create_embedding(self._query_text(content))
             query_vector_list = self._normalize_vector(query_vector)
-                
-            # Get first few values safely
-            first_values = query_vector_list[:5] if len(query_vector_list) >= 5 else query_vector_list
-            logger.info(f"Normalized query vector first values: {first_values}")
             
             # Process and validate filter conditions
-            logger.info("Processing filter conditions...")
             must_conditions = []
             has_layer_filter = False
             
             if filter_conditions:
                 for condition in filter_conditions:
-                    logger.info(f"Processing condition: {condition}")
-                    
                     if isinstance(condition, models.FieldCondition):
                         if condition.key == "metadata_layer":
                             has_layer_filter = True
                         must_conditions.append(condition)
                     else:
-                        logger.warning(f"Skipping invalid condition: {condition}")
+                        hot.warning("search_vectors.filter", "Skipping invalid condition: %r", condition)
             
             # Add layer filter if not already present
             if layer and not has_layer_filter:
@@ -463,9 +737,6 @@ class VectorStore:
                     )
                 )
             
-            # Log final filter conditions
-            logger.info(f"Final filter conditions: {must_conditions}")
-            
             # Use current collection if none specified
             target_collection = collection_name or self._collection_name
             if not target_collection:
@@ -474,7 +745,6 @@ class VectorStore:
                 raise ValueError("No collection available - not initialized")
             
             # Execute search with client
-            logger.info("Executing search...")
             client = self.client
             
             # Create single filter combining all conditions
@@ -489,9 +759,11 @@ class VectorStore:
                 )
 
             # Perform search operation
-            results = client.search(
+            results = await self._run(
+                "search",
+                client.search,
                 collection_name=target_collection,
-                query_vector=query_vector_list,
+                query_vector=query_vector_list.tolist(),
                 query_filter=search_filter,
                 limit=limit,
                 score_threshold=score_threshold,
@@ -503,29 +775,285 @@ class VectorStore:
             processed = []
             for hit in results:
                 if isinstance(hit, models.ScoredPoint):
-                    payload = getattr(hit, 'payload', {})
-                    
-                    # Extract metadata from flattened structure
-                    metadata = {}
-                    for k, v in payload.items():
-                        if k.startswith('metadata_'):
-                            metadata[k[9:]] = v  # Remove metadata_ prefix
-                    
-                    result = {
-                        "content": payload.get("content"),
-                        "metadata": metadata,
-                        "layer": payload.get("layer"),
-                        "timestamp": payload.get("timestamp"),
-                        "score": getattr(hit, 'score', None)
-                    }
-                    processed.append(result)
+                    processed.append(self._payload_to_result(
+                        getattr(hit, 'payload', {}) or {},
+                        score=getattr(hit, 'score', None)
+                    ))
             
+            hot.debug(
+                "search_vectors", "Search in %s returned %d results for %s",
+                target_collection, len(processed), head(query_vector_list),
+                layer=layer, limit=limit, filter=Lazy(repr, must_conditions)
+            )
             return processed
                 
         except Exception as e:
             logger.error(f"Failed to search vectors: {str(e)}")
             return []
             
+    @staticmethod
+    def _query_text(content: Any) -> str:
+        """Text embedded for a search query: a dict's "text" field, else its str."""
+        if isinstance(content, str):
+            return content
+        if isinstance(content, dict) and 'text' in content:
+            return content['text']
+        return str(content)
+            
+    async def search_multi(
+        self,
+        content: Any,
+        filters: Mapping[str, Sequence[models.FieldCondition]],
+        limit: int = 5,
+        quotas: Optional[Mapping[str, int]] = None,
+        score_threshold: float = 0.7,
+        normalize: bool = True,
+        collection_name: Optional[str] = None
+    ) -> List[Dict]:
+        """Search several filtered views of the collection for the same text.
+        
+        The query is embedded once and every filter is searched in a single
+        batched Qdrant request. Hits are merged with merge_ranked: each filter
+        gets its quota of slots, scores are normalized per filter, and each
+        result names its filter in "source".
+        
+        Args:
+            content: Content to search for
+            filters: Filter conditions per search name (e.g. per layer or domain)
+            limit: Max results to return in total
+            quotas: Slots reserved per search name
+            score_threshold: Minimum similarity score
+            normalize: Rank by per-filter normalized scores
+            collection_name: Collection to search in
+            
+        Returns:
+            List[Dict]: Merged search results, best first
+            
+        Raises:
+            ValueError: If quotas name unknown filters or exceed limit
+        """
+        if not filters:
+            return []
+        check_quotas(list(filters), quotas, limit)
+        try:
+            query_vector = await self.embedding_service.create_embedding(self._query_text(content))
+            vector = self._normalize_vector(query_vector).tolist()
+            
+            target_collection = collection_name or self._collection_name
+            if not target_collection:
+                target_collection = await self.get_collection_name()
+            if not target_collection:
+                raise ValueError("No collection available - not initialized")
+            client = self.client
+            
+            names = list(filters)
+            query_filters = [
+                models.Filter(must=list(filters[name])) if filters[name] else None
+                for name in names
+            ]
+            # Each search can fill every slot when the others come back empty
+            if hasattr(client, "query_batch_points"):
+                responses = await self._run(
+                    "search_batch",
+                    client.query_batch_points,
+                    collection_name=target_collection,
+                    requests=[
+                        models.QueryRequest(
+                            query=vector,
+                            filter=query_filter,
+                            limit=limit,
+                            score_threshold=score_threshold,
+                            with_payload=True,
+                            with_vector=False
+                        )
+                        for query_filter in query_filters
+                    ]
+                )
+                batches = [response.points for response in responses]
+            else:
+                batches = await self._run(
+                    "search_batch",
+                    client.search_batch,
+                    collection_name=target_collection,
+                    requests=[
+                        models.SearchRequest(
+                            vector=vector,
+                            filter=query_filter,
+                            limit=limit,
+                            score_threshold=score_threshold,
+                            with_payload=True,
+                            with_vector=False
+                        )
+                        for query_filter in query_filters
+                    ]
+                )
+                
+            hits = {
+                name: [
+                    self._payload_to_result(getattr(hit, 'payload', {}) or {}, score=getattr(hit, 'score', None))
+                    for hit in batch
+                ]
+                for name, batch in zip(names, batches)
+            }
+            merged = merge_ranked(
+                hits,
+                limit,
+                quotas=quotas,
+                floor=score_threshold,
+                normalize=normalize,
+                key=lambda hit: hit["metadata"].get("id")
+            )
+            hot.debug(
+                "search_multi", "Batched search of %d filters in %s returned %d results",
+                len(names), target_collection, len(merged),
+                limit=limit, counts=Lazy(lambda: {name: len(found) for name, found in hits.items()})
+            )
+            return merged
+            
+        except Exception as e:
+            logger.error(f"Failed to search vectors: {str(e)}")
+            return []
+            
+    async def search_layers(
+        self,
+        content: Any,
+        layers: Sequence[str] = ("episodic", "semantic"),
+        limit: int = 5,
+        quotas: Optional[Mapping[str, int]] = None,
+        score_threshold: float = 0.7,
+        filter_conditions: Optional[List[models.FieldCondition]] = None,
+        normalize: bool = True,
+        collection_name: Optional[str] = None
+    ) -> List[Dict]:
+        """Search several memory layers with one embedding and one batched request.
+        
+        Args:
+            content: Content to search for
+            layers: Layers to search
+            limit: Max results to return in total
+            quotas: Slots reserved per layer
+            score_threshold: Minimum similarity score
+            filter_conditions: Conditions applied to every layer
+            normalize: Rank by per-layer normalized scores
+            collection_name: Collection to search in
+            
+        Returns:
+            List[Dict]: Merged search results, best first
+        """
+        return await self.search_multi(
+            content,
+            {
+                layer: [
+                    *(filter_conditions or []),
+                    models.FieldCondition(key="metadata_layer", match=models.MatchValue(value=layer))
+                ]
+                for layer in layers
+            },
+            limit=limit,
+            quotas=quotas,
+            score_threshold=score_threshold,
+            normalize=normalize,
+            collection_name=collection_name
+        )
+            
+    async def get_vectors(
+        self,
+        memory_ids: Sequence[str],
+        collection_name: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """Fetch memories by id without embedding or similarity search.
+        
+        Points are looked up by their derived point id in one retrieve call.
+        Ids that miss (points written before ids were deterministic) fall back
+        to an indexed metadata_id filter scroll, paged until every id is
+        resolved or the scroll ends.
+        
+        Args:
+            memory_ids: Memory ids to fetch
+            collection_name: Collection to read from
+            
+        Returns:
+            Dict[str, Dict]: Results keyed by memory id; missing ids are omitted
+        """
+        ids = list(dict.fromkeys(str(mid) for mid in memory_ids))
+        if not ids:
+            return {}
+            
+        target_collection = collection_name or self._collection_name
+        if not target_collection:
+            target_collection = await self.get_collection_name()
+        client = self.client
+        
+        found: Dict[str, Dict] = {}
+        records = await self._run(
+            "retrieve",
+            client.retrieve,
+            collection_name=target_collection,
+            ids=[point_id_for(mid) for mid in ids],
+            with_payload=True,
+            with_vectors=False
+        )
+        for record in records or []:
+            result = self._payload_to_result(getattr(record, 'payload', {}) or {})
+            memory_id = result["metadata"].get("id")
+            if memory_id is not None:
+                found[str(memory_id)] = result
+                
+        missing = [mid for mid in ids if mid not in found]
+        if missing:
+            # Page until every id resolves; repeated legacy points for one
+            # memory can fill a page without covering the others
+            legacy_filter = [
+                models.FieldCondition(
+                    key="metadata_id",
+                    match=models.MatchAny(any=missing)
+                )
+            ]
+            remaining = set(missing)
+            offset = None
+            while remaining:
+                records, offset = await self._scroll_page(
+                    legacy_filter, len(missing), offset, target_collection
+                )
+                for record in records:
+                    result = self._payload_to_result(getattr(record, 'payload', {}) or {})
+                    memory_id = result["metadata"].get("id")
+                    if memory_id is not None:
+                        found.setdefault(str(memory_id), result)
+                        remaining.discard(str(memory_id))
+                if offset is None:
+                    break
+                    
+        return found
+            
+    def _metadata_payload(self, metadata: Dict) -> Dict[str, Any]:
+        """Convert metadata updates to prefixed payload fields with proper types."""
+        payload = {}
+        for k, v in metadata.items():
+            key = f"metadata_{k}"
+            # Handle special cases for field types
+            if k == "timestamp":
+                # Ensure timestamp is in ISO format
+                if isinstance(v, str):
+                    payload[key] = v
+                else:
+                    payload[key] = datetime.now().isoformat()
+            elif k == "importance":
+                # Ensure importance is float
+                payload[key] = float(v)
+            elif k in ["consolidated", "system", "pinned"]:
+                # Handle boolean fields
+                if isinstance(v, str):
+                    # Convert string 'true'/'false' to boolean
+                    payload[key] = v.lower() == 'true'
+                else:
+                    # Use boolean value directly
+                    payload[key] = bool(v)
+            else:
+                # Default handling
+                payload[key] = v
+        return payload
+            
     async def update_metadata(
         self,
         vector_id: str,
@@ -534,39 +1062,19 @@ class VectorStore:
     ):
         """Update vector metadata.
         
+        Points are selected by memory id payload, which covers both derived
+        and legacy point ids.
+        
         Args:
-            vector_id: ID of vector to update
+            vector_id: Memory ID of vector to update
             metadata: New metadata values
             collection_name: Collection name
         """
         try:
             # Prepare payload with proper type handling
-            payload = {}
-            for k, v in metadata.items():
-                key = f"metadata_{k}"
-                # Handle special cases for field types
-                if k == "timestamp":
-                    # Ensure timestamp is in ISO format
-                    if isinstance(v, str):
-                        payload[key] = v
-                    else:
-                        payload[key] = datetime.now().isoformat()
-                elif k == "importance":
-                    # Ensure importance is float
-                    payload[key] = float(v)
-                elif k in ["consolidated", "system", "pinned"]:
-                    # Handle boolean fields
-                    if isinstance(v, str):
-                        # Convert string 'true'/'false' to boolean
-                        payload[key] = v.lower() == 'true'
-                    else:
-                        # Use boolean value directly
-                        payload[key] = bool(v)
-                else:
-                    # Default handling
-                    payload[key] = v
+            payload = self._metadata_payload(metadata)
             
-            logger.info(f"Updating metadata with payload: {json.dumps(payload, indent=2)}")
+            hot.debug("update_metadata", "Updating metadata of %s with payload: %s", vector_id, payload)
             
             # Get client instance
             client = self.client
@@ -578,24 +1086,208 @@ class VectorStore:
             if not target_collection:
                 raise ValueError("No collection available - not initialized")
             
-            client.set_payload(
+            await self._run(
+                "set_payload",
+                client.set_payload,
                 collection_name=target_collection,
-                points=[vector_id],
+                points=models.Filter(must=[
+                    models.FieldCondition(
+                        key="metadata_id",
+                        match=models.MatchValue(value=str(vector_id))
+                    )
+                ]),
                 payload=payload,
                 wait=True  # Wait for operation to complete
             )
+            change_feed.publish("vector", "update", ids=[vector_id], metadata=list(metadata))
         except Exception as e:
             logger.error(f"Failed to update metadata: {str(e)}")
             raise
             
-    async def inspect_collection(
+    async def update_metadata_batch(
         self,
+        memory_ids: Sequence[str],
+        metadata: Dict,
+        collection_name: Optional[str] = None,
+        wait: bool = True
+    ):
+        """Apply the same metadata update to many memories in one request.
+        
+        Only the payload changes; nothing is re-embedded. Points are selected
+        by memory id payload, which covers both derived and legacy point ids.
+        
+        Args:
+            memory_ids: Memory ids to update
+            metadata: Metadata values to set on every memory
+            collection_name: Collection name
+            wait: Wait for Qdrant to apply the update before returning
+        """
+        ids = [str(mid) for mid in memory_ids]
+        if not ids:
+            return
+            
+        target_collection = collection_name or self._collection_name
+        if not target_collection:
+            target_collection = await self.get_collection_name()
+        if not target_collection:
+            raise ValueError("No collection available - not initialized")
+            
+        await self._run(
+            "set_payload",
+            self.client.set_payload,
+            collection_name=target_collection,
+            payload=self._metadata_payload(metadata),
+            points=models.Filter(must=[
+                models.FieldCondition(
+                    key="metadata_id",
+                    match=models.MatchAny(any=ids)
+                )
+            ]),
+            wait=wait
+        )
+        change_feed.publish("vector", "update", ids=ids, metadata=list(metadata))
+            
+    async def _scroll_page(
+        self,
+        filter_conditions: Optional[List[models.FieldCondition]],
+        limit: int,
+        offset: Optional[Any],
+        collection_name: Optional[str]
+    ) -> Tuple[List[Any], Optional[Any]]:
+        """Read one page of raw records with a filter-only scroll."""
+        target_collection = collection_name or self._collection_name
+        if not target_collection:
+            target_collection = await self.get_collection_name()
+            
+        records, next_offset = await self._run(
+            "scroll",
+            self.client.scroll,
+            collection_name=target_collection,
+            scroll_filter=models.Filter(must=list(filter_conditions)) if filter_conditions else None,
+            limit=limit,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False
+        )
+        return list(records or []), next_offset
+            
+    async def scroll_vectors(
+        self,
+        filter_conditions: Optional[List[models.FieldCondition]] = None,
+        limit: int = 256,
+        offset: Optional[Any] = None,
         collection_name: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[Any]]:
+        """Read one page of memories matching a payload filter.
+        
+        No query embedding is created; points come back in point id order.
+        
+        Args:
+            filter_conditions: Conditions every point must match
+            limit: Page size
+            offset: Cursor returned by the previous page, None for the first
+            collection_name: Collection to read from
+            
+        Returns:
+            Tuple[List[Dict], Optional[Any]]: Results for this page and the
+                cursor for the next one (None when there are no more pages)
+        """
+        records, next_offset = await self._scroll_page(filter_conditions, limit, offset, collection_name)
+        return [
+            self._payload_to_result(getattr(record, 'payload', {}) or {})
+            for record in records
+        ], next_offset
+            
+    async def _scan(
+        self,
+        convert: Callable[[Any], Dict],
+        filter_conditions: Optional[List[models.FieldCondition]],
+        page_size: Optional[int],
+        offset: Optional[Any],
+        collection_name: Optional[str]
+    ) -> AsyncIterator[ScanPage]:
+        """Yield converted pages, reading the next page while one is consumed."""
+        page_size = page_size or self.scan_page_size
+        pending = asyncio.ensure_future(
+            self._scroll_page(filter_conditions, page_size, offset, collection_name)
+        )
+        try:
+            while pending is not None:
+                records, next_offset = await pending
+                pending = None
+                if next_offset is not None:
+                    pending = asyncio.ensure_future(
+                        self._scroll_page(filter_conditions, page_size, next_offset, collection_name)
+                    )
+                yield ScanPage([convert(record) for record in records], next_offset)
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+            
+    def scan_vectors(
+        self,
+        filter_conditions: Optional[List[models.FieldCondition]] = None,
+        page_size: Optional[int] = None,
+        offset: Optional[Any] = None,
+        collection_name: Optional[str] = None
+    ) -> AsyncIterator[ScanPage]:
+        """Iterate over every memory matching a payload filter, a page at a time.
+        
+        Uses scroll with offset cursors and no query embedding. At most two
+        pages are held at once (the one yielded and the one being read), so
+        memory stays flat however large the collection is. Close the
+        iterator (e.g. with contextlib.aclosing) when stopping early.
+        
+        Args:
+            filter_conditions: Conditions every point must match
+            page_size: Points per scroll request, defaults to
+                [QDRANT] scan_page_size
+            offset: Cursor to start from, e.g. a saved ScanPage.next_offset
+            collection_name: Collection to read from
+            
+        Returns:
+            AsyncIterator[ScanPage]: Pages of memory result dicts
+        """
+        return self._scan(
+            lambda record: self._payload_to_result(getattr(record, 'payload', {}) or {}),
+            filter_conditions, page_size, offset, collection_name
+        )
+            
+    def scan_collection(
+        self,
+        collection_name: Optional[str] = None,
+        page_size: Optional[int] = None,
+        offset: Optional[Any] = None
+    ) -> AsyncIterator[ScanPage]:
+        """Iterate over every raw point in a collection, a page at a time.
+        
+        Like scan_vectors, but pages hold point dicts with "id", "payload"
+        and "vector" keys, as returned by inspect_collection.
+        
+        Args:
+            collection_name: Collection to read, defaults to the current one
+            page_size: Points per scroll request, defaults to
+                [QDRANT] scan_page_size
+            offset: Cursor to start from
+            
+        Returns:
+            AsyncIterator[ScanPage]: Pages of point dicts
+        """
+        return self._scan(self._convert_point_to_dict, None, page_size, offset, collection_name)
+            
+    async def inspect_collection(
+        self,
+        collection_name: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> List[Dict]:
         """Inspect collection data.
         
+        Reads every point (or the first ``limit``) through scan_collection.
+        Use scan_collection directly to stream a large collection.
+        
         Args:
             collection_name: Collection to inspect
+            limit: Maximum number of points to return, all if None
             
         Returns:
             List[Dict]: Collection data
@@ -613,9 +1305,10 @@ class VectorStore:
             # Check if collection exists
             try:
                 # Check if collection exists
-                collections = client.get_collections()
+                collections = await self._run("get_collections", client.get_collections)
                 collection_exists = False
-                for c in collections:
+                # QdrantClient returns a CollectionsResponse wrapping the list
+                for c in getattr(collections, "collections", collections):
                     collection_name = self._get_collection_name_from_info(c)
                     if collection_name == target_collection:
                         collection_exists = True
@@ -625,22 +1318,18 @@ class VectorStore:
                     raise ValueError(f"Collection {target_collection} not found")
                 logger.info(f"Collection {target_collection} exists")
                 
-                # Get points with a single request through scroll API
-                batch = client.scroll(
-                    collection_name=target_collection,
-                    limit=1000,  # Increased limit to get more points at once
-                    with_payload=True,
-                    with_vectors=False
-                )
-                
-                if not batch or not batch[0]:
+                points: List[Dict] = []
+                page_size = min(self.scan_page_size, limit) if limit else None
+                async with aclosing(self.scan_collection(target_collection, page_size=page_size)) as pages:
+                    async for page in pages:
+                        points.extend(page)
+                        if limit is not None and len(points) >= limit:
+                            del points[limit:]
+                            break
+                            
+                if not points:
                     logger.info("No points found in collection")
-                    return []
-                    
-                points = batch[0]
-                
-                # Convert Record objects to dicts and return
-                return [self._convert_point_to_dict(p) for p in points]
+                return points
                 
             except Exception as e:
                 logger.error(f"Failed to inspect collection: {str(e)}")
@@ -674,24 +1363,28 @@ class VectorStore:
                 raise ValueError("No collection available - not initialized")
             
             try:
-                # Convert vector_ids to list of strings and create selector
-                point_ids = [str(vid) for vid in vector_ids]
+                # Select by memory id payload, which covers both derived and
+                # legacy random point ids
+                memory_ids = [str(vid) for vid in vector_ids]
                 selector = models.Filter(
                     must=[
                         models.FieldCondition(
-                            key="id",
-                            match=models.MatchAny(any=point_ids)
+                            key="metadata_id",
+                            match=models.MatchAny(any=memory_ids)
                         )
                     ]
                 )
                 
                 # Delete points without verification
-                client.delete(
+                await self._run(
+                    "delete",
+                    client.delete,
                     collection_name=target_collection,
                     points_selector=selector,
                     wait=True  # Wait for operation to complete
                 )
                 logger.info("Successfully deleted vectors")
+                change_feed.publish("vector", "delete", ids=memory_ids)
                 
             except Exception as e:
                 logger.error(f"Failed to delete vectors: {str(e)}")
@@ -9,9 +9,13 @@ import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
 
+from qdrant_client import QdrantClient, models
+
 from nia.memory.two_layer import TwoLayerMemorySystem
 from nia.world.environment import NIAWorld
 from nia.core.types.memory_types import KnowledgeVertical
+from nia.nova.memory.vector_store import VectorStore
+from nia.nova.memory.embedding import EmbeddingService
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
@@ -347,3 +351,41 @@ def mock_logger():
             self.logs.append(("DEBUG", msg))
             
     return MockLogger()
+
+class CountingEmbeddingService(EmbeddingService):
+    """Embedding service that counts create_embedding calls and can add model latency."""
+
+    def __init__(self, latency: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.latency = latency
+        self.calls = 0
+
+    async def create_embedding(self, text):
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await super().create_embedding(text)
+
+@pytest.fixture
+def counting_embedding_service():
+    """The counting embedding service class, e.g. counting_embedding_service(dimension=8)."""
+    return CountingEmbeddingService
+
+@pytest.fixture
+def vector_dimension():
+    """Vector size of the in-process Qdrant collection; override in a module to change it."""
+    return 16
+
+@pytest_asyncio.fixture
+async def vector_store(vector_dimension):
+    """Vector store over an in-process Qdrant collection, embedding with a counting service."""
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        collection_name="test_collection",
+        vectors_config=models.VectorParams(size=vector_dimension, distance=models.Distance.COSINE)
+    )
+    VectorStore._client_instance = client
+    store = VectorStore(embedding_service=CountingEmbeddingService(dimension=vector_dimension))
+    store._collection_name = "test_collection"
+    yield store
+    await store.cleanup()
@@ -1,5 +1,8 @@
 """Unit tests for profile system components."""
 
+import time
+import asyncio
+import logging
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
@@ -222,3 +225,167 @@ class TestProfileManager:
 
         # Verify store calls
         assert mock_neo4j_store.query.call_count >= 2
+
+def _stored_profile(profile_id: str, domains=None) -> dict:
+    """Profile node data as Neo4j returns it."""
+    return {
+        "profile_id": profile_id,
+        "personality": {"openness": 0.8, "conscientiousness": 0.7, "extraversion": 0.6,
+                        "agreeableness": 0.9, "neuroticism": 0.3},
+        "learning_style": {"visual": 0.8, "auditory": 0.4, "kinesthetic": 0.6},
+        "communication": {"direct": 0.7, "detailed": 0.8, "formal": 0.4},
+        "auto_approval": {
+            "auto_approve_domains": ["professional"],
+            "approval_thresholds": {"task_creation": 0.8, "resource_access": 0.9, "domain_crossing": 0.95},
+            "restricted_operations": ["delete"]
+        },
+        "domains": domains or {"professional": {"confidence": 1.0}},
+        "created_at": "2024-01-01T00:00:00+00:00",
+        "updated_at": "2024-01-01T00:00:00+00:00"
+    }
+
+def _merge(target: dict, update: dict):
+    """Apply a minimal profile write over the stored fields."""
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+class FakeProfileStore:
+    """In-memory stand-in for the profile Cypher, counting round-trips."""
+
+    def __init__(self, profiles, latency: float = 0.0):
+        self.profiles = {p["profile_id"]: p for p in profiles}
+        self.latency = latency
+        self.queries = 0
+
+    async def query(self, query, params=None):
+        self.queries += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        params = params or {}
+        if "UNWIND $profile_ids" in query:
+            return [{"p": self.profiles[i]} for i in params["profile_ids"] if i in self.profiles]
+        if "ORDER BY p.profile_id" in query:
+            rows = sorted(
+                (p for p in self.profiles.values()
+                 if (params["domain"] is None or params["domain"] in p["domains"])
+                 and (params["after"] is None or p["profile_id"] > params["after"])),
+                key=lambda p: p["profile_id"]
+            )
+            return [{"p": p} for p in rows[:params.get("limit")]]
+        if "SET p = $profile" in query:
+            _merge(self.profiles[params["profile_id"]], params["profile"])
+            return []
+        if "RETURN p" in query:
+            profile = self.profiles.get(params["profile_id"])
+            return [{"p": profile}] if profile else []
+        return []
+
+@pytest.mark.asyncio
+class TestProfileLoading:
+    """Test bulk loading, pagination and the read-through cache."""
+
+    async def test_list_profiles_single_query(self):
+        """Listing hydrates every profile from one query and warms the cache."""
+        store = FakeProfileStore([_stored_profile(f"user_{i:03d}") for i in range(50)])
+        manager = ProfileManager(store=store)
+
+        profiles = await manager.list_profiles()
+        assert len(profiles) == 50
+        assert all(isinstance(p, UserProfile) for p in profiles)
+        assert store.queries == 1
+
+        await manager.get_profile("user_007")
+        assert store.queries == 1
+        assert manager.cache_stats()["hits"] == 1
+
+    async def test_list_profiles_keyset_pagination(self):
+        """Pages follow the last profile id and respect the domain filter."""
+        store = FakeProfileStore(
+            [_stored_profile(f"user_{i:03d}") for i in range(25)]
+            + [_stored_profile("zz_personal", {"personal": {"confidence": 1.0}})]
+        )
+        manager = ProfileManager(store=store)
+
+        seen, after = [], None
+        while True:
+            page = await manager.list_profiles("professional", limit=10, after=after)
+            if not page:
+                break
+            seen.extend(p.profile_id for p in page)
+            after = page[-1].profile_id
+
+        assert seen == [f"user_{i:03d}" for i in range(25)]
+
+    async def test_get_profiles_loads_misses_in_one_query(self):
+        """Bulk get serves cached profiles and fetches the rest together."""
+        store = FakeProfileStore([_stored_profile(f"user_{i}") for i in range(10)])
+        manager = ProfileManager(store=store)
+        await manager.get_profile("user_0")
+
+        profiles = await manager.get_profiles([f"user_{i}" for i in range(10)] + ["missing"])
+
+        assert list(profiles) == [f"user_{i}" for i in range(10)]
+        assert store.queries == 2
+
+    async def test_writes_invalidate_cache(self):
+        """Updates through the manager are visible on the next read."""
+        store = FakeProfileStore([_stored_profile("user_1")])
+        manager = ProfileManager(store=store)
+        await manager.get_profile("user_1")
+
+        await manager.update_domain_confidence("user_1", "professional", 0.4)
+        assert await manager.get_domain_confidence("user_1", "professional") == 0.4
+
+        settings = AutoApprovalSettings(
+            auto_approve_domains=["personal"],
+            approval_thresholds=ApprovalThresholds(task_creation=0.5, resource_access=0.5, domain_crossing=0.5),
+            restricted_operations=[]
+        )
+        assert await manager.update_auto_approval("user_1", settings)
+        profile = await manager.get_profile("user_1")
+        assert profile.auto_approval.auto_approve_domains == ["personal"]
+        assert manager.cache_stats()["hits"] == 2
+
+    async def test_cache_bounds(self):
+        """The cache evicts least recently used profiles and expires by TTL."""
+        store = FakeProfileStore([_stored_profile(f"user_{i}") for i in range(5)])
+        manager = ProfileManager(store=store, cache_max_size=3)
+        await manager.list_profiles()
+        assert manager.cache_stats()["size"] == 3
+
+        manager = ProfileManager(store=store, cache_ttl_seconds=0.01)
+        await manager.get_profile("user_0")
+        await asyncio.sleep(0.02)
+        await manager.get_profile("user_0")
+        assert store.queries == 3
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_list_profiles_benchmark():
+    """Compare per-profile and single-query listing over 10k profiles at 1ms per round-trip."""
+    store = FakeProfileStore([_stored_profile(f"user_{i:05d}") for i in range(10000)], latency=0.001)
+    manager = ProfileManager(store=store)
+
+    start = time.perf_counter()
+    rows = await store.query("MATCH (p:Profile) RETURN p ORDER BY p.profile_id", {"domain": None, "after": None})
+    for row in rows:
+        await store.query("MATCH (p:Profile {profile_id: $profile_id}) RETURN p", {"profile_id": row["p"]["profile_id"]})
+    legacy = time.perf_counter() - start
+
+    store.queries = 0
+    start = time.perf_counter()
+    profiles = await manager.list_profiles()
+    bulk = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cached = await manager.get_profiles([p.profile_id for p in profiles])
+    warm = time.perf_counter() - start
+
+    assert len(profiles) == len(cached) == 10000
+    assert store.queries == 1
+    logging.getLogger(__name__).info(
+        f"10k profiles: N+1 {legacy:.2f}s, single query {bulk:.2f}s, cached bulk get {warm:.2f}s"
+    )
@@ -0,0 +1,100 @@
+"""Tests for the store change feed."""
+
+import pytest
+import time
+import uuid
+import asyncio
+import threading
+
+from nia.core.change_feed import ChangeFeed, LocalPubSub, PubSubBridge, change_feed
+
+def test_publish_without_subscribers_is_noop():
+    """Nothing is built or queued while nobody listens."""
+    feed = ChangeFeed()
+    feed.publish("vector", "upsert", ids=["a"])
+    assert feed.published == 0
+
+@pytest.mark.asyncio
+async def test_subscriber_woken_on_publish():
+    """Subscribers receive events well under 100ms after the write."""
+    feed = ChangeFeed()
+    subscription = feed.subscribe()
+    waiter = asyncio.create_task(subscription.get())
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    feed.publish("concept", "upsert", ids=["alpha"], type="entity")
+    event = await asyncio.wait_for(waiter, 1.0)
+
+    assert time.perf_counter() - start < 0.1
+    assert (event["store"], event["operation"], event["ids"]) == ("concept", "upsert", ["alpha"])
+    assert event["data"] == {"type": "entity"}
+
+    subscription.close()
+    assert not feed.active
+
+@pytest.mark.asyncio
+async def test_publish_from_other_thread():
+    """Writes from executor threads reach subscribers on the loop."""
+    feed = ChangeFeed()
+    subscription = feed.subscribe()
+
+    thread = threading.Thread(target=feed.publish, args=("vector", "delete"), kwargs={"ids": ["x"]})
+    thread.start()
+    thread.join()
+
+    event = await asyncio.wait_for(subscription.get(), 1.0)
+    assert event["operation"] == "delete"
+
+@pytest.mark.asyncio
+async def test_subscription_drops_oldest_when_full():
+    """A stalled subscriber keeps only the newest events."""
+    feed = ChangeFeed()
+    subscription = feed.subscribe(max_size=2)
+    for i in range(3):
+        feed.publish("graph", "update_node", ids=[str(i)])
+
+    assert [e["ids"] for e in subscription.drain()] == [["1"], ["2"]]
+    assert subscription.dropped == 1
+
+@pytest.mark.asyncio
+async def test_bridge_relays_between_processes():
+    """Events cross a shared pub/sub server once, without echoing back."""
+    server = LocalPubSub()
+    worker, api = ChangeFeed(), ChangeFeed()
+    await worker.attach_bridge(PubSubBridge(server))
+    await api.attach_bridge(PubSubBridge(server))
+    worker_events, api_events = worker.subscribe(), api.subscribe()
+
+    worker.publish("vector", "upsert", ids=["m1"], layer="episodic")
+    event = await asyncio.wait_for(api_events.get(), 1.0)
+    await asyncio.sleep(0.01)
+
+    assert event["ids"] == ["m1"]
+    assert event["origin"] == worker.origin
+    assert len(worker_events.drain()) == 1  # local delivery only, no echo
+
+    await worker.detach_bridge()
+    await api.detach_bridge()
+
+@pytest.mark.asyncio
+async def test_vector_store_publishes_writes(vector_store):
+    """Upserts and deletes on the vector store show up on the feed."""
+    subscription = change_feed.subscribe()
+    memory_id = str(uuid.uuid4())
+    try:
+        await vector_store.store_vector(
+            content={"content": "hello"},
+            metadata={"id": memory_id, "type": "test"},
+            layer="episodic"
+        )
+        await vector_store.delete_vectors([memory_id])
+
+        events = subscription.drain()
+    finally:
+        subscription.close()
+
+    assert [(e["store"], e["operation"], e["ids"]) for e in events] == [
+        ("vector", "upsert", [memory_id]),
+        ("vector", "delete", [memory_id])
+    ]
@@ -0,0 +1,130 @@
+"""Tests for the process-pool compute offload."""
+
+import pytest
+import pytest_asyncio
+import os
+import sys
+import math
+import time
+import asyncio
+import logging
+import numpy as np
+
+from nia.core.compute import ComputePool, ComputeTimeoutError
+from nia.core.compute import analytics as compute_jobs
+
+logger = logging.getLogger(__name__)
+
+@pytest_asyncio.fixture
+async def pool():
+    """Two-worker pool that shares arrays from 1 KiB."""
+    pool = ComputePool(max_workers=2, job_timeout=30, shared_memory_threshold=1024)
+    yield pool
+    pool.shutdown()
+
+async def _loop_lag(duration: float, interval: float = 0.01) -> float:
+    """Worst overshoot of a periodic sleep, in milliseconds."""
+    worst = 0.0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst * 1000
+
+@pytest.mark.asyncio
+async def test_runs_in_worker_process(pool):
+    """Jobs run outside this process and return their result."""
+    assert await pool.run(os.getpid) != os.getpid()
+    assert await pool.run(math.factorial, 10) == 3628800
+
+@pytest.mark.asyncio
+async def test_job_exceptions_propagate(pool):
+    """Exceptions raised by the job reach the caller unchanged."""
+    with pytest.raises(ValueError):
+        await pool.run(math.sqrt, -1)
+    assert pool.stats()["failed"] == 1
+
+@pytest.mark.asyncio
+async def test_large_arrays_use_shared_memory(pool):
+    """Arrays above the threshold are attached, not pickled."""
+    data = np.arange(100_000, dtype=np.float64).reshape(1000, 100)
+    small = np.arange(10, dtype=np.float64)
+
+    assert await pool.run(np.sum, data) == data.sum()
+    assert await pool.run(np.sum, small) == small.sum()
+    assert pool.stats()["shared_bytes"] == data.nbytes
+
+@pytest.mark.asyncio
+async def test_timeout_recycles_and_resubmits(pool):
+    """A timed-out job is killed; a job sharing the pool is retried."""
+    slow = asyncio.create_task(pool.run(time.sleep, 5, timeout=0.5))
+    other = asyncio.create_task(pool.run(time.sleep, 1))
+
+    with pytest.raises(ComputeTimeoutError):
+        await slow
+    assert await other is None
+    assert pool.stats()["recycles"] == 1
+    assert await pool.run(math.factorial, 5) == 120
+
+@pytest.mark.asyncio
+async def test_cancellation_frees_worker(pool):
+    """Cancelling a running job terminates its worker."""
+    task = asyncio.create_task(pool.run(time.sleep, 30))
+    await asyncio.sleep(0.5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    start = time.perf_counter()
+    assert await pool.run(math.factorial, 5) == 120
+    assert time.perf_counter() - start < 10
+    assert pool.stats()["cancelled"] == 1
+
+@pytest.mark.asyncio
+async def test_heavy_modules_stay_out_of_parent(pool):
+    """Analytics jobs import sklearn in the worker only."""
+    pytest.importorskip("sklearn")
+    loaded = "sklearn" in sys.modules
+    data = np.random.default_rng(0).normal(size=(200, 4))
+
+    result = await pool.run(compute_jobs.cluster, data, n_clusters=3)
+
+    assert len(result["clusters"]) == 200
+    assert -1.0 <= result["silhouette"] <= 1.0
+    assert ("sklearn" in sys.modules) == loaded
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_event_loop_latency_benchmark(pool):
+    """Event-loop lag while clustering inline versus in the pool."""
+    pytest.importorskip("sklearn")
+    data = np.random.default_rng(0).normal(size=(20_000, 16))
+    await pool.run(math.factorial, 1)  # start a worker
+
+    idle = await _loop_lag(0.5)
+
+    async def inline():
+        compute_jobs.cluster(data, n_clusters=8)
+
+    start = time.perf_counter()
+    lag_task = asyncio.create_task(_loop_lag(0.2))
+    await asyncio.sleep(0.02)  # let the probe start sleeping
+    await inline()
+    inline_lag = await lag_task
+    inline_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    job = asyncio.create_task(pool.run(compute_jobs.cluster, data, n_clusters=8))
+    offload_lag = await _loop_lag(0.2)
+    while not job.done():
+        offload_lag = max(offload_lag, await _loop_lag(0.1))
+    await job
+    offload_s = time.perf_counter() - start
+
+    assert offload_lag < max(50.0, idle * 5)
+    assert offload_lag < inline_lag
+    logger.info(
+        f"loop lag idle {idle:.1f} ms; inline clustering {inline_lag:.1f} ms over {inline_s:.2f}s; "
+        f"offloaded {offload_lag:.1f} ms over {offload_s:.2f}s"
+    )
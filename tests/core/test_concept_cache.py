@@ -0,0 +1,138 @@
+"""Tests for the concept store's LRU cache and write invalidation."""
+
+import pytest
+import time
+import random
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+from nia.core.neo4j.concept_store import ConceptStore
+
+logger = logging.getLogger(__name__)
+
+class RecordingConceptStore(ConceptStore):
+    """Concept store answering concept lookups from a dict and recording queries."""
+
+    def __init__(self, cache_size: int = 100):
+        super().__init__(uri="bolt://unused:7687", max_retry_time=0)
+        self._concept_pool.max_size = cache_size
+        self.concepts: Dict[str, Dict[str, Any]] = {}
+        self.queries: List[tuple] = []
+
+    async def run_query(self, query: str, parameters: Optional[Dict[str, Any]] = None, _depth: int = 0):
+        self.queries.append((query, parameters or {}))
+        name = (parameters or {}).get("name")
+        if "RETURN c, outgoing + incoming" in query and name in self.concepts:
+            return [{"c": self.concepts[name], "relationships": []}]
+        return []
+
+    @asynccontextmanager
+    async def transaction(self):
+        store = self
+
+        class Tx:
+            async def run(self, query, parameters=None):
+                store.queries.append((query, parameters or {}))
+
+        yield Tx()
+
+    def lookups(self) -> int:
+        return sum("RETURN c, outgoing + incoming" in q for q, _ in self.queries)
+
+def _store(names, cache_size: int = 100) -> RecordingConceptStore:
+    store = RecordingConceptStore(cache_size)
+    for name in names:
+        store.concepts[name] = {"name": name, "type": "entity", "description": f"about {name}"}
+    return store
+
+@pytest.mark.asyncio
+async def test_reads_refresh_recency():
+    """A re-read concept survives eviction; hits do not query Neo4j."""
+    store = _store(["a", "b", "c"], cache_size=2)
+    for name in ["a", "b", "a", "a", "c", "a"]:
+        assert (await store.get_concept(name))["name"] == name
+
+    assert store.lookups() == 3
+    assert "a" in store._concept_pool and "b" not in store._concept_pool
+    stats = store.get_cache_stats()["concepts"]
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (3, 3, 1)
+
+@pytest.mark.asyncio
+async def test_hits_are_copies():
+    """Changing a returned concept does not change the cached one."""
+    store = _store(["a"])
+    first = await store.get_concept("a")
+    first["description"] = "changed"
+    first["relationships"].append({"type": "RELATED_TO", "target": "b"})
+    second = await store.get_concept("a")
+    assert second["description"] == "about a"
+    assert second["relationships"] == []
+
+@pytest.mark.asyncio
+async def test_store_concept_writes_and_invalidates():
+    """Storing a cached concept reaches Neo4j and drops it and its related concepts."""
+    store = _store(["a", "b"])
+    await store.get_concept("a")
+    await store.get_concept("b")
+
+    await store.store_concept("a", "entity", "updated", related=["b"])
+    assert any("MERGE (c:Concept {name: $name})" in q and p.get("description") == "updated" for q, p in store.queries)
+    assert "a" not in store._concept_pool and "b" not in store._concept_pool
+
+    store.concepts["a"]["description"] = "updated"
+    assert (await store.get_concept("a"))["description"] == "updated"
+    assert store.get_cache_stats()["concepts"]["invalidations"] == 2
+
+@pytest.mark.asyncio
+async def test_store_relationship_writes_through():
+    """A relationship is cached and both of its concepts are invalidated."""
+    store = _store(["a", "b"])
+    await store.get_concept("a")
+    await store.get_concept("b")
+
+    await store.store_relationship("a", "b", "PART_OF")
+    assert store._relationship_pool.get("a-b")["type"] == "PART_OF"
+    assert "a" not in store._concept_pool and "b" not in store._concept_pool
+    assert store.get_cache_stats()["relationships"]["size"] == 1
+
+def _zipf_trace(concepts: int, length: int, s: float = 1.1, seed: int = 42) -> List[str]:
+    weights = [1 / (rank ** s) for rank in range(1, concepts + 1)]
+    return [f"concept-{i}" for i in random.Random(seed).choices(range(concepts), weights=weights, k=length)]
+
+def _append_queue_hit_rate(trace: List[str], size: int) -> float:
+    """Hit rate of the previous pool: FIFO order, hits never refreshed an entry."""
+    pool, queue, hits = {}, deque(), 0
+    for name in trace:
+        if name in pool:
+            hits += 1
+            continue
+        pool[name] = True
+        queue.append(name)
+        while len(queue) > size:
+            pool.pop(queue.popleft(), None)
+    return hits / len(trace)
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_zipfian_trace_benchmark():
+    """Replay a Zipfian trace over 10k concepts with a 500-entry cache."""
+    concepts, size = 10_000, 500
+    trace = _zipf_trace(concepts, 100_000)
+    store = _store([f"concept-{i}" for i in range(concepts)], cache_size=size)
+
+    start = time.perf_counter()
+    for name in trace:
+        await store.get_concept(name)
+    elapsed = time.perf_counter() - start
+
+    stats = store.get_cache_stats()["concepts"]
+    previous = _append_queue_hit_rate(trace, size)
+    assert stats["hits"] + stats["misses"] == len(trace)
+    assert stats["hit_rate"] >= previous
+    logger.info(
+        f"Zipfian trace of {len(trace)} reads over {concepts} concepts, cache {size}: "
+        f"hit rate {stats['hit_rate']:.3f} (previous pool {previous:.3f}), "
+        f"{stats['evictions']} evictions, {len(trace) / elapsed:.0f} reads/s"
+    )
@@ -0,0 +1,197 @@
+"""Tests for concept validation fields stored as indexed properties."""
+
+import pytest
+import time
+import json
+import socket
+import logging
+import statistics
+import configparser
+from urllib.parse import urlparse
+from typing import Any, Dict, List, Optional
+
+from nia.core.neo4j.concept_store import ConceptStore, MIGRATE_VALIDATION_QUERY
+from nia.core.neo4j.validation_handler import ValidationHandler
+
+logger = logging.getLogger(__name__)
+
+class RecordingConceptStore(ConceptStore):
+    """Concept store that records queries instead of running them."""
+
+    def __init__(self):
+        super().__init__(uri="bolt://unused:7687", max_retry_time=0)
+        self.queries: List[tuple] = []
+
+    async def run_query(self, query: str, parameters: Optional[Dict[str, Any]] = None, _depth: int = 0):
+        self.queries.append((query, parameters or {}))
+        if "AS migrated" in query:
+            return [{"migrated": 3}]
+        return []
+
+def test_validation_properties_flatten_cross_domain():
+    """Cross-domain fields become flat properties; absent ones are None."""
+    props = ValidationHandler.validation_properties({
+        "domain": "retail",
+        "access_domain": "professional",
+        "confidence": 0.9,
+        "cross_domain": {"approved": True, "requested": True, "source_domain": "retail", "target_domain": "science"}
+    })
+    assert props == {
+        "domain": "retail",
+        "access_domain": "professional",
+        "confidence": 0.9,
+        "cross_domain_approved": True,
+        "cross_domain_requested": True,
+        "cross_domain_source": "retail",
+        "cross_domain_target": "science"
+    }
+    assert ValidationHandler.validation_properties({})["cross_domain_approved"] is None
+
+@pytest.mark.asyncio
+async def test_store_concept_writes_properties():
+    """store_concept sets the validation fields next to validation_json."""
+    store = RecordingConceptStore()
+    await store.store_concept(
+        "pricing", "abstract", "How prices are set",
+        validation={"domain": "retail", "access_domain": "professional", "confidence": 0.7,
+                    "cross_domain": {"approved": False, "requested": True}}
+    )
+
+    query, params = store.queries[-1]
+    assert "c += $validation_properties" in query
+    assert params["validation_properties"]["domain"] == "retail"
+    assert params["validation_properties"]["access_domain"] == "professional"
+    assert params["validation_properties"]["cross_domain_requested"] is True
+    assert json.loads(params["validation_json"])["domain"] == "retail"
+
+@pytest.mark.asyncio
+async def test_domain_filters_are_property_predicates():
+    """Context filters compare properties on the matched node, without JSON parsing."""
+    store = RecordingConceptStore()
+    await store.query_knowledge({
+        "type": "entity",
+        "names": ["pricing"],
+        "context": {"domain": "retail", "access_domain": "professional", "cross_domain.approved": True}
+    })
+
+    query, params = store.queries[-1]
+    assert "apoc" not in query and "validation_json" not in query
+    assert (
+        "MATCH (n:Concept) WHERE n.name IN $names AND n.domain = $context_domain "
+        "AND n.access_domain = $context_access_domain "
+        "AND n.cross_domain_approved = $context_cross_domain_approved"
+    ) in query
+    assert params["context_cross_domain_approved"] is True
+
+@pytest.mark.asyncio
+async def test_schema_and_migration():
+    """Indexes cover the properties; the migration backfills in batches."""
+    store = RecordingConceptStore()
+    assert await store.migrate_validation_properties(batch_size=250) == 3
+
+    queries = [q for q, _ in store.queries]
+    assert any("concept_domain" in q and "(c.domain, c.access_domain)" in q for q in queries)
+    assert not any("CREATE INDEX concept_validation" in q for q in queries)
+    assert (MIGRATE_VALIDATION_QUERY, {"batch_size": 250}) in store.queries
+    assert "IN TRANSACTIONS OF $batch_size ROWS" in MIGRATE_VALIDATION_QUERY
+    assert queries[-1] == "DROP INDEX concept_validation IF EXISTS"
+
+def _neo4j_settings():
+    config = configparser.ConfigParser()
+    config.read("config.ini")
+    return (
+        config.get("NEO4J", "uri", fallback="bolt://localhost:7687"),
+        config.get("NEO4J", "user", fallback="neo4j"),
+        config.get("NEO4J", "password", fallback="password")
+    )
+
+def _neo4j_available() -> bool:
+    url = urlparse(_neo4j_settings()[0])
+    try:
+        with socket.create_connection((url.hostname, url.port or 7687), timeout=1):
+            return True
+    except OSError:
+        return False
+
+DOMAINS = ["general", "retail", "ecommerce", "philosophy", "psychology", "business", "science", "technology"]
+
+# The JSON-parsing filter query_knowledge used before the migration
+JSON_FILTER_QUERY = """
+MATCH (n:Concept)
+WHERE n.validation_json IS NOT NULL
+  AND apoc.convert.fromJsonMap(n.validation_json).domain = $domain
+  AND apoc.convert.fromJsonMap(n.validation_json).access_domain = $access_domain
+RETURN n
+LIMIT 1000
+"""
+
+async def _median_ms(operation, runs: int = 10) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await operation()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+def _operators(plan: Dict[str, Any]) -> List[str]:
+    return [plan["operatorType"]] + [op for child in plan.get("children", []) for op in _operators(child)]
+
+@pytest.mark.neo4j
+@pytest.mark.performance
+@pytest.mark.asyncio
+@pytest.mark.skipif(not _neo4j_available(), reason="Neo4j not reachable")
+async def test_domain_filter_benchmark():
+    """Migrate 200k JSON-only concepts and compare domain-filtered queries."""
+    uri, user, password = _neo4j_settings()
+    store = ConceptStore(uri=uri, user=user, password=password)
+    count = 200_000
+    try:
+        for start in range(0, count, 50_000):
+            await store.run_query(
+                """
+                UNWIND range($start, $end - 1) AS i
+                CREATE (:Concept {
+                    name: 'bench-' + i,
+                    type: 'benchmark',
+                    description: 'concept ' + i,
+                    validation_json: '{"domain": "' + $domains[i % size($domains)] +
+                        '", "access_domain": "' + CASE WHEN i % 2 = 0 THEN 'professional' ELSE 'personal' END +
+                        '", "confidence": 0.5}'
+                })
+                """,
+                {"start": start, "end": start + 50_000, "domains": DOMAINS}
+            )
+        params = {"domain": "science", "access_domain": "professional"}
+        before = await _median_ms(lambda: store.run_query(JSON_FILTER_QUERY, params))
+
+        start = time.perf_counter()
+        migrated = await store.migrate_validation_properties(batch_size=10_000)
+        migration = time.perf_counter() - start
+        await store.run_query("CALL db.awaitIndexes(600)")
+        assert migrated >= count
+
+        query = {"type": "entity", "context": {"domain": "science", "access_domain": "professional"}}
+        after = await _median_ms(lambda: store.query_knowledge(query))
+        driver = await store.driver
+        async with driver.session() as session:
+            result = await session.run(
+                "EXPLAIN MATCH (n:Concept) WHERE n.domain = $domain AND n.access_domain = $access_domain RETURN n",
+                params
+            )
+            summary = await result.consume()
+        operators = _operators(summary.plan)
+        assert any("NodeIndexSeek" in op for op in operators)
+
+        logger.info(
+            f"Domain filter over {count} concepts: JSON scan {before:.1f} ms, "
+            f"index seek {after:.1f} ms (query_knowledge incl. relationships); "
+            f"migration {migration:.1f}s; plan {' <- '.join(operators)}"
+        )
+    finally:
+        await store.run_query(
+            """
+            MATCH (c:Concept) WHERE c.name STARTS WITH 'bench-'
+            CALL { WITH c DETACH DELETE c } IN TRANSACTIONS OF 10000 ROWS
+            """
+        )
+        await store.close()
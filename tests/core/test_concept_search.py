@@ -0,0 +1,197 @@
+"""Tests for full-text concept search."""
+
+import pytest
+import time
+import socket
+import logging
+import statistics
+import configparser
+from urllib.parse import urlparse
+from typing import Any, Dict, List, Optional
+
+from nia.core.neo4j.concept_store import (
+    ConceptStore,
+    CONCEPT_TEXT_INDEX,
+    fulltext_query
+)
+
+logger = logging.getLogger(__name__)
+
+class RecordingConceptStore(ConceptStore):
+    """Concept store that records queries and answers with canned rows."""
+
+    def __init__(self, rows: Optional[List[Dict[str, Any]]] = None):
+        super().__init__(uri="bolt://unused:7687", max_retry_time=0)
+        self.rows = rows or []
+        self.queries: List[tuple] = []
+
+    async def run_query(self, query: str, parameters: Optional[Dict[str, Any]] = None, _depth: int = 0):
+        self.queries.append((query, parameters or {}))
+        if "queryNodes" in query:
+            start = parameters.get("offset", 0)
+            return self.rows[start:start + parameters.get("limit", len(self.rows))]
+        return []
+
+def _row(name: str, score: float) -> Dict[str, Any]:
+    return {
+        "c": {"name": name, "type": "test", "description": f"about {name}"},
+        "score": score,
+        "relationships": []
+    }
+
+def test_fulltext_query_modes():
+    """Every word is required; modes add prefix or fuzzy suffixes."""
+    assert fulltext_query("Machine learning") == "machine AND learning"
+    assert fulltext_query("neural net", "prefix") == "neural* AND net*"
+    assert fulltext_query("neuron", "fuzzy") == "neuron~"
+    assert fulltext_query("  ") == ""
+    with pytest.raises(ValueError):
+        fulltext_query("x", "regex")
+
+def test_fulltext_query_escapes_syntax():
+    """Lucene syntax in user input is matched literally."""
+    assert fulltext_query("c++ AND (x)") == r"c\+\+ AND and AND \(x\)"
+    assert fulltext_query("a:b/c") == r"a\:b\/c"
+
+@pytest.mark.asyncio
+async def test_initialize_indexes_creates_fulltext_index():
+    """initialize_indexes creates the full-text index over name and description."""
+    store = RecordingConceptStore()
+    await store.initialize_indexes()
+
+    (fulltext,) = [q for q, _ in store.queries if "FULLTEXT" in q]
+    assert CONCEPT_TEXT_INDEX in fulltext
+    assert "ON EACH [c.name, c.description]" in fulltext
+
+@pytest.mark.asyncio
+async def test_search_pages_are_ranked():
+    """Pages come from the index in score order with a next offset."""
+    rows = [_row(f"concept-{i}", 10.0 - i) for i in range(5)]
+    store = RecordingConceptStore(rows)
+
+    first = await store.search_concept_page("concept", mode="prefix", limit=2)
+    query, params = store.queries[-1]
+    assert "db.index.fulltext.queryNodes($index, $search)" in query
+    assert "CONTAINS" not in query
+    assert params == {"index": CONCEPT_TEXT_INDEX, "search": "concept*", "offset": 0, "limit": 3}
+    assert [c["name"] for c in first["concepts"]] == ["concept-0", "concept-1"]
+    assert [c["score"] for c in first["concepts"]] == [10.0, 9.0]
+    assert first["has_more"] and first["next_offset"] == 2
+
+    last = await store.search_concept_page("concept", mode="prefix", limit=2, offset=4)
+    assert [c["name"] for c in last["concepts"]] == ["concept-4"]
+    assert not last["has_more"] and last["next_offset"] is None
+
+    # Cached concepts do not carry a search score
+    assert "score" not in store._concept_pool["concept-0"]
+    assert await store.search_concepts("   ") == []
+
+@pytest.mark.asyncio
+async def test_search_concepts_defaults_to_prefix():
+    """Partial words find concepts unless a mode is given."""
+    store = RecordingConceptStore([_row("reasoning", 1.0)])
+
+    assert [c["name"] for c in await store.search_concepts("reason")] == ["reasoning"]
+    assert store.queries[-1][1]["search"] == "reason*"
+    await store.search_concepts("reason", mode="term")
+    assert store.queries[-1][1]["search"] == "reason"
+
+@pytest.mark.asyncio
+async def test_query_knowledge_pattern_uses_index():
+    """Concept patterns are served by the full-text index, not a regex scan."""
+    store = RecordingConceptStore()
+    await store.query_knowledge({"type": "concept", "pattern": "learn"})
+
+    query, params = store.queries[-1]
+    assert "=~" not in query
+    assert "db.index.fulltext.queryNodes($index, $search)" in query
+    assert params["search"] == "learn*"
+
+def _neo4j_settings():
+    config = configparser.ConfigParser()
+    config.read("config.ini")
+    return (
+        config.get("NEO4J", "uri", fallback="bolt://localhost:7687"),
+        config.get("NEO4J", "user", fallback="neo4j"),
+        config.get("NEO4J", "password", fallback="password")
+    )
+
+def _neo4j_available() -> bool:
+    url = urlparse(_neo4j_settings()[0])
+    try:
+        with socket.create_connection((url.hostname, url.port or 7687), timeout=1):
+            return True
+    except OSError:
+        return False
+
+WORDS = [
+    "memory", "neural", "network", "retail", "pricing", "philosophy", "ethics",
+    "learning", "graph", "vector", "emotion", "dialogue", "reasoning", "planning",
+    "inventory", "science", "language", "pattern", "belief", "context"
+]
+
+SCAN_QUERY = """
+    MATCH (c:Concept)
+    WHERE c.name = $query OR c.description = $query OR
+          toLower(c.name) CONTAINS toLower($query) OR
+          toLower(c.description) CONTAINS toLower($query)
+    RETURN c
+    LIMIT 20
+"""
+
+async def _median_ms(operation, runs: int = 20) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await operation()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+@pytest.mark.neo4j
+@pytest.mark.performance
+@pytest.mark.asyncio
+@pytest.mark.skipif(not _neo4j_available(), reason="Neo4j not reachable")
+async def test_concept_search_benchmark():
+    """Compare full-text search with the CONTAINS scan at 10k, 100k and 1M concepts."""
+    uri, user, password = _neo4j_settings()
+    store = ConceptStore(uri=uri, user=user, password=password)
+    await store.initialize_indexes()
+    seeded = 0
+    try:
+        for size in (10_000, 100_000, 1_000_000):
+            while seeded < size:
+                batch = min(50_000, size - seeded)
+                await store.run_query(
+                    """
+                    UNWIND range($start, $end - 1) AS i
+                    CREATE (:Concept {
+                        name: 'bench-' + i,
+                        type: 'benchmark',
+                        description: $words[i % size($words)] + ' ' + $words[(i / 7) % size($words)] + ' concept ' + i
+                    })
+                    """,
+                    {"start": seeded, "end": seeded + batch, "words": WORDS}
+                )
+                seeded += batch
+            await store.run_query("CALL db.awaitIndexes(600)")
+
+            # A selective search: the scan cannot stop early
+            target = f"concept {size - 1}"
+            scan = await _median_ms(lambda: store.run_query(SCAN_QUERY, {"query": target}))
+            indexed = await _median_ms(lambda: store.search_concept_page(target, limit=20))
+            prefix = await _median_ms(lambda: store.search_concept_page("reason", mode="prefix", limit=20))
+            fuzzy = await _median_ms(lambda: store.search_concept_page("reasonin", mode="fuzzy", limit=20))
+            logger.info(
+                f"{size} concepts: scan {scan:.1f} ms, full-text {indexed:.1f} ms, "
+                f"prefix {prefix:.1f} ms, fuzzy {fuzzy:.1f} ms"
+            )
+            page = await store.search_concept_page(target, limit=20)
+            assert page["concepts"][0]["name"] == f"bench-{size - 1}"
+    finally:
+        await store.run_query(
+            """
+            MATCH (c:Concept) WHERE c.name STARTS WITH 'bench-'
+            CALL { WITH c DETACH DELETE c } IN TRANSACTIONS OF 10000 ROWS
+            """
+        )
+        await store.close()
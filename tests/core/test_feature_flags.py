@@ -0,0 +1,173 @@
+"""Tests for the snapshot-backed feature flags."""
+
+import pytest
+import time
+import fnmatch
+import asyncio
+import logging
+
+from nia.core.feature_flags import FeatureFlags
+
+logger = logging.getLogger(__name__)
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls FeatureFlags makes.
+
+    Clients sharing one FakeRedis see each other's writes and messages, like
+    processes sharing a server. Keyspace notifications can be switched off
+    to model a server without notify-keyspace-events.
+    """
+
+    def __init__(self, keyspace_events: bool = True):
+        self.data = {}
+        self.keyspace_events = keyspace_events
+        self.connections = []
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+
+    async def set(self, key, value):
+        self.data[key] = value.encode()
+        self._notify(f"__keyspace@0__:{key}", "set", pattern=True)
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+        self._notify(f"__keyspace@0__:{key}", "del", pattern=True)
+
+    async def mget(self, keys):
+        return [self.data.get(key.decode() if isinstance(key, bytes) else key) for key in keys]
+
+    async def scan_iter(self, match="*"):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key.encode()
+
+    async def publish(self, channel, message):
+        self._notify(channel, message)
+
+    def _notify(self, channel, data, pattern=False):
+        if pattern and not self.keyspace_events:
+            return
+        for connection in self.connections:
+            connection.deliver(channel, data.encode(), pattern)
+
+    def pubsub(self):
+        connection = FakePubSub(self)
+        self.connections.append(connection)
+        return connection
+
+class FakePubSub:
+    def __init__(self, server):
+        self.server = server
+        self.queue = asyncio.Queue()
+        self.channels = set()
+        self.patterns = set()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def psubscribe(self, *patterns):
+        self.patterns.update(patterns)
+
+    def deliver(self, channel, data, pattern):
+        if not pattern and channel in self.channels:
+            self.queue.put_nowait({"type": "message", "channel": channel.encode(), "data": data})
+        for p in self.patterns:
+            if pattern and fnmatch.fnmatch(channel, p):
+                self.queue.put_nowait({"type": "pmessage", "pattern": p, "channel": channel.encode(), "data": data})
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        self.server.connections.remove(self)
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+@pytest.mark.asyncio
+async def test_reads_never_touch_redis():
+    """is_enabled answers from the snapshot loaded at start."""
+    redis = FakeRedis()
+    redis.data["debug:log_storage"] = b"true"
+    flags = FeatureFlags(redis, poll_interval=None)
+    await flags.start()
+
+    for _ in range(1000):
+        assert flags.is_enabled("log_storage")
+    assert not flags.is_enabled("strict_mode")
+    assert await flags.is_debug_enabled("log_storage")
+    assert redis.gets == 0
+    await flags.stop()
+
+@pytest.mark.asyncio
+async def test_changes_published_to_other_processes():
+    """A write in one process updates another's snapshot via pub/sub."""
+    redis = FakeRedis(keyspace_events=False)
+    writer = FeatureFlags(redis, poll_interval=None)
+    reader = FeatureFlags(redis, poll_interval=None)
+    await writer.start()
+    await reader.start()
+
+    await writer.enable_debug("log_websocket")
+    await _settle()
+    assert reader.is_enabled("log_websocket")
+
+    await writer.disable_debug("log_websocket")
+    await _settle()
+    assert not reader.is_enabled("log_websocket")
+
+    await writer.stop()
+    await reader.stop()
+
+@pytest.mark.asyncio
+async def test_keyspace_notifications_catch_external_writes():
+    """Writes made outside FeatureFlags arrive as keyspace events."""
+    redis = FakeRedis()
+    flags = FeatureFlags(redis, poll_interval=None)
+    await flags.start()
+
+    await redis.set("debug:strict_mode", "true")
+    await _settle()
+    assert flags.is_enabled("strict_mode")
+
+    await redis.delete("debug:strict_mode")
+    await _settle()
+    assert not flags.is_enabled("strict_mode")
+    await flags.stop()
+
+@pytest.mark.asyncio
+async def test_polling_fallback():
+    """Without notifications, the poller picks changes up."""
+    redis = FakeRedis(keyspace_events=False)
+    flags = FeatureFlags(redis, poll_interval=0.05)
+    await flags.start()
+
+    await redis.set("debug:log_validation", "true")
+    assert not flags.is_enabled("log_validation")
+    await asyncio.sleep(0.15)
+    assert flags.is_enabled("log_validation")
+    await flags.stop()
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_flag_read_benchmark():
+    """Report synchronous flag reads per second."""
+    redis = FakeRedis()
+    redis.data["debug:log_websocket"] = b"true"
+    flags = FeatureFlags(redis, poll_interval=None)
+    await flags.start()
+
+    reads = 1_000_000
+    start = time.perf_counter()
+    for _ in range(reads):
+        flags.is_enabled("log_websocket")
+    elapsed = time.perf_counter() - start
+
+    assert reads / elapsed > 1_000_000
+    logger.info(f"{reads / elapsed / 1e6:.1f}M flag reads/s ({elapsed / reads * 1e9:.0f} ns per read)")
+    await flags.stop()
@@ -0,0 +1,228 @@
+"""Tests for sampled, rate-limited hot-path logging."""
+
+import pytest
+import pytest_asyncio
+import time
+import uuid
+import queue
+import logging
+import statistics
+from dataclasses import replace
+from qdrant_client import models
+
+from nia.core import hot_logging
+from nia.core.hot_logging import (
+    PROFILES,
+    Lazy,
+    configure_hot_path_logging,
+    get_hot_logger,
+    hot_path_stats,
+    record_fields
+)
+from nia.nova.memory.vector_store import VectorStore
+from nia.nova.memory.embedding import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+class ListHandler(logging.Handler):
+    """Handler that keeps formatted records."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.format(record)
+        self.records.append(record)
+
+@pytest.fixture
+def captured():
+    """A hot logger with its own handler, reset to development afterwards."""
+    hot = get_hot_logger(f"tests.hot.{uuid.uuid4().hex}")
+    handler = ListHandler()
+    hot.logger.addHandler(handler)
+    hot.logger.propagate = False
+    yield hot, handler
+    configure_hot_path_logging("development")
+    hot.logger.removeHandler(handler)
+
+def _profile(**changes):
+    return replace(PROFILES["development"], name="test", **changes)
+
+def test_arguments_formatted_only_when_emitted(captured):
+    """Disabled records never call Lazy arguments."""
+    hot, handler = captured
+    configure_hot_path_logging(_profile(level=logging.INFO))
+    calls = []
+
+    def preview():
+        calls.append(1)
+        return "preview"
+
+    hot.debug("site", "vector %s", Lazy(preview))
+    assert calls == [] and handler.records == []
+
+    hot.info("site", "vector %s", Lazy(preview), dimension=8)
+    assert calls
+    assert handler.records[0].getMessage() == "vector preview"
+    assert record_fields(handler.records[0]) == {"dimension": 8, "site": "site"}
+
+def test_rate_limit_is_per_site_and_reports_suppressed(captured):
+    """A site emits its burst, then one record per token with a drop count."""
+    hot, handler = captured
+    configure_hot_path_logging(_profile(rate_per_second=1.0, burst=5))
+    before = hot_path_stats()["rate_limited"]
+
+    for i in range(100):
+        hot.info("busy", "message %d", i)
+    hot.info("quiet", "other site")
+    assert len(handler.records) == 6
+    assert hot_path_stats()["rate_limited"] - before == 95
+
+    hot._sites["busy"].updated -= 1.0
+    hot.info("busy", "after refill")
+    assert handler.records[-1].getMessage() == "after refill"
+    assert handler.records[-1].suppressed == 95
+
+    # Errors always get through
+    for _ in range(20):
+        hot.error("busy", "failure")
+    assert sum(r.levelno == logging.ERROR for r in handler.records) == 20
+
+def test_sampling_applies_below_warning(captured):
+    """INFO records are sampled; warnings are not."""
+    hot, handler = captured
+    configure_hot_path_logging(_profile(sample_rate=0.1))
+
+    for _ in range(2000):
+        hot.info("sampled", "info")
+        hot.warning("kept", "warning")
+
+    kept = sum(r.levelno == logging.INFO for r in handler.records)
+    assert 100 < kept < 300
+    assert sum(r.levelno == logging.WARNING for r in handler.records) == 2000
+
+def test_production_queues_handlers(captured):
+    """Production moves handlers behind a queue and restores them after."""
+    hot, handler = captured
+    configure_hot_path_logging(replace(PROFILES["production"], rate_per_second=None))
+
+    assert hot.logger.level == logging.INFO
+    assert handler not in hot.logger.handlers
+    assert hot.logger.name in hot_path_stats()["queued"]
+    hot.debug("site", "filtered")
+    hot.warning("site", "queued %s", "warning")
+
+    configure_hot_path_logging("development")
+    assert handler in hot.logger.handlers
+    assert not any(isinstance(h, hot_logging._DroppingQueueHandler) for h in hot.logger.handlers)
+    assert [r.getMessage() for r in handler.records] == ["queued warning"]
+
+def test_full_queue_drops_instead_of_blocking():
+    """A full queue drops and counts records."""
+    handler = hot_logging._DroppingQueueHandler(queue.Queue(maxsize=1))
+    before = hot_path_stats()["dropped"]
+    record = logging.LogRecord("x", logging.WARNING, __file__, 1, "msg", None, None)
+
+    handler.handle(record)
+    handler.handle(record)
+    assert hot_path_stats()["dropped"] - before == 1
+
+def test_queued_records_formatted_by_listener():
+    """Queueing leaves formatting, and Lazy arguments, to the listener thread."""
+    records = queue.Queue()
+    handler = hot_logging._DroppingQueueHandler(records)
+    calls = []
+    record = logging.LogRecord(
+        "x", logging.WARNING, __file__, 1, "vector %s", (Lazy(lambda: calls.append(1) or "preview"),), None
+    )
+
+    handler.handle(record)
+    queued = records.get_nowait()
+    assert calls == [] and queued.msg == "vector %s"
+    assert queued.getMessage() == "vector preview"
+
+class FakeQdrantClient:
+    """Qdrant stand-in that answers instantly, so timings are the store's own."""
+
+    def __init__(self):
+        self.hits = [
+            models.ScoredPoint(
+                id=str(uuid.uuid4()),
+                version=0,
+                score=0.9,
+                payload={"content": f"memory {i}", "metadata_layer": "episodic", "metadata_id": str(i)}
+            )
+            for i in range(5)
+        ]
+
+    def upsert(self, collection_name, points, wait=True):
+        pass
+
+    def search(self, collection_name, query_vector, limit=10, **kwargs):
+        return self.hits[:limit]
+
+    def close(self):
+        pass
+
+@pytest_asyncio.fixture
+async def vector_store():
+    """Vector store over a fake Qdrant client."""
+    VectorStore._client_instance = FakeQdrantClient()
+    store = VectorStore(embedding_service=EmbeddingService(dimension=64))
+    store._collection_name = "test_collection"
+    yield store
+    await store.cleanup()
+
+async def _measure(store: VectorStore, count: int):
+    store_times, search_times = [], []
+    for i in range(count):
+        start = time.perf_counter()
+        await store.store_vector(f"memory {i}", {"id": str(uuid.uuid4()), "type": "test"})
+        store_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        await store.search_vectors(f"memory {i}", limit=5)
+        search_times.append(time.perf_counter() - start)
+    return store_times, search_times
+
+def _percentiles(samples):
+    cuts = statistics.quantiles(samples, n=100)
+    return cuts[49] * 1000, cuts[98] * 1000
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_hot_path_logging_benchmark(vector_store, tmp_path):
+    """Report store and search p50/p99 with per-call DEBUG logs and with the production profile."""
+    root = logging.getLogger()
+    path = tmp_path / "hot.log"
+    handler = logging.FileHandler(path)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s"))
+    level = root.level
+    root.addHandler(handler)
+    root.setLevel(logging.DEBUG)
+    count = 300
+    try:
+        configure_hot_path_logging("development")
+        await _measure(vector_store, 20)
+        off = await _measure(vector_store, count)
+        handler.flush()
+        stored_off = path.read_text().count("Stored vector")
+        configure_hot_path_logging("production")
+        await _measure(vector_store, 20)
+        on = await _measure(vector_store, count)
+    finally:
+        configure_hot_path_logging("development")
+        root.removeHandler(handler)
+        root.setLevel(level)
+        handler.close()
+
+    assert stored_off == count + 20
+    assert path.read_text().count("Stored vector") == stored_off
+
+    for name, index in (("store", 0), ("search", 1)):
+        p50_off, p99_off = _percentiles(off[index])
+        p50_on, p99_on = _percentiles(on[index])
+        logger.info(
+            f"{name}: p50 {p50_off:.3f} -> {p50_on:.3f} ms, "
+            f"p99 {p99_off:.3f} -> {p99_on:.3f} ms (development -> production)"
+        )
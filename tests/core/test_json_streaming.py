@@ -0,0 +1,184 @@
+"""Tests for the incremental streaming JSON extractor."""
+
+import re
+import json
+import time
+import random
+import logging
+import pytest
+
+from nia.core.types.json_utils import (
+    StreamingJSONExtractor,
+    extract_json_incremental,
+    extract_valid_json,
+    iter_json_fields
+)
+
+logger = logging.getLogger(__name__)
+
+QUIRKY_OUTPUT = '''Sure! Fill in the {name} placeholders. Here is the analysis:
+```json
+{
+  response: 'It\\'s "great"',
+  "concepts": [
+    {"name": "Memory", "type": "entity", "related": ["Recall", "Storage",],},
+    {'name': 'Learning', "type": "process", "validated": True},
+  ],
+  "key_points": ["first line
+second line"],
+  "confidence": 0.8,
+  "uncertainties": None,
+}
+```
+Let me know if you need anything else.'''
+
+EXPECTED = {
+    "response": 'It\'s "great"',
+    "concepts": [
+        {"name": "Memory", "type": "entity", "related": ["Recall", "Storage"]},
+        {"name": "Learning", "type": "process", "validated": True}
+    ],
+    "key_points": ["first line\nsecond line"],
+    "confidence": 0.8,
+    "uncertainties": None
+}
+
+def test_tolerates_model_quirks():
+    """Prose, fences, bogus braces, trailing commas, quotes and literals."""
+    assert extract_json_incremental(QUIRKY_OUTPUT) == EXPECTED
+    assert extract_valid_json(QUIRKY_OUTPUT) == EXPECTED
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_fields_emitted_as_they_close(chunk_size):
+    """Any chunking yields the same fields, each as soon as it closes."""
+    extractor = StreamingJSONExtractor()
+    emitted = []
+    for i in range(0, len(QUIRKY_OUTPUT), chunk_size):
+        chunk = QUIRKY_OUTPUT[i:i + chunk_size]
+        for field, value in extractor.feed(chunk):
+            emitted.append((field, value, i + len(chunk)))
+
+    assert [f for f, _, _ in emitted] == list(EXPECTED)
+    assert extractor.result() == EXPECTED
+    concepts_end = QUIRKY_OUTPUT.index("],\n  \"key_points\"") + 1
+    assert emitted[1][2] - concepts_end < chunk_size
+
+def test_truncated_stream_keeps_completed_fields():
+    """A stream cut off mid-object reports what closed before the cut."""
+    extractor = StreamingJSONExtractor()
+    extractor.feed('{"concepts": [{"name": "A"}], "key_points": ["unfinished')
+
+    assert not extractor.done
+    assert extractor.partial == {"concepts": [{"name": "A"}]}
+    with pytest.raises(ValueError):
+        extractor.result()
+
+@pytest.mark.parametrize("text", ['{"a": 1 "b": 2}', '{"a": "x" "b": 2}', '{"a": {"x": 1} "b": 2}', '{"a": 1 2}'])
+def test_missing_comma_abandons_object(text):
+    """A second value without a separating comma is not merged into the first."""
+    assert extract_json_incremental(text) is None
+    with pytest.raises(ValueError):
+        extract_valid_json(text)
+
+def test_rescans_after_missing_comma():
+    """Scanning resumes at the next object after a malformed one."""
+    assert extract_json_incremental('{"a": 1 {"b": 2}}') == {"b": 2}
+
+def test_matches_json_loads_on_valid_json():
+    """Well-formed objects parse exactly as json.loads does."""
+    data = _recorded_output(50, seed=1)
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    assert extract_json_incremental(text) == data
+
+@pytest.mark.asyncio
+async def test_iter_json_fields():
+    """Async iteration yields fields from a chunk stream."""
+    async def chunks():
+        for part in ['{"a": [1,', ' 2], "b"', ': "x"}', ' trailing']:
+            yield part
+
+    assert [field async for field in iter_json_fields(chunks())] == [("a", [1, 2]), ("b", "x")]
+
+def _recorded_output(concepts: int, seed: int = 0) -> dict:
+    """Shape and size of a long structured analysis from a local model."""
+    rng = random.Random(seed)
+    words = "memory graph vector concept learning recall pattern signal context agent".split()
+
+    def sentence(n):
+        return " ".join(rng.choice(words) for _ in range(n)).capitalize() + "."
+
+    return {
+        "response": " ".join(sentence(20) for _ in range(concepts // 10 + 1)),
+        "concepts": [
+            {
+                "name": f"{rng.choice(words).title()} {i}",
+                "type": rng.choice(["entity", "process", "pattern"]),
+                "description": sentence(30),
+                "related": [rng.choice(words) for _ in range(5)],
+                "validation": {"confidence": round(rng.random(), 2), "supported_by": [sentence(8)]}
+            }
+            for i in range(concepts)
+        ],
+        "key_points": [sentence(15) for _ in range(concepts)],
+        "implications": [sentence(15) for _ in range(concepts // 2)],
+        "uncertainties": [sentence(10) for _ in range(concepts // 4)],
+        "reasoning": [sentence(25) for _ in range(concepts // 2)]
+    }
+
+def _quirky(data: dict) -> str:
+    """Render with the quirks local models produce."""
+    body = json.dumps(data, indent=2)
+    body = re.sub(r'(\n\s*)\]', r',\1]', body)  # trailing commas
+    return f"Here is the structured analysis you asked for:\n```json\n{body}\n```\nHope this helps!"
+
+def _legacy_attempts(candidate: str):
+    yield candidate
+    cleaned = re.sub(r'%[0-9.]*[diouxXeEfFgGcrs]', '', candidate)
+    cleaned = cleaned.replace('\\"', '"').replace('\\n', '\n')
+    cleaned = re.sub(r'[^\x20-\x7E\n]', '', cleaned)
+    cleaned = re.sub(r',(\s*[}\]])', r'\1', cleaned)
+    yield re.sub(r'([{,]\s*)(\w+)(:)', r'\1"\2"\3', cleaned)
+    yield re.sub(r',(\s*[\]}])', r'\1', candidate)
+
+def _legacy_extract(text: str) -> dict:
+    """The whole-string cascade extract_valid_json ran before this change."""
+    match = re.search(r'\{[^{]*"concepts"\s*:\s*\[.*?\][^}]*\}', text, re.DOTALL)
+    if not match:
+        match = re.search(r'\{.*\}', text, re.DOTALL)
+    code = re.search(r'```(?:json)?\s*(.*?)\s*```', text, re.DOTALL)
+    for candidate in (match.group(0), code.group(1)):
+        for attempt in _legacy_attempts(candidate):
+            try:
+                return json.loads(attempt)
+            except json.JSONDecodeError:
+                continue
+    raise ValueError("Could not extract valid JSON from response")
+
+@pytest.mark.performance
+def test_extraction_benchmark():
+    """Report post-stream latency and throughput on large recorded outputs."""
+    for concepts in (10, 100, 1000):
+        data = _recorded_output(concepts)
+        text = _quirky(data)
+        chunks = [text[i:i + 16] for i in range(0, len(text), 16)]
+
+        start = time.perf_counter()
+        legacy = _legacy_extract("".join(chunks))
+        legacy_ms = (time.perf_counter() - start) * 1000
+
+        extractor = StreamingJSONExtractor()
+        start = time.perf_counter()
+        for chunk in chunks[:-1]:
+            extractor.feed(chunk)
+        streaming_total = time.perf_counter() - start
+        last = time.perf_counter()
+        extractor.feed(chunks[-1])
+        tail_ms = (time.perf_counter() - last) * 1000
+        streaming_total += tail_ms / 1000
+
+        assert extractor.result() == legacy == data
+        logger.info(
+            f"{len(text) / 1024:8.1f} KiB: legacy {legacy_ms:7.2f} ms after stream end; "
+            f"incremental {tail_ms:6.3f} ms after stream end, "
+            f"{len(text) / 1024 / 1024 / streaming_total:5.1f} MiB/s while streaming"
+        )
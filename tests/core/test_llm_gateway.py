@@ -0,0 +1,234 @@
+"""Tests for the pooled LLM gateway."""
+
+import pytest
+import pytest_asyncio
+import time
+import json
+import socket
+import asyncio
+import logging
+import aiohttp
+from aiohttp import web
+
+from nia.core.interfaces.llm_gateway import LLMGateway, LLMGatewayError
+
+logger = logging.getLogger(__name__)
+
+class FakeOpenAI:
+    """Local stand-in for an OpenAI-compatible server (LM Studio)."""
+
+    def __init__(self, stream: bool = True, latency: float = 0.0):
+        self.stream = stream
+        self.latency = latency
+        self.model_requests = 0
+        self.completion_requests = 0
+        self.peers = set()
+
+    async def models(self, request: web.Request) -> web.Response:
+        self.model_requests += 1
+        return web.json_response({"data": [{"id": "local-model"}, {"id": "other-model"}]})
+
+    async def completions(self, request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        self.completion_requests += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        words = ["Hello", " from", " ", payload["model"]]
+        await asyncio.sleep(self.latency)
+        if not (self.stream and payload.get("stream")):
+            return web.json_response({"choices": [{"message": {"content": "".join(words)}}]})
+
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for word in words:
+            chunk = {"choices": [{"delta": {"content": word}}]}
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+async def _serve(fake: FakeOpenAI):
+    app = web.Application()
+    app.router.add_get("/v1/models", fake.models)
+    app.router.add_post("/v1/chat/completions", fake.completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    fake.base_url = f"http://127.0.0.1:{port}/v1"
+    return runner
+
+@pytest_asyncio.fixture
+async def server():
+    """Run the stand-in server on a free local port."""
+    fake = FakeOpenAI()
+    runner = await _serve(fake)
+    yield fake
+    await runner.cleanup()
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+@pytest.mark.asyncio
+async def test_models_cached_and_connections_reused(server):
+    """Sequential turns list models once and share one connection."""
+    gateway = LLMGateway(server.base_url)
+    for _ in range(20):
+        content, timing = await gateway.complete(MESSAGES)
+    await gateway.close()
+
+    assert content == "Hello from local-model"
+    assert server.model_requests == 1
+    assert server.completion_requests == 20
+    assert len(server.peers) == 1
+    assert timing.reused_connection
+    assert timing.connect_ms == 0.0
+
+@pytest.mark.asyncio
+async def test_models_refreshed_after_ttl(server):
+    """Model discovery is repeated once the TTL passes."""
+    gateway = LLMGateway(server.base_url, models_ttl=0.05)
+    await gateway.get_model_id()
+    await gateway.get_model_id()
+    await asyncio.sleep(0.06)
+    await gateway.get_model_id()
+    await gateway.close()
+
+    assert server.model_requests == 2
+
+@pytest.mark.asyncio
+async def test_timing_phases(server):
+    """First request pays connect; ttft falls within total."""
+    server.latency = 0.02
+    gateway = LLMGateway(server.base_url)
+
+    _, first = await gateway.complete(MESSAGES, model="local-model")
+    _, second = await gateway.complete(MESSAGES, model="local-model")
+    metrics = gateway.get_metrics()
+    await gateway.close()
+
+    assert first.connect_ms > 0 and not first.reused_connection
+    assert second.connect_ms == 0 and second.reused_connection
+    assert 20 <= first.ttft_ms <= first.total_ms
+    assert metrics["requests"] == 2
+    assert set(metrics["ttft_ms"]) == {"avg", "p50", "p95"}
+
+@pytest.mark.asyncio
+async def test_non_streaming_server():
+    """Servers that ignore stream=True still return the full completion."""
+    fake = FakeOpenAI(stream=False)
+    runner = await _serve(fake)
+    gateway = LLMGateway(fake.base_url)
+    content, timing = await gateway.complete(MESSAGES)
+    await gateway.close()
+    await runner.cleanup()
+
+    assert content == "Hello from local-model"
+    assert timing.ttft_ms > 0
+
+def test_guides_compiled_once():
+    """Each schema is compiled once and reused."""
+    compiled = []
+    gateway = LLMGateway("http://unused/v1", guide_factory=lambda s: compiled.append(s) or object())
+    schema = {"type": "object", "properties": {"response": {"type": "string"}}}
+
+    first = gateway.get_guide(schema)
+    assert gateway.get_guide(dict(schema)) is first
+    gateway.get_guide({"type": "string"})
+
+    assert len(compiled) == 2
+
+@pytest.mark.asyncio
+async def test_health_tracked_in_background(server):
+    """Failures mark the server unavailable until a probe succeeds."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        dead_port = sock.getsockname()[1]
+    gateway = LLMGateway(f"http://127.0.0.1:{dead_port}/v1", health_interval=0.02)
+
+    with pytest.raises(LLMGatewayError):
+        await gateway.complete(MESSAGES, model="local-model")
+    assert not gateway.available
+
+    # Server comes back at the configured address
+    gateway.base_url = server.base_url
+    deadline = time.perf_counter() + 1.0
+    while not gateway.available and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+    await gateway.close()
+
+    assert gateway.healthy
+    assert server.completion_requests == 0
+
+@pytest.mark.asyncio
+async def test_initialize_checks_health_without_completion(server):
+    """Startup knows the server's health before the first request."""
+    gateway = LLMGateway(server.base_url)
+    assert gateway.healthy is None
+
+    assert await gateway.initialize()
+    assert gateway.healthy and gateway._health_task is not None
+    await gateway.close()
+
+    assert server.model_requests == 1
+    assert server.completion_requests == 0
+
+def test_session_closed_on_loop_change():
+    """A session from a finished loop is closed when a new loop takes over."""
+    gateway = LLMGateway("http://unused/v1")
+    first = asyncio.run(gateway._ensure_session())
+    second = asyncio.run(gateway._ensure_session())
+
+    assert second is not first
+    assert first.closed
+
+@pytest.mark.asyncio
+async def test_recheck_recovers_without_health_task(server):
+    """A refused caller restarts tracking and re-probes a stale unhealthy server."""
+    gateway = LLMGateway(server.base_url, health_interval=60)
+    gateway.healthy = False
+    gateway.last_health_check = time.monotonic() - 61
+
+    assert await gateway.recheck()
+    assert gateway._health_task is not None
+    assert await gateway.recheck()  # fresh check: no second probe
+    await gateway.close()
+
+    assert gateway.healthy and server.model_requests == 1
+
+async def _per_request_turn(base_url: str):
+    """The previous flow: new client, health check, model list, completion."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{base_url}/models") as response:
+            model = (await response.json())["data"][0]["id"]
+        check = {"model": model, "messages": [{"role": "user", "content": "test"}], "max_tokens": 1}
+        async with session.post(f"{base_url}/chat/completions", json=check) as response:
+            await response.json()
+        async with session.get(f"{base_url}/models") as response:
+            model = (await response.json())["data"][0]["id"]
+        async with session.post(
+            f"{base_url}/chat/completions", json={"model": model, "messages": MESSAGES}
+        ) as response:
+            return (await response.json())["choices"][0]["message"]["content"]
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+async def test_gateway_benchmark(server):
+    """Report turns per second for per-request clients vs the gateway."""
+    turns = 200
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        await _per_request_turn(server.base_url)
+    per_request = turns / (time.perf_counter() - start)
+
+    gateway = LLMGateway(server.base_url)
+    start = time.perf_counter()
+    for _ in range(turns):
+        await gateway.complete(MESSAGES)
+    pooled = turns / (time.perf_counter() - start)
+    metrics = gateway.get_metrics()
+    await gateway.close()
+
+    logger.info(f"per-request client: {per_request:,.0f} turns/s, gateway: {pooled:,.0f} turns/s")
+    logger.info(f"gateway phases: { {k: metrics[k] for k in ('queue_ms', 'connect_ms', 'ttft_ms', 'total_ms')} }")
+    assert pooled > per_request
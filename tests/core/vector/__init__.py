@@ -0,0 +1 @@
+"""Vector service tests package."""
@@ -0,0 +1,144 @@
+"""Tests for the pooled, batching LM Studio embedding client."""
+
+import pytest
+import pytest_asyncio
+import asyncio
+import hashlib
+import numpy as np
+from aiohttp import web
+
+from nia.core.vector.embeddings import EmbeddingService
+
+DIM = 8
+
+def _vector(text: str):
+    digest = hashlib.sha256(text.encode()).digest()
+    return [b / 255.0 for b in digest[:DIM]]
+
+class FakeLMStudio:
+    """Local HTTP stand-in for the LM Studio /embeddings endpoint."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.peers = set()
+
+    async def embeddings(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        inputs = payload["input"] if isinstance(payload["input"], list) else [payload["input"]]
+        self.requests.append(inputs)
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        data = [{"index": i, "embedding": _vector(t)} for i, t in reversed(list(enumerate(inputs)))]
+        return web.json_response({"data": data})
+
+@pytest_asyncio.fixture
+async def lmstudio():
+    """Run the stand-in server on a free local port."""
+    fake = FakeLMStudio()
+    app = web.Application()
+    app.router.add_post("/v1/embeddings", fake.embeddings)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    fake.api_base = f"http://127.0.0.1:{port}/v1"
+    yield fake
+    await runner.cleanup()
+
+def _service(fake, **kwargs) -> EmbeddingService:
+    return EmbeddingService(api_base=fake.api_base, embedding_dim=DIM, **kwargs)
+
+@pytest.mark.asyncio
+async def test_concurrent_get_embedding_coalesced(lmstudio):
+    """Concurrent single calls share one request and keep their own results."""
+    service = _service(lmstudio, batch_window=0.01)
+    texts = [f"text {i}" for i in range(10)]
+
+    embeddings = await asyncio.gather(*(service.get_embedding(t) for t in texts))
+    await service.close()
+
+    assert len(lmstudio.requests) == 1
+    for text, embedding in zip(texts, embeddings):
+        np.testing.assert_allclose(embedding, _vector(service._truncate_text(text)))
+
+@pytest.mark.asyncio
+async def test_get_embeddings_pipelined_with_limit(lmstudio):
+    """Batches run concurrently up to max_in_flight over pooled connections."""
+    lmstudio.latency = 0.05
+    service = _service(lmstudio, batch_size=10, max_in_flight=3)
+
+    embeddings = await service.get_embeddings([f"text {i}" for i in range(100)])
+    await service.close()
+
+    assert len(embeddings) == 100
+    assert len(lmstudio.requests) == 10
+    assert lmstudio.max_in_flight == 3
+    assert len(lmstudio.peers) <= 3
+
+@pytest.mark.asyncio
+async def test_disk_cache_by_model_and_text(lmstudio, tmp_path):
+    """Cached embeddings survive new service instances and are model specific."""
+    first = _service(lmstudio, cache_dir=str(tmp_path))
+    expected = await first.get_embeddings(["a", "b", "a"])
+    await first.close()
+    assert lmstudio.requests == [[first._truncate_text("a"), first._truncate_text("b")]]
+
+    second = _service(lmstudio, cache_dir=str(tmp_path))
+    assert await second.get_similarity("a", "b") == pytest.approx(
+        float(np.dot(expected[0], expected[1]) / (np.linalg.norm(expected[0]) * np.linalg.norm(expected[1])))
+    )
+    await second.close()
+    assert len(lmstudio.requests) == 1
+
+    other_model = _service(lmstudio, cache_dir=str(tmp_path), model="other-model")
+    await other_model.get_embedding("a")
+    await other_model.close()
+    assert len(lmstudio.requests) == 2
+
+@pytest.mark.asyncio
+async def test_memory_cache_on_by_default(lmstudio):
+    """Repeated texts are served from the in-memory LRU without a cache_dir."""
+    service = _service(lmstudio, cache_size=2)
+    first = await service.get_embedding("a")
+    assert await service.get_embedding("a") is first
+    await service.get_embeddings(["b", "c"])
+    await service.get_embedding("a")
+    await service.close()
+
+    assert len(lmstudio.requests) == 3  # "a" was evicted by "b" and "c"
+    assert not first.flags.writeable
+    assert service.cache.hits == 1
+
+@pytest.mark.asyncio
+async def test_close_sends_pending_calls(lmstudio):
+    """Calls waiting in the batch window are answered, not stranded, on close."""
+    service = _service(lmstudio, batch_window=60)
+    waiting = asyncio.ensure_future(service.get_embedding("a"))
+    await asyncio.sleep(0)
+
+    await service.close()
+    embedding = await asyncio.wait_for(waiting, 1)
+
+    np.testing.assert_allclose(embedding, _vector(service._truncate_text("a")))
+    assert not service._pending and not service._batches
+
+@pytest.mark.asyncio
+async def test_server_error_falls_back_to_zeros():
+    """Unreachable servers still yield zero vectors."""
+    service = EmbeddingService(api_base="http://127.0.0.1:9/v1", embedding_dim=DIM)
+
+    single = await service.get_embedding("a")
+    batch = await service.get_embeddings(["a", "b"])
+    await service.close()
+
+    assert not single.any()
+    assert len(batch) == 2 and not any(e.any() for e in batch)
@@ -0,0 +1,166 @@
+"""Tests for concurrent, dependency-aware agent scheduling."""
+
+import pytest
+import time
+import asyncio
+import logging
+
+from nia.memory.agent_scheduler import AgentScheduler, AgentStep
+
+logger = logging.getLogger(__name__)
+
+AGENTS = ('belief', 'desire', 'emotion', 'reflection', 'research', 'task', 'dialogue', 'context', 'structure')
+
+class StubLLM:
+    """LLM stand-in that answers after a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.active = 0
+        self.peak = 0
+
+    async def complete(self, prompt: str) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            return f"response to {prompt}"
+        finally:
+            self.active -= 1
+
+def _turn_steps(llm: StubLLM, meta_inputs=AGENTS, slow=None):
+    """The memory system's turn shape: every agent feeds the meta synthesis."""
+    async def agent(name):
+        if name == slow:
+            await asyncio.sleep(10)
+        return await llm.complete(name)
+
+    async def meta(responses):
+        await llm.complete("meta")
+        return sorted(responses)
+
+    steps = [AgentStep(name, lambda _, name=name: agent(name)) for name in AGENTS]
+    steps.append(AgentStep('meta', meta, requires=tuple(meta_inputs)))
+    return steps
+
+@pytest.mark.asyncio
+async def test_independent_agents_run_concurrently():
+    """Agents overlap up to the limit; meta runs after its inputs."""
+    llm = StubLLM(0.05)
+    result = await AgentScheduler(max_concurrency=4, timeout=5).run(_turn_steps(llm))
+
+    assert result.complete
+    assert result.results['meta'] == sorted(AGENTS)
+    assert llm.peak == 4
+    assert 0.15 < result.total < 0.4  # ceil(9 / 4) agent rounds plus meta, not 10 calls in series
+    meta = result.timings['meta']
+    assert meta.started >= max(result.timings[name].finished for name in AGENTS)
+
+async def _fail():
+    raise RuntimeError("agent unavailable")
+
+@pytest.mark.asyncio
+async def test_timeouts_and_failures_give_partial_results():
+    """A slow or failing agent is reported and left out of the synthesis."""
+    llm = StubLLM(0.01)
+    steps = _turn_steps(llm, slow='research')
+    steps[0] = AgentStep('belief', lambda _: _fail())
+    result = await AgentScheduler(max_concurrency=9, timeout=0.2).run(steps)
+
+    assert set(result.errors) == {'belief', 'research'}
+    assert 'timed out' in result.errors['research']
+    assert result.timings['research'].status == "timeout"
+    assert result.timings['belief'].status == "error"
+    assert result.results['meta'] == sorted(set(AGENTS) - {'belief', 'research'})
+    assert result.total < 1
+
+@pytest.mark.asyncio
+async def test_meta_starts_when_required_inputs_arrive():
+    """Meta does not wait for agents it does not require."""
+    llm = StubLLM(0.01)
+    steps = _turn_steps(llm, meta_inputs=('belief', 'emotion'), slow='context')
+    for step in steps:
+        if step.name == 'context':
+            step.timeout = 0.3
+    result = await AgentScheduler(max_concurrency=9, timeout=5).run(steps)
+
+    assert result.results['meta'] == ['belief', 'emotion']
+    assert result.timings['meta'].finished < 0.2
+    assert result.timings['context'].status == "timeout"
+
+@pytest.mark.asyncio
+async def test_default_timeout_keeps_slow_agents():
+    """Without a configured timeout a slow agent delays the turn instead of being dropped."""
+    scheduler = AgentScheduler(max_concurrency=2)
+    steps = [
+        AgentStep('slow', lambda _: asyncio.sleep(0.2, result='late')),
+        AgentStep('meta', lambda responses: asyncio.sleep(0, result=responses), requires=('slow',))
+    ]
+    result = await scheduler.run(steps)
+
+    assert scheduler.timeout == 0
+    assert result.complete and result.results['meta'] == {'slow': 'late'}
+
+@pytest.mark.asyncio
+async def test_waiting_steps_do_not_hold_slots():
+    """A dependent step waiting on its inputs leaves the slot to others."""
+    order = []
+
+    async def record(name):
+        order.append(name)
+        await asyncio.sleep(0.01)
+
+    steps = [
+        AgentStep('last', lambda _: record('last'), requires=('first',)),
+        AgentStep('first', lambda _: record('first'))
+    ]
+    result = await AgentScheduler(max_concurrency=1, timeout=1).run(steps)
+
+    assert result.complete and order == ['first', 'last']
+
+@pytest.mark.asyncio
+async def test_invalid_graphs_are_rejected():
+    """Unknown dependencies, duplicates and cycles raise ValueError."""
+    scheduler = AgentScheduler(max_concurrency=2, timeout=1)
+    noop = lambda _: asyncio.sleep(0)
+    for steps in (
+        [AgentStep('a', noop, requires=('missing',))],
+        [AgentStep('a', noop), AgentStep('a', noop)],
+        [AgentStep('a', noop, requires=('b',)), AgentStep('b', noop, requires=('a',))]
+    ):
+        with pytest.raises(ValueError):
+            await scheduler.run(steps)
+
+@pytest.mark.asyncio
+async def test_latency_breakdown():
+    """The breakdown lists every step with its status and timings in ms."""
+    result = await AgentScheduler(max_concurrency=2, timeout=5).run(_turn_steps(StubLLM(0.01)))
+    breakdown = result.latency_breakdown()
+
+    assert set(breakdown['steps']) == set(AGENTS) | {'meta'}
+    assert list(breakdown['steps'])[-1] == 'meta'
+    assert breakdown['steps']['meta']['status'] == "ok"
+    assert breakdown['steps']['meta']['run_ms'] >= 10
+    assert breakdown['total_ms'] >= breakdown['steps']['meta']['start_ms']
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_fan_out_benchmark():
+    """Compare a serial turn with scheduled fan-out over a 100 ms stub LLM."""
+    latency = 0.1
+    llm = StubLLM(latency)
+
+    start = time.perf_counter()
+    responses = {name: await llm.complete(name) for name in AGENTS}
+    await llm.complete("meta")
+    serial = time.perf_counter() - start
+
+    for limit in (2, 4, 10):
+        result = await AgentScheduler(max_concurrency=limit, timeout=5).run(_turn_steps(StubLLM(latency)))
+        assert result.complete
+        assert result.total < serial
+        logger.info(
+            f"Turn with {len(responses) + 1} LLM calls at {latency * 1000:.0f} ms: "
+            f"serial {serial * 1000:.0f} ms, max_concurrency={limit} {result.total * 1000:.0f} ms; "
+            f"{result.latency_breakdown()['steps']['meta']}"
+        )
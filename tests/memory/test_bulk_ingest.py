@@ -0,0 +1,119 @@
+"""Tests for the bulk episodic ingest path."""
+
+import pytest
+import pytest_asyncio
+import time
+import logging
+from typing import List, Any
+
+from nia.nova.memory.vector_store import VectorStore
+from nia.nova.memory.two_layer import TwoLayerMemorySystem, EpisodicLayer
+from nia.core.types.memory_types import Memory
+
+logger = logging.getLogger(__name__)
+
+UPSERT_LATENCY = 0.0005  # Simulated Qdrant round-trip in seconds
+
+class RecordingQdrantClient:
+    """Blocking stand-in for QdrantClient that records upsert calls."""
+
+    def __init__(self, latency: float = UPSERT_LATENCY, fail_on_call: int = -1):
+        self.latency = latency
+        self.fail_on_call = fail_on_call
+        self.calls: List[dict] = []
+        self.points: List[Any] = []
+
+    def upsert(self, collection_name: str, points: List[Any], wait: bool = True):
+        time.sleep(self.latency)
+        self.calls.append({"size": len(points), "wait": wait})
+        if len(self.calls) - 1 == self.fail_on_call:
+            raise RuntimeError("upsert rejected")
+        self.points.extend(points)
+
+    def close(self):
+        pass
+
+@pytest_asyncio.fixture
+async def memory_system(counting_embedding_service):
+    """Memory system with an episodic layer over a recording client."""
+    store = VectorStore(embedding_service=counting_embedding_service(dimension=64))
+    store._collection_name = "test_collection"
+    VectorStore._client_instance = RecordingQdrantClient()
+    system = TwoLayerMemorySystem(vector_store=store)
+    system.episodic = EpisodicLayer(vector_store=store)
+    system._initialized = True
+    yield system
+    await store.cleanup()
+
+def _memories(count: int, prefix: str = "memory") -> List[Memory]:
+    return [Memory(content=f"{prefix} {i}", type="test") for i in range(count)]
+
+@pytest.mark.asyncio
+async def test_store_experiences_batches_embedding_and_upserts(memory_system):
+    """N memories cost one embedding call and ceil(N / batch_size) upserts."""
+    memories = _memories(250)
+    results = await memory_system.store_experiences(memories, batch_size=100, wait=False)
+
+    client = VectorStore._client_instance
+    assert [r["id"] for r in results] == [m.id for m in memories]
+    assert all(r["success"] for r in results)
+    assert memory_system.vector_store.embedding_service.calls == 1
+    assert sorted(c["size"] for c in client.calls) == [50, 100, 100]
+    assert all(c["wait"] is False for c in client.calls)
+    assert all(m.id in memory_system._memory_pools["episodic"] for m in memories)
+
+@pytest.mark.asyncio
+async def test_store_experiences_reports_per_item_failures(memory_system):
+    """A failed chunk marks only its own memories as failed."""
+    VectorStore._client_instance.fail_on_call = 0
+    memory_system.vector_store.max_concurrency = 1
+    results = await memory_system.store_experiences(_memories(20), batch_size=10)
+
+    failed = [r for r in results if not r["success"]]
+    assert len(failed) == 10
+    assert all(r["error"] == "upsert rejected" for r in failed)
+
+@pytest.mark.asyncio
+async def test_store_experiences_skips_pooled_duplicates(memory_system):
+    """Memories already pooled with the same content are not re-sent."""
+    memories = _memories(5)
+    await memory_system.store_experiences(memories)
+    await memory_system.store_experiences(memories)
+
+    assert len(VectorStore._client_instance.points) == 5
+
+@pytest.mark.asyncio
+async def test_store_experiences_uninitialized():
+    """Uninitialized systems report an error for every memory."""
+    system = TwoLayerMemorySystem(vector_store=None)
+    results = await system.store_experiences(_memories(3))
+
+    assert [r["success"] for r in results] == [False, False, False]
+    assert all(r["error"] for r in results)
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+async def test_bulk_vs_single_store_benchmark(memory_system):
+    """Compare 10k single stores against the bulk path."""
+    count = 10_000
+    memory_logger = logging.getLogger("nia.nova.memory")
+    level = memory_logger.level
+    memory_logger.setLevel(logging.WARNING)
+    try:
+        start = time.perf_counter()
+        for memory in _memories(count, prefix="single"):
+            await memory_system.store_experience(memory)
+        single_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await memory_system.store_experiences(_memories(count, prefix="bulk"))
+        bulk_time = time.perf_counter() - start
+    finally:
+        memory_logger.setLevel(level)
+
+    logger.info(
+        f"{count} memories: single {single_time:.2f}s ({count / single_time:.0f}/s), "
+        f"bulk {bulk_time:.2f}s ({count / bulk_time:.0f}/s), {single_time / bulk_time:.1f}x"
+    )
+    assert all(r["success"] for r in results)
+    assert bulk_time < single_time
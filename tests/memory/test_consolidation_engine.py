@@ -0,0 +1,243 @@
+"""Tests for paged episodic-to-semantic consolidation."""
+
+import pytest
+import pytest_asyncio
+import time
+import bisect
+import uuid
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from nia.nova.memory.vector_store import VectorStore, point_id_for
+from nia.nova.memory.two_layer import TwoLayerMemorySystem, EpisodicLayer, CircuitBreaker
+from nia.nova.memory.consolidation_engine import (
+    CONCEPTS_QUERY,
+    RELATIONSHIPS_QUERY,
+    CHECKPOINT_QUERY,
+    CHECKPOINT_READ_QUERY
+)
+
+logger = logging.getLogger(__name__)
+
+class FakeQdrantClient:
+    """Blocking stand-in for the QdrantClient calls consolidation makes.
+
+    Scroll walks points in id order, filters on exact payload matches and
+    returns the id of the next match as the cursor, like Qdrant. Points are
+    added to ``points`` directly before the first scroll.
+    """
+
+    def __init__(self):
+        self.points: Dict[str, Dict[str, Any]] = {}
+        self._order: List[str] = []
+        self.calls: Dict[str, int] = {"scroll": 0, "set_payload": 0, "retrieve": 0, "upsert": 0}
+
+    def _matches(self, payload: Dict[str, Any], scroll_filter: Any) -> bool:
+        for condition in (scroll_filter.must if scroll_filter else None) or []:
+            value = payload.get(condition.key)
+            if getattr(condition.match, "any", None) is not None:
+                if value not in condition.match.any:
+                    return False
+            elif value != condition.match.value:
+                return False
+        return True
+
+    def scroll(self, collection_name, scroll_filter=None, limit=10, offset=None, **kwargs):
+        self.calls["scroll"] += 1
+        if len(self._order) != len(self.points):
+            self._order = sorted(self.points)
+        start = bisect.bisect_left(self._order, offset) if offset is not None else 0
+        page = []
+        for point_id in self._order[start:]:
+            payload = self.points[point_id]
+            if not self._matches(payload, scroll_filter):
+                continue
+            if len(page) == limit:
+                return page, point_id
+            page.append(_Record(point_id, payload))
+        return page, None
+
+    def set_payload(self, collection_name, payload, points, wait=True):
+        self.calls["set_payload"] += 1
+        # Consolidation selects by memory id; look those points up directly
+        (condition,) = points.must
+        assert condition.key == "metadata_id"
+        for memory_id in condition.match.any:
+            stored = self.points.get(point_id_for(memory_id))
+            if stored is not None:
+                stored.update(payload)
+
+    def retrieve(self, collection_name, ids, **kwargs):
+        self.calls["retrieve"] += 1
+        return [_Record(i, self.points[i]) for i in ids if i in self.points]
+
+    def upsert(self, collection_name, points, wait=True):
+        self.calls["upsert"] += 1
+
+    def close(self):
+        pass
+
+class _Record:
+    def __init__(self, point_id: str, payload: Dict[str, Any]):
+        self.id = point_id
+        self.payload = payload
+
+class FakeSemanticStore:
+    """Applies the consolidation statements to in-memory concepts and edges."""
+
+    def __init__(self):
+        self.concepts: Dict[str, Dict[str, Any]] = {}
+        self.edges: Dict[str, set] = {}
+        self.checkpoint: Optional[Dict[str, Any]] = None
+        self.transactions = 0
+
+    async def run_query(self, query: str, parameters: Optional[Dict[str, Any]] = None):
+        assert query == CHECKPOINT_READ_QUERY
+        return [dict(self.checkpoint)] if self.checkpoint else []
+
+    async def run_transaction(self, queries: List[Dict[str, Any]]):
+        self.transactions += 1
+        for statement in queries:
+            query, params = statement["query"], statement["parameters"]
+            if query == CONCEPTS_QUERY:
+                for row in params["rows"]:
+                    self.concepts.setdefault(row["id"], {}).update(row["properties"])
+            elif query == RELATIONSHIPS_QUERY:
+                for row in params["rows"]:
+                    self.edges[row["id"]] = {r for r in row["related"] if r in self.concepts}
+            elif query == CHECKPOINT_QUERY:
+                processed = (self.checkpoint or {}).get("processed", 0) + params["count"]
+                self.checkpoint = {"offset": params["offset"], "processed": processed}
+            else:
+                raise AssertionError(f"unexpected query: {query}")
+        return [[] for _ in queries]
+
+@pytest_asyncio.fixture
+async def memory_system(counting_embedding_service):
+    """Memory system over fake Qdrant and Neo4j stores."""
+    store = VectorStore(embedding_service=counting_embedding_service(dimension=32))
+    store._collection_name = "test_collection"
+    VectorStore._client_instance = FakeQdrantClient()
+    system = TwoLayerMemorySystem(vector_store=store)
+    system.episodic = EpisodicLayer(vector_store=store)
+    system.semantic = FakeSemanticStore()
+    system.consolidation_page_size = 500
+    system._initialized = True
+    yield system
+    await store.cleanup()
+
+def _add_memories(system: TwoLayerMemorySystem, count: int) -> List[str]:
+    """Write unconsolidated episodic points directly; each relates to the previous one."""
+    client = VectorStore._client_instance
+    ids = [str(uuid.uuid4()) for _ in range(count)]
+    timestamp = datetime.now(timezone.utc).isoformat()
+    for i, memory_id in enumerate(ids):
+        client.points[point_id_for(memory_id)] = system.vector_store._build_payload(
+            f"memory {i}",
+            {
+                "id": memory_id,
+                "type": "test",
+                "timestamp": timestamp,
+                "consolidated": False,
+                "related": [ids[i - 1]] if i else []
+            },
+            "episodic"
+        )
+    return ids
+
+def _consolidated(system: TwoLayerMemorySystem) -> int:
+    points = VectorStore._client_instance.points.values()
+    return sum(1 for payload in points if payload["metadata_consolidated"])
+
+@pytest.mark.asyncio
+async def test_scan_writes_one_transaction_per_page(memory_system):
+    """Every unconsolidated memory is written and marked, page by page."""
+    ids = _add_memories(memory_system, 1200)
+    client = VectorStore._client_instance
+
+    assert await memory_system.consolidate_memories()
+
+    semantic = memory_system.semantic
+    assert len(semantic.concepts) == 1200
+    assert semantic.concepts[ids[5]]["description"] == "memory 5"
+    assert semantic.transactions == 3
+    assert client.calls["set_payload"] == 3
+    assert _consolidated(memory_system) == 1200
+    assert memory_system.vector_store.embedding_service.calls == 0
+    assert semantic.checkpoint["offset"] is None
+
+    stats = memory_system.get_metrics()["consolidation"]["last_run"]
+    assert stats["consolidated"] == 1200
+    assert stats["pages"] == 3
+    assert stats["memories_per_second"] > 0
+
+@pytest.mark.asyncio
+async def test_interrupted_scan_resumes_from_checkpoint(memory_system):
+    """A scan stopped by the circuit breaker continues where it left off."""
+    _add_memories(memory_system, 1200)
+    memory_system.semantic_circuit = CircuitBreaker(max_failures=1)
+    memory_system.consolidation_page_size = 400
+    engine = memory_system._get_consolidation_engine()
+    write = engine._write
+    calls = 0
+
+    async def fail_second_page(queries):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("neo4j unavailable")
+        await write(queries)
+
+    engine._write = fail_second_page
+    assert not await memory_system.consolidate_memories()
+    assert _consolidated(memory_system) == 400
+    checkpoint = memory_system.semantic.checkpoint["offset"]
+    assert checkpoint is not None
+
+    engine._write = write
+    memory_system.semantic_circuit.record_success()
+    assert await memory_system.consolidate_memories()
+    assert engine.last_run["resumed_from"] == checkpoint
+    assert engine.last_run["consolidated"] == 800
+    assert _consolidated(memory_system) == 1200
+    assert memory_system.semantic.checkpoint == {"offset": None, "processed": 1200}
+
+@pytest.mark.asyncio
+async def test_explicit_ids_skip_missing(memory_system):
+    """Given ids are read with one retrieve per page; unknown ids are skipped."""
+    ids = _add_memories(memory_system, 10)
+    memory_system._memory_pools["episodic"][ids[0]] = {"content": "stale", "metadata": {}}
+
+    assert await memory_system.consolidate_memories(ids[:3] + [str(uuid.uuid4())])
+
+    assert set(memory_system.semantic.concepts) == set(ids[:3])
+    assert memory_system.semantic.edges[ids[2]] == {ids[1]}
+    assert _consolidated(memory_system) == 3
+    assert VectorStore._client_instance.calls["retrieve"] == 1
+    assert ids[0] not in memory_system._memory_pools["episodic"]
+    assert memory_system.get_metrics()["consolidation"]["last_run"]["missing"] == 1
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_consolidation_benchmark(memory_system):
+    """Consolidate 100k episodic memories and report throughput."""
+    count = 100_000
+    _add_memories(memory_system, count)
+    memory_system.consolidation_page_size = 1000
+    client = VectorStore._client_instance
+
+    start = time.perf_counter()
+    assert await memory_system.consolidate_memories()
+    elapsed = time.perf_counter() - start
+
+    stats = memory_system.get_metrics()["consolidation"]["last_run"]
+    assert stats["consolidated"] == count
+    assert memory_system.semantic.transactions == count // 1000
+    assert client.calls["set_payload"] == count // 1000
+    assert memory_system.vector_store.embedding_service.calls == 0
+    logger.info(
+        f"Consolidated {count} memories in {elapsed:.2f}s ({count / elapsed:.0f}/s), "
+        f"{stats['pages']} pages at {stats['avg_page_ms']:.1f} ms, "
+        f"{memory_system.semantic.transactions} transactions, {client.calls['set_payload']} payload updates"
+    )
@@ -0,0 +1,92 @@
+"""Tests for the vectorized hash embedding service."""
+
+import pytest
+import time
+import hashlib
+import logging
+import numpy as np
+
+from nia.nova.memory.embedding import EmbeddingService
+from nia.nova.memory.vector_store import VectorStore
+
+logger = logging.getLogger(__name__)
+
+def _reference_embedding(text: str, dimension: int):
+    """Per-component formula the service has always used."""
+    hash_bytes = hashlib.sha256(text.encode()).digest()
+    return [(hash_bytes[i % len(hash_bytes)] / 128.0) - 1.0 for i in range(dimension)]
+
+@pytest.mark.asyncio
+async def test_single_embedding_matches_reference():
+    """Vectorized output equals the original per-component hash values."""
+    service = EmbeddingService(dimension=100)
+    embedding = await service.create_embedding("hello world")
+
+    assert embedding.dtype == np.float32
+    assert embedding.shape == (100,)
+    np.testing.assert_allclose(embedding, _reference_embedding("hello world", 100))
+
+@pytest.mark.asyncio
+async def test_batch_with_partial_cache_hits():
+    """Batches mix cached and fresh rows in input order."""
+    service = EmbeddingService(dimension=48)
+    await service.create_embedding("b")
+    texts = ["a", "b", "c", "b"]
+
+    embeddings = await service.create_embedding(texts)
+
+    assert embeddings.shape == (4, 48)
+    for row, text in zip(embeddings, texts):
+        np.testing.assert_allclose(row, _reference_embedding(text, 48))
+    assert (await service.create_embedding([])).shape == (0, 48)
+
+@pytest.mark.asyncio
+async def test_cache_is_lru_keyed_by_digest():
+    """Hits refresh recency and keys are content digests."""
+    service = EmbeddingService(cache_size=2, dimension=8)
+    await service.create_embedding("a")
+    await service.create_embedding("b")
+    await service.create_embedding("a")  # a is now most recent
+    await service.create_embedding("c")
+
+    keys = list(service._cache)
+    assert keys == [hashlib.sha256(t.encode()).digest() for t in ("a", "c")]
+
+@pytest.mark.asyncio
+async def test_cached_embeddings_are_read_only():
+    """Cached vectors are shared, so callers cannot mutate them."""
+    service = EmbeddingService(dimension=8)
+    first = await service.create_embedding("a")
+
+    assert first is await service.create_embedding("a")
+    with pytest.raises(ValueError):
+        first[0] = 1.0
+
+@pytest.mark.asyncio
+async def test_normalize_vectors_in_place():
+    """Batch normalization yields unit rows and leaves zero rows as zeros."""
+    store = VectorStore(embedding_service=EmbeddingService(dimension=16))
+    embeddings = await store.embedding_service.create_embedding(["a", "b"])
+    matrix = np.vstack([embeddings, np.zeros((1, 16), dtype=np.float32)])
+
+    normalized = store._normalize_vectors(matrix)
+    single = store._normalize_vector(await store.embedding_service.create_embedding("a"))
+
+    assert normalized.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(normalized, axis=1), [1.0, 1.0, 0.0], rtol=1e-6)
+    np.testing.assert_allclose(single, normalized[0], rtol=1e-6)
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+async def test_embedding_throughput_benchmark():
+    """Report embeddings per second for batch sizes 1 through 4096."""
+    for batch_size in (1, 4, 16, 64, 256, 1024, 4096):
+        service = EmbeddingService(cache_size=batch_size, dimension=768)
+        texts = [f"benchmark text {i}" for i in range(batch_size)]
+
+        start = time.perf_counter()
+        embeddings = await service.create_embedding(texts)
+        elapsed = time.perf_counter() - start
+
+        logger.info(f"batch {batch_size:>4}: {batch_size / elapsed:,.0f} embeddings/s")
+        assert embeddings.shape == (batch_size, 768)
@@ -0,0 +1,71 @@
+"""Tests for direct experience retrieval by memory id."""
+
+import pytest
+import pytest_asyncio
+import uuid
+from qdrant_client import QdrantClient, models
+
+from nia.nova.memory.vector_store import VectorStore
+from nia.nova.memory.embedding import EmbeddingService
+from nia.nova.memory.two_layer import TwoLayerMemorySystem, EpisodicLayer
+from nia.core.types.memory_types import Memory
+
+# Memory ids must be UUID strings; anything else is replaced by the model
+THREAD_ID = str(uuid.uuid4())
+
+@pytest_asyncio.fixture
+async def memory_system():
+    """Memory system over an in-process Qdrant collection, without Neo4j."""
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        collection_name="test_collection",
+        vectors_config=models.VectorParams(size=32, distance=models.Distance.COSINE)
+    )
+    VectorStore._client_instance = client
+    store = VectorStore(embedding_service=EmbeddingService(dimension=32))
+    store._collection_name = "test_collection"
+    system = TwoLayerMemorySystem(vector_store=store)
+    system.episodic = EpisodicLayer(vector_store=store)
+    system._initialized = True
+    yield system
+    await store.cleanup()
+
+@pytest.mark.asyncio
+async def test_get_experience_reads_by_id(memory_system):
+    """A stored experience is found by id once the pool is cleared."""
+    memory = Memory(id=THREAD_ID, content="hello", type="thread")
+    assert await memory_system.store_experience(memory)
+    memory_system._memory_pools["episodic"].clear()
+
+    retrieved = await memory_system.get_experience(THREAD_ID)
+
+    assert retrieved is not None
+    assert retrieved.id == THREAD_ID
+    assert retrieved.content == "hello"
+    assert memory_system.vector_store.get_metrics()["retrieve"]["count"] == 1
+    assert "search" not in memory_system.vector_store.get_metrics()
+
+@pytest.mark.asyncio
+async def test_get_experiences_multi_get(memory_system):
+    """Multi-get resolves pooled and stored ids and omits unknown ones."""
+    ids = [str(uuid.uuid4()) for _ in range(4)]
+    await memory_system.store_experiences([
+        Memory(id=memory_id, content=f"memory {i}", type="test") for i, memory_id in enumerate(ids)
+    ])
+    memory_system._memory_pools["episodic"].pop(ids[2])
+
+    memories = await memory_system.get_experiences([ids[0], ids[2], str(uuid.uuid4())])
+
+    assert set(memories) == {ids[0], ids[2]}
+    assert memories[ids[2]].content == "memory 2"
+    assert memory_system.vector_store.get_metrics()["retrieve"]["count"] == 1
+
+@pytest.mark.asyncio
+async def test_restoring_thread_does_not_duplicate(memory_system):
+    """Re-storing an updated thread overwrites its point."""
+    await memory_system.store_experience(Memory(id=THREAD_ID, content="v1", type="thread"))
+    await memory_system.store_experience(Memory(id=THREAD_ID, content="v2", type="thread"))
+
+    points, _ = VectorStore._client_instance.scroll("test_collection", limit=10)
+    assert len(points) == 1
+    assert points[0].payload["content"] == "v2"
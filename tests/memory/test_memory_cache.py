@@ -0,0 +1,120 @@
+"""Tests for the bounded memory pool cache."""
+
+import pytest
+import uuid
+
+from nia.nova.memory.memory_cache import MemoryCache
+from nia.nova.memory.two_layer import TwoLayerMemorySystem
+from nia.core.types.memory_types import Memory
+
+def _entry(content: str = "hello", **metadata):
+    return {"content": content, "metadata": {"type": "thread", **metadata}, "layer": "episodic"}
+
+def test_lru_eviction():
+    """Least recently used entries are evicted once max_size is exceeded."""
+    cache = MemoryCache(max_size=2, ttl_seconds=None)
+    cache["a"] = _entry("a")
+    cache["b"] = _entry("b")
+    cache.get("a")  # a is now most recent
+    cache["c"] = _entry("c")
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.stats()["evictions"] == 1
+
+def test_ttl_expiry(monkeypatch):
+    """Entries expire after ttl_seconds."""
+    now = [1000.0]
+    monkeypatch.setattr("nia.nova.memory.memory_cache.time.monotonic", lambda: now[0])
+    cache = MemoryCache(max_size=10, ttl_seconds=60)
+    cache["a"] = _entry()
+
+    now[0] += 59
+    assert cache.get("a") is not None
+    now[0] += 2
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["size"] == 0
+
+def test_hit_miss_counters():
+    """Hits and misses are counted per lookup."""
+    cache = MemoryCache()
+    cache["a"] = _entry()
+    cache.get("a")
+    cache.get("a")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+def test_peek_does_not_count_or_refresh():
+    """peek reads an entry without touching counters or recency."""
+    cache = MemoryCache(max_size=2, ttl_seconds=None)
+    cache["a"] = _entry("a")
+    cache["b"] = _entry("b")
+
+    assert cache.peek("a")["content"] == "a"
+    assert cache.peek("missing") is None
+    cache["c"] = _entry("c")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (0, 0)
+    assert "a" not in cache
+
+def test_entries_are_frozen_and_shared():
+    """Hits return the same read-only object with sanitized metadata."""
+    cache = MemoryCache()
+    cache["a"] = _entry(importance=0.5, tags=["x"])
+
+    first = cache.get("a")
+    assert first is cache.get("a")
+    assert first["metadata"]["tags"] == "['x']"
+    with pytest.raises(TypeError):
+        first["content"] = "changed"
+    with pytest.raises(TypeError):
+        first["metadata"]["type"] = "changed"
+
+@pytest.mark.asyncio
+async def test_delete_memory_invalidates_pools():
+    """delete_memory drops pooled copies and the metrics surface reports it."""
+    system = TwoLayerMemorySystem(vector_store=None)
+    memory_id = str(uuid.uuid4())
+    system._memory_pools["episodic"][memory_id] = _entry()
+    system._memory_pools["semantic"][memory_id] = _entry()
+
+    assert await system.delete_memory(memory_id)
+
+    pools = system.get_metrics()["pools"]
+    assert pools["episodic"]["invalidations"] == 1
+    assert pools["semantic"]["invalidations"] == 1
+    assert memory_id not in system._memory_pools["episodic"]
+
+def test_duplicate_check_does_not_count_misses():
+    """The store path's pool check leaves read hit rates alone."""
+    system = TwoLayerMemorySystem(vector_store=None)
+    memory_id = str(uuid.uuid4())
+    system._memory_pools["episodic"][memory_id] = _entry("pooled")
+    memory = Memory(content="pooled", type="thread")
+
+    assert system._matches_pool("episodic", memory_id, memory)
+    assert not system._matches_pool("semantic", memory_id, memory)
+
+    pools = system.get_metrics()["pools"]
+    assert (pools["episodic"]["hits"], pools["semantic"]["misses"]) == (0, 0)
+
+@pytest.mark.asyncio
+async def test_get_experience_served_from_pool():
+    """Pool hits build the memory without touching the stores."""
+    system = TwoLayerMemorySystem(vector_store=None)
+    system._initialized = True
+    memory_id = str(uuid.uuid4())
+    system._memory_pools["episodic"][memory_id] = _entry("pooled", id=memory_id, _synced=True)
+
+    memory = await system.get_experience(memory_id)
+
+    assert isinstance(memory, Memory)
+    assert memory.content == "pooled"
+    assert system.get_metrics()["pools"]["episodic"]["hits"] == 1
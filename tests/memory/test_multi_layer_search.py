@@ -0,0 +1,164 @@
+"""Tests for single-embedding, batched search across memory layers."""
+
+import pytest
+import time
+import uuid
+import logging
+import numpy as np
+from types import SimpleNamespace
+from qdrant_client import models
+
+from nia.core.vector.ranking import merge_ranked, normalize_scores
+from nia.nova.memory.vector_store import VectorStore, point_id_for
+
+logger = logging.getLogger(__name__)
+
+def _hit(memory_id: str, score: float):
+    return {"metadata": {"id": memory_id}, "score": score}
+
+def test_normalize_scores_between_threshold_and_best():
+    """A search's best hit maps to 1.0 and the threshold to 0.0."""
+    assert normalize_scores([_hit("a", 0.9), _hit("b", 0.8)], floor=0.7) == pytest.approx([1.0, 0.5])
+    assert normalize_scores([_hit("a", 0.5)], floor=0.7) == [1.0]
+    assert normalize_scores([]) == []
+
+def test_merge_reserves_quotas_and_ranks_normalized():
+    """Quotas guarantee slots; remaining slots go to the best normalized hits."""
+    hits = {
+        "episodic": [_hit(f"e{i}", 0.95 - i * 0.01) for i in range(5)],
+        "semantic": [_hit("s0", 0.80), _hit("s1", 0.75)]
+    }
+    raw = merge_ranked(hits, 4, floor=0.7, normalize=False)
+    assert [h["metadata"]["id"] for h in raw] == ["e0", "e1", "e2", "e3"]
+
+    merged = merge_ranked(hits, 4, quotas={"semantic": 2}, floor=0.7)
+    assert [h["source"] for h in merged].count("semantic") == 2
+    assert merged[0]["normalized_score"] == 1.0
+    assert {h["metadata"]["id"] for h in merged} == {"e0", "s0", "e1", "s1"}
+
+    with pytest.raises(ValueError):
+        merge_ranked(hits, 2, quotas={"episodic": 2, "semantic": 1})
+    with pytest.raises(ValueError):
+        merge_ranked(hits, 2, quotas={"procedural": 1})
+
+def test_merge_drops_repeated_hits():
+    """Overlapping filters (e.g. domains) return a memory once."""
+    hits = {"retail": [_hit("a", 0.9), _hit("b", 0.8)], "business": [_hit("a", 0.9)]}
+    merged = merge_ranked(hits, 5, key=lambda hit: hit["metadata"]["id"])
+    assert sorted(h["metadata"]["id"] for h in merged) == ["a", "b"]
+
+async def _seed(store: VectorStore, query: str, counts):
+    """Add points per layer at decreasing similarity to the query."""
+    base = np.asarray(await store.embedding_service.create_embedding(query), dtype=np.float32)
+    rng = np.random.default_rng(7)
+    points = []
+    for layer, count, noise in counts:
+        for i in range(count):
+            memory_id = f"{layer}-{i}"
+            vector = base + rng.normal(0, noise * (i + 1), size=base.shape).astype(np.float32)
+            points.append(models.PointStruct(
+                id=point_id_for(memory_id),
+                vector=vector.tolist(),
+                payload=store._build_payload(f"{layer} memory {i}", {"id": memory_id, "layer": layer}, layer)
+            ))
+    VectorStore._client_instance.upsert("test_collection", points=points)
+    store.embedding_service.calls = 0
+
+@pytest.mark.asyncio
+async def test_search_layers_embeds_once_in_one_request(vector_store):
+    """Both layers are served by one embedding and one batched search."""
+    await _seed(vector_store, "pricing", [("episodic", 6, 0.01), ("semantic", 3, 0.2)])
+
+    results = await vector_store.search_layers("pricing", limit=4, score_threshold=0.0)
+
+    assert vector_store.embedding_service.calls == 1
+    assert vector_store.get_metrics()["search_batch"]["count"] == 1
+    assert len(results) == 4
+    assert {r["source"] for r in results} == {"episodic", "semantic"}
+    assert all(r["layer"] == r["source"] for r in results)
+    assert results[0]["normalized_score"] == 1.0
+
+@pytest.mark.asyncio
+async def test_search_layers_quota(vector_store):
+    """A quota keeps weaker semantic matches in the result."""
+    await _seed(vector_store, "pricing", [("episodic", 6, 0.01), ("semantic", 3, 0.2)])
+
+    results = await vector_store.search_layers(
+        "pricing", limit=4, quotas={"semantic": 3}, score_threshold=0.0, normalize=False
+    )
+    assert [r["source"] for r in results].count("semantic") == 3
+
+    with pytest.raises(ValueError):
+        await vector_store.search_layers("pricing", limit=2, quotas={"semantic": 3})
+
+@pytest.mark.asyncio
+async def test_search_multi_by_domain(vector_store):
+    """Arbitrary filters, such as domains, share the same batched request."""
+    await _seed(vector_store, "pricing", [("episodic", 4, 0.01)])
+    domain = lambda value: [models.FieldCondition(key="metadata_id", match=models.MatchValue(value=value))]
+
+    results = await vector_store.search_multi(
+        "pricing",
+        {"first": domain("episodic-0"), "second": domain("episodic-1"), "none": domain("missing")},
+        limit=5,
+        score_threshold=0.0
+    )
+    assert sorted(r["source"] for r in results) == ["first", "second"]
+    assert vector_store.embedding_service.calls == 1
+
+class SlowBatchClient:
+    """Qdrant stand-in with a fixed round-trip for search and batched query."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def _points(self, limit):
+        return [
+            models.ScoredPoint(id=str(uuid.uuid4()), version=0, score=0.9 - i * 0.01,
+                               payload={"content": f"memory {i}", "metadata_id": str(uuid.uuid4())})
+            for i in range(limit)
+        ]
+
+    def search(self, collection_name, query_vector, limit=10, **kwargs):
+        time.sleep(self.latency)
+        return self._points(limit)
+
+    def query_batch_points(self, collection_name, requests, **kwargs):
+        time.sleep(self.latency)
+        return [SimpleNamespace(points=self._points(request.limit)) for request in requests]
+
+    def close(self):
+        pass
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_multi_layer_search_benchmark(counting_embedding_service):
+    """Compare two per-layer searches with one batched search (20 ms embedding, 5 ms Qdrant)."""
+    VectorStore._client_instance = SlowBatchClient(0.005)
+    store = VectorStore(embedding_service=counting_embedding_service(latency=0.02, dimension=64))
+    store._collection_name = "test_collection"
+    runs = 30
+    try:
+        start = time.perf_counter()
+        for i in range(runs):
+            query = f"query {i}"
+            episodic = await store.search_vectors(query, limit=5, layer="episodic")
+            semantic = await store.search_vectors(query, limit=5, layer="semantic")
+            sorted(episodic + semantic, key=lambda x: x.get("score", 0), reverse=True)[:5]
+        separate = (time.perf_counter() - start) / runs
+        separate_embeddings = store.embedding_service.calls
+
+        store.embedding_service.calls = 0
+        start = time.perf_counter()
+        for i in range(runs):
+            await store.search_layers(f"batched {i}", limit=5)
+        batched = (time.perf_counter() - start) / runs
+    finally:
+        await store.cleanup()
+
+    assert store.embedding_service.calls == runs
+    assert batched < separate
+    logger.info(
+        f"Two-layer retrieval: separate {separate * 1000:.1f} ms ({separate_embeddings // runs} embeddings), "
+        f"batched {batched * 1000:.1f} ms (1 embedding, 1 request)"
+    )
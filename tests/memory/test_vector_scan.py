@@ -0,0 +1,131 @@
+"""Tests for paged, filter-only scans of the vector store."""
+
+import pytest
+import time
+import uuid
+import logging
+from contextlib import aclosing
+from qdrant_client import models
+
+from nia.nova.memory.vector_store import VectorStore, point_id_for
+from nia.nova.memory.two_layer import EpisodicLayer
+from nia.nova.memory.consolidation_engine import unconsolidated_filter
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def vector_dimension():
+    """Scans never embed, so small vectors suffice."""
+    return 8
+
+@pytest.fixture
+def vector_store(vector_store):
+    """The shared in-process store, scanning in small pages."""
+    vector_store.scan_page_size = 100
+    return vector_store
+
+def _add_points(store: VectorStore, count: int, consolidated_every: int = 0):
+    """Upsert points directly; every nth one is already consolidated."""
+    points = []
+    for i in range(count):
+        memory_id = str(uuid.uuid4())
+        consolidated = bool(consolidated_every) and i % consolidated_every == 0
+        points.append(models.PointStruct(
+            id=point_id_for(memory_id),
+            vector=[1.0] * 8,
+            payload=store._build_payload(
+                f"memory {i}",
+                {"id": memory_id, "consolidated": consolidated},
+                "episodic"
+            )
+        ))
+    VectorStore._client_instance.upsert("test_collection", points=points)
+
+@pytest.mark.asyncio
+async def test_scan_reads_every_page_without_embedding(vector_store):
+    """A filtered scan covers the whole collection in bounded pages."""
+    _add_points(vector_store, 1050, consolidated_every=3)
+
+    seen = []
+    async for page in vector_store.scan_vectors(filter_conditions=unconsolidated_filter()):
+        assert len(page) <= 100
+        seen.extend(result["metadata"]["id"] for result in page)
+
+    assert len(seen) == 700
+    assert len(set(seen)) == 700
+    assert vector_store.embedding_service.calls == 0
+    assert "search" not in vector_store.get_metrics()
+
+@pytest.mark.asyncio
+async def test_scan_resumes_from_cursor(vector_store):
+    """A saved next_offset continues the scan where it stopped."""
+    _add_points(vector_store, 250)
+
+    async with aclosing(vector_store.scan_vectors(page_size=100)) as pages:
+        first = await pages.__anext__()
+    rest = []
+    async for page in vector_store.scan_vectors(page_size=100, offset=first.next_offset):
+        rest.extend(page)
+
+    assert len(first) == 100
+    assert len(rest) == 150
+    assert not {r["metadata"]["id"] for r in first} & {r["metadata"]["id"] for r in rest}
+
+@pytest.mark.asyncio
+async def test_scan_is_lazy(vector_store):
+    """Stopping after one page reads at most one page ahead."""
+    _add_points(vector_store, 1000)
+
+    async with aclosing(vector_store.scan_collection()) as pages:
+        async for page in pages:
+            assert {"id", "payload"} <= set(page[0])
+            break
+
+    assert vector_store.get_metrics()["scroll"]["count"] <= 2
+
+@pytest.mark.asyncio
+async def test_inspect_collection_is_not_truncated(vector_store):
+    """inspect_collection returns every point, or the first limit."""
+    _add_points(vector_store, 1200)
+
+    assert len(await vector_store.inspect_collection()) == 1200
+    assert len(await vector_store.inspect_collection(limit=150)) == 150
+
+@pytest.mark.asyncio
+async def test_consolidation_candidates_are_complete(vector_store):
+    """Every unconsolidated memory is a candidate, not just a search top-k."""
+    _add_points(vector_store, 300, consolidated_every=2)
+    episodic = EpisodicLayer(vector_store=vector_store)
+
+    pages = [page async for page in episodic.iter_consolidation_candidates(page_size=40)]
+
+    assert sum(len(page) for page in pages) == 150
+    assert max(len(page) for page in pages) == 40
+    assert len(await episodic.get_consolidation_candidates()) == 150
+    assert len(await episodic.get_consolidation_candidates(limit=7)) == 7
+    with pytest.raises(ValueError):
+        await episodic.get_consolidation_candidates(limit=None)
+    assert vector_store.embedding_service.calls == 0
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_scan_benchmark(vector_store):
+    """Report scan throughput over a 20k point collection."""
+    count = 20_000
+    _add_points(vector_store, count)
+    vector_store.scan_page_size = 500
+
+    start = time.perf_counter()
+    scanned = 0
+    largest = 0
+    async for page in vector_store.scan_collection():
+        scanned += len(page)
+        largest = max(largest, len(page))
+    elapsed = time.perf_counter() - start
+
+    assert scanned == count
+    assert largest == 500
+    logger.info(
+        f"Scanned {count} points in {elapsed:.2f}s ({count / elapsed:.0f}/s), "
+        f"{vector_store.get_metrics()['scroll']['count']} scroll requests of at most {largest}"
+    )
@@ -0,0 +1,242 @@
+"""Tests for the non-blocking Qdrant access path in VectorStore."""
+
+import pytest
+import pytest_asyncio
+import asyncio
+import time
+import logging
+import uuid
+from types import SimpleNamespace
+from typing import Dict, List, Any
+
+from nia.nova.memory.vector_store import VectorStore, OperationMetrics, point_id_for
+from nia.nova.memory.embedding import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+CALL_LATENCY = 0.05  # Simulated Qdrant round-trip in seconds
+
+class SlowQdrantClient:
+    """Blocking stand-in for QdrantClient with a fixed per-call latency."""
+
+    def __init__(self, latency: float = CALL_LATENCY):
+        self.latency = latency
+        self.points: List[Any] = []
+
+    def upsert(self, collection_name: str, points: List[Any], wait: bool = True):
+        time.sleep(self.latency)
+        self.points.extend(points)
+
+    def search(self, collection_name: str, query_vector: List[float], **kwargs):
+        time.sleep(self.latency)
+        return []
+
+    def scroll(self, collection_name: str, **kwargs):
+        time.sleep(self.latency)
+        return ([], None)
+
+    def get_collections(self):
+        return [SimpleNamespace(name="test_collection")]
+
+    def close(self):
+        pass
+
+@pytest_asyncio.fixture
+async def vector_store():
+    """Vector store wired to a slow blocking client."""
+    store = VectorStore(embedding_service=EmbeddingService(dimension=32))
+    store.max_concurrency = 8
+    store._collection_name = "test_collection"
+    VectorStore._client_instance = SlowQdrantClient()
+    yield store
+    await store.cleanup()
+
+async def _max_loop_gap(stop: asyncio.Event) -> float:
+    """Measure the longest event loop stall while stop is unset."""
+    max_gap = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.005)
+        now = time.perf_counter()
+        max_gap = max(max_gap, now - last)
+        last = now
+    return max_gap
+
+@pytest.mark.asyncio
+async def test_store_does_not_block_event_loop(vector_store):
+    """Event loop keeps ticking while upserts are in flight."""
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_max_loop_gap(stop))
+
+    await asyncio.gather(*[
+        vector_store.store_vector(content=f"memory {i}", metadata={"id": str(i)})
+        for i in range(16)
+    ])
+    stop.set()
+    max_gap = await monitor
+
+    assert len(VectorStore._client_instance.points) == 16
+    assert max_gap < CALL_LATENCY
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+async def test_concurrent_store_and_search_do_not_serialize(vector_store):
+    """Mixed store/search load completes in roughly calls / max_concurrency round-trips."""
+    requests = 32
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        vector_store.store_vector(content=f"memory {i}")
+        if i % 2 else
+        vector_store.search_vectors(content=f"query {i}")
+        for i in range(requests)
+    ])
+    elapsed = time.perf_counter() - start
+
+    serial_time = requests * CALL_LATENCY
+    logger.info(
+        f"{requests} requests: {elapsed:.3f}s concurrent vs {serial_time:.3f}s serial "
+        f"({serial_time / elapsed:.1f}x)"
+    )
+    assert elapsed < serial_time / 2
+
+@pytest.mark.asyncio
+async def test_latency_metrics_recorded(vector_store):
+    """Each client operation gets its own latency statistics."""
+    await vector_store.store_vector(content="hello")
+    await vector_store.search_vectors(content="hello")
+    await vector_store.inspect_collection()
+
+    metrics = vector_store.get_metrics()
+    assert set(metrics) >= {"upsert", "search", "scroll", "get_collections"}
+    assert metrics["upsert"]["count"] == 1
+    assert metrics["upsert"]["errors"] == 0
+    assert metrics["upsert"]["avg_ms"] >= CALL_LATENCY * 1000 * 0.9
+
+@pytest.mark.asyncio
+async def test_failed_calls_counted_as_errors(vector_store):
+    """Exceptions propagate and are counted against the operation."""
+    def fail(**kwargs):
+        raise RuntimeError("qdrant unavailable")
+    VectorStore._client_instance.upsert = fail
+
+    with pytest.raises(RuntimeError):
+        await vector_store.store_vector(content="hello")
+
+    assert vector_store.get_metrics()["upsert"]["errors"] == 1
+
+def test_operation_metrics_snapshot():
+    """Percentiles come from the rolling sample window."""
+    metrics = OperationMetrics(window=100)
+    for ms in range(1, 101):
+        metrics.record(float(ms), wait_ms=1.0)
+    snapshot = metrics.snapshot()
+
+    assert snapshot["count"] == 100
+    assert snapshot["max_ms"] == 100.0
+    assert snapshot["p50_ms"] == 51.0
+    assert snapshot["p95_ms"] == 96.0
+    assert snapshot["avg_wait_ms"] == 1.0
+
+@pytest_asyncio.fixture
+async def local_store():
+    """Vector store backed by an in-process Qdrant collection."""
+    from qdrant_client import QdrantClient, models
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        collection_name="test_collection",
+        vectors_config=models.VectorParams(size=32, distance=models.Distance.COSINE)
+    )
+    VectorStore._client_instance = client
+    store = VectorStore(embedding_service=EmbeddingService(dimension=32))
+    store._collection_name = "test_collection"
+    yield store
+    await store.cleanup()
+
+def test_point_id_for_is_deterministic():
+    """Memory ids map to stable UUIDv5 point ids."""
+    assert point_id_for("thread-1") == point_id_for("thread-1")
+    assert point_id_for("thread-1") != point_id_for("thread-2")
+    assert uuid.UUID(point_id_for("thread-1")).version == 5
+
+@pytest.mark.asyncio
+async def test_repeated_store_is_idempotent(local_store):
+    """Storing the same memory id twice overwrites a single point."""
+    await local_store.store_vector(content="v1", metadata={"id": "thread-1"})
+    await local_store.store_vector(content="v2", metadata={"id": "thread-1"})
+
+    points, _ = VectorStore._client_instance.scroll("test_collection", limit=10)
+    assert len(points) == 1
+    assert points[0].id == point_id_for("thread-1")
+    assert points[0].payload["content"] == "v2"
+
+@pytest.mark.asyncio
+async def test_get_vectors_by_id(local_store):
+    """Memories are fetched by id with retrieve, no embedding needed."""
+    await local_store.store_vectors([
+        {"content": f"memory {i}", "metadata": {"id": f"m{i}"}} for i in range(5)
+    ])
+    local_store.embedding_service = None  # Any embedding attempt would fail
+
+    results = await local_store.get_vectors(["m1", "m3", "missing"])
+
+    assert set(results) == {"m1", "m3"}
+    assert results["m3"]["content"] == "memory 3"
+    assert local_store.get_metrics()["retrieve"]["count"] == 1
+
+@pytest.mark.asyncio
+async def test_get_vectors_finds_legacy_points(local_store):
+    """Points stored under random ids are found through the metadata_id filter."""
+    from qdrant_client import models
+    VectorStore._client_instance.upsert("test_collection", points=[models.PointStruct(
+        id=str(uuid.uuid4()),
+        vector=[1.0] * 32,
+        payload={"content": "legacy", "metadata_id": "old-1"}
+    )])
+
+    results = await local_store.get_vectors(["old-1"])
+
+    assert results["old-1"]["content"] == "legacy"
+
+@pytest.mark.asyncio
+async def test_get_vectors_pages_legacy_fallback(local_store):
+    """Repeated legacy points for one id do not hide the other ids."""
+    from qdrant_client import models
+    VectorStore._client_instance.upsert("test_collection", points=[
+        models.PointStruct(
+            id=str(uuid.uuid4()),
+            vector=[1.0] * 32,
+            payload={"content": f"legacy {memory_id}", "metadata_id": memory_id}
+        )
+        for memory_id in ["old-1"] * 5 + ["old-2", "old-3"]
+    ])
+
+    results = await local_store.get_vectors(["old-1", "old-2", "old-3"])
+
+    assert set(results) == {"old-1", "old-2", "old-3"}
+
+@pytest.mark.asyncio
+async def test_update_metadata_by_memory_id(local_store):
+    """Metadata updates reach points stored under derived and legacy ids."""
+    from qdrant_client import models
+    await local_store.store_vector(content="x", metadata={"id": "m1"})
+    VectorStore._client_instance.upsert("test_collection", points=[models.PointStruct(
+        id=str(uuid.uuid4()),
+        vector=[1.0] * 32,
+        payload={"content": "legacy", "metadata_id": "old-1"}
+    )])
+
+    await local_store.update_metadata("m1", {"consolidated": True})
+    await local_store.update_metadata("old-1", {"consolidated": True})
+
+    results = await local_store.get_vectors(["m1", "old-1"])
+    assert all(r["metadata"]["consolidated"] is True for r in results.values())
+
+@pytest.mark.asyncio
+async def test_delete_vectors_by_memory_id(local_store):
+    """Deleting by memory id removes the stored point."""
+    await local_store.store_vector(content="x", metadata={"id": "m1"})
+    await local_store.store_vector(content="y", metadata={"id": "m2"})
+
+    await local_store.delete_vector("m1")
+
+    assert set(await local_store.get_vectors(["m1", "m2"])) == {"m2"}
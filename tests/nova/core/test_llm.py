@@ -1,10 +1,14 @@
 """Unit tests for LM Studio LLM implementation."""
 
 import pytest
+import pytest_asyncio
+import time
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, Any, List, AsyncIterator, Union
 import json
 import aiohttp
+from aiohttp import web
 from datetime import datetime
 from pydantic import BaseModel
 
@@ -249,3 +253,95 @@ async def test_structured_completion(llm, mock_response):
         assert result.response == "Test analysis"
         assert len(result.concepts) == 2
         assert result.metadata["test"] == "metadata"
+
+class SlowStreamServer:
+    """Local stub that streams SSE chunks with a delay between tokens."""
+
+    def __init__(self, tokens: List[str], delay: float):
+        self.tokens = tokens
+        self.delay = delay
+        self.closed = asyncio.Event()
+
+    async def completions(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        try:
+            for i, token in enumerate(self.tokens):
+                final = i == len(self.tokens) - 1
+                event = json.dumps({"choices": [{
+                    "delta": {"content": token},
+                    "finish_reason": "stop" if final else None
+                }]})
+                line = f"data: {event}\n\n".encode()
+                # Split events across writes to exercise incremental framing
+                await response.write(line[:10])
+                await response.write(line[10:])
+                await asyncio.sleep(self.delay)
+            await response.write(b"data: [DONE]\n\n")
+        finally:
+            self.closed.set()
+        return response
+
+@pytest_asyncio.fixture
+async def slow_server():
+    """Run the slow streaming stub on a free local port."""
+    server = SlowStreamServer(["Hello", ",", " streaming", " world"], delay=0.2)
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", server.completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    server.api_base = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/v1"
+    yield server
+    await runner.cleanup()
+
+@pytest.mark.asyncio
+async def test_time_to_first_chunk(slow_server):
+    """The first chunk arrives before the server finishes streaming."""
+    llm = LMStudioLLM(chat_model="test_model", api_base=slow_server.api_base)
+    start = time.perf_counter()
+
+    stream = await llm.generate("Test prompt", stream=True)
+    arrivals, chunks = [], []
+    async for chunk in stream:
+        arrivals.append(time.perf_counter() - start)
+        chunks.append(chunk)
+    await llm.close()
+
+    assert arrivals[0] < 0.15
+    assert arrivals[-1] >= 0.6
+    assert "".join(c["data"]["content"] for c in chunks) == "Hello, streaming world"
+    assert [c["data"]["is_final"] for c in chunks] == [False, False, False, True]
+
+@pytest.mark.asyncio
+async def test_abandoned_stream_releases_connection(slow_server):
+    """Closing the iterator early releases the response."""
+    llm = LMStudioLLM(chat_model="test_model", api_base=slow_server.api_base)
+
+    stream = await llm.analyze({"text": "test"}, template="parsing_analysis", stream=True)
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert first["data"]["content"] == "Hello"
+    assert not llm._session.connector._acquired
+    await llm.close()
+
+@pytest.mark.asyncio
+async def test_analyze_fields_streams_closed_fields(llm):
+    """Top-level fields are yielded while later ones are still streaming."""
+    pieces = ['Here you go: {"concepts": [{"name": "A"}', '], "key_points": ["p1",', ' "p2",]', ', "unfinished": "']
+
+    async def generate_chunks():
+        for piece in pieces:
+            yield f"data: {json.dumps({'choices': [{'delta': {'content': piece}}]})}\n".encode()
+
+    response = MagicMock()
+    response.content.iter_any = generate_chunks
+    with patch.object(llm, "_make_request", AsyncMock(return_value=response)):
+        events = [e async for e in llm.analyze_fields({"text": "test"}, template="parsing_analysis")]
+
+    assert [(e["data"]["field"], e["data"]["value"]) for e in events] == [
+        ("concepts", [{"name": "A"}]),
+        ("key_points", ["p1", "p2"])
+    ]
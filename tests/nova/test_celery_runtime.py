@@ -0,0 +1,169 @@
+"""Tests for the per-worker async runtime used by Celery tasks."""
+
+import pytest
+import time
+import asyncio
+import logging
+from typing import Any, Dict, List
+
+from nia.nova.core import celery_app
+from nia.nova.core.celery_app import (
+    WorkerRuntime,
+    runtime,
+    store_chat_message,
+    store_events
+)
+from nia.memory.two_layer import TwoLayerMemorySystem
+
+logger = logging.getLogger(__name__)
+
+CONNECT_LATENCY = 0.005  # Simulated driver/session setup in seconds
+
+class LoopBoundEpisodic:
+    """Episodic layer stand-in whose connections are bound to one event loop."""
+
+    def __init__(self):
+        self.store = object()
+        self.loop = None
+        self.connects = 0
+        self.stored: List[Any] = []
+        self.bulk_calls = 0
+
+    async def connect(self):
+        self.loop = asyncio.get_running_loop()
+        self.connects += 1
+        await asyncio.sleep(CONNECT_LATENCY)
+
+    async def _ensure_connected(self):
+        # Drivers bound to a dead loop have to be recreated
+        if self.loop is not asyncio.get_running_loop():
+            await self.connect()
+
+    async def store_memory(self, memory) -> bool:
+        await self._ensure_connected()
+        self.stored.append(memory)
+        return True
+
+    async def store_memories(self, memories) -> List[Dict[str, Any]]:
+        await self._ensure_connected()
+        self.bulk_calls += 1
+        self.stored.extend(memories)
+        return [{"id": m.id, "success": True, "error": None} for m in memories]
+
+def _memory_system() -> TwoLayerMemorySystem:
+    system = TwoLayerMemorySystem(vector_store=None)
+    system.episodic = LoopBoundEpisodic()
+    return system
+
+@pytest.fixture
+def worker():
+    """Process runtime with a stand-in memory system; stopped afterwards."""
+    runtime.stop()
+    system = _memory_system()
+    runtime.start()
+    runtime._memory_system = system
+    runtime.run(system.episodic.connect())
+    yield system
+    runtime._memory_system = None
+    runtime.stop()
+
+def test_tasks_share_one_loop_and_connection(worker):
+    """Consecutive tasks reuse the loop and the initialized memory system."""
+    for i in range(5):
+        result = store_chat_message({"content": f"hello {i}", "sender_id": "user"})
+        assert result["content"] == f"hello {i}"
+
+    assert worker.episodic.connects == 1
+    assert len(worker.episodic.stored) == 5
+
+def test_store_events_batches_writes(worker):
+    """A batch of mixed events is written with one store_memories call."""
+    results = store_events([
+        {"type": "chat_message", "data": {"content": "hi"}},
+        {"type": "task_update", "data": {"task_id": "t1", "status": "done"}},
+        {"type": "agent_status", "data": {"agent_id": "a1", "status": "idle"}}
+    ])
+
+    assert [r["type"] for r in results] == ["chat_message", "task_update", "agent_status"]
+    assert worker.episodic.bulk_calls == 1
+    assert len(worker.episodic.stored) == 3
+
+def test_runtime_restarts_after_fork(monkeypatch):
+    """A runtime inherited by a forked child starts a fresh loop."""
+    worker_runtime = WorkerRuntime()
+    worker_runtime.start()
+    parent_loop, parent_thread = worker_runtime._loop, worker_runtime._thread
+
+    monkeypatch.setattr(celery_app.os, "getpid", lambda: -1)
+    assert not worker_runtime.running
+    worker_runtime.start()
+
+    assert worker_runtime._loop is not parent_loop
+    assert worker_runtime.run(asyncio.sleep(0, result=42)) == 42
+    worker_runtime.stop()
+    parent_loop.call_soon_threadsafe(parent_loop.stop)
+    parent_thread.join(timeout=5)
+    parent_loop.close()
+    assert not parent_thread.is_alive()
+
+def test_run_times_out_and_cancels():
+    """A coroutine exceeding the task timeout raises and is cancelled."""
+    worker_runtime = WorkerRuntime(task_timeout=0.05)
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    try:
+        with pytest.raises(TimeoutError):
+            worker_runtime.run(slow())
+        assert worker_runtime.run(asyncio.sleep(0.1, result="done"), timeout=0) == "done"
+    finally:
+        worker_runtime.stop()
+    assert cancelled == [True]
+
+def test_single_event_store_failure_is_reported(worker):
+    """A rejected single write returns an error and is not broadcast."""
+    async def reject(memory) -> bool:
+        return False
+    worker.episodic.store_memory = reject
+
+    result = store_chat_message({"content": "hi", "client_id": "c1"})
+
+    assert result["error"] == "Failed to store memory"
+
+@pytest.mark.performance
+def test_task_throughput_benchmark(worker):
+    """Compare per-call event loops against the persistent worker runtime."""
+    count = 200
+    legacy_system = _memory_system()
+
+    def legacy_run_async(coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    async def legacy_get_memory_system():
+        await legacy_system.episodic._ensure_connected()
+        return legacy_system
+
+    start = time.perf_counter()
+    for i in range(count):
+        system = legacy_run_async(legacy_get_memory_system())
+        legacy_run_async(system.episodic.store_memory({"content": i}))
+    before = count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(count):
+        store_chat_message({"content": f"message {i}"})
+    after = count / (time.perf_counter() - start)
+
+    logger.info(f"{count} tasks: per-call loops {before:.0f}/s, worker runtime {after:.0f}/s")
+    assert worker.episodic.connects == 1
+    assert after > before
@@ -0,0 +1,223 @@
+"""Tests for set-based task validation, bulk endpoints and the task board."""
+
+import time
+import asyncio
+import logging
+import pytest
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException
+
+from nia.nova.core.models import TaskNode, TaskState, TaskTransitionRequest
+from nia.nova.endpoints.tasks_endpoints import (
+    validate_task,
+    create_task,
+    create_tasks,
+    transition_task_state,
+    transition_task_states,
+    get_task_board
+)
+
+logger = logging.getLogger(__name__)
+
+class FakeSemanticStore:
+    """In-memory stand-in for the task Cypher, counting round-trips."""
+
+    def __init__(self, latency: float = 0.0):
+        self.concepts: Dict[str, Dict[str, Any]] = {}
+        self.depends_on: Dict[str, int] = {}
+        self.latency = latency
+        self.queries = 0
+
+    async def run_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        self.queries += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        params = params or {}
+        if "UNWIND $deps" in query:
+            return [{"missing": [d for d in params["deps"] if d not in self.concepts]}]
+        if "MATCH (t:Concept {name: $dep_id})" in query:
+            return [{"exists": int(params["dep_id"] in self.concepts)}]
+        if "UNWIND $tasks" in query:
+            for task in params["tasks"]:
+                self.concepts.setdefault(task["id"], {}).update(
+                    {
+                        **task,
+                        "name": task["id"],
+                        "type": "task",
+                        "description": task["label"],
+                        "status": TaskState(task["status"]).value
+                    }
+                )
+            return []
+        if "UNWIND $ids" in query:
+            return [
+                {
+                    "id": id,
+                    "status": self.concepts[id]["status"],
+                    "domain": self.concepts[id].get("domain"),
+                    "dep_count": self.depends_on.get(id, 0)
+                }
+                for id in params["ids"] if id in self.concepts
+            ]
+        if "UNWIND $updates" in query:
+            for update in params["updates"]:
+                self.concepts[update["name"]]["status"] = TaskState(update["status"]).value
+            return []
+        if "collect(t {.*" in query:
+            by_status: Dict[str, List[Dict[str, Any]]] = {}
+            for concept in self.concepts.values():
+                if concept.get("type") == "task":
+                    by_status.setdefault(concept["status"], []).append({**concept, "id": concept["name"]})
+            return [{"status": s, "tasks": tasks} for s, tasks in by_status.items()]
+        if "SET t.status = $status" in query:
+            self.concepts[params["name"]]["status"] = TaskState(params["status"]).value
+            return []
+        return []
+
+@pytest.fixture
+def memory_system():
+    """Memory system over a fake semantic store and mocked episodic layer."""
+    memory_system = MagicMock()
+    memory_system.semantic = FakeSemanticStore()
+    memory_system.episodic = MagicMock()
+    memory_system.episodic.store = AsyncMock()
+    memory_system.episodic.store_memories = AsyncMock(return_value=[])
+    memory_system.validate_domain_access = AsyncMock()
+    return memory_system
+
+def _seed(store: FakeSemanticStore, count: int, status: str = "pending") -> List[str]:
+    ids = [f"dep-{i}" for i in range(count)]
+    for id in ids:
+        store.concepts[id] = {"name": id, "type": "task", "status": status}
+    return ids
+
+@pytest.mark.asyncio
+async def test_validate_task_checks_dependencies_in_one_query(memory_system):
+    """Missing dependencies are reported from a single UNWIND lookup."""
+    deps = _seed(memory_system.semantic, 150) + ["ghost-1", "ghost-2"]
+    task = TaskNode(id="t1", label="Task", dependencies=deps)
+
+    with pytest.raises(HTTPException) as exc:
+        await validate_task(task, memory_system)
+
+    assert exc.value.detail == "Dependency ghost-1 does not exist"
+    assert memory_system.semantic.queries == 1
+
+@pytest.mark.asyncio
+async def test_create_task_stores_with_one_write(memory_system):
+    """A valid task costs one dependency check and one write."""
+    deps = _seed(memory_system.semantic, 120)
+    result = await create_task(TaskNode(id="t1", label="Task", dependencies=deps), memory_system)
+
+    assert result["success"]
+    assert memory_system.semantic.concepts["t1"]["description"] == "Task"
+    assert memory_system.semantic.queries == 2
+
+@pytest.mark.asyncio
+async def test_create_tasks_allows_intra_batch_dependencies(memory_system):
+    """Bulk create validates once and writes all tasks in one statement."""
+    _seed(memory_system.semantic, 5)
+    tasks = [
+        TaskNode(id=f"t{i}", label=f"Task {i}", dependencies=["dep-0", f"t{i - 1}"] if i else ["dep-1"])
+        for i in range(50)
+    ]
+
+    result = await create_tasks(tasks, memory_system)
+
+    assert result["count"] == 50
+    assert all(f"t{i}" in memory_system.semantic.concepts for i in range(50))
+    assert memory_system.semantic.queries == 2
+
+@pytest.mark.asyncio
+async def test_create_tasks_rejects_whole_batch(memory_system):
+    """One invalid task keeps the rest of the batch from being written."""
+    tasks = [TaskNode(id="good", label="Good"), TaskNode(id="bad", label="Bad", dependencies=["ghost"])]
+
+    with pytest.raises(HTTPException) as exc:
+        await create_tasks(tasks, memory_system)
+
+    assert exc.value.status_code == 400
+    assert [entry["taskId"] for entry in exc.value.detail["invalid"]] == ["bad"]
+    assert "good" not in memory_system.semantic.concepts
+
+@pytest.mark.asyncio
+async def test_transition_task_state_uses_fetched_dep_count(memory_system):
+    """Blocking reuses the dependency count loaded with the current state."""
+    memory_system.semantic.concepts["t1"] = {"name": "t1", "type": "task", "status": "in_progress"}
+    memory_system.semantic.depends_on["t1"] = 3
+
+    result = await transition_task_state("t1", TaskState.BLOCKED, memory_system)
+
+    assert result["success"]
+    assert memory_system.semantic.concepts["t1"]["status"] == "blocked"
+    assert memory_system.semantic.queries == 2
+
+@pytest.mark.asyncio
+async def test_transition_task_states_bulk(memory_system):
+    """Bulk transitions read and write once, then batch episodic storage."""
+    ids = _seed(memory_system.semantic, 30)
+    transitions = [TaskTransitionRequest(task_id=id, new_state=TaskState.IN_PROGRESS) for id in ids]
+
+    result = await transition_task_states(transitions, memory_system)
+
+    assert len(result["transitions"]) == 30
+    assert {c["status"] for c in memory_system.semantic.concepts.values()} == {"in_progress"}
+    assert memory_system.semantic.queries == 2
+    memory_system.episodic.store_memories.assert_awaited_once()
+    assert len(memory_system.episodic.store_memories.await_args.args[0]) == 30
+
+@pytest.mark.asyncio
+async def test_transition_task_states_rejects_invalid(memory_system):
+    """An invalid transition rejects the batch without writing."""
+    ids = _seed(memory_system.semantic, 2)
+    memory_system.semantic.concepts[ids[1]]["status"] = "completed"
+    transitions = [TaskTransitionRequest(task_id=id, new_state=TaskState.IN_PROGRESS) for id in ids]
+
+    with pytest.raises(HTTPException) as exc:
+        await transition_task_states(transitions, memory_system)
+
+    assert [entry["taskId"] for entry in exc.value.detail["invalid"]] == [ids[1]]
+    assert memory_system.semantic.concepts[ids[0]]["status"] == "pending"
+
+@pytest.mark.asyncio
+async def test_get_task_board_single_query(memory_system):
+    """The board groups every task by state from one query."""
+    _seed(memory_system.semantic, 4)
+    memory_system.semantic.concepts["dep-3"]["status"] = "completed"
+
+    board = await get_task_board(memory_system)
+
+    assert [len(board["tasks"][s.value]) for s in TaskState] == [3, 0, 0, 1]
+    assert board["totalTasks"] == 4
+    assert memory_system.semantic.queries == 1
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_dependency_validation_benchmark():
+    """Compare per-dependency and set-based validation at 1ms per round-trip."""
+    for dep_count in (10, 100, 500):
+        store = FakeSemanticStore(latency=0.001)
+        memory_system = MagicMock(semantic=store)
+        deps = _seed(store, dep_count)
+        task = TaskNode(id="t1", label="Task", dependencies=deps)
+
+        start = time.perf_counter()
+        for dep in deps:
+            await store.run_query(
+                "MATCH (t:Concept {name: $dep_id}) RETURN count(t) as exists",
+                {"dep_id": dep}
+            )
+        legacy_ms = (time.perf_counter() - start) * 1000
+
+        store.queries = 0
+        start = time.perf_counter()
+        await validate_task(task, memory_system)
+        set_based_ms = (time.perf_counter() - start) * 1000
+
+        assert store.queries == 1
+        assert set_based_ms < legacy_ms
+        logger.info(
+            f"{dep_count:4d} deps: per-dependency {legacy_ms:8.2f} ms ({dep_count} queries), "
+            f"set-based {set_based_ms:6.2f} ms (1 query)"
+        )
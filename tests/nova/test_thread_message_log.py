@@ -0,0 +1,229 @@
+"""Tests for the append-only thread message log."""
+
+import pytest
+import time
+import json
+import uuid
+import logging
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+from nia.nova.core.thread_manager import ThreadManager
+from nia.nova.core.error_handling import ResourceNotFoundError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+class FakeSemanticStore:
+    """In-memory stand-in for the Neo4j queries ThreadManager issues."""
+
+    def __init__(self):
+        self.threads: Dict[str, Dict[str, Any]] = {}
+        self.messages: Dict[tuple, Dict[str, Any]] = {}
+        self.queries: List[str] = []
+
+    def _log(self, thread_id: str) -> List[Dict[str, Any]]:
+        return sorted((m for (tid, _), m in self.messages.items() if tid == thread_id), key=lambda m: m["seq"])
+
+    async def run_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        params = params or {}
+        self.queries.append(query)
+        if "SET t.messages_migrated = true" in query:
+            thread = self.threads.get(params["thread_id"])
+            if thread is None or thread.get("messages_migrated") is not None:
+                # Like Neo4j, an aggregate without a grouping key still returns a row
+                return [] if "WITH t, count(m)" in query else [{"shifted": 0}]
+            thread["messages_migrated"] = True
+            thread["message_count"] = thread.get("message_count", 0) + params["count"]
+            shifted = self._log(params["thread_id"])
+            for m in shifted:
+                del self.messages[(params["thread_id"], m["seq"])]
+            for m in shifted:
+                m["seq"] += params["count"]
+                self.messages[(params["thread_id"], m["seq"])] = m
+            return [{"id": params["thread_id"], "shifted": len(shifted)}]
+        if "RETURN t.messages_migrated" in query:
+            thread = self.threads.get(params["thread_id"])
+            return [] if thread is None else [{"migrated": thread.get("messages_migrated")}]
+        if "UNWIND $messages" in query:
+            for message in params["messages"]:
+                self.messages[(params["thread_id"], message["seq"])] = dict(message)
+            return []
+        if "UNWIND $thread_ids" in query:
+            rows = []
+            for thread_id in params["thread_ids"]:
+                recent = self._log(thread_id)[-params["limit"]:]
+                if recent:
+                    rows.append({
+                        "thread_id": thread_id,
+                        "messages": [{"seq": m["seq"], "payload": m["payload"]} for m in recent]
+                    })
+            return rows
+        if "CREATE (m:ThreadMessage" in query:
+            thread = self.threads.get(params["thread_id"])
+            if thread is None:
+                return []
+            thread["message_count"] = thread.get("message_count", 0) + 1
+            seq = thread["message_count"]
+            self.messages[(params["thread_id"], seq)] = {**params, "seq": seq}
+            return [{"seq": seq}]
+        if "MATCH (m:ThreadMessage" in query and "RETURN" in query:
+            cursor = params["cursor"]
+            rows = self._log(params["thread_id"])
+            if "ASC" in query:
+                rows = [m for m in rows if m["seq"] > cursor][params["offset"]:]
+            else:
+                rows = [m for m in reversed(rows) if cursor is None or m["seq"] < cursor]
+            return [{"seq": m["seq"], "payload": m["payload"]} for m in rows[:params["limit"]]]
+        return []
+
+def _legacy_message(content: str) -> Dict[str, Any]:
+    """A message as embedded in thread documents before the message log."""
+    return {
+        "type": "thread_message",
+        "timestamp": "2026-01-01T00:00:00+00:00",
+        "client_id": "system",
+        "data": {"content": content},
+        "thread_id": "legacy",
+        "sender_id": "system"
+    }
+
+@pytest.fixture
+def thread_manager():
+    """Thread manager over a fake semantic store and mocked episodic layer."""
+    memory_system = MagicMock()
+    memory_system.semantic = FakeSemanticStore()
+    memory_system.episodic = MagicMock()
+    memory_system.episodic.store_memory = AsyncMock()
+    manager = ThreadManager(memory_system)
+    manager.thread_id = str(uuid.uuid4())
+    memory_system.semantic.threads[manager.thread_id] = {}
+    return manager
+
+@pytest.mark.asyncio
+async def test_add_message_appends_without_rewriting_thread(thread_manager):
+    """Posting assigns increasing seqs and never re-stores the thread."""
+    thread_manager.get_thread = AsyncMock()
+    first = await thread_manager.add_message(thread_manager.thread_id, {"content": "a"})
+    second = await thread_manager.add_message(thread_manager.thread_id, {"content": "b"})
+
+    assert (first["seq"], second["seq"]) == (1, 2)
+    assert second["data"]["content"] == "b"
+    thread_manager.get_thread.assert_not_called()
+    thread_manager.memory_system.episodic.store_memory.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_add_message_unknown_thread(thread_manager):
+    """Posting to a thread without a header raises once get_thread finds nothing."""
+    thread_manager.get_thread = AsyncMock()
+    with pytest.raises(ResourceNotFoundError):
+        await thread_manager.add_message(str(uuid.uuid4()), {"content": "a"})
+
+@pytest.mark.asyncio
+async def test_get_thread_messages_cursor_pagination(thread_manager):
+    """Pages walk backwards from the newest and forwards from a cursor."""
+    thread_manager.get_thread = AsyncMock()
+    for i in range(25):
+        await thread_manager.add_message(thread_manager.thread_id, {"content": f"m{i}"})
+
+    newest = await thread_manager.get_thread_messages(thread_manager.thread_id, limit=10)
+    assert [m["seq"] for m in newest["messages"]] == list(range(16, 26))
+    assert newest["has_more"] and newest["next_cursor"] == 16
+
+    older = await thread_manager.get_thread_messages(
+        thread_manager.thread_id, before=newest["next_cursor"], limit=10
+    )
+    assert [m["seq"] for m in older["messages"]] == list(range(6, 16))
+
+    forward = await thread_manager.get_thread_messages(thread_manager.thread_id, after=20, limit=10)
+    assert [m["seq"] for m in forward["messages"]] == list(range(21, 26))
+    assert not forward["has_more"] and forward["next_cursor"] is None
+
+    skipped = await thread_manager.get_thread_messages(thread_manager.thread_id, offset=10, limit=10)
+    assert [m["seq"] for m in skipped["messages"]] == list(range(11, 21))
+    assert skipped["has_more"] and skipped["next_cursor"] == 20
+
+@pytest.mark.asyncio
+async def test_get_thread_messages_unknown_thread(thread_manager):
+    """An unknown thread is not found rather than an empty page."""
+    with pytest.raises(ResourceNotFoundError):
+        await thread_manager.get_thread_messages(str(uuid.uuid4()))
+
+@pytest.mark.asyncio
+async def test_get_thread_messages_validates_limit(thread_manager):
+    """Page sizes outside 1..MAX_MESSAGE_PAGE_SIZE and negative offsets are rejected."""
+    for kwargs in ({"limit": 0}, {"limit": ThreadManager.MAX_MESSAGE_PAGE_SIZE + 1}, {"offset": -1}):
+        with pytest.raises(ValidationError):
+            await thread_manager.get_thread_messages(thread_manager.thread_id, **kwargs)
+
+@pytest.mark.asyncio
+async def test_legacy_messages_migrated_on_read(thread_manager):
+    """Embedded history moves into the log ahead of messages appended since."""
+    semantic = thread_manager.memory_system.semantic
+    thread_id = thread_manager.thread_id
+    thread = {"id": thread_id, "messages": [_legacy_message(f"old {i}") for i in range(5)]}
+    thread_manager.memory_system.episodic.store.search_vectors = AsyncMock(return_value=[{"content": thread}])
+    thread_manager.LEGACY_MIGRATION_BATCH_SIZE = 2
+    await thread_manager.add_message(thread_id, {"content": "new"})
+
+    page = await thread_manager.get_thread_messages(thread_id)
+    contents = [m["data"]["content"] for m in page["messages"]]
+    assert contents == ["old 0", "old 1", "old 2", "old 3", "old 4", "new"]
+    assert [m["seq"] for m in page["messages"]] == list(range(1, 7))
+    assert sum("UNWIND $messages" in q for q in semantic.queries) == 3
+
+    hydrated = await thread_manager.get_thread(thread_id)
+    assert [m["seq"] for m in hydrated["messages"]] == list(range(1, 7))
+    assert sum("SET t.messages_migrated" in q for q in semantic.queries) == 1
+
+@pytest.mark.asyncio
+async def test_migrated_thread_not_remigrated_after_restart(thread_manager):
+    """A new process reading a migrated thread leaves its log untouched."""
+    semantic = thread_manager.memory_system.semantic
+    thread_id = thread_manager.thread_id
+    thread = {"id": thread_id, "messages": [_legacy_message(f"old {i}") for i in range(3)]}
+    thread_manager.memory_system.episodic.store.search_vectors = AsyncMock(return_value=[{"content": thread}])
+    hydrated = await thread_manager.get_thread(thread_id)
+    before = dict(semantic.messages)
+
+    # The hydrated page is what update_thread writes back into the document
+    restarted = ThreadManager(thread_manager.memory_system)
+    thread_manager.memory_system.episodic.store.search_vectors = AsyncMock(return_value=[{"content": hydrated}])
+    again = await restarted.get_thread(thread_id)
+
+    assert semantic.messages == before
+    assert [m["seq"] for m in again["messages"]] == [1, 2, 3]
+    assert sum("UNWIND $messages" in q for q in semantic.queries) == 1
+
+@pytest.mark.asyncio
+async def test_list_threads_hydrates_in_one_query(thread_manager):
+    """Listed threads carry their logged messages, loaded in one batched query."""
+    semantic = thread_manager.memory_system.semantic
+    thread_manager.get_thread = AsyncMock()
+    other = str(uuid.uuid4())
+    semantic.threads[other] = {}
+    await thread_manager.add_message(thread_manager.thread_id, {"content": "a"})
+    thread_manager.memory_system.episodic.store.search_vectors = AsyncMock(return_value=[
+        {"content": {"id": thread_manager.thread_id, "messages": []}},
+        {"content": {"id": other, "messages": []}}
+    ])
+
+    threads = await thread_manager.list_threads()
+    assert [len(t["messages"]) for t in threads] == [1, 0]
+    assert threads[0]["messages"][0]["data"]["content"] == "a"
+    assert sum("UNWIND $thread_ids" in q for q in semantic.queries) == 1
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+async def test_post_cost_constant_as_thread_grows(thread_manager):
+    """Per-message posting time does not grow with thread length."""
+    count, window = 20_000, 1_000
+    timings = []
+    for i in range(count):
+        start = time.perf_counter()
+        await thread_manager.add_message(thread_manager.thread_id, {"content": f"message {i}"})
+        timings.append(time.perf_counter() - start)
+
+    first = sum(timings[:window]) / window
+    last = sum(timings[-window:]) / window
+    logger.info(f"avg post: first {window} {first * 1e6:.0f}us, last {window} {last * 1e6:.0f}us")
+    assert last < first * 3
@@ -0,0 +1,288 @@
+"""Tests for queued fan-out broadcasts in ConnectionManager."""
+
+import pytest
+import time
+import json
+import asyncio
+import logging
+from typing import List, Optional
+from fastapi import WebSocketDisconnect
+
+from nia.core.change_feed import change_feed
+from nia.nova.core.websocket_server import ConnectionManager, WebSocketServer
+
+logger = logging.getLogger(__name__)
+
+class SimulatedWebSocket:
+    """WebSocket stand-in that records sent text, optionally stalling."""
+
+    def __init__(self, delay: float = 0.0, stall: Optional[asyncio.Event] = None, fail: bool = False):
+        self.delay = delay
+        self.stall = stall
+        self.fail = fail
+        self.received: List[dict] = []
+        self.closed_with: Optional[int] = None
+
+    async def send_json(self, data: dict):
+        raise AssertionError("Messages must go through the client's sender")
+
+    async def send_text(self, text: str):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        if json.loads(text)["type"] == "connection_success":
+            return
+        if self.stall:
+            await self.stall.wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received.append(json.loads(text))
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        self.closed_with = code
+
+async def _connect(manager: ConnectionManager, count: int, **kwargs) -> List[SimulatedWebSocket]:
+    sockets = []
+    for i in range(count):
+        websocket = SimulatedWebSocket(**kwargs)
+        await manager.connect(websocket, f"{'slow' if kwargs else 'client'}-{i}", "chat")
+        sockets.append(websocket)
+    return sockets
+
+async def _wait_for(predicate, timeout: float = 5.0):
+    """Poll until predicate() holds or the timeout passes."""
+    deadline = time.perf_counter() + timeout
+    while not predicate() and time.perf_counter() < deadline:
+        await asyncio.sleep(0.005)
+
+@pytest.mark.asyncio
+async def test_broadcast_does_not_wait_for_slow_client():
+    """A stalled client does not delay delivery to the others."""
+    manager = ConnectionManager()
+    stall = asyncio.Event()
+    fast = await _connect(manager, 3)
+    slow = await _connect(manager, 1, stall=stall)
+
+    await asyncio.wait_for(manager.broadcast({"type": "chat_message", "n": 1}, "chat"), 1)
+    await asyncio.sleep(0.05)
+
+    assert all(len(ws.received) == 1 for ws in fast)
+    assert slow[0].received == []
+    stall.set()
+    await _wait_for(lambda: slow[0].received)
+    assert len(slow[0].received) == 1
+
+@pytest.mark.asyncio
+async def test_drop_oldest_policy_bounds_queue():
+    """Overflowing messages evict the oldest queued ones."""
+    manager = ConnectionManager(send_queue_size=3, slow_consumer_policy="drop_oldest")
+    stall = asyncio.Event()
+    slow = (await _connect(manager, 1, stall=stall))[0]
+
+    await manager.broadcast({"type": "update", "n": 0}, "chat")
+    await asyncio.sleep(0.01)
+    for n in range(1, 10):
+        await manager.broadcast({"type": "update", "n": n}, "chat")
+    stall.set()
+    await _wait_for(lambda: len(slow.received) == 4)
+
+    # The first message was already taken by the writer before stalling
+    assert [m["n"] for m in slow.received] == [0, 7, 8, 9]
+    assert manager.get_metrics()["dropped"] == 6
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_keeps_latest_per_type():
+    """Coalescing replaces the queued message of the same type."""
+    manager = ConnectionManager(send_queue_size=2, slow_consumer_policy="coalesce")
+    stall = asyncio.Event()
+    slow = (await _connect(manager, 1, stall=stall))[0]
+
+    await manager.broadcast({"type": "status", "n": 0}, "chat")
+    await asyncio.sleep(0.01)
+    await manager.broadcast({"type": "status", "n": 1}, "chat")
+    await manager.broadcast({"type": "chat_message", "n": 2}, "chat")
+    await manager.broadcast({"type": "status", "n": 3}, "chat")
+    stall.set()
+    await _wait_for(lambda: len(slow.received) == 3)
+
+    assert [m["n"] for m in slow.received] == [0, 2, 3]
+    assert manager.get_metrics()["coalesced"] == 1
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_and_failed_sends():
+    """Overflowing or failing clients are closed and removed."""
+    manager = ConnectionManager(send_queue_size=1, slow_consumer_policy="disconnect")
+    stall = asyncio.Event()
+    slow = (await _connect(manager, 1, stall=stall))[0]
+    broken = SimulatedWebSocket()
+    await manager.connect(broken, "broken", "chat")
+    await asyncio.sleep(0.01)  # Let the writers deliver the connection acks
+    broken.fail = True
+
+    for n in range(3):
+        await manager.broadcast({"type": "update", "n": n}, "chat")
+        await asyncio.sleep(0.01)
+
+    assert slow.closed_with == 1008
+    assert broken.closed_with == 1011
+    assert manager.active_connections["chat"] == {}
+    metrics = manager.get_metrics()
+    assert metrics["slow_disconnects"] == 1
+    assert metrics["send"]["errors"] == 1
+    stall.set()
+
+@pytest.mark.asyncio
+async def test_failed_send_leaves_other_subscriptions():
+    """A failed channel send unsubscribes the client from that channel only."""
+    manager = ConnectionManager()
+    broken = SimulatedWebSocket()
+    await manager.connect(broken, "client-0", "chat")
+    await manager.join_channel("client-0", "nova-team")
+    await manager.join_channel("client-0", "nova-support")
+    await asyncio.sleep(0.01)
+
+    broken.fail = True
+    await manager.broadcast({"type": "message", "n": 0}, "chat", "nova-team")
+    await _wait_for(lambda: broken.closed_with is not None)
+
+    assert broken.closed_with == 1011
+    assert "client-0" not in manager.channel_subscriptions["nova-team"]
+    assert "client-0" in manager.channel_subscriptions["nova-support"]
+
+@pytest.mark.asyncio
+async def test_pong_is_queued_behind_broadcasts():
+    """Pongs go through the client's queue, after messages already queued."""
+    manager = ConnectionManager()
+    stall = asyncio.Event()
+    websocket = (await _connect(manager, 1, stall=stall))[0]
+
+    await manager.broadcast({"type": "update", "n": 0}, "chat")
+    await manager.handle_ping(websocket, "slow-0")
+    stall.set()
+    await _wait_for(lambda: len(websocket.received) == 2)
+
+    assert [m["type"] for m in websocket.received] == ["update", "pong"]
+
+class ScriptedWebSocket(SimulatedWebSocket):
+    """Simulated client that sends scripted messages, then hangs up once answered."""
+
+    def __init__(self, script: List[dict], replies: int):
+        super().__init__()
+        self.script = list(script)
+        self.replies = replies
+
+    async def receive_json(self) -> dict:
+        if self.script:
+            return self.script.pop(0)
+        await _wait_for(lambda: len(self.received) >= self.replies)
+        raise WebSocketDisconnect()
+
+@pytest.mark.asyncio
+async def test_handler_replies_go_through_sender():
+    """Acknowledgements and errors are queued like broadcasts, not sent directly."""
+    server = WebSocketServer(memory_system_provider=lambda: None)
+    server._initialized = True
+    websocket = ScriptedWebSocket([
+        {"type": "subscribe", "data": {"channel": "nova-team"}},
+        {"type": "subscribe", "data": {"channel": "unknown"}}
+    ], replies=2)
+
+    await server.handle_chat_connection(websocket, "client-0")
+
+    assert [m["type"] for m in websocket.received] == ["subscription_success", "error"]
+    assert "Invalid channel" in websocket.received[1]["data"]["error"]
+    assert server.manager.get_metrics()["send"]["count"] == 3  # including the connection ack
+
+@pytest.mark.asyncio
+async def test_flushing_disconnect_sends_queued_messages():
+    """A disconnect with flush delivers what was queued; a plain one discards it."""
+    manager = ConnectionManager()
+    kept, discarded = await _connect(manager, 2, delay=0.01)
+    for websocket, client_id in ((kept, "slow-0"), (discarded, "slow-1")):
+        for n in range(3):
+            await manager.send(websocket, client_id, {"type": "error", "n": n})
+
+    await manager.disconnect("slow-1", "chat")
+    await manager.disconnect("slow-0", "chat", flush=True)
+
+    assert [m["n"] for m in kept.received] == [0, 1, 2]
+    assert len(discarded.received) < 3
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+async def test_broadcast_load_1000_clients():
+    """1,000 clients, 5 of them slow: fast clients get every message promptly."""
+    manager = ConnectionManager(send_queue_size=64)
+    fast = await _connect(manager, 995)
+    slow = await _connect(manager, 5, delay=0.05)
+    messages = 50
+
+    start = time.perf_counter()
+    for n in range(messages):
+        await manager.broadcast({"type": "chat_message", "n": n, "content": "x" * 200}, "chat")
+    enqueue_time = time.perf_counter() - start
+    await _wait_for(lambda: all(len(ws.received) == messages for ws in fast))
+    fast_time = time.perf_counter() - start
+
+    metrics = manager.get_metrics()
+    logger.info(
+        f"{messages} broadcasts to 1000 clients: enqueue {enqueue_time * 1000:.0f}ms, "
+        f"fast clients done {fast_time * 1000:.0f}ms, slow backlog {metrics['queue_depth']['max']}, "
+        f"send p95 {metrics['send']['p95_ms']:.2f}ms"
+    )
+    assert all([m["n"] for m in ws.received] == list(range(messages)) for ws in fast)
+    # Sequential sends would take at least 5 slow clients x 50 messages x 50ms
+    assert fast_time < 5 * messages * 0.05
+    assert metrics["queue_depth"]["max"] > 0
+    for ws in fast + slow:
+        await manager.disconnect(next(
+            cid for cid, conn in manager.active_connections["chat"].items() if conn is ws
+        ), "chat")
+
+@pytest.mark.asyncio
+async def test_memory_updates_pushed_from_change_feed():
+    """Store writes reach graph clients without polling."""
+    server = WebSocketServer(memory_system_provider=lambda: None)
+    websocket = SimulatedWebSocket()
+    await server.manager.connect(websocket, "graph-client", "graph")
+    await server.broadcast_memory_updates()
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    change_feed.publish("concept", "upsert", ids=["alpha"])
+    await _wait_for(lambda: websocket.received)
+    latency = time.perf_counter() - start
+
+    server._memory_update_task.cancel()
+    await asyncio.gather(server._memory_update_task, return_exceptions=True)
+
+    assert latency < 0.1
+    message = websocket.received[0]
+    assert message["type"] == "memory_update"
+    assert message["data"]["store"] == "concept"
+    assert message["data"]["updates"][0]["ids"] == ["alpha"]
+    assert not change_feed.active
+
+@pytest.mark.asyncio
+async def test_stream_applies_backpressure():
+    """Streams reach a slow client complete and in order, pacing the producer."""
+    manager = ConnectionManager(send_queue_size=2)
+    server = WebSocketServer(memory_system_provider=lambda: None)
+    server.manager = manager
+    websocket = SimulatedWebSocket(delay=0.005)
+    await manager.connect(websocket, "client-0", "chat")
+    produced = []
+
+    async def chunks():
+        for i in range(20):
+            produced.append(i)
+            # Producer never runs more than the queue size ahead of delivery
+            assert i - len(websocket.received) <= 2 + 1
+            yield {"type": "llm_chunk", "data": {"content": str(i), "is_final": i == 19}}
+
+    sent = await server.stream_llm("client-0", chunks())
+    await _wait_for(lambda: len(websocket.received) == 20)
+
+    assert sent == 20
+    assert [m["data"]["content"] for m in websocket.received] == [str(i) for i in range(20)]
+    assert websocket.received[0]["client_id"] == "client-0"
+    assert manager.senders["chat"]["client-0"].dropped == 0
@@ -112,6 +112,11 @@ def mock_episodic_layer():
         async def get_consolidation_candidates(self) -> List[Dict]:
             return self.memories
             
+        async def iter_consolidation_candidates(self, page_size: Optional[int] = None):
+            page_size = page_size or len(self.memories) or 1
+            for start in range(0, len(self.memories), page_size):
+                yield self.memories[start:start + page_size]
+            
     return MockEpisodicLayer()
 
 @pytest.fixture